@@ -20,6 +20,8 @@ logging.basicConfig(
         logging.StreamHandler()
     ]
 )
+from backend.logger.logger import install_queue_logging
+install_queue_logging(logging.getLogger())
 init_logger = logging.getLogger(__name__)
 
 # Import database managers from the new modular structure
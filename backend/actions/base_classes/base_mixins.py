@@ -109,21 +109,9 @@ class LanguageHelpersMixin(ActionCommonMixin):
 
     def _initialize_language_and_helpers(self, tracker: Tracker) -> None:
         self._update_language_code_and_location_info(tracker)
-        if not hasattr(self, "keyword_detector"):
-            self.keyword_detector = self.helpers.keyword_detector
-        else:
-            if not hasattr(self.keyword_detector, "language_code"):
-                self.keyword_detector._initialize_constants(self.language_code)
-            if self.keyword_detector.language_code != self.language_code:
-                self.keyword_detector._initialize_constants(self.language_code)
-
-        if not hasattr(self, "location_validator"):
-            self.location_validator = self.helpers.location_validator
-        else:
-            if not hasattr(self.location_validator, "language_code"):
-                self.location_validator._initialize_constants(self.language_code)
-            if self.location_validator.language_code != self.language_code:
-                self.location_validator._initialize_constants(self.language_code)
+        # Prebuilt per-language instances: bind the right one, never re-initialise shared helpers
+        self.keyword_detector = self.helpers.keyword_detector_for(self.language_code)
+        self.location_validator = self.helpers.location_validator_for(self.language_code)
 
     def _get_categories_in_local_language(self, categories: List[str]) -> List[str]:
         return language_helpers.categories_in_local_language(categories, self.language_code)
@@ -16,8 +16,13 @@ Structure:
     }
 }
 """
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
 from .mapping_buttons import *
 
+logger = logging.getLogger(__name__)
+
 #special case for sensitive issues follow up so that the messaging is consistent accross all forms that may use it
 SENSITIVE_ISSUES_UTTERANCES_AND_BUTTONS = {
             'utterances': {
@@ -2303,6 +2308,85 @@ Do you want to add more details before submission?""",
     },
 }
 
+# ---------------------------------------------------------------------------
+# Flattened lookup tables (built once at import)
+# ---------------------------------------------------------------------------
+
+LANGUAGES = ("en", "ne")
+_NO_BUTTONS: Tuple[Dict[str, Any], ...] = ()
+
+# (form_name, action_name, index, language) -> text / buttons
+_UTTERANCES: Dict[Tuple[str, str, Any, str], str] = {}
+_BUTTONS: Dict[Tuple[str, str, int, str], Tuple[Dict[str, Any], ...]] = {}
+# (form_name, action_name[, language]) -> all utterances / count
+_ALL_UTTERANCES: Dict[Tuple[str, str, str], Tuple[str, ...]] = {}
+_UTTERANCE_COUNTS: Dict[Tuple[str, str], int] = {}
+
+
+def _resolve_button_set(button_sets: Any, button_index: int) -> Optional[Dict[str, Any]]:
+    """Button set for a 1-based index; some mappings still use 0-based or string keys."""
+    if isinstance(button_sets, list):
+        for i in (button_index - 1, button_index):
+            if 0 <= i < len(button_sets):
+                return button_sets[i]
+        return None
+    if isinstance(button_sets, dict):
+        for key in (button_index, str(button_index), button_index - 1, str(button_index - 1)):
+            if key in button_sets:
+                return button_sets[key]
+    return None
+
+
+def _button_indices(button_sets: Any) -> List[int]:
+    if isinstance(button_sets, list):
+        return list(range(len(button_sets) + 1))
+    keys = [int(k) for k in button_sets if str(k).lstrip("-").isdigit()]
+    return list(range(min(keys, default=0), max(keys, default=0) + 2))
+
+
+def _build_lookup_tables() -> List[str]:
+    """Flatten UTTERANCE_MAPPING into the lookup tables; return mapping problems found."""
+    problems: List[str] = []
+    for form_name, actions in UTTERANCE_MAPPING.items():
+        if not isinstance(actions, dict):
+            continue
+        for action_name, entry in actions.items():
+            if not isinstance(entry, dict):
+                continue
+            utterances = entry.get("utterances")
+            if isinstance(utterances, dict):
+                _UTTERANCE_COUNTS[(form_name, action_name)] = len(utterances)
+                for utter_index, texts in utterances.items():
+                    if not isinstance(texts, dict):
+                        problems.append(f"{form_name}.{action_name} utterance {utter_index!r} is not a dict")
+                        continue
+                    for language in LANGUAGES:
+                        if language not in texts:
+                            problems.append(f"{form_name}.{action_name} utterance {utter_index!r} has no {language!r}")
+                    for language, text in texts.items():
+                        _UTTERANCES[(form_name, action_name, utter_index, language)] = text
+                for language in LANGUAGES:
+                    if all(isinstance(t, dict) and language in t for t in utterances.values()):
+                        _ALL_UTTERANCES[(form_name, action_name, language)] = tuple(
+                            t[language] for t in utterances.values()
+                        )
+
+            button_sets = entry.get("buttons")
+            if isinstance(button_sets, (dict, list)):
+                for button_index in _button_indices(button_sets):
+                    button_set = _resolve_button_set(button_sets, button_index)
+                    if not isinstance(button_set, dict):
+                        continue
+                    for language, buttons in button_set.items():
+                        _BUTTONS[(form_name, action_name, button_index, language)] = tuple(buttons or ())
+    return problems
+
+
+_MAPPING_PROBLEMS = _build_lookup_tables()
+for _problem in _MAPPING_PROBLEMS:
+    logger.warning("UTTERANCE_MAPPING: %s", _problem)
+
+
 def get_utterance_base(form_name: str, action_name: str, utter_index: int, language: str = 'en') -> str:
     """
     Get the appropriate utterance based on form, action, index, and language.
@@ -2316,10 +2400,10 @@ def get_utterance_base(form_name: str, action_name: str, utter_index: int, langu
     Returns:
         str: The appropriate utterance name
     """
-    try:
-        return UTTERANCE_MAPPING[form_name][action_name]['utterances'][utter_index][language]
-    except Exception as e:
-        raise ValueError(f"Error getting utterance: {str(e)}, form_name: {form_name}, action_name: {action_name}, utter_index: {utter_index}, language: {language}")
+    text = _UTTERANCES.get((form_name, action_name, utter_index, language))
+    if text is None:
+        raise ValueError(f"Error getting utterance: no utterance, form_name: {form_name}, action_name: {action_name}, utter_index: {utter_index}, language: {language}")
+    return text
 
 def get_all_utterances(form_name: str, action_name: str, language: str = 'en') -> list:
     """
@@ -2333,11 +2417,7 @@ def get_all_utterances(form_name: str, action_name: str, language: str = 'en') -
     Returns:
         list: List of utterance names
     """
-    try:
-        return [utterance[language] for utterance in UTTERANCE_MAPPING[form_name][action_name]['utterances'].values()]
-    except KeyError as e:
-        print(f"Error getting utterances: {str(e)}")
-        return []
+    return list(_ALL_UTTERANCES.get((form_name, action_name, language), ()))
 
 def get_utterance_count(form_name: str, action_name: str) -> int:
     """
@@ -2350,13 +2430,9 @@ def get_utterance_count(form_name: str, action_name: str) -> int:
     Returns:
         int: Number of utterances
     """
-    try:
-        return len(UTTERANCE_MAPPING[form_name][action_name]['utterances'])
-    except KeyError as e:
-        print(f"Error getting utterance count: {str(e)}")
-        return 0
+    return _UTTERANCE_COUNTS.get((form_name, action_name), 0)
 
-def get_buttons_base(form_name: str, action_name: str, button_index: int, language: str = 'en') -> list:
+def get_buttons_base(form_name: str, action_name: str, button_index: int, language: str = 'en') -> Tuple[Dict[str, Any], ...]:
     """
     Get the buttons for a specific form, action, index, and language.
     
@@ -2367,35 +2443,7 @@ def get_buttons_base(form_name: str, action_name: str, button_index: int, langua
         language (str): Language code ('en' or 'ne')
         
     Returns:
-        list: List of button dictionaries with title and payload
+        tuple: Shared, read-only sequence of button dictionaries with title and payload
+            (empty when the form/action/index has no buttons). Copy with list() before editing.
     """
-    try:
-        button_sets = UTTERANCE_MAPPING[form_name][action_name]['buttons']
-
-        # API contract is 1-based; some mappings may still use 0-based keys.
-        if isinstance(button_sets, list):
-            zero_based = button_index - 1
-            if 0 <= zero_based < len(button_sets):
-                return button_sets[zero_based].get(language, [])
-            if 0 <= button_index < len(button_sets):
-                return button_sets[button_index].get(language, [])
-            raise IndexError(button_index)
-
-        if isinstance(button_sets, dict):
-            if button_index in button_sets:
-                return button_sets[button_index].get(language, [])
-            if str(button_index) in button_sets:
-                return button_sets[str(button_index)].get(language, [])
-
-            zero_based = button_index - 1
-            if zero_based in button_sets:
-                return button_sets[zero_based].get(language, [])
-            if str(zero_based) in button_sets:
-                return button_sets[str(zero_based)].get(language, [])
-
-            raise KeyError(button_index)
-
-        raise TypeError(type(button_sets))
-    except (KeyError, IndexError, TypeError) as e:
-        print(f"Error getting buttons: {str(e)}")
-        return []
\ No newline at end of file
+    return _BUTTONS.get((form_name, action_name, button_index, language), _NO_BUTTONS)
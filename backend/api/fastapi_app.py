@@ -40,17 +40,44 @@ elif _env.exists():
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
 
 from backend.api.routers import grievance, files, voice_grievance, gsheet, messaging
-from backend.api.websocket_fastapi import emit_status_update_accessible, socketio_app
+from backend.logger.metrics import render_metrics
+from backend.services.message_dispatcher import start_outbox, stop_outbox
+from backend.services.database_services.async_manager import close_async_db_pool
+from backend.logger.request_timing import REQUEST_TIMING_ENABLED, RequestTimingMiddleware
+from backend.api.websocket_fastapi import (
+    emit_status_update_accessible,
+    emit_task_status_event,
+    socketio_app,
+)
+from backend.task_queue.settings import TASK_STATUS_TRANSPORT
+from backend.task_queue.status_bus import TaskStatusFanout
+
+
+async def _dispatch_task_status(event):
+    files.record_task_status(event)
+    await emit_task_status_event(event)
+
+
+task_status_fanout = TaskStatusFanout(_dispatch_task_status)
 
 
 @asynccontextmanager
 async def _lifespan(app: FastAPI):
     # Wire real Socket.IO emit for accessible (grievance suffix A) on POST /task-status.
     files.set_emit_status_update_accessible(emit_status_update_accessible)
+    # Celery workers publish task status on the Redis bus; one API worker fans it out to Socket.IO.
+    if TASK_STATUS_TRANSPORT != "http":
+        task_status_fanout.start()
+    # Drain the messaging outbox from startup: messages queued before a restart are delivered.
+    start_outbox()
     yield
+    stop_outbox()
+    if TASK_STATUS_TRANSPORT != "http":
+        await task_status_fanout.stop()
+    await close_async_db_pool()
 
 
 app = FastAPI(title="Backend API", version="0.1.0", lifespan=_lifespan)
@@ -83,6 +110,9 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Opt-in (REQUEST_TIMING=1): Server-Timing header with DB time / query count per request
+if REQUEST_TIMING_ENABLED:
+    app.add_middleware(RequestTimingMiddleware)
 
 
 @app.get("/health", response_class=PlainTextResponse)
@@ -91,6 +121,13 @@ def health():
     return "OK"
 
 
+@app.get("/metrics")
+def metrics():
+    """Task metrics in Prometheus text format (aggregated across Celery workers when multiprocess mode is on)."""
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+
 # Grievance API: paths already include /api/grievance, so no prefix
 app.include_router(grievance.router)
 # File server: same paths as Flask FileServerAPI (no prefix)
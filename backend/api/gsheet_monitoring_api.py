@@ -1,8 +1,12 @@
-from flask import Blueprint, request
+import logging
 import os
+
+from flask import Blueprint, request
 from .api_manager import APIManager
 from backend.services.database_services.postgres_services import db_manager
 
+logger = logging.getLogger(__name__)
+
 
 class GSheetMonitoringAPI:
     """API routes for Google Sheets monitoring operations"""
@@ -26,24 +30,22 @@ class GSheetMonitoringAPI:
     def _verify_auth(self):
         """Verify the authorization token or username"""
         auth_header = request.headers.get('Authorization')
-        print(f"[DEBUG] Auth header: {auth_header}")
-        print(f"[DEBUG] Expected bearer token: {self.gsheet_bearer_token}")
+        logger.debug("gsheet auth: header present=%s", bool(auth_header))
         
         # Check for original API token authentication
         if auth_header == f"Bearer {self.gsheet_bearer_token}":
-            print("[DEBUG] Valid API token authentication")
+            logger.debug("gsheet auth: valid API token")
             return None  # Valid API token
         
         # Check for username-based authentication (new office authentication)
         if auth_header and auth_header.startswith('Bearer '):
             username = auth_header.replace('Bearer ', '')
-            print(f"[DEBUG] Checking office user authentication for: {username}")
             # Validate that it's a known office user
             if self._is_valid_office_user(username):
-                print(f"[DEBUG] Valid office user authentication for: {username}")
+                logger.debug("gsheet auth: valid office user %s", username)
                 return None  # Valid office user
         
-        print("[DEBUG] Authentication failed")
+        logger.debug("gsheet auth: failed")
         return self.api_manager.error_response("Invalid token or username", 403)
     
     def _is_valid_office_user(self, username):
@@ -56,10 +58,9 @@ class GSheetMonitoringAPI:
             # Check if it's a valid office user in the database
             query = "SELECT 1 FROM office_user WHERE us_unique_id = %s AND user_status = 'active'"
             result = self.db.execute_query(query, (username,), "check_office_user")
-            print(f"[DEBUG] Office user check for {username}: {len(result)} rows found")
             return len(result) > 0
         except Exception as e:
-            print(f"[DEBUG] Error checking office user {username}: {str(e)}")
+            logger.warning("gsheet auth: office user check failed for %s: %s", username, e)
             return False
 
     def handle_request(self, func):
@@ -79,9 +80,7 @@ class GSheetMonitoringAPI:
         """Get grievances for Google Sheets monitoring"""
         # Verify authentication
         auth_error = self._verify_auth()
-        print("[DEBUG] auth_error:", auth_error)
         if auth_error:
-            print("[DEBUG] Returning auth_error of type:", type(auth_error))
             return auth_error
 
         try:
@@ -100,37 +99,30 @@ class GSheetMonitoringAPI:
             else:
                 username = None
 
-            print(f"[DEBUG] Query params: status={status}, start_date={start_date}, end_date={end_date}, username={username}")
+            logger.debug(
+                "gsheet grievances: status=%s start_date=%s end_date=%s username=%s",
+                status, start_date, end_date, username,
+            )
 
             # Fetch grievances using database manager with user filtering
-            print("[DEBUG] Calling get_grievances_for_gsheet with params:", {"status": status, "start_date": start_date, "end_date": end_date, "username": username})
             grievances = self.db.gsheet.get_grievances_for_gsheet(
                 status=status,
                 start_date=start_date,
                 end_date=end_date,
                 username=username
             )
-            print("[DEBUG] grievances type:", type(grievances), "length:", len(grievances))
-            if grievances:
-                print("[DEBUG] First grievance sample:", grievances[0])
-            else:
-                print("[DEBUG] No grievances returned!")
+            # Row count only: result sets hold complainant PII and can be large
+            logger.debug("gsheet grievances: %s rows", len(grievances))
 
             response_data = {
                 "count": len(grievances),
                 "data": grievances
             }
-            print("[DEBUG] Response data structure:", response_data)
-            
-            response = self.api_manager.success_response(response_data, "Grievances retrieved successfully")
-            print("[DEBUG] Final response type:", type(response))
-            return response
+            return self.api_manager.success_response(response_data, "Grievances retrieved successfully")
 
         except Exception as e:
-            print("[DEBUG] Exception in get_grievances:", e)
-            error_response = self.api_manager.error_response(str(e))
-            print("[DEBUG] error_response type:", type(error_response), error_response)
-            return error_response
+            logger.error("gsheet grievances failed: %s", e)
+            return self.api_manager.error_response(str(e))
 
 # Create the API instance
 gsheet_monitoring = GSheetMonitoringAPI()
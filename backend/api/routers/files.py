@@ -3,8 +3,11 @@ File server API router (production). Same URL surface as legacy FileServerAPI in
 Uses FileServerCore and Celery; accessible emit is wired from fastapi_app lifespan (Socket.IO ASGI).
 """
 
+import contextlib
+import hashlib
 import json
 import os
+import tempfile
 import time
 import uuid
 from typing import Any, Callable, Dict, List, Optional
@@ -16,9 +19,11 @@ _FILE_FAILURE_TTL_SEC = 3600
 
 from fastapi import APIRouter, File, Form, Query, Request, UploadFile
 from fastapi.responses import FileResponse, JSONResponse
+from starlette.concurrency import run_in_threadpool
 
 from backend.config.constants import MAX_FILE_SIZE
 from backend.config.database_constants import get_task_status_codes
+from backend.services.database_services.async_manager import get_async_db_manager
 from backend.services.database_services.postgres_services import db_manager
 from backend.services.file_server_core import FileServerCore
 from backend.actions.grievance_intake.ensure_records import (
@@ -26,6 +31,7 @@ from backend.actions.grievance_intake.ensure_records import (
 )
 from backend.shared_functions.utterance_mapping_server import get_utterance
 from backend.task_queue.registered_tasks import process_file_upload_task
+from backend.task_queue.status_bus import event_source
 from werkzeug.utils import secure_filename
 
 status_codes = get_task_status_codes()
@@ -38,12 +44,16 @@ STARTED = status_codes["STARTED"]
 from backend.config.constants import ALLOWED_EXTENSIONS
 
 _upload_folder = os.getenv("UPLOAD_FOLDER", "uploads")
+# Bytes read per await when streaming multipart uploads to disk (bounds memory per request).
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 file_server_core = FileServerCore(
     upload_folder=_upload_folder,
     allowed_extensions=ALLOWED_EXTENSIONS,
 )
 
 router = APIRouter()
+# Awaitable DB access for the async routes (asyncpg when "files" is in DB_ASYNC_ROUTERS)
+files_db = get_async_db_manager("files", grievance=db_manager, file=db_manager.file)
 
 # --- Emit stub: 8C can replace this with the real Socket.IO emit ---
 _emit_status_update_accessible: Optional[Callable[[str, str, dict], None]] = None
@@ -89,24 +99,71 @@ def _extract_session_type_from_grievance_id(grievance_id: str) -> str:
     return "unknown"
 
 
-def _validate_files(
+class _UploadTooLarge(Exception):
+    """Raised mid-stream once an upload passes the size limit."""
+
+
+def _write_upload_chunk(out, digest, chunk: bytes) -> None:
+    digest.update(chunk)
+    out.write(chunk)
+
+
+async def _stream_upload_to_disk(
+    file: UploadFile,
+    dest_dir: str,
+    filename: str,
+    max_bytes: int,
+) -> Dict[str, Any]:
+    """Copy an upload to dest_dir/filename in UPLOAD_CHUNK_SIZE pieces.
+
+    At most one chunk is held in memory; hashing and disk writes run in the thread pool, and the
+    file only appears under its final name (atomic rename) once fully written.
+    Raises _UploadTooLarge as soon as max_bytes is exceeded, leaving nothing on disk.
+    """
+    await run_in_threadpool(os.makedirs, dest_dir, exist_ok=True)
+    fd, tmp_path = await run_in_threadpool(
+        tempfile.mkstemp, dir=dest_dir, prefix=".upload_", suffix=".part"
+    )
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while True:
+                chunk = await file.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise _UploadTooLarge(filename)
+                await run_in_threadpool(_write_upload_chunk, out, digest, chunk)
+        file_path = os.path.join(dest_dir, filename)
+        await run_in_threadpool(os.replace, tmp_path, file_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+    return {"file_path": file_path, "file_size": size, "content_sha256": digest.hexdigest()}
+
+
+async def _validate_files(
     core: FileServerCore,
     files: List[UploadFile],
     grievance_id: str,
 ) -> tuple:
-    """Returns (uploaded_files, oversized_files, wrong_extensions_list)."""
+    """Returns (uploaded_files, oversized_files, wrong_extensions_list).
+
+    Files are streamed to disk one chunk at a time; file metadata is left to the Celery task.
+    """
     uploaded_files = []
     oversized_files = []
     wrong_extensions_list = []
+    grievance_dir = os.path.join(core.upload_folder, grievance_id)
 
     for file in files:
         if file and file.filename:
             filename = secure_filename(file.filename)
-            content = file.file.read()
-            file_size = len(content)
-            file.file.seek(0)
-
-            if file_size > MAX_FILE_SIZE:
+            # Multipart parsing already knows the size; only stream what can be accepted.
+            if file.size is not None and file.size > MAX_FILE_SIZE:
                 oversized_files.append(filename)
                 continue
             ext = file.filename.rsplit(".", 1)[1].lower() if "." in file.filename else None
@@ -117,27 +174,22 @@ def _validate_files(
                 wrong_extensions_list.append({"file_name": filename, "extension": ext})
                 continue
 
-            file_id = str(uuid.uuid4())
-            grievance_dir = os.path.join(core.upload_folder, grievance_id)
-            os.makedirs(grievance_dir, exist_ok=True)
-            file_path = os.path.join(grievance_dir, filename)
-            with open(file_path, "wb") as f:
-                f.write(content)
+            try:
+                stored = await _stream_upload_to_disk(file, grievance_dir, filename, MAX_FILE_SIZE)
+            except _UploadTooLarge:
+                oversized_files.append(filename)
+                continue
 
-            metadata = core.get_file_metadata(file_path)
-            file_data = {
-                "file_id": file_id,
+            uploaded_files.append({
+                "file_id": str(uuid.uuid4()),
                 "file_name": filename,
-                "file_path": file_path,
-                "file_size": file_size,
-                **metadata,
-            }
-            uploaded_files.append(file_data)
+                **stored,
+            })
 
     return uploaded_files, oversized_files, wrong_extensions_list
 
 
-def _resolve_grievance_for_upload(
+async def _resolve_grievance_for_upload(
     grievance_id: Optional[str],
     complainant_id: Optional[str],
 ) -> Dict[str, Optional[str]]:
@@ -145,7 +197,8 @@ def _resolve_grievance_for_upload(
     complainant_id = (complainant_id or "").strip() or None
 
     if not grievance_id:
-        ensured = ensure_intake_records_for_attachment(
+        ensured = await run_in_threadpool(
+            ensure_intake_records_for_attachment,
             db_manager,
             grievance_id=None,
             complainant_id=complainant_id,
@@ -154,8 +207,9 @@ def _resolve_grievance_for_upload(
             "grievance_id": ensured["grievance_id"],
             "complainant_id": ensured["complainant_id"],
         }
-    if not db_manager.check_entry_exists_for_entity_key("grievance_id", grievance_id):
-        ensured = ensure_intake_records_for_attachment(
+    if not await files_db.grievance_exists(grievance_id):
+        ensured = await run_in_threadpool(
+            ensure_intake_records_for_attachment,
             db_manager,
             grievance_id=grievance_id,
             complainant_id=complainant_id,
@@ -285,27 +339,11 @@ async def upload_files(
     )
 
     try:
-        grievance_id = (grievance_id or "").strip() or None
-        complainant_id = (complainant_id or "").strip() or None
-
-        if not grievance_id:
-            ensured = ensure_intake_records_for_attachment(
-                db_manager,
-                grievance_id=None,
-                complainant_id=complainant_id,
-            )
-            grievance_id = ensured["grievance_id"]
-            complainant_id = ensured["complainant_id"]
-        elif not db_manager.check_entry_exists_for_entity_key("grievance_id", grievance_id):
-            ensured = ensure_intake_records_for_attachment(
-                db_manager,
-                grievance_id=grievance_id,
-                complainant_id=complainant_id,
-            )
-            grievance_id = ensured["grievance_id"]
-            complainant_id = ensured.get("complainant_id") or complainant_id
+        resolved = await _resolve_grievance_for_upload(grievance_id, complainant_id)
+        grievance_id = resolved["grievance_id"]
+        complainant_id = resolved["complainant_id"]
 
-        if db_manager.is_grievance_archived(grievance_id):
+        if await files_db.is_grievance_archived(grievance_id):
             file_server_core.log_event(
                 event_type=FAILED,
                 details={"error": "grievance_archived", "grievance_id": grievance_id},
@@ -323,7 +361,7 @@ async def upload_files(
             error_message = get_utterance("file_server", "upload_files", 4, language_code)
             return JSONResponse({"error": error_message}, status_code=400)
 
-        uploaded_files, oversized_files, wrong_extensions_list = _validate_files(
+        uploaded_files, oversized_files, wrong_extensions_list = await _validate_files(
             file_server_core, files, grievance_id
         )
 
@@ -398,16 +436,21 @@ async def upload_voice_chunk(
     mime_type: Optional[str] = Form(None),
     rasa_session_id: Optional[str] = Form(None),
     flask_session_id: Optional[str] = Form(None),
+    chunk_offset: Optional[int] = Form(None),
     chunk: UploadFile = File(...),
 ):
-    """Append one voice-note chunk (1s MediaRecorder slice). Idempotent on retry."""
+    """Write one voice-note chunk (1s MediaRecorder slice). Idempotent on retry.
+
+    With `chunk_offset` (byte position in the recording) chunks may arrive in any order and on
+    any API worker; without it they must arrive in order.
+    """
     language_code = _get_language_code(request)
     try:
-        resolved = _resolve_grievance_for_upload(grievance_id, complainant_id)
+        resolved = await _resolve_grievance_for_upload(grievance_id, complainant_id)
         grievance_id = resolved["grievance_id"]
         complainant_id = resolved["complainant_id"]
 
-        if db_manager.is_grievance_archived(grievance_id):
+        if await files_db.is_grievance_archived(grievance_id):
             return JSONResponse(
                 {
                     "error": "This grievance has been archived. New uploads are not allowed.",
@@ -442,6 +485,7 @@ async def upload_voice_chunk(
                 upload_id=upload_id,
                 chunk_index=chunk_index,
                 chunk_bytes=chunk_bytes,
+                chunk_offset=chunk_offset,
             )
             session = result["session"]
         except ValueError as exc:
@@ -452,6 +496,8 @@ async def upload_voice_chunk(
                 return JSONResponse({"error": "Chunk received out of order"}, status_code=409)
             if code == "empty_chunk":
                 return JSONResponse({"error": "Empty chunk"}, status_code=400)
+            if code == "invalid_chunk_offset":
+                return JSONResponse({"error": "Invalid chunk_offset"}, status_code=400)
             if code == "voice_chunk_size_exceeded":
                 file_server_core.abort_voice_chunk_upload(upload_id)
                 return JSONResponse(
@@ -469,7 +515,7 @@ async def upload_voice_chunk(
                 "duplicate": result.get("duplicate", False),
                 "bytes_received": len(chunk_bytes),
                 "total_bytes": session["total_bytes"],
-                "chunks_received": session["next_chunk_index"],
+                "chunks_received": session["chunks_received"],
                 "grievance_id": grievance_id,
                 "complainant_id": complainant_id,
                 "flask_session_id": flask_session_id,
@@ -501,11 +547,11 @@ async def upload_voice_complete(
     """Finalize a chunked voice note and queue the standard file-upload task."""
     language_code = _get_language_code(request)
     try:
-        resolved = _resolve_grievance_for_upload(grievance_id, complainant_id)
+        resolved = await _resolve_grievance_for_upload(grievance_id, complainant_id)
         grievance_id = resolved["grievance_id"]
         complainant_id = resolved["complainant_id"]
 
-        if db_manager.is_grievance_archived(grievance_id):
+        if await files_db.is_grievance_archived(grievance_id):
             return JSONResponse(
                 {
                     "error": "This grievance has been archived. New uploads are not allowed.",
@@ -527,6 +573,8 @@ async def upload_voice_complete(
                 return JSONResponse({"error": "No audio chunks received"}, status_code=400)
             if code == "grievance_mismatch":
                 return JSONResponse({"error": "Grievance mismatch for upload session"}, status_code=409)
+            if code == "chunks_missing":
+                return JSONResponse({"error": "Voice note is missing chunks; resend them and retry"}, status_code=409)
             raise
 
         result = process_file_upload_task.delay(
@@ -561,7 +609,7 @@ async def upload_voice_complete(
 
 
 @router.get("/files/{item}")
-def get_files_or_file(item: str, request: Request):
+async def get_files_or_file(item: str, request: Request):
     """GET /files/{grievance_id} lists files; GET /files/{filename} serves file. Same path in Flask (list registered first)."""
     # If it looks like a grievance_id (e.g. GR-...), treat as list; else try serve by filename
     looks_like_grievance_id = item.startswith("GR-") and "-" in item
@@ -573,7 +621,7 @@ def get_files_or_file(item: str, request: Request):
                 event_type=STARTED,
                 details={"grievance_id": item, "session_type": session_type},
             )
-            files = db_manager.get_grievance_files(item)
+            files = await files_db.get_grievance_files(item)
             file_server_core.log_event(
                 event_type=SUCCESS,
                 details={"grievance_id": item, "file_count": len(files), "session_type": session_type},
@@ -599,12 +647,12 @@ def get_files_or_file(item: str, request: Request):
 
 
 @router.get("/download/{file_id}")
-def download_file(file_id: str, request: Request):
+async def download_file(file_id: str, request: Request):
     """Download a specific file."""
     try:
         language_code = _get_language_code(request)
         file_server_core.log_event(event_type=STARTED, details={"file_id": file_id})
-        file_data = db_manager.file.get_file_by_id(file_id)
+        file_data = await files_db.get_file_by_id(file_id)
         if file_data and os.path.exists(file_data["file_path"]):
             file_server_core.log_event(
                 event_type=SUCCESS,
@@ -630,7 +678,7 @@ def _prune_expired_file_failures() -> None:
 
 
 @router.get("/file-status/{file_id}")
-def get_file_status(file_id: str, request: Request):
+async def get_file_status(file_id: str, request: Request):
     """Get the processing status of a file."""
     try:
         language_code = _get_language_code(request)
@@ -644,7 +692,7 @@ def get_file_status(file_id: str, request: Request):
             return JSONResponse(
                 {"status": "FAILURE", "error": failure.get("error", "Upload failed")}
             )
-        if db_manager.file.is_file_saved(file_id):
+        if await files_db.is_file_saved(file_id):
             file_server_core.log_event(
                 event_type=SUCCESS, details={"file_id": file_id, "status": SUCCESS}
             )
@@ -690,7 +738,7 @@ async def update_grievance_review(grievance_id: str, request: Request):
             file_server_core.log_event(event_type=FAILED, details={"error": "Request must be JSON"})
             return JSONResponse({"error": "Request must be JSON"}, status_code=400)
         data = await request.json()
-        success = db_manager.update_grievance_review_data(grievance_id, data)
+        success = await run_in_threadpool(db_manager.update_grievance_review_data, grievance_id, data)
         if not success:
             file_server_core.log_event(event_type=FAILED, details={"error": "Update failed"})
             return JSONResponse({"error": "Update failed"}, status_code=400)
@@ -728,9 +776,34 @@ async def test_upload(request: Request):
         return JSONResponse({"error": str(e)}, status_code=500)
 
 
+def record_task_status(event: Dict[str, Any]) -> None:
+    """Log a task status event and remember file upload failures for GET /file-status/{file_id}.
+
+    Shared by POST /task-status and the task status bus fan-out (backend.task_queue.status_bus).
+    """
+    task_data = event.get("data") or {}
+    status = event.get("status")
+    file_server_core.log_event(
+        event_type="task_status_update",
+        details={
+            "grievance_id": event.get("grievance_id"),
+            "flask_session_id": event.get("flask_session_id"),
+            "status": status,
+            "data": task_data,
+            "source": event_source(event.get("grievance_id")),
+        },
+    )
+    # Record file upload failures so GET /file-status/{file_id} can return FAILURE to the client
+    if status == "FAILED" and task_data.get("file_id"):
+        _FILE_FAILURES[task_data["file_id"]] = {
+            "error": task_data.get("error", "Upload failed"),
+            "timestamp": time.time(),
+        }
+
+
 @router.post("/task-status")
 async def task_status_update(request: Request):
-    """Receive task status updates and emit websocket messages. Uses stub emit until 8C wires Socket.IO."""
+    """Receive task status updates over HTTP (legacy / TASK_STATUS_TRANSPORT=http) and emit websocket messages."""
     try:
         data = await request.json()
         if not data:
@@ -738,7 +811,7 @@ async def task_status_update(request: Request):
 
         grievance_id = data.get("grievance_id")
         flask_session_id = data.get("flask_session_id")
-        source = "A" if grievance_id and str(grievance_id).endswith("A") else "B"
+        source = event_source(grievance_id)
         status = data.get("status")
         task_data = data.get("data", {})
 
@@ -750,23 +823,7 @@ async def task_status_update(request: Request):
                 status_code=400,
             )
 
-        file_server_core.log_event(
-            event_type="task_status_update",
-            details={
-                "grievance_id": grievance_id,
-                "flask_session_id": flask_session_id,
-                "status": status,
-                "data": task_data,
-                "source": source,
-            },
-        )
-
-        # Record file upload failures so GET /file-status/{file_id} can return FAILURE to the client
-        if status == "FAILED" and task_data.get("file_id"):
-            _FILE_FAILURES[task_data["file_id"]] = {
-                "error": task_data.get("error", "Upload failed"),
-                "timestamp": time.time(),
-            }
+        record_task_status(data)
 
         emit_fn = get_emit_status_update_accessible()
 
@@ -778,17 +835,15 @@ async def task_status_update(request: Request):
             # Bot/webchat (source "B"): emit to the webchat Socket.IO room (session id from client).
             if flask_session_id:
                 try:
-                    from backend.api.websocket_fastapi import emit_webchat_task_status
+                    from backend.api.websocket_fastapi import (
+                        emit_webchat_task_status,
+                        webchat_task_event_name,
+                    )
 
                     task_name = task_data.get("task_name", "unknown")
-                    if "file" in str(task_name).lower():
-                        event_name = "file_status_update"
-                    else:
-                        event_name = "task_status"
-
                     emit_webchat_task_status(
                         flask_session_id,
-                        event_name,
+                        webchat_task_event_name(task_name),
                         {
                             "status": status,
                             "data": task_data,
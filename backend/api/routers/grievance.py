@@ -2,6 +2,7 @@
 Grievance API router. Same URL surface and behaviour as Flask backend.
 """
 
+import asyncio
 import logging
 import os
 from typing import Any, Dict, Optional
@@ -9,15 +10,19 @@ from typing import Any, Dict, Optional
 from fastapi import APIRouter, Depends, Header, HTTPException
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
+from starlette.concurrency import run_in_threadpool
 from backend.clients.messaging_api import send_email as send_email_via_api
 from backend.clients.messaging_api import send_sms as send_sms_via_api
 from backend.config.constants import EMAIL_TEMPLATES, DIC_SMS_TEMPLATES
+from backend.services.database_services.async_manager import get_async_db_manager
 from backend.services.database_services.grievance_manager import GrievanceDbManager
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 grievance_manager = GrievanceDbManager()
+# Awaitable DB access for the async routes (asyncpg when "grievance" is in DB_ASYNC_ROUTERS)
+grievance_db = get_async_db_manager("grievance", grievance=grievance_manager)
 
 
 # --- Request/response models (preserve Flask response structure) ---
@@ -169,10 +174,10 @@ def _send_status_update_notifications(
 
 
 @router.get("/api/grievance/statuses")
-def get_available_statuses():
+async def get_available_statuses():
     """Get all available grievance statuses. Same response as Flask."""
     try:
-        statuses = grievance_manager.get_available_statuses()
+        statuses = await grievance_db.get_available_statuses()
         return {
             "status": "SUCCESS",
             "message": "Available statuses retrieved successfully",
@@ -187,17 +192,17 @@ def get_available_statuses():
 
 
 @router.post("/api/grievance/{grievance_id}/status")
-def update_grievance_status(grievance_id: str, body: UpdateStatusBody):
+async def update_grievance_status(grievance_id: str, body: UpdateStatusBody):
     """Update the status of a specific grievance. Same behaviour as Flask."""
     try:
-        grievance = grievance_manager.get_grievance_by_id(grievance_id)
+        grievance = await grievance_db.get_grievance_by_id(grievance_id)
         if not grievance:
             return JSONResponse(
                 status_code=404,
                 content={"status": "ERROR", "message": f"Grievance {grievance_id} not found"},
             )
 
-        success = grievance_manager.update_grievance_status(
+        success = await grievance_db.update_grievance_status(
             grievance_id=grievance_id,
             status_code=body.status_code,
             created_by=body.created_by,
@@ -211,7 +216,9 @@ def update_grievance_status(grievance_id: str, body: UpdateStatusBody):
             )
 
         try:
-            _send_status_update_notifications(grievance_id, body.status_code, body.notes, body.created_by)
+            await run_in_threadpool(
+                _send_status_update_notifications, grievance_id, body.status_code, body.notes, body.created_by
+            )
         except Exception as e:
             print(f"Error sending notifications: {str(e)}")
 
@@ -234,19 +241,21 @@ def update_grievance_status(grievance_id: str, body: UpdateStatusBody):
 
 
 @router.get("/api/grievance/{grievance_id}")
-def get_grievance(grievance_id: str):
+async def get_grievance(grievance_id: str):
     """Get detailed information about a specific grievance. Same response as Flask."""
     try:
-        grievance = grievance_manager.get_grievance_by_id(grievance_id)
+        grievance = await grievance_db.get_grievance_by_id(grievance_id)
         if not grievance:
             return JSONResponse(
                 status_code=404,
                 content={"status": "ERROR", "message": f"Grievance {grievance_id} not found"},
             )
 
-        status_history = grievance_manager.get_grievance_status_history(grievance_id)
-        files = grievance_manager.get_grievance_files(grievance_id)
-        current_status = grievance_manager.get_grievance_status(grievance_id)
+        status_history, files, current_status = await asyncio.gather(
+            grievance_db.get_grievance_status_history(grievance_id),
+            grievance_db.get_grievance_files(grievance_id),
+            grievance_db.get_grievance_status(grievance_id),
+        )
 
         response_data = {
             "grievance": grievance,
@@ -268,7 +277,7 @@ def get_grievance(grievance_id: str):
 
 
 @router.patch("/api/grievance/{grievance_id}/classification")
-def patch_grievance_classification(
+async def patch_grievance_classification(
     grievance_id: str,
     body: GrievanceClassificationPatchBody,
     _: None = Depends(_ticketing_auth_check),
@@ -291,14 +300,14 @@ def patch_grievance_classification(
     if body.grievance_categories is not None:
         payload["grievance_categories"] = body.grievance_categories
 
-    if not grievance_manager.get_grievance_by_id(grievance_id):
+    if not await grievance_db.get_grievance_by_id(grievance_id):
         return JSONResponse(
             status_code=404,
             content={"status": "ERROR", "message": f"Grievance {grievance_id} not found"},
         )
 
     try:
-        grievance_manager.update_grievance(grievance_id, payload)
+        await grievance_db.update_grievance(grievance_id, payload)
         return {
             "ok": True,
             "grievance_id": grievance_id,
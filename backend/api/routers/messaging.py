@@ -4,6 +4,7 @@ from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Depends, Header, HTTPException, status
 from pydantic import BaseModel, EmailStr, Field, ValidationError, constr
 
+from backend.services.message_dispatcher import MessageDispatcher, get_dispatcher
 from backend.services.messaging import Messaging
 from backend.logger.logger import TaskLogger
 
@@ -60,10 +61,25 @@ class MessagingResponse(BaseModel):
     error: Optional[str] = None
 
 
+class SendBatchRequest(BaseModel):
+    sms: List[SendSmsRequest] = Field(default_factory=list)
+    email: List[SendEmailRequest] = Field(default_factory=list)
+
+
+class BatchResponse(BaseModel):
+    status: str
+    queued: int
+    message_ids: List[str]
+
+
 def get_messaging() -> Messaging:
     return Messaging()
 
 
+def get_message_dispatcher() -> MessageDispatcher:
+    return get_dispatcher()
+
+
 def _get_logger():
     task_logger = TaskLogger(service_name="messaging_api")
     return task_logger.logger
@@ -206,3 +222,62 @@ def send_email(
             },
         )
 
+
+@router.post(
+    "/api/messaging/send-batch",
+    response_model=BatchResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def send_batch(
+    payload: SendBatchRequest,
+    _auth: None = Depends(_auth_check),
+    dispatcher: MessageDispatcher = Depends(get_message_dispatcher),
+):
+    """
+    Queue many SMS / emails in the Redis outbox and return at once.
+
+    Delivery is batched per provider and retried with backoff in the background by every
+    API process; the response only confirms acceptance. Use send-sms / send-email when the
+    caller needs the delivery outcome. 503 when the outbox cannot be written.
+    """
+    logger = _get_logger()
+    if not payload.sms and not payload.email:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "status": "FAILED",
+                "error_code": "VALIDATION_ERROR",
+                "error": "Batch must contain at least one sms or email message",
+            },
+        )
+    items = [MessageDispatcher.sms_item(m.to, m.text) for m in payload.sms]
+    for m in payload.email:
+        attachments = None
+        if m.context and m.context.attachments:
+            attachments = [a.model_dump() for a in m.context.attachments]
+        items.append(MessageDispatcher.email_item(list(m.to), m.subject, m.html_body, attachments))
+    try:
+        ids = dispatcher.enqueue_many(items)
+    except Exception as exc:
+        logger.exception("Messaging outbox unavailable: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "status": "FAILED",
+                "error_code": "OUTBOX_UNAVAILABLE",
+                "error": str(exc),
+            },
+        )
+    logger.info(
+        "Messaging API send-batch queued sms=%d email=%d", len(payload.sms), len(payload.email)
+    )
+    return BatchResponse(status="QUEUED", queued=len(ids), message_ids=ids)
+
+
+@router.get("/api/messaging/outbox")
+def outbox_stats(
+    _auth: None = Depends(_auth_check),
+    dispatcher: MessageDispatcher = Depends(get_message_dispatcher),
+) -> Dict[str, int]:
+    """Outbox counters across all API processes (queued, due, sent, retried, failed, dead)."""
+    return dispatcher.outbox.stats()
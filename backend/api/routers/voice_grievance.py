@@ -3,6 +3,7 @@ Voice grievance router. Same URL surface and behaviour as Flask blueprint.
 Routes: POST /accessible-file-upload, GET /grievance-status/{grievance_id}, POST /submit-grievance.
 """
 
+import asyncio
 import os
 import uuid
 from datetime import datetime
@@ -10,11 +11,13 @@ from typing import List
 
 from fastapi import APIRouter, File, Form, Request, UploadFile
 from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 from werkzeug.utils import secure_filename
 
 from backend.config.constants import DEFAULT_VALUES, VALID_FIELD_NAMES
 from backend.config.database_constants import get_task_status_codes
 from backend.logger.logger import TaskLogger
+from backend.services.database_services.async_manager import get_async_db_manager
 from backend.services.database_services.postgres_services import db_manager
 from backend.task_queue.registered_tasks import process_batch_files_task
 
@@ -40,6 +43,8 @@ DEFAULT_PROVINCE = DEFAULT_VALUES["DEFAULT_PROVINCE"]
 DEFAULT_DISTRICT = DEFAULT_VALUES["DEFAULT_DISTRICT"]
 
 router = APIRouter()
+# Awaitable DB access for the async routes (asyncpg when "voice" is in DB_ASYNC_ROUTERS)
+voice_db = get_async_db_manager("voice", grievance=db_manager, file=db_manager.file)
 task_logger = TaskLogger(service_name="voice_grievance")
 
 
@@ -119,18 +124,20 @@ async def accessible_file_upload(
 
 
 @router.get("/grievance-status/{grievance_id}")
-def get_grievance_status(grievance_id: str):
+async def get_grievance_status(grievance_id: str):
     """Get the current status of a grievance and its associated tasks. Same as Flask."""
     try:
-        grievance = db_manager.get_grievance_by_id(grievance_id)
+        grievance = await voice_db.get_grievance_by_id(grievance_id)
         if not grievance:
             return JSONResponse(
                 status_code=404,
                 content={"status": FAILED, "error": "Grievance not found"},
             )
 
-        status = db_manager.get_grievance_status(grievance_id)
-        files = db_manager.get_grievance_files(grievance_id)
+        status, files = await asyncio.gather(
+            voice_db.get_grievance_status(grievance_id),
+            voice_db.get_grievance_files(grievance_id),
+        )
 
         # Match Flask: duplicate "status" key (second overwrites in JSON)
         return {
@@ -223,7 +230,7 @@ async def submit_grievance(request: Request):
             if duration is not None:
                 recording_data["duration_seconds"] = duration
 
-            recording_id = db_manager.create_or_update_recording(recording_data)
+            recording_id = await run_in_threadpool(db_manager.create_or_update_recording, recording_data)
             if recording_id:
                 audio_files.append(recording_data)
             else:
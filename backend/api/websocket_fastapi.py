@@ -9,16 +9,20 @@ Exposes:
 - `socketio_app`: ASGI application to mount
 - `emit_status_update_accessible(session_id, status, message)`: helper used by
   other parts of the codebase to push status updates to a specific session/room.
+- `emit_task_status_event(event)`: awaitable delivery of a task status bus event
+  (see `backend/task_queue/status_bus.py`); clients joining a room with
+  `last_event_id` (or `replay: true`) get the recent events they missed.
 """
 
 import asyncio
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import socketio
 
 from backend.logger.logger import TaskLogger
 from backend.config.constants import FIELD_CATEGORIES_MAPPING
+from backend.task_queue.status_bus import async_client, event_room, event_source, recent_events
 
 task_logger = TaskLogger(service_name="socketio_fastapi")
 logger = task_logger.logger
@@ -50,6 +54,11 @@ def _build_emit_key(message: Any) -> str:
     return emit_key
 
 
+def webchat_task_event_name(task_name: Any) -> str:
+    """Webchat event for a task status: file tasks go to `file_status_update`, the rest to `task_status`."""
+    return "file_status_update" if "file" in str(task_name).lower() else "task_status"
+
+
 # Use Redis manager so multiple workers can share the same message queue
 manager = socketio.AsyncRedisManager(SOCKETIO_REDIS_URL)
 
@@ -85,6 +94,7 @@ async def join(sid, data):
         logger.debug("ASGI client joining room", extra={"sid": sid, "room": room})
         await sio.enter_room(sid, room)
         logger.debug("ASGI client joined room", extra={"sid": sid, "room": room})
+        await _replay_task_status(sid, room, data)
 
 
 @sio.event
@@ -107,6 +117,57 @@ async def join_room(sid, data):
     if room:
         logger.debug("ASGI join_room called", extra={"sid": sid, "room": room})
         await sio.enter_room(sid, room)
+        await _replay_task_status(sid, room, data)
+
+
+async def _replay_task_status(sid, room: str, data: Dict[str, Any]) -> None:
+    """Re-send recent task status events a reconnecting client missed (opt-in via join payload)."""
+    last_event_id = data.get("last_event_id")
+    if not last_event_id and not data.get("replay"):
+        return
+    try:
+        events = await recent_events(async_client(), room, last_event_id)
+    except Exception as e:
+        logger.warning("Task status replay unavailable", extra={"room": room, "error": str(e)})
+        return
+    for event in events:
+        await emit_task_status_event(event, to=sid)
+
+
+async def emit_task_status_event(event: Dict[str, Any], to: Optional[str] = None) -> None:
+    """
+    Deliver a task status bus event with the same routing as POST /task-status.
+
+    Awaited (not fire-and-forget) so the fan-out loop keeps events in stream order.
+    `to` overrides the room, e.g. a single sid for replay.
+    """
+    room = to or event_room(event)
+    if not room:
+        return
+    status = event.get("status")
+    task_data = event.get("data") or {}
+    grievance_id = event.get("grievance_id")
+    event_id = event.get("event_id")
+    if event_source(grievance_id) == "A":
+        await sio.emit(
+            _build_emit_key(task_data),
+            {"status": status, "message": task_data, "session_id": grievance_id, "event_id": event_id},
+            room=room,
+        )
+        return
+    task_name = task_data.get("task_name", "unknown")
+    await sio.emit(
+        webchat_task_event_name(task_name),
+        {
+            "status": status,
+            "data": task_data,
+            "grievance_id": grievance_id,
+            "flask_session_id": event.get("flask_session_id"),
+            "task_name": task_name,
+            "event_id": event_id,
+        },
+        room=room,
+    )
 
 
 def emit_status_update_accessible(session_id: str, status: str, message: Dict[str, Any]) -> None:
@@ -456,6 +456,11 @@ IMAGE_COMPRESS_MAX_LONG_EDGE = 1280
 IMAGE_COMPRESS_JPEG_QUALITY = 80
 IMAGE_COMPRESS_SKIP_MAX_LONG_EDGE = 1280
 IMAGE_COMPRESS_SKIP_MAX_BYTES = 500_000
+# Derived renditions written from the same decode: thumbnail (list views) + WebP copies.
+IMAGE_RENDITION_THUMB_LONG_EDGE = 400
+IMAGE_RENDITION_WEBP_QUALITY = 75
+# Images compressed at once across a batch (file worker host: never > 2, spec §6.5)
+IMAGE_COMPRESS_CONCURRENCY = 2
 
 ############################
 # FIELD CONFIGURATION
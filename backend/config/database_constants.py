@@ -1,122 +1,215 @@
 """
 Database constants loaded from database at startup.
 
-These constants are automatically loaded from the database when the module is first imported.
+These constants are automatically loaded when the module is first imported.
 They behave like regular Python constants but are sourced from the database.
+
+The last successful load is kept as a JSON snapshot (DATABASE_CONSTANTS_SNAPSHOT_PATH, default
+in the temp dir). When a fresh-enough snapshot exists, import reads it instead of querying
+the database and a background thread refreshes it. Refreshes update the dicts in place, so
+names imported with ``from ... import GRIEVANCE_STATUS`` see the new values.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+import json
 import logging
+import os
+import tempfile
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
 # Default timeline
 DEFAULT_TIMELINE_DAYS = 15
 
+SNAPSHOT_PATH = os.environ.get(
+    "DATABASE_CONSTANTS_SNAPSHOT_PATH",
+    os.path.join(tempfile.gettempdir(), "grm_database_constants.json"),
+)
+SNAPSHOT_MAX_AGE_SEC = int(os.environ.get("DATABASE_CONSTANTS_SNAPSHOT_MAX_AGE_SEC", "86400"))
+
 ############################
 # GLOBAL CONSTANTS (LOADED FROM DATABASE)
 ############################
 
-# These will be populated from the database on first import
-GRIEVANCE_STATUSES = {}
-TASK_STATUSES = {}
-PROCESSING_STATUSES = {}
-GRIEVANCE_CLASSIFICATION_STATUSES = {}
-FIELD_NAMES = {}
-TIMELINE_CACHE = {}
+# These will be populated on first import (and updated in place on refresh)
+GRIEVANCE_STATUSES: Dict[str, Any] = {}
+TASK_STATUSES: Dict[str, Any] = {}
+PROCESSING_STATUSES: Dict[str, Any] = {}
+GRIEVANCE_CLASSIFICATION_STATUSES: Dict[str, Any] = {}
+FIELD_NAMES: Dict[str, Any] = {}
+TIMELINE_CACHE: Dict[Any, Any] = {}
 
 # Status code mappings (derived from database)
-GRIEVANCE_STATUS_CODES = {}
-TASK_STATUS_CODES = {}
-PROCESSING_STATUS_CODES = {}
+GRIEVANCE_STATUS_CODES: Dict[str, str] = {}
+TASK_STATUS_CODES: Dict[str, str] = {}
+PROCESSING_STATUS_CODES: Dict[str, str] = {}
+
+############################
+# BACKWARDS COMPATIBILITY EXPORTS
+############################
+
+# Export old names for backwards compatibility with existing code
+# These map to the new database-loaded constants
+
+# Maps status_code to dict with keys like "name_en", "name_ne", "description_en", "description_ne"
+GRIEVANCE_STATUS_DICT: Dict[str, Dict[str, str]] = {}
+# {'STARTED': 'started', 'SUCCESS': 'SUCCESS', etc.}
+TASK_STATUS: Dict[str, str] = {}
+GRIEVANCE_STATUS = GRIEVANCE_STATUS_CODES  # Maps status codes to themselves
+GRIEVANCE_CLASSIFICATION_STATUS: Dict[str, str] = {}
+TRANSCRIPTION_PROCESSING_STATUS = PROCESSING_STATUS_CODES
 
 # Initialization flag
 _LOADED = False
+_refresh_thread: Optional[threading.Thread] = None
 
 ############################
 # INITIALIZATION FUNCTIONS
 ############################
 
-def _initialize_constants():
-    """Initialize constants from database - called automatically on first import"""
-    global GRIEVANCE_STATUSES, TASK_STATUSES, PROCESSING_STATUSES, GRIEVANCE_CLASSIFICATION_STATUSES, FIELD_NAMES, TIMELINE_CACHE
-    global GRIEVANCE_STATUS_CODES, TASK_STATUS_CODES, PROCESSING_STATUS_CODES, _LOADED
-    
-    if _LOADED:
-        return  # Already loaded
-    
-    try:
-        # Import here to avoid circular imports
-        from backend.services.database_services.postgres_services import DatabaseManager
-        
-        db_manager = DatabaseManager()
-        
-        # Load grievance statuses
-        grievance_statuses = db_manager.execute_query(
+def _replace(target: Dict, values: Dict) -> None:
+    """Swap contents in place without an empty window: readers on other threads
+    (background refresh) always see either the old or the new value for a live key."""
+    target.update(values)
+    for stale in [k for k in target if k not in values]:
+        target.pop(stale, None)
+
+def _apply_snapshot(snapshot: Dict[str, List[Dict[str, Any]]]) -> None:
+    """Fill every constant dict in place from table rows."""
+    grievance_statuses = snapshot["grievance_statuses"]
+    _replace(GRIEVANCE_STATUSES, {row['status_code']: row for row in grievance_statuses})
+    _replace(GRIEVANCE_STATUS_CODES, {row['status_code']: row['status_code'] for row in grievance_statuses})
+
+    task_statuses = snapshot["task_statuses"]
+    _replace(TASK_STATUSES, {row['task_status_code']: row for row in task_statuses})
+    _replace(TASK_STATUS_CODES, {row['task_status_code']: row['task_status_code'] for row in task_statuses})
+
+    processing_statuses = snapshot["processing_statuses"]
+    _replace(PROCESSING_STATUSES, {row['status_code']: row for row in processing_statuses})
+    _replace(PROCESSING_STATUS_CODES, {row['status_code']: row['status_code'] for row in processing_statuses})
+
+    _replace(GRIEVANCE_CLASSIFICATION_STATUSES, {row['code']: row for row in snapshot["grievance_classification_statuses"]})
+    _replace(FIELD_NAMES, {row['field_name']: row for row in snapshot["field_names"]})
+    _replace(TIMELINE_CACHE, {
+        (row['status_update_code'], row['grievance_high_priority'], row['sensitive_issues_detected']): row['timeline']
+        for row in snapshot["status_update_timeline"]
+    })
+
+    _replace(GRIEVANCE_STATUS_DICT, {
+        status_code: {
+            "name_en": data.get("status_name_en", ""),
+            "name_ne": data.get("status_name_ne", ""),
+            "description_en": data.get("description_en", ""),
+            "description_ne": data.get("description_ne", "")
+        }
+        for status_code, data in GRIEVANCE_STATUSES.items()
+    })
+    _replace(TASK_STATUS, get_task_status_codes())
+    _replace(GRIEVANCE_CLASSIFICATION_STATUS, {row['code']: row['code'] for row in GRIEVANCE_CLASSIFICATION_STATUSES.values()})
+
+def _query_snapshot() -> Dict[str, List[Dict[str, Any]]]:
+    """Read all constant tables from the database."""
+    # Import here to avoid circular imports
+    from backend.services.database_services.postgres_services import DatabaseManager
+
+    db_manager = DatabaseManager()
+    return {
+        "grievance_statuses": db_manager.execute_query(
             "SELECT * FROM grievance_statuses ORDER BY sort_order, status_code"
-        )
-        GRIEVANCE_STATUSES = {row['status_code']: row for row in grievance_statuses}
-        GRIEVANCE_STATUS_CODES = {row['status_code']: row['status_code'] for row in grievance_statuses}
-        
-        # Load task statuses
-        task_statuses = db_manager.execute_query(
+        ),
+        "task_statuses": db_manager.execute_query(
             "SELECT * FROM task_statuses ORDER BY task_status_code"
-        )
-        TASK_STATUSES = {row['task_status_code']: row for row in task_statuses}
-        TASK_STATUS_CODES = {row['task_status_code']: row['task_status_code'] for row in task_statuses}
-        
-        # Load processing statuses
-        processing_statuses = db_manager.execute_query(
+        ),
+        "processing_statuses": db_manager.execute_query(
             "SELECT * FROM processing_statuses ORDER BY status_code"
-        )
-        PROCESSING_STATUSES = {row['status_code']: row for row in processing_statuses}
-        PROCESSING_STATUS_CODES = {row['status_code']: row['status_code'] for row in processing_statuses}
-        
-        # Load grievance classification statuses
-        classification_statuses = db_manager.execute_query(
+        ),
+        "grievance_classification_statuses": db_manager.execute_query(
             "SELECT * FROM grievance_classification_statuses ORDER BY code"
-        )
-        GRIEVANCE_CLASSIFICATION_STATUSES = {row['code']: row for row in classification_statuses}
-        
-        # Load field names
-        field_names = db_manager.execute_query(
+        ),
+        "field_names": db_manager.execute_query(
             "SELECT * FROM field_names ORDER BY field_name"
-        )
-        FIELD_NAMES = {row['field_name']: row for row in field_names}
-        
-        # Load timeline cache
-        timeline_data = db_manager.execute_query(
+        ),
+        "status_update_timeline": db_manager.execute_query(
             "SELECT status_update_code, grievance_high_priority, sensitive_issues_detected, timeline FROM status_update_timeline"
-        )
-        TIMELINE_CACHE = {}
-        for row in timeline_data:
-            key = (row['status_update_code'], row['grievance_high_priority'], row['sensitive_issues_detected'])
-            TIMELINE_CACHE[key] = row['timeline']
-        
-        _LOADED = True
-        logger.info(f"Database constants loaded successfully:")
-        logger.info(f"  - Grievance statuses: {len(GRIEVANCE_STATUSES)}")
-        logger.info(f"  - Task statuses: {len(TASK_STATUSES)}")
-        logger.info(f"  - Processing statuses: {len(PROCESSING_STATUSES)}")
-        logger.info(f"  - Grievance classification statuses: {len(GRIEVANCE_CLASSIFICATION_STATUSES)}")
-        logger.info(f"  - Field names: {len(FIELD_NAMES)}")
-        logger.info(f"  - Timeline entries: {len(TIMELINE_CACHE)}")
-        
+        ),
+    }
+
+def _read_snapshot_file(max_age_sec: int = SNAPSHOT_MAX_AGE_SEC) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+    try:
+        if time.time() - os.path.getmtime(SNAPSHOT_PATH) > max_age_sec:
+            return None
+        with open(SNAPSHOT_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _write_snapshot_file(snapshot: Dict[str, List[Dict[str, Any]]]) -> None:
+    try:
+        directory = os.path.dirname(SNAPSHOT_PATH) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".database_constants_")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, default=str)
+        os.replace(tmp_path, SNAPSHOT_PATH)
+    except OSError as e:
+        logger.warning(f"Could not write database constants snapshot {SNAPSHOT_PATH}: {e}")
+
+def _load_from_database() -> None:
+    """Query the database, apply the result and persist it as the snapshot."""
+    snapshot = _query_snapshot()
+    _apply_snapshot(snapshot)
+    _write_snapshot_file(snapshot)
+    logger.info(f"Database constants loaded successfully:")
+    logger.info(f"  - Grievance statuses: {len(GRIEVANCE_STATUSES)}")
+    logger.info(f"  - Task statuses: {len(TASK_STATUSES)}")
+    logger.info(f"  - Processing statuses: {len(PROCESSING_STATUSES)}")
+    logger.info(f"  - Grievance classification statuses: {len(GRIEVANCE_CLASSIFICATION_STATUSES)}")
+    logger.info(f"  - Field names: {len(FIELD_NAMES)}")
+    logger.info(f"  - Timeline entries: {len(TIMELINE_CACHE)}")
+
+def _background_refresh() -> None:
+    try:
+        _load_from_database()
+    except Exception as e:
+        logger.warning(f"Background refresh of database constants failed (keeping snapshot): {e}")
+
+def _initialize_constants():
+    """Initialize constants - called automatically on first import"""
+    global _LOADED, _refresh_thread
+
+    if _LOADED:
+        return  # Already loaded
+
+    snapshot = _read_snapshot_file()
+    if snapshot is not None:
+        try:
+            _apply_snapshot(snapshot)
+            _LOADED = True
+            logger.info(f"Database constants loaded from snapshot {SNAPSHOT_PATH}; refreshing in background")
+            _refresh_thread = threading.Thread(
+                target=_background_refresh, name="database-constants-refresh", daemon=True
+            )
+            _refresh_thread.start()
+            return
+        except (KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable database constants snapshot: {e}")
+
+    try:
+        _load_from_database()
     except Exception as e:
         logger.error(f"Failed to load database constants: {str(e)}")
         # Set fallback values
         _set_fallback_values()
-        _LOADED = True
+    _LOADED = True
 
 def _set_fallback_values():
     """Set fallback values when database is unavailable"""
-    global GRIEVANCE_STATUSES, TASK_STATUSES, PROCESSING_STATUSES, GRIEVANCE_CLASSIFICATION_STATUSES, FIELD_NAMES, TIMELINE_CACHE
-    global GRIEVANCE_STATUS_CODES, TASK_STATUS_CODES, PROCESSING_STATUS_CODES
-    
     logger.warning("Using fallback values for database constants")
     
     # Fallback grievance statuses
-    GRIEVANCE_STATUSES = {
+    grievance_statuses = {
         "SUBMITTED": {"status_code": "SUBMITTED", "status_name_en": "Submitted", "status_name_ne": "जमा भएको"},
         "UNDER_EVALUATION": {"status_code": "UNDER_EVALUATION", "status_name_en": "Under Evaluation", "status_name_ne": "समीक्षा भइरहेको"},
         "ESCALATED": {"status_code": "ESCALATED", "status_name_en": "Escalated", "status_name_ne": "विस्तारित भएको"},
@@ -125,19 +218,17 @@ def _set_fallback_values():
         "DISPUTED": {"status_code": "DISPUTED", "status_name_en": "Disputed", "status_name_ne": "विरोध भएको"},
         "CLOSED": {"status_code": "CLOSED", "status_name_en": "Closed", "status_name_ne": "बन्द भएको"}
     }
-    GRIEVANCE_STATUS_CODES = {k: k for k in GRIEVANCE_STATUSES.keys()}
     
     # Fallback task statuses
-    TASK_STATUSES = {
+    task_statuses = {
         "started": {"task_status_code": "started", "task_status_name": "Started"},
         "SUCCESS": {"task_status_code": "SUCCESS", "task_status_name": "Success"},
         "failed": {"task_status_code": "failed", "task_status_name": "Failed"},
         "retrying": {"task_status_code": "retrying", "task_status_name": "Retrying"}
     }
-    TASK_STATUS_CODES = {k: k for k in TASK_STATUSES.keys()}
     
     # Fallback processing statuses
-    PROCESSING_STATUSES = {
+    processing_statuses = {
         "PROCESSING": {"status_code": "PROCESSING", "status_name": "Processing"},
         "COMPLETED": {"status_code": "COMPLETED", "status_name": "Completed"},
         "FAILED": {"status_code": "FAILED", "status_name": "Failed"},
@@ -146,14 +237,12 @@ def _set_fallback_values():
         "VERIFIED": {"status_code": "VERIFIED", "status_name": "Verified"},
         "VERIFIED_AND_AMENDED": {"status_code": "VERIFIED_AND_AMENDED", "status_name": "Verified and Amended"}
     }
-    PROCESSING_STATUS_CODES = {k: k for k in PROCESSING_STATUSES.keys()}
     
     # Fallback grievance classification statuses
     from backend.config.database_tables import GRIEVANCE_CLASSIFICATION_STATUS_SEED_DATA
-    GRIEVANCE_CLASSIFICATION_STATUSES = {row['code']: row for row in GRIEVANCE_CLASSIFICATION_STATUS_SEED_DATA}
     
     # Fallback field names
-    FIELD_NAMES = {
+    field_names = {
         "grievance_description": {"field_name": "grievance_description", "description": "Grievance details"},
         "complainant_full_name": {"field_name": "complainant_full_name", "description": "User full name"},
         "complainant_phone": {"field_name": "complainant_phone", "description": "User phone number"},
@@ -170,7 +259,7 @@ def _set_fallback_values():
     }
     
     # Fallback timeline cache
-    TIMELINE_CACHE = {
+    timeline = {
         ("SUBMITTED", False, False): 15,
         ("SUBMITTED", True, True): 15,
         ("UNDER_REVIEW", False, False): 15,
@@ -189,6 +278,23 @@ def _set_fallback_values():
         ("CLOSED", True, True): 15
     }
 
+    _apply_snapshot({
+        "grievance_statuses": list(grievance_statuses.values()),
+        "task_statuses": list(task_statuses.values()),
+        "processing_statuses": list(processing_statuses.values()),
+        "grievance_classification_statuses": list(GRIEVANCE_CLASSIFICATION_STATUS_SEED_DATA),
+        "field_names": list(field_names.values()),
+        "status_update_timeline": [
+            {
+                "status_update_code": code,
+                "grievance_high_priority": high_priority,
+                "sensitive_issues_detected": sensitive,
+                "timeline": days,
+            }
+            for (code, high_priority, sensitive), days in timeline.items()
+        ],
+    })
+
 ############################
 # ACCESS FUNCTIONS
 ############################
@@ -231,35 +337,16 @@ def get_field_name(field_name: str) -> Optional[Dict[str, Any]]:
     return FIELD_NAMES.get(field_name)
 
 def refresh_constants():
-    """Refresh all constants from the database."""
+    """Refresh all constants from the database (in place; falls back like the first load)."""
     global _LOADED
     _LOADED = False
-    _initialize_constants()
+    try:
+        _load_from_database()
+    except Exception as e:
+        logger.error(f"Failed to load database constants: {str(e)}")
+        if not GRIEVANCE_STATUSES:
+            _set_fallback_values()
+    _LOADED = True
 
 # Auto-initialize on import
 _initialize_constants()
-
-############################
-# BACKWARDS COMPATIBILITY EXPORTS
-############################
-
-# Export old names for backwards compatibility with existing code
-# These map to the new database-loaded constants
-
-# Create a backwards-compatible GRIEVANCE_STATUS_DICT
-# Maps status_code to dict with keys like "name_en", "name_ne", "description_en", "description_ne"
-GRIEVANCE_STATUS_DICT = {
-    status_code: {
-        "name_en": data.get("status_name_en", ""),
-        "name_ne": data.get("status_name_ne", ""),
-        "description_en": data.get("description_en", ""),
-        "description_ne": data.get("description_ne", "")
-    }
-    for status_code, data in GRIEVANCE_STATUSES.items()
-}
-
-# Legacy exports - these now point to database-loaded values
-TASK_STATUS = get_task_status_codes()  # Returns {'STARTED': 'started', 'SUCCESS': 'SUCCESS', etc.}
-GRIEVANCE_STATUS = GRIEVANCE_STATUS_CODES  # Maps status codes to themselves
-GRIEVANCE_CLASSIFICATION_STATUS = {row['code']: row['code'] for row in GRIEVANCE_CLASSIFICATION_STATUSES.values()}
-TRANSCRIPTION_PROCESSING_STATUS = PROCESSING_STATUS_CODES
@@ -3,15 +3,28 @@ Task logging functionality for the Nepal Chatbot Queue System.
 
 Logs append to a file per day (e.g. queue_system_2026-03-02.log). Each day gets
 a new file; within the day all sessions/restarts append to that day's file.
+
+By default (LOG_QUEUE=1) loggers hand records to a QueueHandler and one background
+QueueListener thread per process does the formatting-to-disk/console, so logging
+never blocks a request or task on file writes. LOG_FORMAT=json switches output to
+one JSON object per line. DEBUG records are sampled per call site
+(LOG_DEBUG_BURST per second) so per-row debug lines cannot flood the writer.
 """
 
+import atexit
 import logging
 import json
+import os
+import queue
+import threading
 import time
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
+from backend.logger.metrics import record_task_event
+
 class LoggingConfig:
     """Centralized logging configuration for the entire system"""
     
@@ -26,9 +39,12 @@ class LoggingConfig:
     # Format settings
     LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     LOG_LEVEL = 'INFO'
+    LOG_JSON = os.getenv('LOG_FORMAT', '').strip().lower() == 'json'
     
-    # Metrics configuration
-    METRICS_FILE = 'metrics.json'
+    # Background writer and debug sampling
+    LOG_QUEUE = os.getenv('LOG_QUEUE', '1').strip().lower() not in ('0', 'false', 'no')
+    DEBUG_SAMPLE_BURST = int(os.getenv('LOG_DEBUG_BURST', '20'))
+    DEBUG_SAMPLE_INTERVAL_SEC = 1.0
     
     # Default services to monitor (centralized service registry)
     # Base names only; date suffix is added when USE_DAILY_FILENAME is True
@@ -64,11 +80,6 @@ class LoggingConfig:
         else:
             filename = f'{base}.log'
         return log_dir / filename
-    
-    @classmethod
-    def get_metrics_path(cls) -> Path:
-        """Get the full metrics file path"""
-        return Path(cls.LOG_DIR) / cls.METRICS_FILE
 
 
 class DailyRotatingFileHandler(logging.FileHandler):
@@ -99,6 +110,142 @@ class DailyRotatingFileHandler(logging.FileHandler):
         super().emit(record)
 
 
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: ts, level, logger, message (+ exc_info)."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'process': record.process,
+        }
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exc_info'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def make_formatter(fmt: Optional[str] = None, datefmt: Optional[str] = None) -> logging.Formatter:
+    """Formatter for the configured output: JSON lines or the plain LOG_FORMAT text."""
+    if LoggingConfig.LOG_JSON:
+        return JsonFormatter()
+    return logging.Formatter(fmt or LoggingConfig.LOG_FORMAT, datefmt)
+
+
+class SampledDebugFilter(logging.Filter):
+    """
+    Let through at most `burst` DEBUG records per call site per `interval` seconds.
+    The first record of the next window notes how many were dropped.
+    """
+
+    def __init__(self, burst: int = LoggingConfig.DEBUG_SAMPLE_BURST,
+                 interval: float = LoggingConfig.DEBUG_SAMPLE_INTERVAL_SEC):
+        super().__init__()
+        self.burst = burst
+        self.interval = interval
+        self._sites: Dict[Tuple[str, int], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG:
+            return True
+        key = (record.pathname, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            site = self._sites.get(key)
+            if site is None or now - site[0] >= self.interval:
+                dropped = int(site[2]) if site else 0
+                self._sites[key] = [now, 1, 0]
+                if dropped and isinstance(record.msg, str):
+                    record.msg = f"{record.msg} [{dropped} similar debug lines dropped]"
+                return True
+            if site[1] < self.burst:
+                site[1] += 1
+                return True
+            site[2] += 1
+            return False
+
+
+class _RoutingQueueListener(QueueListener):
+    """Queue items are (handlers, record): each record goes to its own logger's handlers."""
+
+    def handle(self, item) -> None:
+        handlers, record = item
+        for handler in handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+class _QueueLogWriter:
+    """Single background writer thread per process; restarted lazily after fork (Celery prefork)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pid: Optional[int] = None
+        self._queue: Optional[queue.SimpleQueue] = None
+        self._listener: Optional[_RoutingQueueListener] = None
+
+    def queue(self) -> queue.SimpleQueue:
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._queue = queue.SimpleQueue()
+                    self._listener = _RoutingQueueListener(self._queue)
+                    self._listener.start()
+                    self._pid = os.getpid()
+        return self._queue
+
+    def stop(self) -> None:
+        """Drain pending records and stop the writer (registered with atexit)."""
+        if self._listener is not None and self._pid == os.getpid():
+            self._listener.stop()
+            self._pid = None
+
+
+_writer = _QueueLogWriter()
+atexit.register(_writer.stop)
+
+
+class _QueuedHandler(QueueHandler):
+    """Enqueues records for the background writer, which emits them to `target_handlers`."""
+
+    def __init__(self, target_handlers: List[logging.Handler]):
+        super().__init__(None)
+        self.target_handlers = tuple(target_handlers)
+        self.addFilter(SampledDebugFilter())
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Same-process queue: merge args now (they may change later) but skip the
+        # stock copy + pre-format; target handlers still format exc_info themselves.
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        _writer.queue().put_nowait((self.target_handlers, record))
+
+
+def install_queue_logging(logger: logging.Logger) -> logging.Logger:
+    """
+    Move a logger's handlers behind a queue so callers never wait on I/O.
+    No-op when LOG_QUEUE=0 or the logger is already queued.
+    """
+    if not LoggingConfig.LOG_QUEUE:
+        return logger
+    direct = [h for h in logger.handlers if not isinstance(h, (_QueuedHandler, QueueHandler))]
+    if not direct or any(isinstance(h, _QueuedHandler) for h in logger.handlers):
+        return logger
+    for handler in direct:
+        if LoggingConfig.LOG_JSON:
+            handler.setFormatter(JsonFormatter())
+        logger.removeHandler(handler)
+    logger.addHandler(_QueuedHandler(direct))
+    return logger
+
+
 class TaskLogger:
     """Centralized task logging functionality"""
     
@@ -111,7 +258,7 @@ class TaskLogger:
         """Set up the logger with file and console handlers. File: append, new file each day."""
         logger = logging.getLogger(self.service_name)
         if not logger.handlers:
-            formatter = logging.Formatter(self.config.LOG_FORMAT)
+            formatter = make_formatter(self.config.LOG_FORMAT)
 
             if self.config.USE_DAILY_FILENAME:
                 file_handler = DailyRotatingFileHandler(self.service_name, self.config)
@@ -128,6 +275,7 @@ class TaskLogger:
             logger.addHandler(file_handler)
             logger.addHandler(console_handler)
             logger.setLevel(getattr(logging, self.config.LOG_LEVEL))
+            install_queue_logging(logger)
         return logger
     
     def log_task_event(self, task_name: str, details: Optional[Dict[str, Any]] = None, service_name: str = None, event_type=None) -> None:
@@ -138,52 +286,9 @@ class TaskLogger:
         
         self.logger.info(log_message)
         if event_type:
-            # Record metrics if needed
-            if event_type == 'started':
-                self._record_metric(task_name, 'start_time', time.time())
-            elif event_type == 'completed':
-                start_time = self._get_metric(task_name, 'start_time', time.time())
-                duration = time.time() - start_time
-                self._record_metric(task_name, 'last_duration', duration)
-                self._record_metric(task_name, 'total_tasks', 
-                    self._get_metric(task_name, 'total_tasks', 0) + 1)
-            elif event_type == 'failed':
-                self._record_metric(task_name, 'failed_tasks', 
-                    self._get_metric(task_name, 'failed_tasks', 0) + 1)
-            elif event_type == 'retrying':
-                self._record_metric(task_name, 'retry_count', 
-                    self._get_metric(task_name, 'retry_count', 0) + 1)
-    
-    def _record_metric(self, task_name: str, metric_name: str, value: float):
-        """Record a metric for a task"""
-        metrics_file = self.config.get_metrics_path()
-        metrics = {}
-        if metrics_file.exists():
-            try:
-                with open(metrics_file, 'r') as f:
-                    metrics = json.load(f)
-            except json.JSONDecodeError:
-                pass
-        
-        if task_name not in metrics:
-            metrics[task_name] = {}
-        metrics[task_name][metric_name] = value
-        
-        with open(metrics_file, 'w') as f:
-            json.dump(metrics, f, indent=2)
-    
-    def _get_metric(self, task_name: str, metric_name: str, default: Any = None) -> Any:
-        """Get a metric value for a task"""
-        metrics_file = self.config.get_metrics_path()
-        if metrics_file.exists():
-            try:
-                with open(metrics_file, 'r') as f:
-                    metrics = json.load(f)
-                    return metrics.get(task_name, {}).get(metric_name, default)
-            except json.JSONDecodeError:
-                pass
-        return default 
-    
+            # Counters/histograms live in memory (see backend.logger.metrics); no file I/O here
+            record_task_event(task_name, event_type, service_name or self.service_name)
+
     def log_event(self, message: str, extra_data: Optional[Dict[str, Any]] = None, level: str = "info"):
         """General-purpose logging with consistent formatting."""
         log_message = f"Service: {self.service_name} - Message: {message}"
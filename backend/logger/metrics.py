@@ -0,0 +1,178 @@
+"""
+In-memory task metrics, exposed in Prometheus text format.
+
+Counters and a duration histogram per task name live in process memory, so
+recording an event is a dict/lock update with no file I/O. Celery prefork
+workers are separate processes: set PROMETHEUS_MULTIPROC_DIR (same directory
+for the workers and the API, emptied on deploy) and each process keeps its values
+in an mmap'd file that the /metrics endpoint aggregates. Without it, /metrics
+reports this process only.
+
+The directory may be shared by several containers (docker-compose mounts one
+volume into an API and its workers). prometheus_client names the files by PID,
+and every container has its own PID namespace, so files here are named by
+hostname and PID instead (process_identifier()).
+"""
+
+import os
+import socket
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    values,
+)
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+_HOSTNAME = socket.gethostname()
+
+
+def process_identifier(pid: Optional[int] = None) -> str:
+    """Name of a process's metric files: unique across containers sharing the directory."""
+    return f"{_HOSTNAME}-{pid or os.getpid()}"
+
+
+if os.environ.get(MULTIPROC_DIR_ENV):
+    # Metric values are created on first .labels(), so every series below uses this class
+    values.ValueClass = values.MultiProcessValue(process_identifier)
+
+# Task durations range from sub-second DB writes to multi-minute LLM/transcription jobs
+TASK_DURATION_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+
+TASKS_STARTED = Counter(
+    "grm_tasks_started_total", "Task executions started (including retries)", ["service", "task"]
+)
+TASKS_COMPLETED = Counter(
+    "grm_tasks_completed_total", "Task executions completed successfully", ["service", "task"]
+)
+TASKS_FAILED = Counter(
+    "grm_tasks_failed_total", "Task executions that failed", ["service", "task"]
+)
+TASKS_RETRIED = Counter(
+    "grm_tasks_retried_total", "Task retries scheduled", ["service", "task"]
+)
+TASK_DURATION = Histogram(
+    "grm_task_duration_seconds",
+    "Wall time from task start to completion or failure",
+    ["service", "task"],
+    buckets=TASK_DURATION_BUCKETS,
+)
+
+# Event types as passed by TaskManager (database task status codes) and older callers
+STARTED_EVENTS = frozenset({"started", "retry_started"})
+COMPLETED_EVENTS = frozenset({"completed", "success", "SUCCESS"})
+FAILED_EVENTS = frozenset({"failed", "FAILED"})
+RETRY_EVENTS = frozenset({"retrying", "RETRYING"})
+
+# Start times of running tasks, keyed by (task name, thread): a worker process or
+# thread runs one task at a time, so this pairs each start with its completion.
+_started_at: Dict[Tuple[str, int], float] = {}
+_started_lock = threading.Lock()
+
+
+def _running_key(task_name: str) -> Tuple[str, int]:
+    return (task_name, threading.get_ident())
+
+
+def record_task_event(
+    task_name: str,
+    event_type: str,
+    service: str = "queue_system",
+    duration: Optional[float] = None,
+) -> None:
+    """Record one task lifecycle event. Unknown event types are ignored."""
+    if event_type in STARTED_EVENTS:
+        TASKS_STARTED.labels(service, task_name).inc()
+        with _started_lock:
+            _started_at[_running_key(task_name)] = time.monotonic()
+        return
+
+    if event_type in RETRY_EVENTS:
+        TASKS_RETRIED.labels(service, task_name).inc()
+        return
+
+    if event_type in COMPLETED_EVENTS:
+        counter = TASKS_COMPLETED
+    elif event_type in FAILED_EVENTS:
+        counter = TASKS_FAILED
+    else:
+        return
+    counter.labels(service, task_name).inc()
+    with _started_lock:
+        started = _started_at.pop(_running_key(task_name), None)
+    if duration is None and started is not None:
+        duration = time.monotonic() - started
+    if duration is not None:
+        TASK_DURATION.labels(service, task_name).observe(duration)
+
+
+def metrics_registry() -> CollectorRegistry:
+    """Registry to export: all worker processes in multiprocess mode, else this process."""
+    if not os.environ.get(MULTIPROC_DIR_ENV):
+        return REGISTRY
+    from prometheus_client import multiprocess
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Prometheus exposition body and its content type."""
+    return generate_latest(metrics_registry()), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid: Optional[int] = None) -> None:
+    """Drop a finished worker's live values in multiprocess mode (call on child exit)."""
+    if not os.environ.get(MULTIPROC_DIR_ENV):
+        return
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(process_identifier(pid))
+
+
+def connect_celery_task_metrics(celery_app, service: str) -> None:
+    """Record start/success/failure/retry for every task of a Celery app via its signals."""
+    from celery import signals
+
+    def _task_name(sender=None, task=None):
+        return getattr(task or sender, "name", None) or str(task or sender)
+
+    def on_prerun(sender=None, task=None, **kwargs):
+        record_task_event(_task_name(sender, task), "started", service)
+
+    def on_success(sender=None, **kwargs):
+        record_task_event(_task_name(sender), "completed", service)
+
+    def on_failure(sender=None, **kwargs):
+        record_task_event(_task_name(sender), "failed", service)
+
+    def on_retry(sender=None, **kwargs):
+        record_task_event(_task_name(sender), "retrying", service)
+
+    # Signals are global; only count tasks that belong to this app
+    def _ours(handler):
+        def wrapped(sender=None, **kwargs):
+            task = kwargs.get("task") or sender
+            if getattr(task, "app", None) is celery_app:
+                handler(sender=sender, **kwargs)
+        return wrapped
+
+    for signal, handler in (
+        (signals.task_prerun, on_prerun),
+        (signals.task_success, on_success),
+        (signals.task_failure, on_failure),
+        (signals.task_retry, on_retry),
+    ):
+        signal.connect(_ours(handler), weak=False)
+    signals.worker_process_shutdown.connect(
+        lambda pid=None, **kwargs: mark_process_dead(pid), weak=False
+    )
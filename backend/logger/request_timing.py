@@ -0,0 +1,203 @@
+"""
+Opt-in per-request timing: wall time, DB time, SQL statement count and slowest statements.
+
+Enable with REQUEST_TIMING=1. RequestTimingMiddleware (pure ASGI, used by the backend and
+ticketing apps) opens a RequestStats for each HTTP request; DB layers call record_sql()
+(SQLAlchemy via instrument_sqlalchemy_engine, psycopg2 via BaseDatabaseManager's cursor).
+Responses get a Server-Timing header; requests slower than REQUEST_TIMING_SLOW_MS are
+logged with their slowest statements.
+
+With REQUEST_PROFILE_TOKEN set, a request carrying `?__profile=1` and header
+`X-Profile-Token: <token>` is sampled every REQUEST_PROFILE_INTERVAL_MS and answered with
+folded stacks (`frame;frame;frame count` lines, input for flamegraph.pl / speedscope)
+instead of the normal body.
+"""
+
+import heapq
+import hmac
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+REQUEST_TIMING_ENABLED = os.getenv("REQUEST_TIMING", "").strip().lower() in ("1", "true", "yes")
+SLOW_REQUEST_MS = float(os.getenv("REQUEST_TIMING_SLOW_MS", "500"))
+PROFILE_TOKEN = os.getenv("REQUEST_PROFILE_TOKEN", "")
+PROFILE_INTERVAL_MS = float(os.getenv("REQUEST_PROFILE_INTERVAL_MS", "5"))
+SLOWEST_STATEMENTS_KEPT = 5
+STATEMENT_PREVIEW_CHARS = 200
+
+
+@dataclass
+class RequestStats:
+    """Counters for one request; filled by record_sql() while the request's context is active."""
+
+    started: float = field(default_factory=time.perf_counter)
+    db_seconds: float = 0.0
+    statement_count: int = 0
+    # min-heap of (seconds, statement) keeping the slowest few
+    slowest: List[Tuple[float, str]] = field(default_factory=list)
+
+    def add_statement(self, statement: str, seconds: float) -> None:
+        self.db_seconds += seconds
+        self.statement_count += 1
+        entry = (seconds, " ".join(str(statement).split())[:STATEMENT_PREVIEW_CHARS])
+        if len(self.slowest) < SLOWEST_STATEMENTS_KEPT:
+            heapq.heappush(self.slowest, entry)
+        elif seconds > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, entry)
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def server_timing(self) -> str:
+        return (
+            f"app;dur={self.elapsed() * 1000:.1f}, "
+            f'db;dur={self.db_seconds * 1000:.1f};desc="{self.statement_count} queries"'
+        )
+
+    def slowest_statements(self) -> List[Tuple[float, str]]:
+        return sorted(self.slowest, reverse=True)
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def current_request_stats() -> Optional[RequestStats]:
+    return _current.get()
+
+
+def record_sql(statement: str, seconds: float) -> None:
+    """Attribute one executed statement to the current request, if it is being timed."""
+    stats = _current.get()
+    if stats is not None:
+        stats.add_statement(statement, seconds)
+
+
+def instrument_sqlalchemy_engine(engine) -> None:
+    """Time every cursor execute on `engine` into the current request's stats."""
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("request_timing_starts", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("request_timing_starts")
+        if starts:
+            record_sql(statement, time.perf_counter() - starts.pop())
+
+
+############################
+# SAMPLING PROFILER
+############################
+
+class _StackSampler:
+    """Samples the stacks of all other threads (event loop + threadpool) on a timer."""
+
+    def __init__(self, interval_sec: float):
+        self.interval_sec = interval_sec
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval_sec):
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                if stack:
+                    self.stacks[";".join(reversed(stack))] += 1
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def folded(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+def _profile_requested(scope) -> bool:
+    if not PROFILE_TOKEN or b"__profile=1" not in scope.get("query_string", b""):
+        return False
+    token = dict(scope.get("headers") or []).get(b"x-profile-token", b"").decode("latin-1")
+    return hmac.compare_digest(token, PROFILE_TOKEN)
+
+
+############################
+# ASGI MIDDLEWARE
+############################
+
+class RequestTimingMiddleware:
+    """ASGI middleware: per-request RequestStats, Server-Timing header, slow-request log, ?__profile=1."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        stats = RequestStats()
+        token = _current.set(stats)
+        try:
+            if _profile_requested(scope):
+                await self._profile(scope, receive, send)
+            else:
+                await self._timed(scope, receive, send, stats)
+        finally:
+            _current.reset(token)
+        if stats.elapsed() * 1000 >= SLOW_REQUEST_MS:
+            logger.warning(
+                "Slow request %s %s: %.0fms, db %.0fms in %d queries; slowest: %s",
+                scope.get("method"), scope.get("path"), stats.elapsed() * 1000,
+                stats.db_seconds * 1000, stats.statement_count,
+                [(round(s * 1000, 1), sql) for s, sql in stats.slowest_statements()],
+            )
+
+    async def _timed(self, scope, receive, send, stats: RequestStats):
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers") or [])
+                headers.append((b"server-timing", stats.server_timing().encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_timing)
+
+    async def _profile(self, scope, receive, send):
+        async def discard(message):
+            return None
+
+        with _StackSampler(PROFILE_INTERVAL_MS / 1000) as sampler:
+            await self.app(scope, receive, discard)
+        stats = _current.get()
+        body = sampler.folded().encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"text/plain; charset=utf-8"),
+                (b"content-length", str(len(body)).encode()),
+                (b"server-timing", stats.server_timing().encode("latin-1")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
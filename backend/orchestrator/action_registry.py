@@ -3,9 +3,12 @@ Action registry: invoke Rasa actions with adapters and parse events to slot upda
 """
 
 import asyncio
+import importlib
 import os
 import sys
-from typing import Any, Dict, List
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 # Ensure project root is on path (backend is at repo root)
 _REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -14,242 +17,161 @@ if _REPO_ROOT not in sys.path:
 
 from backend.orchestrator.adapters import CollectingDispatcher, SessionTracker
 
-# Action class mapping (lazy import to avoid circular deps and heavy startup)
-_ACTIONS: Dict[str, Any] = {}
-
-
-def _get_action(action_name: str) -> Any:
-    """Lazy-load action instances."""
-    if not _ACTIONS:
-        from backend.actions.generic_actions import (
-            ActionIntroduce,
-            ActionNextAction,
-            ActionSetEnglish,
-            ActionSetNepali,
-            ActionMainMenu,
-        )
-        from backend.actions.forms.form_grievance import (
-            ActionStartGrievanceProcess,
-            ActionAskGrievanceNewDetail,
-        )
-        from backend.actions.forms.form_road_hazard import (
-            ActionStartDustGrievanceProcess,
-            ActionStartRoadHazardGrievanceProcess,
-            ActionAskDustNewDetail,
-            ActionAskRoadHazardSubtype,
-            ActionAskRoadHazardNewDetail,
-        )
-        from backend.actions.action_map_location import (
-            ActionAskLocationMethod,
-            ActionAskMapLocation,
-            ActionApplyMapPin,
-            ActionOpenMapPicker,
-        )
-        from backend.actions.forms.form_seah_1 import (
-            ActionStartSeahIntake,
-            ActionAskFormSeah1SensitiveIssuesFollowUp,
-            ActionAskFormSeah1SeahVictimSurvivorRole,
-            ActionAskFormSeah1SeahWitnessVictimConsentToFile,
-            ActionAskFormSeah1SeahWitnessImmediateDanger,
-        )
-        from backend.actions.forms.form_seah_2 import (
-            ActionAskFormSeah2SeahProjectIdentification,
-            ActionAskFormSeah2SensitiveIssuesNewDetail,
-            ActionAskFormSeah2SeahContactConsentChannel,
-        )
-        from backend.actions.forms.form_seah_focal_point import (
-            ActionPrepareSeahFocalComplainantCapture,
-            ActionAskFormSeahFocalPoint1SeahFocalLearnedWhen,
-            ActionAskFormSeahFocalPoint1SeahFocalReporterConsentToReport,
-            ActionAskFormSeahFocalPoint1SensitiveIssuesFollowUp,
-            ActionAskFormSeahFocalPoint2SeahProjectIdentification,
-            ActionAskFormSeahFocalPoint2SeahFocalSurvivorRisks,
-            ActionAskFormSeahFocalPoint2SeahFocalMitigationMeasures,
-            ActionAskFormSeahFocalPoint2SeahFocalOtherAtRiskParties,
-            ActionAskFormSeahFocalPoint2SeahFocalProjectRisk,
-            ActionAskFormSeahFocalPoint2SeahFocalReputationalRisk,
-            ActionAskFormSeahFocalPoint2SensitiveIssuesNewDetail,
-            ActionAskFormSeahFocalPoint2SeahContactConsentChannel,
-            ActionAskFormSeahFocalPoint2SeahFocalReferredToSupport,
-            ActionOutroSensitiveIssues,
-        )
-        from backend.actions.action_outro import (
-            ActionSeahOutro,
-            ActionGrievanceOutro,
-            ActionStatusCheckRequestFollowUp,
-        )
-        from backend.actions.forms.form_modify_grievance import (
-            ActionAskModifyFollowUpAnswer,
-            ActionAskModifyGrievanceNewDetail,
-        )
-        from backend.actions.forms.form_modify_contact import (
-            ActionAskFormModifyContactComplainantPhone,
-            ActionAskModifyMissingField,
-        )
-        from backend.actions.forms.form_status_check import (
-            ActionStartStatusCheck,
-            ActionAskStatusCheckMethod,
-            ActionAskFormStatusCheck1ComplainantPhone,
-            ActionAskStatusCheckRetrieveGrievances,
-            ActionAskStatusCheckListGrievanceId,
-            ActionAskStatusCheckComplainantFullName,
-            ActionStatusCheckModifyGrievance,
-            ActionSkipStatusCheckOutro,
-            ActionAskStatusCheckGrievanceIdSelected,
-        )
-        from backend.actions.forms.form_otp import (
-            ActionAskOtpConsent,
-            ActionAskOtpInput,
-        )
-        from backend.actions.forms.form_status_check_skip import (
-            ActionAskValidProvinceAndDistrict,
-        )
-        from backend.actions.forms.form_grievance_complainant_review import (
-            ActionRetrieveClassificationResults,
-            ActionAskFormGrievanceComplainantReviewGrievanceClassificationConsent,
-            ActionAskFormGrievanceComplainantReviewGrievanceCategoriesStatus,
-            ActionAskFormGrievanceComplainantReviewGrievanceCatModify,
-            ActionAskFormGrievanceComplainantReviewGrievanceSummaryStatus,
-            ActionAskFormGrievanceComplainantReviewGrievanceSummaryTemp,
-            ActionAskFormGrievanceComplainantReviewGenderFollowUp,
-            ActionAskFormGrievanceComplainantReviewSensitiveIssuesFollowUp,
-            ActionUpdateGrievanceCategorization,
-        )
-        from backend.actions.action_submit_grievance import (
-            ActionSubmitGrievance,
-            ActionSubmitSeah,
-        )
-        from backend.actions.action_ask_commons import (
-            ActionAskStoryStep,
-            ActionAskStoryRoute,
-            ActionAskLanguageCode,
-            ActionAskStoryMain,
-            ActionAskComplainantLocationConsent,
-            ActionAskComplainantProvince,
-            ActionAskComplainantDistrict,
-            ActionAskComplainantMunicipalityTemp,
-            ActionAskComplainantMunicipalityConfirmed,
-            ActionAskComplainantVillageTemp,
-            ActionAskComplainantVillageConfirmed,
-            ActionAskComplainantWard,
-            ActionAskComplainantAddressTemp,
-            ActionAskComplainantAddressConfirmed,
-            ActionAskComplainantConsent,
-            ActionAskComplainantFullName,
-            ActionAskComplainantEmailTemp,
-            ActionAskComplainantEmailConfirmed,
-            ActionAskComplainantPhone,
-        )
-        # Intro/menu
-        _ACTIONS["action_introduce"] = ActionIntroduce()
-        _ACTIONS["action_next_action"] = ActionNextAction()
-        _ACTIONS["action_set_english"] = ActionSetEnglish()
-        _ACTIONS["action_set_nepali"] = ActionSetNepali()
-        _ACTIONS["action_main_menu"] = ActionMainMenu()
-
-        # Grievance
-        _ACTIONS["action_start_grievance_process"] = ActionStartGrievanceProcess()
-        _ACTIONS["action_start_dust_grievance_process"] = ActionStartDustGrievanceProcess()
-        _ACTIONS["action_start_road_hazard_grievance_process"] = (
-            ActionStartRoadHazardGrievanceProcess()
-        )
-        _ACTIONS["action_ask_grievance_new_detail"] = ActionAskGrievanceNewDetail()
-        _ACTIONS["action_ask_dust_new_detail"] = ActionAskDustNewDetail()
-        _ACTIONS["action_ask_road_hazard_subtype"] = ActionAskRoadHazardSubtype()
-        _ACTIONS["action_ask_road_hazard_new_detail"] = ActionAskRoadHazardNewDetail()
-        _ACTIONS["action_ask_location_method"] = ActionAskLocationMethod()
-        _ACTIONS["action_ask_map_location"] = ActionAskMapLocation()
-        _ACTIONS["action_open_map_picker"] = ActionOpenMapPicker()
-        _ACTIONS["action_apply_map_pin"] = ActionApplyMapPin()
-        _ACTIONS["action_submit_grievance"] = ActionSubmitGrievance()
-        _ACTIONS["action_submit_seah"] = ActionSubmitSeah()
+# Action name -> (module, class). Modules are imported and actions instantiated on first use
+# (or by warm_up_actions at startup), so one flow does not pay for every form module.
+_ACTION_FACTORIES: Dict[str, Tuple[str, str]] = {
+    # Intro/menu
+    "action_introduce": ("backend.actions.generic_actions", "ActionIntroduce"),
+    "action_next_action": ("backend.actions.generic_actions", "ActionNextAction"),
+    "action_set_english": ("backend.actions.generic_actions", "ActionSetEnglish"),
+    "action_set_nepali": ("backend.actions.generic_actions", "ActionSetNepali"),
+    "action_main_menu": ("backend.actions.generic_actions", "ActionMainMenu"),
+
+    # Grievance
+    "action_start_grievance_process": ("backend.actions.forms.form_grievance", "ActionStartGrievanceProcess"),
+    "action_start_dust_grievance_process": ("backend.actions.forms.form_road_hazard", "ActionStartDustGrievanceProcess"),
+    "action_start_road_hazard_grievance_process": ("backend.actions.forms.form_road_hazard", "ActionStartRoadHazardGrievanceProcess"),
+    "action_ask_grievance_new_detail": ("backend.actions.forms.form_grievance", "ActionAskGrievanceNewDetail"),
+    "action_ask_dust_new_detail": ("backend.actions.forms.form_road_hazard", "ActionAskDustNewDetail"),
+    "action_ask_road_hazard_subtype": ("backend.actions.forms.form_road_hazard", "ActionAskRoadHazardSubtype"),
+    "action_ask_road_hazard_new_detail": ("backend.actions.forms.form_road_hazard", "ActionAskRoadHazardNewDetail"),
+    "action_ask_location_method": ("backend.actions.action_map_location", "ActionAskLocationMethod"),
+    "action_ask_map_location": ("backend.actions.action_map_location", "ActionAskMapLocation"),
+    "action_open_map_picker": ("backend.actions.action_map_location", "ActionOpenMapPicker"),
+    "action_apply_map_pin": ("backend.actions.action_map_location", "ActionApplyMapPin"),
+    "action_submit_grievance": ("backend.actions.action_submit_grievance", "ActionSubmitGrievance"),
+    "action_submit_seah": ("backend.actions.action_submit_grievance", "ActionSubmitSeah"),
+
+    # SEAH forms
+    "action_start_seah_intake": ("backend.actions.forms.form_seah_1", "ActionStartSeahIntake"),
+    "action_ask_form_seah_1_sensitive_issues_follow_up": ("backend.actions.forms.form_seah_1", "ActionAskFormSeah1SensitiveIssuesFollowUp"),
+    "action_ask_form_seah_1_seah_victim_survivor_role": ("backend.actions.forms.form_seah_1", "ActionAskFormSeah1SeahVictimSurvivorRole"),
+    "action_ask_form_seah_1_seah_witness_victim_consent_to_file": ("backend.actions.forms.form_seah_1", "ActionAskFormSeah1SeahWitnessVictimConsentToFile"),
+    "action_ask_form_seah_1_seah_witness_immediate_danger": ("backend.actions.forms.form_seah_1", "ActionAskFormSeah1SeahWitnessImmediateDanger"),
+    "action_ask_form_seah_2_seah_project_identification": ("backend.actions.forms.form_seah_2", "ActionAskFormSeah2SeahProjectIdentification"),
+    "action_ask_form_seah_2_sensitive_issues_new_detail": ("backend.actions.forms.form_seah_2", "ActionAskFormSeah2SensitiveIssuesNewDetail"),
+    "action_ask_form_seah_2_seah_contact_consent_channel": ("backend.actions.forms.form_seah_2", "ActionAskFormSeah2SeahContactConsentChannel"),
+    "action_prepare_seah_focal_complainant_capture": ("backend.actions.forms.form_seah_focal_point", "ActionPrepareSeahFocalComplainantCapture"),
+    "action_ask_form_seah_focal_point_1_seah_focal_learned_when": ("backend.actions.forms.form_seah_focal_point", "ActionAskFormSeahFocalPoint1SeahFocalLearnedWhen"),
+    "action_ask_form_seah_focal_point_1_seah_focal_reporter_consent_to_report": ("backend.actions.forms.form_seah_focal_point", "ActionAskFormSeahFocalPoint1SeahFocalReporterConsentToReport"),
+    "action_ask_form_seah_focal_point_1_sensitive_issues_follow_up": ("backend.actions.forms.form_seah_focal_point", "ActionAskFormSeahFocalPoint1SensitiveIssuesFollowUp"),
+    "action_ask_form_seah_focal_point_2_seah_project_identification": ("backend.actions.forms.form_seah_focal_point", "ActionAskFormSeahFocalPoint2SeahProjectIdentification"),
+    "action_ask_form_seah_focal_point_2_seah_focal_survivor_risks": ("backend.actions.forms.form_seah_focal_point", "ActionAskFormSeahFocalPoint2SeahFocalSurvivorRisks"),
+    "action_ask_form_seah_focal_point_2_seah_focal_mitigation_measures": ("backend.actions.forms.form_seah_focal_point", "ActionAskFormSeahFocalPoint2SeahFocalMitigationMeasures"),
+    "action_ask_form_seah_focal_point_2_seah_focal_other_at_risk_parties": ("backend.actions.forms.form_seah_focal_point", "ActionAskFormSeahFocalPoint2SeahFocalOtherAtRiskParties"),
+    "action_ask_form_seah_focal_point_2_seah_focal_project_risk": ("backend.actions.forms.form_seah_focal_point", "ActionAskFormSeahFocalPoint2SeahFocalProjectRisk"),
+    "action_ask_form_seah_focal_point_2_seah_focal_reputational_risk": ("backend.actions.forms.form_seah_focal_point", "ActionAskFormSeahFocalPoint2SeahFocalReputationalRisk"),
+    "action_ask_form_seah_focal_point_2_sensitive_issues_new_detail": ("backend.actions.forms.form_seah_focal_point", "ActionAskFormSeahFocalPoint2SensitiveIssuesNewDetail"),
+    "action_ask_form_seah_focal_point_2_seah_contact_consent_channel": ("backend.actions.forms.form_seah_focal_point", "ActionAskFormSeahFocalPoint2SeahContactConsentChannel"),
+    "action_ask_form_seah_focal_point_2_seah_focal_referred_to_support": ("backend.actions.forms.form_seah_focal_point", "ActionAskFormSeahFocalPoint2SeahFocalReferredToSupport"),
+    "action_outro_sensitive_issues": ("backend.actions.forms.form_seah_focal_point", "ActionOutroSensitiveIssues"),
+    "action_seah_outro": ("backend.actions.action_outro", "ActionSeahOutro"),
+
+    # Status check
+    "action_start_status_check": ("backend.actions.forms.form_status_check", "ActionStartStatusCheck"),
+    "action_ask_status_check_method": ("backend.actions.forms.form_status_check", "ActionAskStatusCheckMethod"),
+    "action_ask_status_check_retrieve_grievances": ("backend.actions.forms.form_status_check", "ActionAskStatusCheckRetrieveGrievances"),
+    "action_ask_status_check_list_grievance_id": ("backend.actions.forms.form_status_check", "ActionAskStatusCheckListGrievanceId"),
+    "action_ask_status_check_complainant_full_name": ("backend.actions.forms.form_status_check", "ActionAskStatusCheckComplainantFullName"),
+    "action_status_check_request_follow_up": ("backend.actions.action_outro", "ActionStatusCheckRequestFollowUp"),
+    "action_status_check_modify_grievance": ("backend.actions.forms.form_status_check", "ActionStatusCheckModifyGrievance"),
+    "action_ask_modify_follow_up_answer": ("backend.actions.forms.form_modify_grievance", "ActionAskModifyFollowUpAnswer"),
+    "action_ask_modify_grievance_new_detail": ("backend.actions.forms.form_modify_grievance", "ActionAskModifyGrievanceNewDetail"),
+    "action_ask_form_modify_contact_complainant_phone": ("backend.actions.forms.form_modify_contact", "ActionAskFormModifyContactComplainantPhone"),
+    "action_ask_modify_missing_field": ("backend.actions.forms.form_modify_contact", "ActionAskModifyMissingField"),
+    "action_skip_status_check_outro": ("backend.actions.forms.form_status_check", "ActionSkipStatusCheckOutro"),
+    "action_ask_status_check_grievance_id_selected": ("backend.actions.forms.form_status_check", "ActionAskStatusCheckGrievanceIdSelected"),
+
+    # Flow/story common actions (status-check menus and language selection)
+    "action_ask_story_step": ("backend.actions.action_ask_commons", "ActionAskStoryStep"),
+    "action_ask_story_route": ("backend.actions.action_ask_commons", "ActionAskStoryRoute"),
+    "action_ask_language_code": ("backend.actions.action_ask_commons", "ActionAskLanguageCode"),
+    "action_ask_story_main": ("backend.actions.action_ask_commons", "ActionAskStoryMain"),
+
+    # Contact
+    "action_ask_complainant_location_consent": ("backend.actions.action_ask_commons", "ActionAskComplainantLocationConsent"),
+    "action_ask_complainant_province": ("backend.actions.action_ask_commons", "ActionAskComplainantProvince"),
+    "action_ask_complainant_district": ("backend.actions.action_ask_commons", "ActionAskComplainantDistrict"),
+    "action_ask_complainant_municipality_temp": ("backend.actions.action_ask_commons", "ActionAskComplainantMunicipalityTemp"),
+    "action_ask_complainant_municipality_confirmed": ("backend.actions.action_ask_commons", "ActionAskComplainantMunicipalityConfirmed"),
+    "action_ask_complainant_village_temp": ("backend.actions.action_ask_commons", "ActionAskComplainantVillageTemp"),
+    "action_ask_complainant_village_confirmed": ("backend.actions.action_ask_commons", "ActionAskComplainantVillageConfirmed"),
+    "action_ask_complainant_ward": ("backend.actions.action_ask_commons", "ActionAskComplainantWard"),
+    "action_ask_complainant_address_temp": ("backend.actions.action_ask_commons", "ActionAskComplainantAddressTemp"),
+    "action_ask_complainant_address_confirmed": ("backend.actions.action_ask_commons", "ActionAskComplainantAddressConfirmed"),
+    "action_ask_complainant_consent": ("backend.actions.action_ask_commons", "ActionAskComplainantConsent"),
+    "action_ask_complainant_full_name": ("backend.actions.action_ask_commons", "ActionAskComplainantFullName"),
+    "action_ask_complainant_email_temp": ("backend.actions.action_ask_commons", "ActionAskComplainantEmailTemp"),
+    "action_ask_complainant_email_confirmed": ("backend.actions.action_ask_commons", "ActionAskComplainantEmailConfirmed"),
+    "action_ask_complainant_phone": ("backend.actions.action_ask_commons", "ActionAskComplainantPhone"),
+    "action_ask_form_status_check_1_complainant_phone": ("backend.actions.forms.form_status_check", "ActionAskFormStatusCheck1ComplainantPhone"),
+
+    # OTP
+    "action_ask_otp_consent": ("backend.actions.forms.form_otp", "ActionAskOtpConsent"),
+    "action_ask_otp_input": ("backend.actions.forms.form_otp", "ActionAskOtpInput"),
+
+    # Status check skip (valid_province_and_district; complainant_* use shared contact actions)
+    "action_ask_form_status_check_skip_valid_province_and_district": ("backend.actions.forms.form_status_check_skip", "ActionAskValidProvinceAndDistrict"),
+    "action_ask_form_status_check_skip_complainant_district": ("backend.actions.action_ask_commons", "ActionAskComplainantDistrict"),
+    "action_ask_form_status_check_skip_complainant_municipality_temp": ("backend.actions.action_ask_commons", "ActionAskComplainantMunicipalityTemp"),
+    "action_ask_form_status_check_skip_complainant_municipality_confirmed": ("backend.actions.action_ask_commons", "ActionAskComplainantMunicipalityConfirmed"),
+
+    # Grievance review (retrieve classification from DB before showing review)
+    "action_retrieve_classification_results": ("backend.actions.forms.form_grievance_complainant_review", "ActionRetrieveClassificationResults"),
+    "action_ask_form_grievance_complainant_review_grievance_classification_consent": ("backend.actions.forms.form_grievance_complainant_review", "ActionAskFormGrievanceComplainantReviewGrievanceClassificationConsent"),
+    "action_ask_form_grievance_complainant_review_grievance_categories_status": ("backend.actions.forms.form_grievance_complainant_review", "ActionAskFormGrievanceComplainantReviewGrievanceCategoriesStatus"),
+    "action_ask_form_grievance_complainant_review_grievance_cat_modify": ("backend.actions.forms.form_grievance_complainant_review", "ActionAskFormGrievanceComplainantReviewGrievanceCatModify"),
+    "action_ask_form_grievance_complainant_review_grievance_summary_status": ("backend.actions.forms.form_grievance_complainant_review", "ActionAskFormGrievanceComplainantReviewGrievanceSummaryStatus"),
+    "action_ask_form_grievance_complainant_review_grievance_summary_temp": ("backend.actions.forms.form_grievance_complainant_review", "ActionAskFormGrievanceComplainantReviewGrievanceSummaryTemp"),
+    "action_ask_form_grievance_complainant_review_grievance_gender_follow_up": ("backend.actions.forms.form_grievance_complainant_review", "ActionAskFormGrievanceComplainantReviewGenderFollowUp"),
+    "action_ask_form_grievance_complainant_review_sensitive_issues_follow_up": ("backend.actions.forms.form_grievance_complainant_review", "ActionAskFormGrievanceComplainantReviewSensitiveIssuesFollowUp"),
+    "action_update_grievance_categorization": ("backend.actions.forms.form_grievance_complainant_review", "ActionUpdateGrievanceCategorization"),
+    "action_grievance_outro": ("backend.actions.action_outro", "ActionGrievanceOutro"),
+}
 
-        # SEAH forms
-        _ACTIONS["action_start_seah_intake"] = ActionStartSeahIntake()
-        _ACTIONS["action_ask_form_seah_1_sensitive_issues_follow_up"] = ActionAskFormSeah1SensitiveIssuesFollowUp()
-        _ACTIONS["action_ask_form_seah_1_seah_victim_survivor_role"] = ActionAskFormSeah1SeahVictimSurvivorRole()
-        _ACTIONS["action_ask_form_seah_1_seah_witness_victim_consent_to_file"] = ActionAskFormSeah1SeahWitnessVictimConsentToFile()
-        _ACTIONS["action_ask_form_seah_1_seah_witness_immediate_danger"] = ActionAskFormSeah1SeahWitnessImmediateDanger()
-        _ACTIONS["action_ask_form_seah_2_seah_project_identification"] = ActionAskFormSeah2SeahProjectIdentification()
-        _ACTIONS["action_ask_form_seah_2_sensitive_issues_new_detail"] = ActionAskFormSeah2SensitiveIssuesNewDetail()
-        _ACTIONS["action_ask_form_seah_2_seah_contact_consent_channel"] = ActionAskFormSeah2SeahContactConsentChannel()
-        _ACTIONS["action_prepare_seah_focal_complainant_capture"] = ActionPrepareSeahFocalComplainantCapture()
-        _ACTIONS["action_ask_form_seah_focal_point_1_seah_focal_learned_when"] = ActionAskFormSeahFocalPoint1SeahFocalLearnedWhen()
-        _ACTIONS["action_ask_form_seah_focal_point_1_seah_focal_reporter_consent_to_report"] = ActionAskFormSeahFocalPoint1SeahFocalReporterConsentToReport()
-        _ACTIONS["action_ask_form_seah_focal_point_1_sensitive_issues_follow_up"] = ActionAskFormSeahFocalPoint1SensitiveIssuesFollowUp()
-        _ACTIONS["action_ask_form_seah_focal_point_2_seah_project_identification"] = ActionAskFormSeahFocalPoint2SeahProjectIdentification()
-        _ACTIONS["action_ask_form_seah_focal_point_2_seah_focal_survivor_risks"] = ActionAskFormSeahFocalPoint2SeahFocalSurvivorRisks()
-        _ACTIONS["action_ask_form_seah_focal_point_2_seah_focal_mitigation_measures"] = ActionAskFormSeahFocalPoint2SeahFocalMitigationMeasures()
-        _ACTIONS["action_ask_form_seah_focal_point_2_seah_focal_other_at_risk_parties"] = ActionAskFormSeahFocalPoint2SeahFocalOtherAtRiskParties()
-        _ACTIONS["action_ask_form_seah_focal_point_2_seah_focal_project_risk"] = ActionAskFormSeahFocalPoint2SeahFocalProjectRisk()
-        _ACTIONS["action_ask_form_seah_focal_point_2_seah_focal_reputational_risk"] = ActionAskFormSeahFocalPoint2SeahFocalReputationalRisk()
-        _ACTIONS["action_ask_form_seah_focal_point_2_sensitive_issues_new_detail"] = ActionAskFormSeahFocalPoint2SensitiveIssuesNewDetail()
-        _ACTIONS["action_ask_form_seah_focal_point_2_seah_contact_consent_channel"] = ActionAskFormSeahFocalPoint2SeahContactConsentChannel()
-        _ACTIONS["action_ask_form_seah_focal_point_2_seah_focal_referred_to_support"] = ActionAskFormSeahFocalPoint2SeahFocalReferredToSupport()
-        _ACTIONS["action_outro_sensitive_issues"] = ActionOutroSensitiveIssues()
-        _ACTIONS["action_seah_outro"] = ActionSeahOutro()
-
-        # Status check
-        _ACTIONS["action_start_status_check"] = ActionStartStatusCheck()
-        _ACTIONS["action_ask_status_check_method"] = ActionAskStatusCheckMethod()
-        _ACTIONS["action_ask_status_check_retrieve_grievances"] = ActionAskStatusCheckRetrieveGrievances()
-        _ACTIONS["action_ask_status_check_list_grievance_id"] = ActionAskStatusCheckListGrievanceId()
-        _ACTIONS["action_ask_status_check_complainant_full_name"] = ActionAskStatusCheckComplainantFullName()
-        _ACTIONS["action_status_check_request_follow_up"] = ActionStatusCheckRequestFollowUp()
-        _ACTIONS["action_status_check_modify_grievance"] = ActionStatusCheckModifyGrievance()
-        _ACTIONS["action_ask_modify_follow_up_answer"] = ActionAskModifyFollowUpAnswer()
-        _ACTIONS["action_ask_modify_grievance_new_detail"] = ActionAskModifyGrievanceNewDetail()
-        _ACTIONS["action_ask_form_modify_contact_complainant_phone"] = ActionAskFormModifyContactComplainantPhone()
-        _ACTIONS["action_ask_modify_missing_field"] = ActionAskModifyMissingField()
-        _ACTIONS["action_skip_status_check_outro"] = ActionSkipStatusCheckOutro()
-        _ACTIONS["action_ask_status_check_grievance_id_selected"] = ActionAskStatusCheckGrievanceIdSelected()
+_ACTIONS: Dict[str, Any] = {}
+_ACTIONS_LOCK = threading.Lock()
 
-        # Flow/story common actions (status-check menus and language selection)
-        _ACTIONS["action_ask_story_step"] = ActionAskStoryStep()
-        _ACTIONS["action_ask_story_route"] = ActionAskStoryRoute()
-        _ACTIONS["action_ask_language_code"] = ActionAskLanguageCode()
-        _ACTIONS["action_ask_story_main"] = ActionAskStoryMain()
+# Optional callback(action_name, seconds) after each invoke_action (benchmarks)
+ActionTimingHook = Callable[[str, float], None]
+_action_timing_hook: Optional[ActionTimingHook] = None
 
-        # Contact
-        _ACTIONS["action_ask_complainant_location_consent"] = ActionAskComplainantLocationConsent()
-        _ACTIONS["action_ask_complainant_province"] = ActionAskComplainantProvince()
-        _ACTIONS["action_ask_complainant_district"] = ActionAskComplainantDistrict()
-        _ACTIONS["action_ask_complainant_municipality_temp"] = ActionAskComplainantMunicipalityTemp()
-        _ACTIONS["action_ask_complainant_municipality_confirmed"] = ActionAskComplainantMunicipalityConfirmed()
-        _ACTIONS["action_ask_complainant_village_temp"] = ActionAskComplainantVillageTemp()
-        _ACTIONS["action_ask_complainant_village_confirmed"] = ActionAskComplainantVillageConfirmed()
-        _ACTIONS["action_ask_complainant_ward"] = ActionAskComplainantWard()
-        _ACTIONS["action_ask_complainant_address_temp"] = ActionAskComplainantAddressTemp()
-        _ACTIONS["action_ask_complainant_address_confirmed"] = ActionAskComplainantAddressConfirmed()
-        _ACTIONS["action_ask_complainant_consent"] = ActionAskComplainantConsent()
-        _ACTIONS["action_ask_complainant_full_name"] = ActionAskComplainantFullName()
-        _ACTIONS["action_ask_complainant_email_temp"] = ActionAskComplainantEmailTemp()
-        _ACTIONS["action_ask_complainant_email_confirmed"] = ActionAskComplainantEmailConfirmed()
-        _ACTIONS["action_ask_complainant_phone"] = ActionAskComplainantPhone()
-        _ACTIONS["action_ask_form_status_check_1_complainant_phone"] = ActionAskFormStatusCheck1ComplainantPhone()
 
-        # OTP
-        _ACTIONS["action_ask_otp_consent"] = ActionAskOtpConsent()
-        _ACTIONS["action_ask_otp_input"] = ActionAskOtpInput()
+def set_action_timing_hook(hook: Optional[ActionTimingHook]) -> None:
+    """Call `hook(action_name, seconds)` after every invoked action (None to disable)."""
+    global _action_timing_hook
+    _action_timing_hook = hook
 
-        # Status check skip (valid_province_and_district; complainant_* use shared contact actions)
-        _ACTIONS["action_ask_form_status_check_skip_valid_province_and_district"] = ActionAskValidProvinceAndDistrict()
-        _ACTIONS["action_ask_form_status_check_skip_complainant_district"] = ActionAskComplainantDistrict()
-        _ACTIONS["action_ask_form_status_check_skip_complainant_municipality_temp"] = ActionAskComplainantMunicipalityTemp()
-        _ACTIONS["action_ask_form_status_check_skip_complainant_municipality_confirmed"] = ActionAskComplainantMunicipalityConfirmed()
 
-        # Grievance review (retrieve classification from DB before showing review)
-        _ACTIONS["action_retrieve_classification_results"] = ActionRetrieveClassificationResults()
-        _ACTIONS["action_ask_form_grievance_complainant_review_grievance_classification_consent"] = ActionAskFormGrievanceComplainantReviewGrievanceClassificationConsent()
-        _ACTIONS["action_ask_form_grievance_complainant_review_grievance_categories_status"] = ActionAskFormGrievanceComplainantReviewGrievanceCategoriesStatus()
-        _ACTIONS["action_ask_form_grievance_complainant_review_grievance_cat_modify"] = ActionAskFormGrievanceComplainantReviewGrievanceCatModify()
-        _ACTIONS["action_ask_form_grievance_complainant_review_grievance_summary_status"] = ActionAskFormGrievanceComplainantReviewGrievanceSummaryStatus()
-        _ACTIONS["action_ask_form_grievance_complainant_review_grievance_summary_temp"] = ActionAskFormGrievanceComplainantReviewGrievanceSummaryTemp()
-        _ACTIONS["action_ask_form_grievance_complainant_review_grievance_gender_follow_up"] = ActionAskFormGrievanceComplainantReviewGenderFollowUp()
-        _ACTIONS["action_ask_form_grievance_complainant_review_sensitive_issues_follow_up"] = ActionAskFormGrievanceComplainantReviewSensitiveIssuesFollowUp()
-        _ACTIONS["action_update_grievance_categorization"] = ActionUpdateGrievanceCategorization()
-        _ACTIONS["action_grievance_outro"] = ActionGrievanceOutro()
-    return _ACTIONS.get(action_name)
+def _get_action(action_name: str) -> Any:
+    """Return the action instance for `action_name`, creating it on first use."""
+    action = _ACTIONS.get(action_name)
+    if action is not None:
+        return action
+    factory = _ACTION_FACTORIES.get(action_name)
+    if factory is None:
+        return None
+    module_path, class_name = factory
+    with _ACTIONS_LOCK:
+        action = _ACTIONS.get(action_name)
+        if action is None:
+            action_cls = getattr(importlib.import_module(module_path), class_name)
+            action = _ACTIONS[action_name] = action_cls()
+    return action
+
+
+def warm_up_actions(action_names: Optional[Iterable[str]] = None) -> Dict[str, float]:
+    """Import and instantiate actions ahead of the first turn (all registered by default).
+
+    Returns seconds spent per module; the first action of a module carries its import time.
+    """
+    timings: Dict[str, float] = {}
+    for action_name in action_names if action_names is not None else _ACTION_FACTORIES:
+        module_path = _ACTION_FACTORIES[action_name][0]
+        started = time.perf_counter()
+        _get_action(action_name)
+        timings[module_path] = timings.get(module_path, 0.0) + time.perf_counter() - started
+    return timings
 
 
 def events_to_slot_updates(events: List[Any]) -> Dict[str, Any]:
@@ -280,4 +202,10 @@ async def invoke_action(
     action = _get_action(action_name)
     if not action:
         raise ValueError(f"Unknown action: {action_name}")
-    return await action.run(dispatcher, tracker, domain)
+    if _action_timing_hook is None:
+        return await action.run(dispatcher, tracker, domain)
+    started = time.perf_counter()
+    try:
+        return await action.run(dispatcher, tracker, domain)
+    finally:
+        _action_timing_hook(action_name, time.perf_counter() - started)
@@ -0,0 +1,13 @@
+"""
+Orchestrator load-test / benchmark harness.
+
+Replays recorded conversations (conversations/*.yaml) against POST /message or the
+Socket.IO bridge with N concurrent virtual users and reports turns/sec, p50/p95/p99
+turn latency and, in-process, time per state transition and per action. Results are
+written as JSON and can be compared against a previous run (e.g. the last release).
+
+    python -m backend.orchestrator.bench run --concurrency 8 --iterations 20 --out bench.json
+    python -m backend.orchestrator.bench compare baseline.json bench.json
+
+See README.md in this directory.
+"""
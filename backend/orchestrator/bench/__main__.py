@@ -0,0 +1,146 @@
+"""
+CLI for the orchestrator benchmark harness.
+
+    python -m backend.orchestrator.bench run [--target URL] [--transport http|socketio]
+        [--concurrency N] [--iterations N] [--conversation NAME ...] [--out FILE]
+        [--compare BASELINE --max-regression 0.15]
+    python -m backend.orchestrator.bench compare BASELINE CURRENT [--max-regression 0.15]
+    python -m backend.orchestrator.bench record
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from contextlib import ExitStack
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from backend.orchestrator.bench import runner  # noqa: E402
+
+
+def _run(args) -> int:
+    conversations = runner.load_conversations(args.conversation)
+    in_process = args.target is None
+
+    with ExitStack() as stack:
+        if args.target:
+            target = args.target
+        else:
+            if not args.real_services:
+                from backend.orchestrator.bench.standins import standins
+
+                stack.enter_context(standins())
+            runner.start_orchestrator_in_process()
+            target = stack.enter_context(runner.InProcessServer()).url
+
+        transport_cls = runner.SocketIOTransport if args.transport == "socketio" else runner.HttpTransport
+
+        collected = runner.RunStats()
+
+        def install_hooks():
+            # Transition/action timings are only visible when the orchestrator runs in this process
+            from backend.orchestrator import action_registry, state_machine
+
+            def on_transition(state, intent, next_state, seconds):
+                collected.transitions[f"{state} -> {next_state}"].append(seconds)
+
+            def on_action(action_name, seconds):
+                collected.actions[action_name].append(seconds)
+
+            state_machine.set_transition_timing_hook(on_transition)
+            action_registry.set_action_timing_hook(on_action)
+            stack.callback(state_machine.set_transition_timing_hook, None)
+            stack.callback(action_registry.set_action_timing_hook, None)
+
+        async def main():
+            transport = transport_cls(target)
+            try:
+                if args.warmup:
+                    await runner.replay_all(transport, conversations, concurrency=1, iterations=0,
+                                            warmup=args.warmup)
+                if in_process:
+                    install_hooks()
+                started = time.perf_counter()
+                stats = await runner.replay_all(
+                    transport, conversations, concurrency=args.concurrency,
+                    iterations=args.iterations, warmup=0,
+                )
+                return stats, time.perf_counter() - started
+            finally:
+                await transport.close()
+
+        stats, elapsed = asyncio.run(main())
+        stats.transitions, stats.actions = collected.transitions, collected.actions
+
+    results = runner.build_results(stats, elapsed, {
+        "transport": args.transport,
+        "target": args.target or ("in-process" if not args.real_services else "in-process (real services)"),
+        "concurrency": args.concurrency,
+        "iterations": args.iterations,
+        "conversations": list(conversations),
+    })
+    runner.print_results(results)
+    if args.out:
+        runner.write_results(results, args.out)
+        print(f"wrote {args.out}")
+    if args.compare:
+        regressions = runner.compare_results(runner.read_results(args.compare), results, args.max_regression)
+        if regressions:
+            return 1
+    return 1 if results["summary"]["errors"] else 0
+
+
+def _compare(args) -> int:
+    regressions = runner.compare_results(
+        runner.read_results(args.baseline), runner.read_results(args.current), args.max_regression
+    )
+    return 1 if regressions else 0
+
+
+def _record(args) -> int:
+    from backend.orchestrator.bench.record import record_all
+
+    for path in record_all(runner.CONVERSATIONS_DIR):
+        print(f"wrote {path}")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m backend.orchestrator.bench")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="replay conversations and report throughput/latency")
+    run.add_argument("--target", help="orchestrator base URL (default: start one in-process with stand-ins)")
+    run.add_argument("--real-services", action="store_true",
+                     help="in-process without stand-ins (uses the configured Postgres/LLM)")
+    run.add_argument("--transport", choices=("http", "socketio"), default="http")
+    run.add_argument("--concurrency", type=int, default=int(os.getenv("BENCH_CONCURRENCY", "4")))
+    run.add_argument("--iterations", type=int, default=int(os.getenv("BENCH_ITERATIONS", "10")),
+                     help="replays of each conversation")
+    run.add_argument("--warmup", type=int, default=1, help="unmeasured replays of each conversation first")
+    run.add_argument("--conversation", action="append", help="limit to these conversations (repeatable)")
+    run.add_argument("--out", help="write results JSON here")
+    run.add_argument("--compare", help="baseline results JSON to compare against")
+    run.add_argument("--max-regression", type=float, default=0.15)
+    run.set_defaults(func=_run)
+
+    compare = sub.add_parser("compare", help="compare two results files")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    compare.add_argument("--max-regression", type=float, default=0.15)
+    compare.set_defaults(func=_compare)
+
+    record = sub.add_parser("record", help="re-record conversations/*.yaml from the scripted test flows")
+    record.set_defaults(func=_record)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""
+Re-record conversations/*.yaml by driving the scripted end-to-end flows from
+tests/orchestrator/flow_helpers.py through a recording TestClient, with the stand-ins
+installed. Run after changing the flow so replays stop diverging:
+
+    python -m backend.orchestrator.bench record
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import yaml
+
+RECORDING_USER = "bench-recording"
+
+
+class RecordingClient:
+    """TestClient wrapper that keeps each POST /message body and the next_state it produced."""
+
+    def __init__(self, client):
+        self._client = client
+        self.turns: List[Dict[str, Any]] = []
+
+    def post(self, url, json=None, **kwargs):
+        response = self._client.post(url, json=json, **kwargs)
+        if url == "/message" and response.status_code == 200:
+            turn: Dict[str, Any] = {}
+            if json.get("text"):
+                turn["text"] = json["text"]
+            if json.get("payload") is not None:
+                turn["payload"] = json["payload"]
+            if json.get("metadata"):
+                turn["metadata"] = json["metadata"]
+            if not turn:
+                turn["text"] = ""
+            turn["expect_state"] = response.json().get("next_state")
+            self.turns.append(turn)
+        return response
+
+
+def _grievance_intake(client, user_id, h):
+    h.intro_english(client, user_id)
+    h.post_turn(client, user_id, payload="/new_grievance")
+    h.post_turn(client, user_id, text="Dust from the road construction is covering our crops every day.")
+    h.post_turn(client, user_id, text="The trucks also block the school road in the morning.")
+    body = h.post_turn(client, user_id, payload="/submit_details")
+    body = h.drive_until_filed_or_done(client, user_id, body)
+    h.complete_grievance_review(client, user_id, body)
+
+
+def _grievance_with_attachments(client, user_id, h):
+    h.intro_english(client, user_id)
+    h.post_turn(client, user_id, payload="/new_grievance")
+    h.post_turn(client, user_id, text="Drainage was blocked by the contractor and the field flooded.")
+    # The webchat syncs ids after an early file upload, then the complainant carries on
+    h.post_turn(client, user_id, payload="/attachment_ids_sync", metadata={
+        "attachment_sync": {"grievance_id": "GR-BENCH-ATT-001", "complainant_id": "CM-BENCH-ATT-001"},
+    })
+    body = h.post_turn(client, user_id, payload="/submit_details")
+    if body.get("next_state") == "location_consent":
+        h.accept_location_consent(client, user_id)
+        h.choose_location_map(client, user_id)
+        body = h.submit_map_pin(client, user_id)
+    body = h.drive_until_filed_or_done(client, user_id, body)
+    h.complete_grievance_review(client, user_id, body)
+
+
+def _seah_intake(client, user_id, h):
+    h.intro_english(client, user_id)
+    h.post_turn(client, user_id, payload="/seah_intake")
+    h.post_turn(client, user_id, payload="/victim_survivor")
+    body = h.post_turn(client, user_id, payload="/anonymous")
+    h.advance_seah_anonymous_victim_flow(client, user_id, body)
+
+
+def _status_check(client, user_id, h):
+    h.intro_english(client, user_id)
+    body = h.post_turn(client, user_id, payload="/check_status")
+    # Walk the first offered option a few steps (method choice, then its follow-up prompt)
+    for _ in range(3):
+        payloads = h.all_button_payloads(body)
+        if body.get("next_state") != "status_check_form" or not payloads:
+            break
+        body = h.post_turn(client, user_id, payload=payloads[0])
+
+
+FLOWS: Dict[str, Callable] = {
+    "grievance_intake": _grievance_intake,
+    "grievance_with_attachments": _grievance_with_attachments,
+    "seah_intake": _seah_intake,
+    "status_check": _status_check,
+}
+
+
+def record_all(out_dir: Path) -> List[Path]:
+    """Record every flow in FLOWS to out_dir/<name>.yaml; returns the written paths."""
+    from fastapi.testclient import TestClient
+
+    from backend.orchestrator.bench.standins import standins
+    from backend.orchestrator.main import app
+    from tests.orchestrator import flow_helpers
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written = []
+    with standins():
+        for name, flow in FLOWS.items():
+            client = RecordingClient(TestClient(app))
+            flow(client, f"{RECORDING_USER}-{name}", flow_helpers)
+            path = out_dir / f"{name}.yaml"
+            with path.open("w", encoding="utf-8") as f:
+                f.write(f"# Recorded by `python -m backend.orchestrator.bench record`; "
+                        f"{len(client.turns)} turns.\n")
+                yaml.safe_dump({"name": name, "turns": client.turns}, f, sort_keys=False, allow_unicode=True)
+            written.append(path)
+    return written
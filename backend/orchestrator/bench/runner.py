@@ -0,0 +1,381 @@
+"""
+Replay recorded conversations with N concurrent virtual users and collect latency stats.
+
+A conversation file (conversations/<name>.yaml) holds the turns of one recorded session:
+
+    name: grievance_intake
+    turns:
+      - {text: ""}
+      - {payload: /set_english, expect_state: main_menu}
+      - {text: "Dust from road construction", expect_state: form_grievance}
+
+Each virtual user replays whole conversations under its own user_id. A turn whose
+next_state differs from `expect_state` is counted as a divergence (the recording no
+longer matches the flow), which usually means the conversation should be re-recorded.
+"""
+
+import asyncio
+import json
+import math
+import os
+import platform
+import socket
+import subprocess
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import yaml
+
+CONVERSATIONS_DIR = Path(__file__).resolve().parent / "conversations"
+SOCKETIO_QUIET_SEC = 0.05
+TURN_TIMEOUT_SEC = 30.0
+
+
+def load_conversations(names: Optional[Sequence[str]] = None) -> Dict[str, Dict[str, Any]]:
+    """Load conversations/<name>.yaml (all of them when names is empty)."""
+    conversations = {}
+    for path in sorted(CONVERSATIONS_DIR.glob("*.yaml")):
+        with path.open(encoding="utf-8") as f:
+            data = yaml.safe_load(f) or {}
+        conversations[data.get("name") or path.stem] = data
+    if names:
+        missing = sorted(set(names) - set(conversations))
+        if missing:
+            raise SystemExit(f"unknown conversation(s): {', '.join(missing)}; have {', '.join(conversations)}")
+        conversations = {name: conversations[name] for name in names}
+    return conversations
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of samples (0 when empty)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def _timing_summary(samples: Sequence[float]) -> Dict[str, float]:
+    return {
+        "count": len(samples),
+        "total_ms": round(sum(samples) * 1000, 2),
+        "avg_ms": round(sum(samples) / len(samples) * 1000, 3) if samples else 0.0,
+        "p95_ms": round(percentile(samples, 95) * 1000, 3),
+    }
+
+
+@dataclass
+class RunStats:
+    turn_latencies: List[float] = field(default_factory=list)
+    by_conversation: Dict[str, List[float]] = field(default_factory=lambda: defaultdict(list))
+    errors: int = 0
+    divergences: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    conversations_completed: int = 0
+    transitions: Dict[str, List[float]] = field(default_factory=lambda: defaultdict(list))
+    actions: Dict[str, List[float]] = field(default_factory=lambda: defaultdict(list))
+
+    def add_turn(self, conversation: str, seconds: float) -> None:
+        self.turn_latencies.append(seconds)
+        self.by_conversation[conversation].append(seconds)
+
+
+############################
+# TRANSPORTS
+############################
+
+class HttpTransport:
+    """POST /message per turn; reports next_state for divergence checks.
+
+    Transports' send() returns (next_state or None, perf_counter time the turn finished).
+    """
+
+    def __init__(self, base_url: str):
+        import httpx
+
+        self._client = httpx.AsyncClient(base_url=base_url.rstrip("/"), timeout=TURN_TIMEOUT_SEC)
+
+    async def send(self, user_id: str, turn: Dict[str, Any]) -> Tuple[Optional[str], float]:
+        body: Dict[str, Any] = {"user_id": user_id, "text": turn.get("text") or ""}
+        if turn.get("payload") is not None:
+            body["payload"] = turn["payload"]
+        if turn.get("metadata"):
+            body["metadata"] = turn["metadata"]
+        response = await self._client.post("/message", json=body)
+        finished = time.perf_counter()
+        response.raise_for_status()
+        return response.json().get("next_state"), finished
+
+    async def end_conversation(self, user_id: str) -> None:
+        return None
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+class SocketIOTransport:
+    """
+    complainant_uttered per turn over the Socket.IO bridge (needs python-socketio's asyncio
+    client, i.e. aiohttp). The bridge sends no end-of-turn marker: a turn ends after the first
+    bot_uttered plus SOCKETIO_QUIET_SEC of silence, and the quiet period is not counted.
+    Turn metadata (map pins, attachment sync) is not carried by the bridge.
+    """
+
+    def __init__(self, base_url: str):
+        self._base_url = base_url.rstrip("/")
+        self._clients: Dict[str, Any] = {}
+
+    async def _client_for(self, user_id: str):
+        client = self._clients.get(user_id)
+        if client is None:
+            import socketio
+
+            client = socketio.AsyncClient()
+            client.bench_inbox = asyncio.Queue()
+
+            @client.on("bot_uttered")
+            async def _on_bot_uttered(data):
+                client.bench_inbox.put_nowait(time.perf_counter())
+
+            await client.connect(self._base_url, socketio_path="/socket.io", transports=["websocket"])
+            self._clients[user_id] = client
+        return client
+
+    async def send(self, user_id: str, turn: Dict[str, Any]) -> Tuple[Optional[str], float]:
+        client = await self._client_for(user_id)
+        message = turn.get("payload") or turn.get("text") or ""
+        await client.emit("complainant_uttered", {"message": message, "session_id": user_id})
+        # First reply bounds the latency; drain the rest of the turn's messages.
+        first = await asyncio.wait_for(client.bench_inbox.get(), TURN_TIMEOUT_SEC)
+        while True:
+            try:
+                await asyncio.wait_for(client.bench_inbox.get(), SOCKETIO_QUIET_SEC)
+            except asyncio.TimeoutError:
+                break
+        return None, first
+
+    async def end_conversation(self, user_id: str) -> None:
+        client = self._clients.pop(user_id, None)
+        if client is not None:
+            await client.disconnect()
+
+    async def close(self) -> None:
+        for user_id in list(self._clients):
+            await self.end_conversation(user_id)
+
+
+############################
+# REPLAY
+############################
+
+async def _replay(transport, name: str, conversation: Dict[str, Any], user_id: str,
+                  stats: Optional[RunStats]) -> None:
+    try:
+        for turn in conversation.get("turns") or []:
+            started = time.perf_counter()
+            next_state, finished = await transport.send(user_id, turn)
+            if stats is None:
+                continue
+            stats.add_turn(name, finished - started)
+            expected = turn.get("expect_state")
+            if expected and next_state and next_state != expected:
+                stats.divergences[name] += 1
+        if stats is not None:
+            stats.conversations_completed += 1
+    except Exception:
+        if stats is None:
+            raise
+        stats.errors += 1
+    finally:
+        await transport.end_conversation(user_id)
+
+
+async def replay_all(transport, conversations: Dict[str, Dict[str, Any]], *,
+                     concurrency: int, iterations: int, warmup: int = 1,
+                     run_id: str = "") -> RunStats:
+    """Warm up, then replay each conversation `iterations` times across `concurrency` workers."""
+    run_id = run_id or str(int(time.time()))
+    for n in range(warmup):
+        for name, conversation in conversations.items():
+            await _replay(transport, name, conversation, f"bench-warmup-{run_id}-{name}-{n}", None)
+
+    stats = RunStats()
+    jobs: asyncio.Queue = asyncio.Queue()
+    for n in range(iterations):
+        for name in conversations:
+            jobs.put_nowait((name, n))
+
+    async def worker(worker_id: int) -> None:
+        while True:
+            try:
+                name, n = jobs.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            user_id = f"bench-{run_id}-{name}-{worker_id}-{n}"
+            await _replay(transport, name, conversations[name], user_id, stats)
+
+    await asyncio.gather(*(worker(w) for w in range(concurrency)))
+    return stats
+
+
+############################
+# IN-PROCESS SERVER
+############################
+
+class InProcessServer:
+    """Serve backend.orchestrator.main:asgi with uvicorn on a free local port in a thread."""
+
+    def __init__(self):
+        import uvicorn
+
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            self.port = s.getsockname()[1]
+        config = uvicorn.Config(
+            "backend.orchestrator.main:asgi", host="127.0.0.1", port=self.port,
+            log_level="warning", lifespan="off",
+        )
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(target=self._server.run, name="bench-uvicorn", daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def __enter__(self):
+        self._thread.start()
+        deadline = time.monotonic() + 30
+        while not self._server.started:
+            if time.monotonic() > deadline or not self._thread.is_alive():
+                raise RuntimeError("in-process orchestrator did not start")
+            time.sleep(0.05)
+        return self
+
+    def __exit__(self, *exc):
+        self._server.should_exit = True
+        self._thread.join(timeout=10)
+
+
+def start_orchestrator_in_process() -> None:
+    """Run the app's startup (config, domain, state table, action warm-up) once."""
+    from backend.orchestrator import main
+
+    main.startup()
+
+
+############################
+# RESULTS
+############################
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=Path(__file__).resolve().parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def build_results(stats: RunStats, elapsed_sec: float, meta: Dict[str, Any]) -> Dict[str, Any]:
+    latencies = stats.turn_latencies
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "host": platform.node(),
+            "cpus": os.cpu_count(),
+            **meta,
+        },
+        "summary": {
+            "conversations": stats.conversations_completed,
+            "turns": len(latencies),
+            "errors": stats.errors,
+            "divergences": sum(stats.divergences.values()),
+            "elapsed_sec": round(elapsed_sec, 3),
+            "turns_per_sec": round(len(latencies) / elapsed_sec, 2) if elapsed_sec else 0.0,
+            "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+            "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+            "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        },
+        "conversations": {
+            name: {
+                "turns": len(samples),
+                "divergences": stats.divergences.get(name, 0),
+                "p50_ms": round(percentile(samples, 50) * 1000, 2),
+                "p95_ms": round(percentile(samples, 95) * 1000, 2),
+                "p99_ms": round(percentile(samples, 99) * 1000, 2),
+            }
+            for name, samples in sorted(stats.by_conversation.items())
+        },
+        "transitions": {k: _timing_summary(v) for k, v in sorted(stats.transitions.items())},
+        "actions": {k: _timing_summary(v) for k, v in sorted(stats.actions.items())},
+    }
+
+
+def print_results(results: Dict[str, Any], top: int = 15) -> None:
+    meta, summary = results["meta"], results["summary"]
+    print(
+        f"{meta.get('transport')} {meta.get('target')} @ {meta.get('commit')}: "
+        f"concurrency={meta.get('concurrency')} iterations={meta.get('iterations')}"
+    )
+    print(
+        f"{summary['turns']} turns / {summary['conversations']} conversations in {summary['elapsed_sec']}s: "
+        f"{summary['turns_per_sec']} turns/sec, p50 {summary['p50_ms']}ms, p95 {summary['p95_ms']}ms, "
+        f"p99 {summary['p99_ms']}ms, errors {summary['errors']}, divergences {summary['divergences']}"
+    )
+    for name, row in results["conversations"].items():
+        print(f"  {name:<24} turns={row['turns']:<6} p50={row['p50_ms']:<8} p95={row['p95_ms']:<8} "
+              f"p99={row['p99_ms']:<8} divergences={row['divergences']}")
+    for section in ("actions", "transitions"):
+        rows = sorted(results[section].items(), key=lambda kv: -kv[1]["total_ms"])[:top]
+        if rows:
+            print(f"slowest {section} (total ms):")
+            for name, row in rows:
+                print(f"  {row['total_ms']:>10.1f}  n={row['count']:<6} avg={row['avg_ms']:<8} {name}")
+
+
+# (metric path, higher is better)
+COMPARED_METRICS = (
+    (("summary", "turns_per_sec"), True),
+    (("summary", "p50_ms"), False),
+    (("summary", "p95_ms"), False),
+    (("summary", "p99_ms"), False),
+)
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any],
+                    max_regression: float) -> List[str]:
+    """Print metric deltas; return the metrics that regressed by more than max_regression."""
+    regressions = []
+    metrics = list(COMPARED_METRICS) + [
+        (("conversations", name, "p95_ms"), False)
+        for name in current.get("conversations", {}) if name in baseline.get("conversations", {})
+    ]
+    print(f"baseline {baseline['meta'].get('commit')} -> current {current['meta'].get('commit')}")
+    for path, higher_is_better in metrics:
+        old, new = baseline, current
+        for key in path:
+            old, new = old[key], new[key]
+        change = (new - old) / old if old else 0.0
+        regressed = (-change if higher_is_better else change) > max_regression
+        label = ".".join(path)
+        print(f"  {label:<40} {old:>10} -> {new:<10} {change:+.1%}{'  REGRESSION' if regressed else ''}")
+        if regressed:
+            regressions.append(label)
+    return regressions
+
+
+def write_results(results: Dict[str, Any], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+
+def read_results(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
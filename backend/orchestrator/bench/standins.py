@@ -0,0 +1,147 @@
+"""
+In-memory stand-ins for Postgres-backed grievance storage, the LLM calls and SMS, so the
+conversation path can be benchmarked without external services (same surface as the
+mock_flow_db fixture in tests/orchestrator/conftest.py).
+"""
+
+import importlib
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Tuple
+
+
+class InMemoryGrievanceStore:
+    """Holds what the patched DatabaseManager methods write; one per benchmark run."""
+
+    def __init__(self):
+        self.grievances: Dict[str, Dict[str, Any]] = {}
+        self.complainants: Dict[str, Dict[str, Any]] = {}
+        self.files: Dict[str, List[Dict[str, Any]]] = {}
+        # Written by the stub classifier like the Celery worker's results, so later grievance
+        # saves from the session do not wipe them
+        self.classifications: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def _gid(data):
+        return (data or {}).get("grievance_id") or "GR-BENCH-001"
+
+    def database_methods(self) -> Dict[str, Any]:
+        """DatabaseManager method name -> replacement (called with the manager as self)."""
+        store = self
+
+        def create_or_update_complainant(_self, data):
+            cid = (data or {}).get("complainant_id") or "CM-BENCH-001"
+            store.complainants[cid] = dict(data or {})
+            return cid
+
+        def create_or_update_grievance(_self, data):
+            gid = store._gid(data)
+            store.grievances[gid] = {**dict(data or {}), "grievance_id": gid}
+            return gid
+
+        def update_grievance(_self, grievance_id, data):
+            store.grievances.setdefault(grievance_id, {}).update(data or {})
+            return True
+
+        def submit_to_db(_self, data):
+            gid = store._gid(data)
+            store.grievances[gid] = {**dict(data or {}), "grievance_id": gid}
+            return {"ok": True, "grievance_id": gid, "complainant_id": data.get("complainant_id")}
+
+        def get_grievance_by_id(_self, grievance_id):
+            if grievance_id in store.grievances:
+                return {**store.grievances[grievance_id], **store.classifications.get(grievance_id, {})}
+            return {
+                "grievance_id": grievance_id,
+                "grievance_categories": ["ENVIRONMENT - Dust"],
+                "grievance_summary": "Benchmark summary",
+                "grievance_description": "Benchmark description",
+                "grievance_classification_status": "LLM_skipped",
+            }
+
+        return {
+            "create_or_update_complainant": create_or_update_complainant,
+            "create_or_update_grievance": create_or_update_grievance,
+            "update_grievance": update_grievance,
+            "submit_grievance_to_db": submit_to_db,
+            "submit_seah_to_db": submit_to_db,
+            "get_grievance_by_id": get_grievance_by_id,
+            "get_grievance_files": lambda _self, gid: store.files.get(gid, []),
+            "check_entry_exists_for_entity_key": lambda _self, *a, **k: False,
+            "find_seah_contact_point": lambda _self, *a, **k: None,
+        }
+
+    def stub_classification(self):
+        """Stub LLM: classifies instantly and stores the result the way the Celery worker would."""
+        store = self
+
+        async def classify(_form, tracker, dispatcher, **kwargs):
+            summary = (
+                kwargs.get("grievance_description")
+                or tracker.get_slot("grievance_description")
+                or "Benchmark grievance summary"
+            )
+            result = {
+                "grievance_categories": ["ENVIRONMENT - Other"],
+                "grievance_summary": summary,
+                "grievance_classification_status": "LLM_generated",
+            }
+            grievance_id = tracker.get_slot("grievance_id")
+            if grievance_id:
+                store.classifications[grievance_id] = result
+            return {**result, "grievance_summary_temp": summary}
+
+        return classify
+
+
+async def _stub_sensitive_check(form, full_description, session_id=None, grievance_id=None, dispatcher=None):
+    """No sensitive-content worker: skip the DB poll and use the keyword fallback directly."""
+    return form.detect_sensitive_content(dispatcher, full_description) or {"grievance_sensitive_issue": False}
+
+
+def _resolve(dotted: str) -> Tuple[Any, str]:
+    module_path, attr = dotted.rsplit(".", 1)
+    return importlib.import_module(module_path), attr
+
+
+@contextmanager
+def standins() -> Iterator[InMemoryGrievanceStore]:
+    """Patch DB, LLM classification, sensitive-issue check, SMS/email, ticket dispatch and geocoding."""
+    from backend.services.database_services.postgres_services import DatabaseManager
+    from backend.services.messaging import Messaging
+
+    store = InMemoryGrievanceStore()
+    patches: List[Tuple[Any, str, Any]] = [
+        (DatabaseManager, name, fn) for name, fn in store.database_methods().items()
+    ]
+    patches.append((Messaging, "send_sms", lambda *a, **k: True))
+    classify = store.stub_classification()
+    for dotted, replacement in (
+        ("backend.actions.grievance_intake.classification.trigger_async_classification", classify),
+        ("backend.actions.forms.intake_submit.trigger_async_classification", classify),
+        ("backend.actions.grievance_intake.sensitive.get_sensitive_issue_slots_on_submit", _stub_sensitive_check),
+        ("backend.actions.forms.intake_submit.get_sensitive_issue_slots_on_submit", _stub_sensitive_check),
+        ("backend.actions.grievance_intake.voice_record.get_sensitive_issue_slots_on_submit", _stub_sensitive_check),
+        ("backend.actions.grievance_intake.sensitive.trigger_detect_sensitive_content_task", lambda *a, **k: None),
+        ("backend.clients.messaging_api.send_sms", lambda *a, **k: {"status": "SUCCESS"}),
+        ("backend.clients.messaging_api.send_email", lambda *a, **k: {"status": "SUCCESS"}),
+        ("backend.actions.utils.ticketing_dispatch.dispatch_ticket", lambda *a, **k: None),
+        ("backend.shared_functions.location_mapping.resolve_pin_to_location_code", lambda *a, **k: "P1_JHA"),
+        (
+            "backend.shared_functions.location_mapping.resolve_location_code_to_names",
+            lambda *a, **k: {"province_name": "Koshi", "district_name": "Jhapa"},
+        ),
+    ):
+        owner, attr = _resolve(dotted)
+        patches.append((owner, attr, replacement))
+
+    originals = [(owner, attr, owner.__dict__.get(attr)) for owner, attr, _ in patches]
+    try:
+        for owner, attr, replacement in patches:
+            setattr(owner, attr, replacement)
+        yield store
+    finally:
+        for owner, attr, original in reversed(originals):
+            if original is None:
+                delattr(owner, attr)
+            else:
+                setattr(owner, attr, original)
@@ -5,6 +5,7 @@ Orchestrator FastAPI app: POST /message, GET /health.
 import logging
 import os
 import sys
+import time
 from pathlib import Path
 
 _REPO_ROOT = Path(__file__).resolve().parents[2]
@@ -20,6 +21,9 @@ def _configure_orchestrator_logging() -> None:
         datefmt="%Y-%m-%d %H:%M:%S",
         force=True,
     )
+    from backend.logger.logger import install_queue_logging
+
+    install_queue_logging(logging.getLogger())
     for name in ("botocore", "boto3", "urllib3", "s3transfer"):
         logging.getLogger(name).setLevel(logging.WARNING)
     # Application loggers: keep DEBUG for form flow and actions (set via LOG_LEVEL if desired)
@@ -51,7 +55,8 @@ from starlette.routing import Mount
 
 from backend.orchestrator.paths import DOMAIN_YAML_PATH
 from backend.orchestrator.session_store import get_session, save_session, create_session
-from backend.orchestrator.state_machine import run_flow_turn
+from backend.orchestrator.action_registry import warm_up_actions
+from backend.orchestrator.state_machine import compile_state_table, run_flow_turn
 from backend.orchestrator.config_loader import load_config
 from backend.orchestrator.socket_server import socket_app
 
@@ -76,6 +81,25 @@ def startup() -> None:
     global _CONFIG, _DOMAIN
     _CONFIG = load_config()
     _DOMAIN = _load_domain()
+    compile_state_table(_CONFIG.get("flow"))
+    warm = os.environ.get("ORCHESTRATOR_WARM_UP", "1").strip().lower()
+    if warm not in ("0", "false", "no"):
+        # Import form modules and build actions now so the first user turn does not pay for it.
+        started = time.perf_counter()
+        timings = warm_up_actions()
+        print(
+            f"Orchestrator: warmed {len(timings)} action modules in "
+            f"{time.perf_counter() - started:.2f}s (ORCHESTRATOR_WARM_UP=0 to skip)."
+        )
+    gazetteer = os.environ.get("LOCATION_GAZETTEER", "1").strip().lower()
+    if gazetteer not in ("0", "false", "no"):
+        # Location names resolve from an in-process snapshot instead of per-level queries each turn.
+        from backend.services.database_services.postgres_services import db_manager
+        from backend.shared_functions.gazetteer import start_gazetteer
+
+        snapshot = start_gazetteer(db_manager)
+        if snapshot is not None:
+            print(f"Orchestrator: gazetteer loaded {len(snapshot)} locations (LOCATION_GAZETTEER=0 to skip).")
     cel = os.environ.get("ENABLE_CELERY_CLASSIFICATION", "").strip().lower()
     if cel in ("1", "true", "yes"):
         print("Orchestrator: ENABLE_CELERY_CLASSIFICATION=1 — grievance LLM classification will run via Celery when user clicks 'File as is'.")
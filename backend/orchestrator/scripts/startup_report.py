@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Report orchestrator cold-start cost: slowest imports of backend.orchestrator.main
+(from `python -X importtime`) and the time to warm up the lazy action registry.
+
+Exits 1 when --budget-ms is given and the import + warm-up total exceeds it.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, _REPO_ROOT)
+
+TARGET_MODULE = "backend.orchestrator.main"
+
+
+def parse_importtime(stderr: str):
+    """Return [(cumulative_us, self_us, module)] from `-X importtime` output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue
+        rows.append((cumulative_us, self_us, parts[2].rstrip()))
+    return rows
+
+
+def measure_imports():
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [_REPO_ROOT, env.get("PYTHONPATH")]))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {TARGET_MODULE}"],
+        cwd=_REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        tail = "\n".join(proc.stderr.splitlines()[-20:])
+        raise SystemExit(f"import {TARGET_MODULE} failed:\n{tail}")
+    return parse_importtime(proc.stderr)
+
+
+def measure_warm_up():
+    from backend.orchestrator.action_registry import warm_up_actions
+
+    started = time.perf_counter()
+    timings = warm_up_actions()
+    return time.perf_counter() - started, timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--top", type=int, default=25, help="number of imports to list (default 25)")
+    parser.add_argument("--budget-ms", type=float, default=None, help="fail if import + warm-up exceeds this")
+    args = parser.parse_args()
+
+    rows = measure_imports()
+    import_us = next((cum for cum, _, name in rows if name.strip() == TARGET_MODULE), 0)
+    print(f"import {TARGET_MODULE}: {import_us / 1000:.0f} ms")
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for cumulative_us, self_us, name in sorted(rows, reverse=True)[: args.top]:
+        print(f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>9.1f}  {name}")
+
+    warm_seconds, timings = measure_warm_up()
+    print(f"\nwarm_up_actions: {len(timings)} modules in {warm_seconds * 1000:.0f} ms")
+    for module, seconds in sorted(timings.items(), key=lambda kv: -kv[1])[: args.top]:
+        print(f"{seconds * 1000:>14.1f}  {module}")
+
+    total_ms = import_us / 1000 + warm_seconds * 1000
+    print(f"\ntotal: {total_ms:.0f} ms")
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(f"over budget ({args.budget_ms:.0f} ms)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""Content-addressed storage for grievance attachments.
+
+Uploads are keyed by the SHA-256 of the bytes the client sent. The processed file (compressed
+image, audio as-is) is stored once under ``<upload_folder>/blobs/<aa>/<sha256><ext>`` and every
+``file_attachments`` row with the same hash points at it; ``attachment_blobs`` keeps the
+reference count and the cached processing results.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+
+BLOB_DIRNAME = "blobs"
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(file_path: str) -> str:
+    """SHA-256 hex digest of a file, read in bounded chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def blob_path_for(upload_folder: str, content_sha256: str, ext: str = "") -> str:
+    """Blob location for a hash; fanned out by the first two hex chars."""
+    return os.path.join(upload_folder, BLOB_DIRNAME, content_sha256[:2], f"{content_sha256}{ext.lower()}")
+
+
+def adopt_into_store(src_path: str, blob_path: str) -> str:
+    """Move a processed upload into its blob slot and return the blob path.
+
+    If the slot is already filled (same content stored earlier), the new copy is dropped.
+    """
+    if os.path.abspath(src_path) == os.path.abspath(blob_path):
+        return blob_path
+    if os.path.isfile(blob_path):
+        discard_duplicate(src_path, blob_path)
+        return blob_path
+    os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+    os.replace(src_path, blob_path)
+    return blob_path
+
+
+def discard_duplicate(src_path: str, blob_path: str) -> None:
+    """Remove an uploaded copy whose content already lives at `blob_path`."""
+    if src_path and os.path.abspath(src_path) != os.path.abspath(blob_path) and os.path.exists(src_path):
+        try:
+            os.remove(src_path)
+        except OSError:
+            pass
+
+
+def stored_file_name(file_name: str, blob_path: str) -> str:
+    """Keep the client's file name but use the stored extension (e.g. .png compressed to .jpg)."""
+    stem, ext = os.path.splitext(file_name)
+    blob_ext = os.path.splitext(blob_path)[1]
+    if blob_ext and blob_ext.lower() != ext.lower():
+        return f"{stem}{blob_ext}"
+    return file_name
@@ -0,0 +1,506 @@
+"""
+Async access path for the FastAPI routers (grievance, files, voice).
+
+The psycopg2 managers are synchronous: an ``async def`` endpoint that calls them directly
+holds the event loop for the whole query, so one slow statement stalls every request on
+that worker. The routers use the managers below instead:
+
+- ThreadedAsyncDbManager: awaitable wrapper that runs the existing sync managers on the
+  threadpool. Same SQL, same connection-per-query behaviour; it only frees the loop.
+- AsyncpgDbManager: native asyncpg implementation of the core router reads/writes over
+  its own pool (AsyncDbPool), so many queries can be in flight per process without a
+  thread each. Anything it does not implement natively falls through to the threadpool.
+
+Which one a router gets is chosen per router with DB_ASYNC_ROUTERS (comma-separated
+router names, or "all"). Routers not listed — or every router when asyncpg is not
+installed — use the threaded path. Results keep the sync managers' shape (dict rows,
+JSON text parsed, uuids as str) and their error contract (log, return None / [] / False).
+
+See docs/services/10_database_service.md §6.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, FrozenSet, List, Optional
+
+from backend.config.constants import DB_CONFIG
+from backend.logger.logger import TaskLogger
+from backend.logger.request_timing import record_sql
+
+try:
+    import asyncpg
+except ImportError:  # optional: without it every router stays on the threaded path
+    asyncpg = None
+
+logger = TaskLogger(service_name="db_manager").logger
+
+ALL_ROUTERS = "all"
+
+_GRIEVANCE_UPDATE_FIELDS = (
+    "grievance_categories", "grievance_categories_alternative", "grievance_summary",
+    "grievance_description", "grievance_claimed_amount", "grievance_location", "language_code",
+    "follow_up_question", "grievance_sensitive_issue", "grievance_high_priority",
+    "grievance_timeline", "grievance_classification_status", "case_sensitivity",
+    "vault_payload_ref", "vault_last_updated_at",
+)
+
+
+@dataclass(frozen=True)
+class AsyncDbConfig:
+    routers: FrozenSet[str]
+    pool_min_size: int
+    pool_max_size: int
+    command_timeout: float
+    statement_cache_size: int
+
+    def enabled_for(self, router: str) -> bool:
+        return ALL_ROUTERS in self.routers or router in self.routers
+
+
+def resolve_async_db_config() -> AsyncDbConfig:
+    """Read the DB_ASYNC_* environment (see module docstring)."""
+    routers = frozenset(
+        r.strip().lower() for r in os.getenv("DB_ASYNC_ROUTERS", "").split(",") if r.strip()
+    )
+    min_size = max(0, int(os.getenv("DB_ASYNC_POOL_MIN_SIZE", "1")))
+    return AsyncDbConfig(
+        routers=routers,
+        pool_min_size=min_size,
+        pool_max_size=max(1, min_size, int(os.getenv("DB_ASYNC_POOL_MAX_SIZE", "10"))),
+        command_timeout=float(os.getenv("DB_ASYNC_COMMAND_TIMEOUT", "30")),
+        # 0 when the database sits behind pgbouncer in transaction mode
+        statement_cache_size=max(0, int(os.getenv("DB_ASYNC_STATEMENT_CACHE_SIZE", "100"))),
+    )
+
+
+def asyncpg_available() -> bool:
+    return asyncpg is not None
+
+
+class AsyncDbPool:
+    """Lazily created asyncpg pool, one per event loop (pools cannot cross loops)."""
+
+    def __init__(self, config: Optional[AsyncDbConfig] = None, db_params: Optional[Dict[str, Any]] = None):
+        if asyncpg is None:
+            raise RuntimeError("asyncpg is not installed")
+        self.config = config or resolve_async_db_config()
+        self.db_params = dict(db_params or DB_CONFIG)
+        self._pools: Dict[asyncio.AbstractEventLoop, Any] = {}
+        self._locks: Dict[asyncio.AbstractEventLoop, asyncio.Lock] = {}
+
+    async def _init_connection(self, conn) -> None:
+        # Match psycopg2: json/jsonb come back parsed, uuids as str. Strings are sent to
+        # json columns as-is because the managers already store pre-serialised JSON text.
+        for typename in ("json", "jsonb"):
+            await conn.set_type_codec(
+                typename,
+                schema="pg_catalog",
+                encoder=lambda v: v if isinstance(v, str) else json.dumps(v, default=str),
+                decoder=json.loads,
+            )
+        await conn.set_type_codec("uuid", schema="pg_catalog", encoder=str, decoder=str, format="text")
+
+    async def get_pool(self):
+        loop = asyncio.get_running_loop()
+        pool = self._pools.get(loop)
+        if pool is not None:
+            return pool
+        lock = self._locks.setdefault(loop, asyncio.Lock())
+        async with lock:
+            pool = self._pools.get(loop)
+            if pool is None:
+                pool = await asyncpg.create_pool(
+                    host=self.db_params.get("host"),
+                    port=int(self.db_params.get("port") or 5432),
+                    database=self.db_params.get("database"),
+                    user=self.db_params.get("user"),
+                    password=self.db_params.get("password"),
+                    min_size=self.config.pool_min_size,
+                    max_size=self.config.pool_max_size,
+                    command_timeout=self.config.command_timeout,
+                    statement_cache_size=self.config.statement_cache_size,
+                    init=self._init_connection,
+                )
+                self._pools[loop] = pool
+                logger.info(
+                    "asyncpg pool ready (min=%s max=%s)",
+                    self.config.pool_min_size,
+                    self.config.pool_max_size,
+                )
+        return pool
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Any]:
+        pool = await self.get_pool()
+        async with pool.acquire() as conn:
+            yield conn
+
+    async def close(self) -> None:
+        """Close the pool bound to the running loop (app shutdown)."""
+        loop = asyncio.get_running_loop()
+        self._locks.pop(loop, None)
+        pool = self._pools.pop(loop, None)
+        if pool is not None:
+            await pool.close()
+
+
+class ThreadedAsyncDbManager:
+    """Awaitable facade over the sync grievance/file managers, run on the threadpool."""
+
+    backend = "threaded"
+
+    def __init__(self, grievance=None, file=None):
+        self._grievance = grievance
+        self._file = file
+
+    @property
+    def grievance(self):
+        if self._grievance is None:
+            from .grievance_manager import GrievanceDbManager
+
+            self._grievance = GrievanceDbManager()
+        return self._grievance
+
+    @property
+    def file(self):
+        if self._file is None:
+            from .base_manager import FileDbManager
+
+            self._file = FileDbManager()
+        return self._file
+
+    async def run_sync(self, fn, *args, **kwargs):
+        """Run a blocking manager call off the event loop (request timing context is copied)."""
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    async def get_grievance_by_id(self, grievance_id: str) -> Optional[Dict[str, Any]]:
+        return await self.run_sync(self.grievance.get_grievance_by_id, grievance_id)
+
+    async def grievance_exists(self, grievance_id: str) -> bool:
+        return await self.run_sync(
+            self.grievance.check_entry_exists_for_entity_key, "grievance_id", grievance_id
+        )
+
+    async def is_grievance_archived(self, grievance_id: str) -> bool:
+        return await self.run_sync(self.grievance.is_grievance_archived, grievance_id)
+
+    async def get_grievance_status(self, grievance_id: str) -> Optional[Dict[str, Any]]:
+        return await self.run_sync(self.grievance.get_grievance_status, grievance_id)
+
+    async def get_grievance_status_history(self, grievance_id: str, language: str = "en") -> List[Dict]:
+        return await self.run_sync(self.grievance.get_grievance_status_history, grievance_id, language)
+
+    async def get_grievance_files(self, grievance_id: str) -> List[Dict]:
+        return await self.run_sync(self.grievance.get_grievance_files, grievance_id)
+
+    async def get_available_statuses(self, language: str = "en") -> List[Dict]:
+        return await self.run_sync(self.grievance.get_available_statuses, language)
+
+    async def update_grievance(self, grievance_id: str, data: Dict[str, Any]) -> int:
+        return await self.run_sync(self.grievance.update_grievance, grievance_id, data)
+
+    async def update_grievance_status(
+        self,
+        grievance_id: str,
+        status_code: str,
+        created_by: Optional[str] = None,
+        assigned_to: Optional[str] = None,
+        notes: Optional[str] = None,
+    ) -> bool:
+        return await self.run_sync(
+            self.grievance.update_grievance_status,
+            grievance_id,
+            status_code,
+            created_by,
+            assigned_to,
+            notes,
+        )
+
+    async def get_file_by_id(self, file_id: str) -> Optional[Dict]:
+        return await self.run_sync(self.file.get_file_by_id, file_id)
+
+    async def is_file_saved(self, file_id: str) -> bool:
+        return await self.run_sync(self.file.is_file_saved, file_id)
+
+
+class AsyncpgDbManager(ThreadedAsyncDbManager):
+    """Native asyncpg versions of the router read/write methods (same SQL as the sync managers)."""
+
+    backend = "asyncpg"
+
+    def __init__(self, pool: AsyncDbPool, grievance=None, file=None):
+        super().__init__(grievance=grievance, file=file)
+        self.pool = pool
+
+    async def _fetch(self, query: str, *args, operation: str = "query") -> List[Dict[str, Any]]:
+        started = time.perf_counter()
+        try:
+            async with self.pool.acquire() as conn:
+                rows = await conn.fetch(query, *args)
+            return [dict(row) for row in rows]
+        except Exception as e:
+            logger.error("%s failed: %s", operation, e)
+            raise
+        finally:
+            record_sql(query, time.perf_counter() - started)
+
+    async def get_grievance_by_id(self, grievance_id: str) -> Optional[Dict[str, Any]]:
+        query = """
+            SELECT g.*, c.complainant_full_name, c.complainant_phone, c.complainant_email,
+                   c.complainant_province, c.complainant_district, c.complainant_municipality,
+                   c.complainant_ward, c.complainant_village, c.complainant_address,
+                   c.location_geo,
+                   c.contact_id, c.country_code, c.location_code, c.location_resolution_status,
+                   c.level_1_name, c.level_2_name, c.level_3_name, c.level_4_name, c.level_5_name, c.level_6_name,
+                   c.level_1_code, c.level_2_code, c.level_3_code, c.level_4_code, c.level_5_code, c.level_6_code,
+                   gp.party_role, gp.is_primary_reporter
+            FROM grievances g
+            LEFT JOIN grievance_parties gp ON g.grievance_id = gp.grievance_id AND gp.is_primary_reporter = TRUE
+            LEFT JOIN complainants c ON gp.complainant_id = c.complainant_id
+            WHERE g.grievance_id = $1
+        """
+        try:
+            rows = await self._fetch(query, grievance_id, operation="get_grievance_by_id")
+        except Exception as e:
+            logger.error("get_grievance_by_id JOIN query failed for %s: %s — trying core read", grievance_id, e)
+            try:
+                rows = await self._fetch(
+                    "SELECT * FROM grievances WHERE grievance_id = $1",
+                    grievance_id,
+                    operation="get_grievance_core_by_id",
+                )
+            except Exception:
+                return None
+        return self.grievance._parse_database_result(rows[0]) if rows else None
+
+    async def grievance_exists(self, grievance_id: str) -> bool:
+        try:
+            rows = await self._fetch(
+                "SELECT grievance_id FROM grievances WHERE grievance_id = $1",
+                grievance_id,
+                operation="check_grievance_exists",
+            )
+            return bool(rows)
+        except Exception:
+            return False
+
+    async def is_grievance_archived(self, grievance_id: str) -> bool:
+        query = """
+            SELECT g.is_archived,
+                   (
+                       SELECT h.status_code
+                       FROM grievance_status_history h
+                       WHERE h.grievance_id = g.grievance_id
+                       ORDER BY h.created_at DESC
+                       LIMIT 1
+                   ) AS current_status
+            FROM grievances g
+            WHERE g.grievance_id = $1
+        """
+        try:
+            rows = await self._fetch(query, grievance_id, operation="is_grievance_archived")
+        except Exception:
+            return False
+        if not rows:
+            return False
+        if rows[0].get("is_archived"):
+            return True
+        return (rows[0].get("current_status") or "").lower() == "archived"
+
+    async def get_grievance_status(self, grievance_id: str) -> Optional[Dict[str, Any]]:
+        query = """
+            WITH latest_status AS (
+                SELECT status_code, assigned_to, notes, created_at, grievance_id
+                FROM grievance_status_history
+                WHERE grievance_id = $1
+                ORDER BY created_at DESC
+                LIMIT 1
+            )
+            SELECT
+                h.status_code,
+                CASE WHEN $2 = 'en' THEN s.status_name_en ELSE s.status_name_ne END as status_name,
+                h.assigned_to,
+                h.notes,
+                h.created_at as status_date
+            FROM latest_status h
+            JOIN grievance_statuses s ON h.status_code = s.status_code
+        """
+        try:
+            rows = await self._fetch(
+                query, grievance_id, self.grievance.DEFAULT_LANGUAGE_CODE, operation="get_grievance_status"
+            )
+            return rows[0] if rows else None
+        except Exception:
+            return None
+
+    async def get_grievance_status_history(self, grievance_id: str, language: str = "en") -> List[Dict]:
+        query = """
+            SELECT
+                h.status_code,
+                CASE WHEN $1 = 'en' THEN s.status_name_en ELSE s.status_name_ne END as status_name,
+                h.assigned_to,
+                h.notes,
+                h.created_by,
+                h.created_at
+            FROM grievance_status_history h
+            JOIN grievance_statuses s ON h.status_code = s.status_code
+            WHERE h.grievance_id = $2
+            ORDER BY h.created_at DESC
+        """
+        try:
+            return await self._fetch(query, language, grievance_id, operation="get_grievance_status_history")
+        except Exception:
+            return []
+
+    async def get_grievance_files(self, grievance_id: str) -> List[Dict]:
+        query = """
+            SELECT file_id, file_name, file_type, file_size, upload_timestamp
+            FROM file_attachments
+            WHERE grievance_id = $1
+            ORDER BY upload_timestamp DESC
+        """
+        try:
+            return await self._fetch(query, grievance_id, operation="get_grievance_files")
+        except Exception:
+            return []
+
+    async def get_available_statuses(self, language: str = "en") -> List[Dict]:
+        query = """
+            SELECT
+                status_code,
+                CASE WHEN $1 = 'en' THEN status_name_en ELSE status_name_ne END as status_name,
+                CASE WHEN $1 = 'en' THEN description_en ELSE description_ne END as description,
+                sort_order
+            FROM grievance_statuses
+            WHERE is_active = true
+            ORDER BY sort_order
+        """
+        try:
+            return await self._fetch(query, language, operation="get_available_statuses")
+        except Exception:
+            return []
+
+    async def update_grievance(self, grievance_id: str, data: Dict[str, Any]) -> int:
+        fields = [f for f in _GRIEVANCE_UPDATE_FIELDS if data.get(f) is not None]
+        if not fields:
+            logger.warning("update_grievance: No fields to update for grievance_id: %s", grievance_id)
+            return False
+        values = [self.grievance._prepare_field_for_database(f, data[f]) for f in fields]
+        assignments = [f"{f} = ${i}" for i, f in enumerate(fields, start=1)]
+        assignments.append("grievance_modification_date = CURRENT_TIMESTAMP")
+        query = f"""
+            UPDATE grievances
+            SET {', '.join(assignments)}
+            WHERE grievance_id = ${len(fields) + 1}
+            RETURNING grievance_id
+        """
+        try:
+            rows = await self._fetch(query, *values, grievance_id, operation="update_grievance")
+            logger.info("update_grievance: Updated grievance %s, rows affected: %s", grievance_id, len(rows))
+            return len(rows)
+        except Exception:
+            return False
+
+    async def update_grievance_status(
+        self,
+        grievance_id: str,
+        status_code: str,
+        created_by: Optional[str] = None,
+        assigned_to: Optional[str] = None,
+        notes: Optional[str] = None,
+    ) -> bool:
+        """Status check, history row and archive flags in one transaction (sync path: one per statement)."""
+        created_by = created_by or self.grievance.DEFAULT_USER
+        archived = status_code == "archived"
+        started = time.perf_counter()
+        try:
+            async with self.pool.acquire() as conn:
+                async with conn.transaction():
+                    active = await conn.fetchval(
+                        "SELECT 1 FROM grievance_statuses WHERE status_code = $1 AND is_active = true",
+                        status_code,
+                    )
+                    if not active:
+                        logger.error("Invalid or inactive status code: %s", status_code)
+                        return False
+                    await conn.execute(
+                        """
+                        INSERT INTO grievance_status_history
+                            (grievance_id, change_type, status_code, assigned_to, notes, created_by)
+                        VALUES ($1, 'status_change', $2, $3, $4, $5)
+                        """,
+                        grievance_id, status_code, assigned_to, notes, created_by,
+                    )
+                    await conn.execute(
+                        """
+                        UPDATE grievances SET
+                            is_archived = $2,
+                            archived_at = CASE
+                                WHEN $2 THEN CURRENT_TIMESTAMP
+                                WHEN is_archived THEN NULL
+                                ELSE archived_at
+                            END,
+                            grievance_modification_date = CURRENT_TIMESTAMP
+                        WHERE grievance_id = $1
+                        """,
+                        grievance_id, archived,
+                    )
+            return True
+        except Exception as e:
+            logger.error("Error updating grievance status: %s", e)
+            return False
+        finally:
+            record_sql("update_grievance_status", time.perf_counter() - started)
+
+    async def get_file_by_id(self, file_id: str) -> Optional[Dict]:
+        query = """
+            SELECT file_id, grievance_id, file_name, file_path,
+                   file_type, file_size, upload_timestamp
+            FROM file_attachments
+            WHERE file_id = $1
+        """
+        try:
+            rows = await self._fetch(query, file_id, operation="get_file_by_id")
+            return rows[0] if rows else None
+        except Exception:
+            return None
+
+    async def is_file_saved(self, file_id: str) -> bool:
+        try:
+            rows = await self._fetch(
+                "SELECT 1 FROM file_attachments WHERE file_id = $1", file_id, operation="is_file_saved"
+            )
+            return bool(rows)
+        except Exception:
+            return False
+
+
+_shared_pool: Optional[AsyncDbPool] = None
+
+
+def _get_shared_pool(config: AsyncDbConfig) -> AsyncDbPool:
+    global _shared_pool
+    if _shared_pool is None:
+        _shared_pool = AsyncDbPool(config)
+    return _shared_pool
+
+
+def get_async_db_manager(router: str, grievance=None, file=None, config: Optional[AsyncDbConfig] = None):
+    """Async manager for one router: asyncpg when enabled for it in DB_ASYNC_ROUTERS, else threaded."""
+    config = config or resolve_async_db_config()
+    if config.enabled_for(router):
+        if asyncpg is not None:
+            return AsyncpgDbManager(_get_shared_pool(config), grievance=grievance, file=file)
+        logger.warning("DB_ASYNC_ROUTERS enables %s but asyncpg is not installed; using threadpool", router)
+    return ThreadedAsyncDbManager(grievance=grievance, file=file)
+
+
+async def close_async_db_pool() -> None:
+    """Close the asyncpg pool of the running loop, if one was opened."""
+    if _shared_pool is not None:
+        await _shared_pool.close()
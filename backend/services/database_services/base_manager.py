@@ -15,6 +15,7 @@ from contextlib import contextmanager
 # Import database configuration from constants.py (single source of truth)
 from backend.config.constants import DB_CONFIG
 from backend.logger.logger import TaskLogger
+from backend.logger.request_timing import current_request_stats
 from backend.config.constants import DEFAULT_VALUES
 from backend.services.db_debug_log import (
     grievance_row_summary,
@@ -45,11 +46,25 @@ class DatabaseQueryError(DatabaseError):
     """Exception for database query issues"""
     pass
 
+class TimedDictCursor(DictCursor):
+    """DictCursor that adds each statement's time to the current request's stats (REQUEST_TIMING=1)."""
+
+    def execute(self, query, vars=None):
+        stats = current_request_stats()
+        if stats is None:
+            return super().execute(query, vars)
+        started = time.perf_counter()
+        try:
+            return super().execute(query, vars)
+        finally:
+            stats.add_statement(query, time.perf_counter() - started)
+
 class BaseDatabaseManager:
     """Base class for database operations with proper logging and error handling"""
     def __init__(self, logger_name: str = 'db_manager', timezone: Optional[pytz.BaseTzInfo] = pytz.timezone(DEFAULT_TIMEZONE)):
         self.logger = TaskLogger(service_name=logger_name).logger
-        self.logger.setLevel(logging.DEBUG)
+        # DB_LOG_LEVEL=DEBUG for per-query/per-row detail; DEBUG is sampled per call site
+        self.logger.setLevel(getattr(logging, os.getenv('DB_LOG_LEVEL', 'INFO').upper(), logging.INFO))
         self.nepal_tz = timezone
         self.db_params = DB_CONFIG.copy()
         self.logger.info("Database parameters: %s", redact_db_params(self.db_params))
@@ -97,8 +112,8 @@ class BaseDatabaseManager:
         conn = None
         start_time = datetime.now()
         try:
-            self.logger.info(f"Connecting to database: {self.db_params['database']}")
-            conn = psycopg2.connect(**self.db_params, cursor_factory=DictCursor)  # type: ignore
+            self.logger.debug("Connecting to database: %s", self.db_params['database'])
+            conn = psycopg2.connect(**self.db_params, cursor_factory=TimedDictCursor)  # type: ignore
             yield conn
         except Exception as e:
             self.logger.error(f"Database connection error: {str(e)}")
@@ -106,7 +121,7 @@ class BaseDatabaseManager:
         finally:
             if conn:
                 duration = (datetime.now() - start_time).total_seconds()
-                self.logger.info(f"Database connection closed. Duration: {duration:.2f}s")
+                self.logger.debug("Database connection closed. Duration: %.2fs", duration)
                 conn.close()
 
     @contextmanager
@@ -114,10 +129,10 @@ class BaseDatabaseManager:
         """Transaction context manager with logging"""
         with self.get_connection() as conn:
             try:
-                self.logger.info("Starting database transaction")
+                self.logger.debug("Starting database transaction")
                 yield conn
                 conn.commit()
-                self.logger.info("Transaction committed successfully")
+                self.logger.debug("Transaction committed successfully")
             except Exception as e:
                 conn.rollback()
                 self.logger.error(f"Transaction rolled back: {str(e)}")
@@ -155,11 +170,11 @@ class BaseDatabaseManager:
         try:
             with self.transaction() as conn:
                 with conn.cursor() as cur:
-                    self.logger.info(f"Executing {operation}: {query[:100]}...")
+                    self.logger.debug("Executing %s: %s...", operation, query[:100])
                     cur.execute(query, params or ())
                     results = [dict(row) for row in cur.fetchall()]
                     duration = (datetime.now() - start_time).total_seconds()
-                    self.logger.info(f"{operation} completed in {duration:.2f}s. Rows: {len(results)}")
+                    self.logger.debug("%s completed in %.2fs. Rows: %s", operation, duration, len(results))
                     return results
                     
         except Exception as e:
@@ -179,11 +194,11 @@ class BaseDatabaseManager:
             )
             with self.transaction() as conn:
                 with conn.cursor() as cur:
-                    self.logger.info(f"execute_update: Executing update query: {query[:100]}...")
+                    self.logger.debug("execute_update: Executing update query: %s...", query[:100])
                     cur.execute(query, values)
                     affected_rows = cur.rowcount
                     duration = (datetime.now() - start_time).total_seconds()
-                    self.logger.info(f"execute_update: Update completed in {duration:.2f}s. Affected rows: {affected_rows}")
+                    self.logger.debug("execute_update: Update completed in %.2fs. Affected rows: %s", duration, affected_rows)
                     return affected_rows
         except Exception as e:
             self.logger.error(f"execute_update: Update failed: {str(e)}")
@@ -318,7 +333,7 @@ class BaseDatabaseManager:
             self.logger.debug("No grievances to decrypt")
             return grievances
         
-        self.logger.debug(f"Starting batch decryption of {len(grievances)} grievances")
+        self.logger.debug("Starting batch decryption of %s grievances", len(grievances))
         
         try:
             decryption_count = 0
@@ -343,7 +358,7 @@ class BaseDatabaseManager:
                                     if i < 2:  # Log first 2 failures for debugging
                                         self.logger.warning(f"Failed to decrypt field '{field}' for grievance {i}")
             
-            self.logger.debug(f"Batch decryption complete: {decryption_count} fields decrypted across {len(grievances)} grievances")
+            self.logger.debug("Batch decryption complete: %s fields decrypted across %s grievances", decryption_count, len(grievances))
         except Exception as e:
             self.logger.error(f"Error batch decrypting grievances: {str(e)}")
             # Fall back to individual decryption if batch fails
@@ -383,7 +398,7 @@ class BaseDatabaseManager:
                     columns = [desc[0] for desc in cur.description]
                     rows = cur.fetchall()
                     
-                    self.logger.debug(f"Raw query results: {len(rows)} rows, columns: {columns}")
+                    self.logger.debug("Raw query results: %s rows, columns: %s", len(rows), columns)
                     if rows:
                         self.logger.debug(
                             "First row shape: %s",
@@ -404,37 +419,37 @@ class BaseDatabaseManager:
                         if decrypt_field == "NONE":
                             sensitive_grievances.append(grievance)
                             if i < 2:  # Log first 2 for debugging
-                                self.logger.debug(f"Row {i}: Added to sensitive_grievances (NONE strategy)")
+                                self.logger.debug("Row %s: Added to sensitive_grievances (NONE strategy)", i)
                         elif decrypt_field == "ALL":
                             grievances_to_decrypt.append(grievance)
                             if i < 2:  # Log first 2 for debugging
-                                self.logger.debug(f"Row {i}: Added to grievances_to_decrypt (ALL strategy)")
+                                self.logger.debug("Row %s: Added to grievances_to_decrypt (ALL strategy)", i)
                         elif decrypt_field == "NOT_SENSITIVE":
                             # Segregate based on sensitivity
                             is_sensitive = grievance.get('grievance_sensitive_issue', True)
                             if not is_sensitive:
                                 grievances_to_decrypt.append(grievance)
                                 if i < 2:  # Log first 2 for debugging
-                                    self.logger.debug(f"Row {i}: Added to grievances_to_decrypt (NOT_SENSITIVE strategy, is_sensitive={is_sensitive})")
+                                    self.logger.debug("Row %s: Added to grievances_to_decrypt (NOT_SENSITIVE strategy, is_sensitive=%s)", i, is_sensitive)
                             else:
                                 sensitive_grievances.append(grievance)
                                 if i < 2:  # Log first 2 for debugging
-                                    self.logger.debug(f"Row {i}: Added to sensitive_grievances (NOT_SENSITIVE strategy, is_sensitive={is_sensitive})")
+                                    self.logger.debug("Row %s: Added to sensitive_grievances (NOT_SENSITIVE strategy, is_sensitive=%s)", i, is_sensitive)
                         else:
                             raise ValueError(f"Invalid decrypt_field value: {decrypt_field}. Must be 'NONE', 'ALL', or 'NOT_SENSITIVE'")
                     
-                    self.logger.debug(f"Segregation complete: {len(grievances_to_decrypt)} to decrypt, {len(sensitive_grievances)} sensitive")
+                    self.logger.debug("Segregation complete: %s to decrypt, %s sensitive", len(grievances_to_decrypt), len(sensitive_grievances))
                     
                     # Batch decrypt grievances that need decryption
                     if grievances_to_decrypt:
-                        self.logger.debug(f"Starting batch decryption of {len(grievances_to_decrypt)} grievances")
+                        self.logger.debug("Starting batch decryption of %s grievances", len(grievances_to_decrypt))
                         grievances_to_decrypt = self._batch_decrypt_grievances(grievances_to_decrypt)
-                        self.logger.debug(f"Batch decryption complete: {len(grievances_to_decrypt)} grievances processed")
+                        self.logger.debug("Batch decryption complete: %s grievances processed", len(grievances_to_decrypt))
                     
                     # Combine all grievances
                     grievances = grievances_to_decrypt + sensitive_grievances
 
-                    self.logger.debug(f"Final result: {len(grievances)} total grievances")
+                    self.logger.debug("Final result: %s total grievances", len(grievances))
                     if grievances:
                         self.logger.debug(
                             "First grievance sample: %s",
@@ -1032,6 +1047,7 @@ class TableDbManager(BaseDatabaseManager):
                 cur.execute("DROP TABLE IF EXISTS grievance_status_history CASCADE")
                 cur.execute("DROP TABLE IF EXISTS grievance_history CASCADE")
                 cur.execute("DROP TABLE IF EXISTS file_attachments CASCADE")
+                cur.execute("DROP TABLE IF EXISTS attachment_blobs CASCADE")
                 cur.execute("DROP TABLE IF EXISTS grievances CASCADE")
                 cur.execute("DROP TABLE IF EXISTS office_user CASCADE")
                 cur.execute("DROP TABLE IF EXISTS complainants CASCADE")
@@ -1407,6 +1423,26 @@ class TableDbManager(BaseDatabaseManager):
         cur.execute(
             "ALTER TABLE file_attachments ADD COLUMN IF NOT EXISTS client_metadata JSONB"
         )
+        cur.execute(
+            "ALTER TABLE file_attachments ADD COLUMN IF NOT EXISTS content_sha256 TEXT"
+        )
+
+        # Content-addressed attachment blobs (shared by file_attachments rows with the same hash)
+        self.migrations_logger.info("Creating/recreating attachment_blobs table...")
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS attachment_blobs (
+                content_sha256 TEXT PRIMARY KEY,
+                blob_path TEXT NOT NULL,
+                file_type TEXT,
+                file_size BIGINT,
+                processing_metadata JSONB,
+                ref_count INTEGER NOT NULL DEFAULT 0,
+                storage_tier VARCHAR(16) NOT NULL DEFAULT 'active',
+                storage_key TEXT NULL,
+                created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+                last_referenced_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
 
         # Voice recording tables with language_code fields
         self.migrations_logger.info("Creating/recreating grievance_voice_recordings table...")
@@ -1575,6 +1611,7 @@ class TableDbManager(BaseDatabaseManager):
             CREATE INDEX IF NOT EXISTS idx_file_attachments_grievance_id ON file_attachments(grievance_id);
             CREATE INDEX IF NOT EXISTS idx_file_attachments_file_id ON file_attachments(file_id);
             CREATE INDEX IF NOT EXISTS idx_file_attachments_upload_timestamp ON file_attachments(upload_timestamp);
+            CREATE INDEX IF NOT EXISTS idx_file_attachments_content_sha256 ON file_attachments(content_sha256);
         """)
 
         # Voice recordings indexes
@@ -2319,6 +2356,7 @@ class FileDbManager(BaseDatabaseManager):
             'file_type',
             'file_size',
             'client_metadata',
+            'content_sha256',
         ]
 
         try:
@@ -2328,6 +2366,52 @@ class FileDbManager(BaseDatabaseManager):
             self.logger.error(f"Error storing file attachment: {str(e)}")
             return False
             
+    def get_attachment_blob(self, content_sha256: str) -> Optional[Dict]:
+        """Return the stored blob for an upload hash, or None when the content is new."""
+        query = """
+            SELECT content_sha256, blob_path, file_type, file_size,
+                   processing_metadata, ref_count, storage_tier
+            FROM attachment_blobs
+            WHERE content_sha256 = %s
+        """
+        try:
+            results = self.execute_query(query, (content_sha256,), "get_attachment_blob")
+            return results[0] if results else None
+        except Exception as e:
+            self.logger.error(f"Error retrieving attachment blob: {str(e)}")
+            return None
+
+    def add_attachment_blob_reference(self, blob_data: Dict) -> bool:
+        """Register a blob (first upload) or add one reference to it (re-upload)
+
+        Args:
+            blob_data: content_sha256, blob_path, file_type, file_size, processing_metadata
+
+        Returns:
+            bool: True when the blob row was written
+        """
+        query = """
+            INSERT INTO attachment_blobs
+                (content_sha256, blob_path, file_type, file_size, processing_metadata, ref_count)
+            VALUES (%s, %s, %s, %s, %s, 1)
+            ON CONFLICT (content_sha256) DO UPDATE
+            SET ref_count = attachment_blobs.ref_count + 1,
+                storage_tier = 'active',
+                last_referenced_at = CURRENT_TIMESTAMP
+        """
+        values = (
+            blob_data['content_sha256'],
+            blob_data['blob_path'],
+            blob_data.get('file_type'),
+            blob_data.get('file_size'),
+            json.dumps(blob_data.get('processing_metadata') or {}, default=str),
+        )
+        try:
+            return self.execute_update(query, values) > 0
+        except Exception as e:
+            self.logger.error(f"Error storing attachment blob reference: {str(e)}")
+            return False
+
     def get_grievance_files(self, grievance_id: str) -> List[Dict]:
         query = """
             SELECT file_id, file_name, file_type, file_size, upload_timestamp
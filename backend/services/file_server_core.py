@@ -1,11 +1,10 @@
 import os
 import logging
-import time
 from werkzeug.utils import secure_filename
-import uuid
 from datetime import datetime
 import wave
 import contextlib
+import json
 from .database_services.postgres_services import db_manager
 from ..config.constants import (
     MAX_FILE_SIZE,
@@ -19,6 +18,15 @@ from ..config.constants import (
 from ..shared_functions.utterance_mapping_server import get_utterance
 from typing import Dict, Any, Optional, List
 from ..api.api_manager import APIManager
+from .attachment_store import (
+    adopt_into_store,
+    blob_path_for,
+    discard_duplicate,
+    file_sha256,
+    stored_file_name,
+)
+from .image_compression import CompressResult, compress_image, compress_images, rendition_path
+from .voice_chunk_sessions import VoiceChunkSessionStore
 from backend.logger.logger import TaskLogger
 
 # Define service name for logging
@@ -26,8 +34,7 @@ SERVICE_NAME = "file_processor"
 
 UPLOAD_FOLDER = 'uploads'
 
-# In-memory voice chunk upload sessions (upload_id -> session dict). TTL 1 hour.
-_VOICE_CHUNK_SESSIONS: Dict[str, Dict[str, Any]] = {}
+# Voice chunk upload sessions live on disk under UPLOAD_FOLDER (see voice_chunk_sessions). TTL 1 hour.
 _VOICE_CHUNK_TTL_SEC = 3600
 _VOICE_CHUNK_AUDIO_MAX_BYTES = FILE_TYPE_MAX_SIZES.get(
     "AUDIO", MAX_FILE_SIZE
@@ -139,9 +146,17 @@ class FileServerCore(APIManager):
             return {}
 
     def process_file_upload(self, grievance_id: str, file_data: dict) -> dict:
-        """Process an uploaded file"""
+        """Process an uploaded file
+
+        Content already stored for another attachment (same SHA-256) is not processed again:
+        the new row points at the shared blob and reuses its cached processing results.
+        """
         # Get file type
         file_type = self.get_file_type(file_data['file_name'])
+
+        # File stats are read here (worker) rather than in the upload request
+        for key, value in self.get_file_metadata(file_data['file_path']).items():
+            file_data.setdefault(key, value)
         
         # Add metadata
         file_data.update({
@@ -149,31 +164,25 @@ class FileServerCore(APIManager):
             'upload_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
             'grievance_id': grievance_id
         })
-        
-        # Additional processing based on file type
-        if file_type == 'audio':
-            # Add audio-specific metadata
-            audio_metadata = self.get_audio_metadata(file_data['file_path'])
-            file_data.update(audio_metadata)
 
-        if file_type == 'image':
-            from backend.services.image_compression import compress_image
-
-            compress_result = compress_image(file_data['file_path'])
-            if compress_result.output_path != file_data['file_path']:
-                file_data['file_path'] = compress_result.output_path
-                file_data['file_name'] = os.path.basename(compress_result.output_path)
-            file_data['file_size'] = compress_result.compressed_bytes
-            self.logger.info(
-                "image_compression result status=%s original_bytes=%s compressed_bytes=%s "
-                "width=%s height=%s file=%s",
-                compress_result.status,
-                compress_result.original_bytes,
-                compress_result.compressed_bytes,
-                compress_result.width,
-                compress_result.height,
-                compress_result.output_path,
+        content_sha256 = file_data.get('content_sha256') or file_sha256(file_data['file_path'])
+        file_data['content_sha256'] = content_sha256
+
+        blob = db_manager.file.get_attachment_blob(content_sha256)
+        if blob and os.path.isfile(blob['blob_path']):
+            processing_metadata = self._reuse_attachment_blob(file_data, blob)
+        else:
+            processing_metadata = self._process_attachment_content(file_data, file_type)
+            ext = os.path.splitext(file_data['file_path'])[1]
+            file_data['file_path'] = adopt_into_store(
+                file_data['file_path'],
+                blob_path_for(self.upload_folder, content_sha256, ext),
             )
+            for rendition in (processing_metadata.get('image_compression') or {}).get('renditions', []):
+                rendition['path'] = adopt_into_store(
+                    rendition['path'],
+                    rendition_path(file_data['file_path'], rendition['name'], rendition['format']),
+                )
 
         client_meta = file_data.get("client_metadata") or {}
         if client_meta:
@@ -190,14 +199,110 @@ class FileServerCore(APIManager):
                 "(check DB logs for cause; often grievance_id missing or FK violation)"
             )
 
+        if not db_manager.file.add_attachment_blob_reference({
+            'content_sha256': content_sha256,
+            'blob_path': file_data['file_path'],
+            'file_type': file_type,
+            'file_size': file_data.get('file_size'),
+            'processing_metadata': processing_metadata,
+        }):
+            self.logger.warning(f"attachment blob reference not recorded for {content_sha256}")
+
         return file_data
 
+    def _process_attachment_content(self, file_data: dict, file_type: str) -> dict:
+        """Type-specific processing for new content; returns the results to cache per hash."""
+        processing_metadata = {}
+        if file_type == 'audio':
+            # Add audio-specific metadata
+            audio_metadata = self.get_audio_metadata(file_data['file_path'])
+            file_data.update(audio_metadata)
+            processing_metadata['audio'] = audio_metadata
+
+        if file_type == 'image':
+            if file_data.get('image_compression') is None:
+                self._apply_compress_result(file_data, compress_image(file_data['file_path']))
+            processing_metadata['image_compression'] = file_data.pop('image_compression')
+        return processing_metadata
+
+    def _apply_compress_result(self, file_data: dict, compress_result: CompressResult) -> None:
+        """Point file_data at the compressed output and keep the result for the blob cache."""
+        if compress_result.output_path != file_data['file_path']:
+            file_data['file_path'] = compress_result.output_path
+            file_data['file_name'] = os.path.basename(compress_result.output_path)
+        file_data['file_size'] = compress_result.compressed_bytes
+        self.logger.info(
+            "image_compression result status=%s original_bytes=%s compressed_bytes=%s "
+            "width=%s height=%s renditions=%s file=%s",
+            compress_result.status,
+            compress_result.original_bytes,
+            compress_result.compressed_bytes,
+            compress_result.width,
+            compress_result.height,
+            len(compress_result.renditions),
+            compress_result.output_path,
+        )
+        file_data['image_compression'] = {
+            'status': compress_result.status,
+            'original_bytes': compress_result.original_bytes,
+            'compressed_bytes': compress_result.compressed_bytes,
+            'width': compress_result.width,
+            'height': compress_result.height,
+            'renditions': compress_result.renditions,
+        }
+
+    def precompress_batch_images(self, file_list: list) -> int:
+        """Compress the new images of a batch together (bounded concurrency) before per-file tasks.
+
+        Results are stored on each file_data so process_file_upload skips its own compression;
+        images whose content is already stored are left to the dedup path. Returns the count compressed.
+        """
+        pending = []
+        for file_data in file_list:
+            if file_data.get('image_compression') is not None:
+                continue
+            if self.get_file_type(file_data.get('file_name', '')) != 'image':
+                continue
+            content_sha256 = file_data.get('content_sha256') or file_sha256(file_data['file_path'])
+            file_data['content_sha256'] = content_sha256
+            if db_manager.file.get_attachment_blob(content_sha256):
+                continue
+            pending.append(file_data)
+
+        for file_data, compress_result in zip(pending, compress_images([f['file_path'] for f in pending])):
+            self._apply_compress_result(file_data, compress_result)
+        return len(pending)
+
+    def _reuse_attachment_blob(self, file_data: dict, blob: dict) -> dict:
+        """Point file_data at an existing blob and drop the duplicate upload."""
+        blob_path = blob['blob_path']
+        # Compressed ahead of time but stored meanwhile by another upload
+        for rendition in (file_data.pop('image_compression', None) or {}).get('renditions', []):
+            discard_duplicate(rendition['path'], rendition_path(blob_path, rendition['name'], rendition['format']))
+        discard_duplicate(file_data['file_path'], blob_path)
+        file_data['file_path'] = blob_path
+        file_data['file_name'] = stored_file_name(file_data['file_name'], blob_path)
+        if blob.get('file_size') is not None:
+            file_data['file_size'] = blob['file_size']
+        processing_metadata = blob.get('processing_metadata') or {}
+        if isinstance(processing_metadata, str):
+            processing_metadata = json.loads(processing_metadata)
+        file_data.update(processing_metadata.get('audio') or {})
+        self.logger.info(
+            "attachment dedup hit sha256=%s refs=%s file=%s",
+            file_data['content_sha256'],
+            blob.get('ref_count'),
+            blob_path,
+        )
+        return processing_metadata
+
 
     def process_batch_files(self, grievance_id: str, file_list: list) -> dict:
         """Process a batch of files for a grievance"""
         self.log_event(event_type=STARTED, details={'grievance_id': grievance_id, 'file_count': len(file_list)})
         
         try:
+            self.precompress_batch_images(file_list)
             results = []
             for file_data in file_list:
                 ext = file_data['file_type']
@@ -232,22 +337,13 @@ class FileServerCore(APIManager):
         """Check if mime type is allowed"""
         return mime_type in ALLOWED_MIME_TYPES
 
-    def _prune_expired_voice_chunk_sessions(self) -> None:
-        now = time.time()
-        expired = [
-            uid
-            for uid, session in _VOICE_CHUNK_SESSIONS.items()
-            if (now - session.get("created_at", 0)) > _VOICE_CHUNK_TTL_SEC
-        ]
-        for uid in expired:
-            session = _VOICE_CHUNK_SESSIONS.pop(uid, None)
-            if session:
-                part_path = session.get("part_path")
-                if part_path and os.path.exists(part_path):
-                    try:
-                        os.remove(part_path)
-                    except OSError:
-                        pass
+    def _voice_chunk_sessions(self) -> VoiceChunkSessionStore:
+        """Session store under the current upload folder (shared by every API worker)."""
+        return VoiceChunkSessionStore(
+            self.upload_folder,
+            ttl_sec=_VOICE_CHUNK_TTL_SEC,
+            max_bytes=_VOICE_CHUNK_AUDIO_MAX_BYTES,
+        )
 
     def _validate_voice_chunk_filename(self, filename: str) -> str:
         safe_name = secure_filename(filename or "")
@@ -265,29 +361,17 @@ class FileServerCore(APIManager):
         mime_type: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Start a resumable voice-note upload; first chunk is appended separately."""
-        self._prune_expired_voice_chunk_sessions()
         safe_name = self._validate_voice_chunk_filename(file_name)
         if mime_type and mime_type not in ALLOWED_MIME_TYPES:
             raise ValueError("invalid_voice_mime_type")
 
-        upload_id = str(uuid.uuid4())
-        file_id = str(uuid.uuid4())
-        grievance_dir = os.path.join(self.upload_folder, grievance_id)
-        os.makedirs(grievance_dir, exist_ok=True)
-        part_path = os.path.join(grievance_dir, f".voice_part_{upload_id}.part")
-
-        session = {
-            "upload_id": upload_id,
-            "file_id": file_id,
-            "grievance_id": grievance_id,
-            "file_name": safe_name,
-            "mime_type": mime_type or "audio/webm",
-            "part_path": part_path,
-            "next_chunk_index": 0,
-            "total_bytes": 0,
-            "created_at": time.time(),
-        }
-        _VOICE_CHUNK_SESSIONS[upload_id] = session
+        session = self._voice_chunk_sessions().create(
+            grievance_id=grievance_id,
+            file_name=safe_name,
+            mime_type=mime_type or "audio/webm",
+        )
+        upload_id = session["upload_id"]
+        file_id = session["file_id"]
         self.log_event(
             event_type=STARTED,
             details={
@@ -304,33 +388,18 @@ class FileServerCore(APIManager):
         upload_id: str,
         chunk_index: int,
         chunk_bytes: bytes,
+        chunk_offset: Optional[int] = None,
     ) -> Dict[str, Any]:
-        """Append one ordered chunk; duplicate indices are acknowledged (retry-safe)."""
-        self._prune_expired_voice_chunk_sessions()
-        session = _VOICE_CHUNK_SESSIONS.get(upload_id)
-        if not session:
-            raise ValueError("upload_session_not_found")
-
-        expected = session["next_chunk_index"]
-        if chunk_index < expected:
-            return {"duplicate": True, "session": session}
-        if chunk_index > expected:
-            raise ValueError("chunk_out_of_order")
-
-        chunk_len = len(chunk_bytes)
-        if chunk_len == 0:
-            raise ValueError("empty_chunk")
-
-        projected = session["total_bytes"] + chunk_len
-        if projected > _VOICE_CHUNK_AUDIO_MAX_BYTES:
-            raise ValueError("voice_chunk_size_exceeded")
-
-        with open(session["part_path"], "ab") as part_file:
-            part_file.write(chunk_bytes)
-
-        session["next_chunk_index"] = expected + 1
-        session["total_bytes"] = projected
-        return {"duplicate": False, "session": session}
+        """Write one chunk at `chunk_offset` (any order); without an offset chunks must be in order.
+
+        Duplicate indices are acknowledged (retry-safe).
+        """
+        return self._voice_chunk_sessions().write_chunk(
+            upload_id,
+            chunk_index,
+            chunk_bytes,
+            offset=chunk_offset,
+        )
 
     def finalize_voice_chunk_upload(
         self,
@@ -338,35 +407,21 @@ class FileServerCore(APIManager):
         expected_grievance_id: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Move assembled part file into place and return file_data for Celery."""
-        session = _VOICE_CHUNK_SESSIONS.pop(upload_id, None)
-        if not session:
-            raise ValueError("upload_session_not_found")
-        if (
-            expected_grievance_id
-            and session["grievance_id"] != expected_grievance_id
-        ):
-            _VOICE_CHUNK_SESSIONS[upload_id] = session
-            raise ValueError("grievance_mismatch")
-        if session["next_chunk_index"] < 1:
-            part_path = session.get("part_path")
-            if part_path and os.path.exists(part_path):
-                try:
-                    os.remove(part_path)
-                except OSError:
-                    pass
-            raise ValueError("no_chunks_received")
+        sessions = self._voice_chunk_sessions()
+        session = sessions.claim_for_finalize(upload_id, expected_grievance_id)
 
-        grievance_dir = os.path.dirname(session["part_path"])
+        grievance_dir = os.path.join(self.upload_folder, session["grievance_id"])
+        os.makedirs(grievance_dir, exist_ok=True)
         final_path = os.path.join(grievance_dir, session["file_name"])
         os.replace(session["part_path"], final_path)
+        sessions.release(upload_id)
 
-        metadata = self.get_file_metadata(final_path)
+        # Metadata is filled in by process_file_upload in the Celery task
         file_data = {
             "file_id": session["file_id"],
             "file_name": session["file_name"],
             "file_path": final_path,
             "file_size": session["total_bytes"],
-            **metadata,
         }
         self.log_event(
             event_type=SUCCESS,
@@ -375,21 +430,13 @@ class FileServerCore(APIManager):
                 "upload_id": upload_id,
                 "file_id": session["file_id"],
                 "bytes": session["total_bytes"],
-                "chunks": session["next_chunk_index"],
+                "chunks": session["chunks_received"],
             },
         )
         return file_data
 
     def abort_voice_chunk_upload(self, upload_id: str) -> None:
-        session = _VOICE_CHUNK_SESSIONS.pop(upload_id, None)
-        if not session:
-            return
-        part_path = session.get("part_path")
-        if part_path and os.path.exists(part_path):
-            try:
-                os.remove(part_path)
-            except OSError:
-                pass
+        self._voice_chunk_sessions().release(upload_id)
 
 # Initialize the core  instances
 file_server_core = FileServerCore()
@@ -5,14 +5,18 @@ from __future__ import annotations
 import logging
 import os
 import tempfile
-from dataclasses import dataclass
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
 
 from backend.config.constants import (
+    IMAGE_COMPRESS_CONCURRENCY,
     IMAGE_COMPRESS_JPEG_QUALITY,
     IMAGE_COMPRESS_MAX_LONG_EDGE,
     IMAGE_COMPRESS_SKIP_MAX_BYTES,
     IMAGE_COMPRESS_SKIP_MAX_LONG_EDGE,
+    IMAGE_RENDITION_THUMB_LONG_EDGE,
+    IMAGE_RENDITION_WEBP_QUALITY,
 )
 
 logger = logging.getLogger(__name__)
@@ -24,6 +28,13 @@ class ImageCompressPolicy:
     jpeg_quality: int = IMAGE_COMPRESS_JPEG_QUALITY
     skip_max_long_edge: int = IMAGE_COMPRESS_SKIP_MAX_LONG_EDGE
     skip_max_bytes: int = IMAGE_COMPRESS_SKIP_MAX_BYTES
+    thumb_long_edge: int = IMAGE_RENDITION_THUMB_LONG_EDGE
+    webp_quality: int = IMAGE_RENDITION_WEBP_QUALITY
+
+
+# (name, format) written next to the stored image as <base>.<name>.<format>.
+# The stored JPEG itself is the "display" JPEG.
+RENDITIONS = (("display", "webp"), ("thumb", "jpg"), ("thumb", "webp"))
 
 
 @dataclass
@@ -34,6 +45,7 @@ class CompressResult:
     height: Optional[int]
     status: str  # compressed | skipped | failed
     output_path: str
+    renditions: List[Dict[str, Any]] = field(default_factory=list)
 
 
 def get_default_policy() -> ImageCompressPolicy:
@@ -49,6 +61,53 @@ def _jpeg_output_path(file_path: str) -> str:
     return f"{base}.jpg"
 
 
+def rendition_path(file_path: str, name: str, fmt: str) -> str:
+    """Path of a derived rendition next to the stored image (shared naming with ticketing)."""
+    base, _ = os.path.splitext(file_path)
+    return f"{base}.{name}.{fmt}"
+
+
+def _save_atomic(image, path: str, **options) -> None:
+    fd, temp_path = tempfile.mkstemp(suffix=os.path.splitext(path)[1], dir=os.path.dirname(path) or ".")
+    os.close(fd)
+    try:
+        image.write_to_file(temp_path, **options)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def _write_renditions(image, stored_path: str, policy: ImageCompressPolicy) -> List[Dict[str, Any]]:
+    """Write RENDITIONS from an in-memory image; a failure here never fails the upload."""
+    import pyvips
+
+    written = []
+    try:
+        sources = {
+            "display": image,
+            "thumb": image.thumbnail_image(policy.thumb_long_edge, size=pyvips.Size.DOWN),
+        }
+        for name, fmt in RENDITIONS:
+            source = sources[name]
+            path = rendition_path(stored_path, name, fmt)
+            if fmt == "webp":
+                _save_atomic(source, path, Q=policy.webp_quality, strip=True)
+            else:
+                _save_atomic(source, path, Q=policy.jpeg_quality, strip=True)
+            written.append({
+                "name": name,
+                "format": fmt,
+                "path": path,
+                "width": source.width,
+                "height": source.height,
+                "bytes": os.path.getsize(path),
+            })
+    except Exception as exc:
+        logger.warning("image_compression renditions failed file=%s error=%s", stored_path, exc)
+    return written
+
+
 def _probe_image(file_path: str) -> tuple[int, int]:
     import pyvips
 
@@ -60,10 +119,14 @@ def _probe_image(file_path: str) -> tuple[int, int]:
 def compress_image(
     file_path: str,
     policy: Optional[ImageCompressPolicy] = None,
+    renditions: bool = True,
 ) -> CompressResult:
     """
     Normalize complainant images to JPEG (max long edge, quality 80, EXIF stripped).
 
+    The source is decoded once; the normalized image is kept in memory and the derived
+    RENDITIONS are written from it.
+
     On failure or skip threshold match, keeps the original file and returns
     status ``skipped`` or ``failed`` without raising.
     """
@@ -85,7 +148,7 @@ def compress_image(
                 original_bytes,
                 edge,
             )
-            return CompressResult(
+            result = CompressResult(
                 original_bytes=original_bytes,
                 compressed_bytes=original_bytes,
                 width=width,
@@ -93,13 +156,18 @@ def compress_image(
                 status="skipped",
                 output_path=file_path,
             )
+            if renditions:
+                source = pyvips.Image.thumbnail(file_path, policy.max_long_edge, size=pyvips.Size.DOWN)
+                result.renditions = _write_renditions(source.copy_memory(), file_path, policy)
+            return result
 
         # Animated GIF: thumbnail uses first frame only (spec §6.3).
+        # copy_memory: every save below reuses this one decode.
         thumbnail = pyvips.Image.thumbnail(
             file_path,
             policy.max_long_edge,
             size=pyvips.Size.DOWN,
-        )
+        ).copy_memory()
 
         output_path = _jpeg_output_path(file_path)
         fd, temp_path = tempfile.mkstemp(suffix=".jpg", dir=os.path.dirname(file_path) or ".")
@@ -133,6 +201,7 @@ def compress_image(
                 height=thumbnail.height,
                 status="compressed",
                 output_path=output_path,
+                renditions=_write_renditions(thumbnail, output_path, policy) if renditions else [],
             )
         finally:
             if temp_path and os.path.exists(temp_path):
@@ -155,6 +224,21 @@ def compress_image(
         )
 
 
+def compress_images(
+    file_paths: Sequence[str],
+    policy: Optional[ImageCompressPolicy] = None,
+    max_workers: int = IMAGE_COMPRESS_CONCURRENCY,
+) -> List[CompressResult]:
+    """Compress a batch with at most `max_workers` images in flight; results in input order.
+
+    libvips releases the GIL while it works, so threads overlap decode/encode of different images.
+    """
+    if len(file_paths) <= 1 or max_workers <= 1:
+        return [compress_image(path, policy) for path in file_paths]
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="img-compress") as pool:
+        return list(pool.map(lambda path: compress_image(path, policy), file_paths))
+
+
 def log_heif_availability() -> None:
     """Log whether HEIF loaders are available (call from Celery worker startup)."""
     try:
@@ -0,0 +1,337 @@
+"""
+Outbound messaging throughput against local fake SMTP / DOIT SMS servers.
+
+Both fakes run in-process on 127.0.0.1. ``--handshake-ms`` delays each new SMTP
+connection to stand in for TCP + STARTTLS + AUTH round trips to a remote relay (the fake
+speaks plain SMTP); ``--sms-latency-ms`` delays every gateway response.
+
+Scenarios:
+  email_fresh     one SMTP connection per message (previous EmailClient behaviour)
+  email_pooled    SmtpPool sessions shared by --concurrency senders
+  sms_single      DoitSmsClient, one POST /api/sms per message (keep-alive session)
+  sms_batched     DoitSmsClient with --sms-batch-size recipients per request
+  outbox          MessageDispatcher over the in-memory store: enqueue everything, then
+                  wait for the drain (production uses the Redis store)
+
+Run:
+  python -m backend.services.message_dispatch_bench --emails 300 --sms 1000 --out dispatch.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import smtplib
+import socketserver
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.mime.text import MIMEText
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from backend.config.sms_config import SmsConfig
+from backend.config.smtp_config import SmtpConfig
+from backend.services.message_dispatcher import DispatchConfig, MessageDispatcher, SmtpPool
+
+SENDER = "grm@bench.local"
+
+
+class _SmtpHandler(socketserver.StreamRequestHandler):
+    """Just enough ESMTP for smtplib: EHLO, AUTH PLAIN, MAIL, RCPT, DATA, NOOP, RSET, QUIT."""
+
+    disable_nagle_algorithm = True
+
+    def _reply(self, line: str) -> None:
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self) -> None:
+        server: FakeSmtpServer = self.server  # type: ignore[assignment]
+        if server.handshake_delay:
+            time.sleep(server.handshake_delay)
+        server.count("connections")
+        self._reply("220 fake-smtp ready")
+        while True:
+            raw = self.rfile.readline()
+            if not raw:
+                return
+            verb = raw.decode(errors="replace").strip().split(" ", 1)[0].upper()
+            if verb in ("EHLO", "HELO"):
+                self._reply("250-fake-smtp")
+                self._reply("250 AUTH PLAIN")
+            elif verb == "AUTH":
+                self._reply("235 2.7.0 Authentication successful")
+            elif verb in ("MAIL", "RCPT", "NOOP", "RSET"):
+                self._reply("250 OK")
+            elif verb == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                while self.rfile.readline() not in (b".\r\n", b""):
+                    pass
+                server.count("messages")
+                self._reply("250 OK queued")
+            elif verb == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("502 Command not implemented")
+
+
+class FakeSmtpServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, handshake_delay: float = 0.0) -> None:
+        super().__init__(("127.0.0.1", 0), _SmtpHandler)
+        self.handshake_delay = handshake_delay
+        self.stats = {"connections": 0, "messages": 0}
+        self._lock = threading.Lock()
+        threading.Thread(target=self.serve_forever, name="fake-smtp", daemon=True).start()
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+    def config(self) -> SmtpConfig:
+        return SmtpConfig(host="127.0.0.1", port=self.port, username="bench", password="bench",
+                          from_addr=SENDER, from_display="GRM Bench")
+
+    def connect(self) -> smtplib.SMTP:
+        """Plain authenticated session (the fake has no STARTTLS; see --handshake-ms)."""
+        smtp = smtplib.SMTP("127.0.0.1", self.port, timeout=30)
+        smtp.ehlo()
+        smtp.login("bench", "bench")
+        return smtp
+
+    def close(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+class _SmsHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real gateway
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+    def _json(self, status: int, body: Dict[str, Any]) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:
+        self._json(200, {"balance": 1000, "ntc_rate": 0.5, "ncell_rate": 0.5})
+
+    def do_POST(self) -> None:
+        server: FakeSmsServer = self.server  # type: ignore[assignment]
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}")
+        if server.latency:
+            time.sleep(server.latency)
+        recipients = [m for m in str(body.get("mobile", "")).split(",") if m]
+        server.record(recipients)
+        self._json(200, {"message": "SMS sent successfully"})
+
+
+class FakeSmsServer(ThreadingHTTPServer):
+    """DOIT-shaped gateway: POST /api/sms {message, mobile} (comma-separated), GET /api/balance."""
+
+    daemon_threads = True
+
+    def __init__(self, latency: float = 0.0) -> None:
+        super().__init__(("127.0.0.1", 0), _SmsHandler)
+        self.latency = latency
+        self.requests = 0
+        self.recipients: List[str] = []
+        self._lock = threading.Lock()
+        threading.Thread(target=self.serve_forever, name="fake-sms", daemon=True).start()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def record(self, recipients: List[str]) -> None:
+        with self._lock:
+            self.requests += 1
+            self.recipients.extend(recipients)
+
+    def close(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+def _email(i: int) -> str:
+    msg = MIMEText(f"<p>Escalation notice {i}</p>", "html", "utf-8")
+    msg["Subject"] = f"GRM bench {i}"
+    msg["From"] = SENDER
+    msg["To"] = f"officer{i}@bench.local"
+    return msg.as_string()
+
+
+def _timed(fn: Callable[[], Any], count: int) -> Dict[str, Any]:
+    started = time.perf_counter()
+    fn()
+    seconds = time.perf_counter() - started
+    return {"messages": count, "seconds": round(seconds, 3),
+            "per_sec": round(count / seconds, 1) if seconds else None}
+
+
+def bench_email(server: FakeSmtpServer, *, emails: int, concurrency: int, pooled: bool) -> Dict[str, Any]:
+    before = dict(server.stats)
+    pool = SmtpPool(server.config(), size=concurrency, connect=server.connect) if pooled else None
+
+    def send(i: int) -> None:
+        if pool is not None:
+            pool.sendmail(SENDER, [f"officer{i}@bench.local"], _email(i))
+            return
+        smtp = server.connect()
+        try:
+            smtp.sendmail(SENDER, [f"officer{i}@bench.local"], _email(i))
+        finally:
+            smtp.quit()
+
+    def run() -> None:
+        with ThreadPoolExecutor(max_workers=concurrency) as ex:
+            list(ex.map(send, range(emails)))
+
+    result = _timed(run, emails)
+    if pool is not None:
+        pool.close()
+    result["connections"] = server.stats["connections"] - before["connections"]
+    result["delivered"] = server.stats["messages"] - before["messages"]
+    return result
+
+
+def _doit_client(server: FakeSmsServer, batch_size: int):
+    from backend.services.messaging import DoitSmsClient
+
+    config = SmsConfig(provider="doit", enabled=True, base_url=server.base_url,
+                       bearer_token="bench", whitelist_only=False)
+    return DoitSmsClient(config, DispatchConfig(sms_rate_per_sec=0, sms_batch_size=batch_size))
+
+
+def _sms_messages(count: int) -> List[Tuple[str, str]]:
+    # A handful of distinct texts, like escalation notices per step
+    return [(f"98{i:08d}", f"GRM: ticket escalated to level {i % 3 + 1}") for i in range(count)]
+
+
+def bench_sms(server: FakeSmsServer, *, sms: int, batch_size: int) -> Dict[str, Any]:
+    client = _doit_client(server, batch_size)
+    before_requests, before_recipients = server.requests, len(server.recipients)
+    results: List[bool] = []
+    result = _timed(lambda: results.extend(client.send_sms_batch(_sms_messages(sms))), sms)
+    result["requests"] = server.requests - before_requests
+    result["delivered"] = len(server.recipients) - before_recipients
+    result["failed"] = results.count(False)
+    return result
+
+
+class _BenchMessaging:
+    """Messaging-shaped adapter over the fakes for MessageDispatcher."""
+
+    def __init__(self, smtp: FakeSmtpServer, sms: FakeSmsServer, *, pool_size: int, batch_size: int) -> None:
+        self.pool = SmtpPool(smtp.config(), size=pool_size, connect=smtp.connect)
+        self.sms = _doit_client(sms, batch_size)
+
+    def send_sms_batch(self, messages: List[Tuple[str, str]]) -> List[bool]:
+        return self.sms.send_sms_batch(messages)
+
+    def send_email_batch(self, messages: List[Dict[str, Any]]) -> List[bool]:
+        with self.pool.session() as smtp:
+            for i, m in enumerate(messages):
+                smtp.sendmail(SENDER, m["to"], _email(i))
+        return [True] * len(messages)
+
+
+def bench_outbox(
+    smtp: FakeSmtpServer,
+    sms: FakeSmsServer,
+    *,
+    emails: int,
+    sms_count: int,
+    concurrency: int,
+    batch_size: int,
+) -> Dict[str, Any]:
+    messaging = _BenchMessaging(smtp, sms, pool_size=concurrency, batch_size=batch_size)
+    dispatcher = MessageDispatcher(messaging, DispatchConfig(outbox_workers=concurrency))
+    before_smtp, before_sms = smtp.stats["messages"], len(sms.recipients)
+
+    started = time.perf_counter()
+    for phone, text in _sms_messages(sms_count):
+        dispatcher.enqueue_sms(phone, text)
+    for i in range(emails):
+        dispatcher.enqueue_email([f"officer{i}@bench.local"], f"GRM bench {i}", "<p>x</p>")
+    enqueue_seconds = time.perf_counter() - started
+    drained = dispatcher.outbox.drain(timeout=300)
+    total = time.perf_counter() - started
+    dispatcher.outbox.stop(timeout=1)
+    messaging.pool.close()
+    return {
+        "messages": emails + sms_count,
+        "enqueue_ms": round(enqueue_seconds * 1000, 1),
+        "seconds": round(total, 3),
+        "per_sec": round((emails + sms_count) / total, 1) if total else None,
+        "drained": drained,
+        "delivered": (smtp.stats["messages"] - before_smtp) + (len(sms.recipients) - before_sms),
+        "outbox": dispatcher.outbox.stats(),
+    }
+
+
+def run_bench(
+    *,
+    emails: int = 200,
+    sms: int = 500,
+    concurrency: int = 4,
+    handshake_ms: float = 40.0,
+    sms_latency_ms: float = 5.0,
+    sms_batch_size: int = 50,
+) -> Dict[str, Any]:
+    smtp_server = FakeSmtpServer(handshake_delay=handshake_ms / 1000)
+    sms_server = FakeSmsServer(latency=sms_latency_ms / 1000)
+    try:
+        return {
+            "params": {"emails": emails, "sms": sms, "concurrency": concurrency, "handshake_ms": handshake_ms,
+                       "sms_latency_ms": sms_latency_ms, "sms_batch_size": sms_batch_size},
+            "email_fresh": bench_email(smtp_server, emails=emails, concurrency=concurrency, pooled=False),
+            "email_pooled": bench_email(smtp_server, emails=emails, concurrency=concurrency, pooled=True),
+            "sms_single": bench_sms(sms_server, sms=sms, batch_size=1),
+            "sms_batched": bench_sms(sms_server, sms=sms, batch_size=sms_batch_size),
+            "outbox": bench_outbox(smtp_server, sms_server, emails=emails, sms_count=sms,
+                                   concurrency=concurrency, batch_size=sms_batch_size),
+        }
+    finally:
+        smtp_server.close()
+        sms_server.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m backend.services.message_dispatch_bench", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--emails", type=int, default=200)
+    parser.add_argument("--sms", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=4, help="senders / pool size / outbox workers")
+    parser.add_argument("--handshake-ms", type=float, default=40.0, help="delay per new SMTP connection")
+    parser.add_argument("--sms-latency-ms", type=float, default=5.0, help="delay per gateway request")
+    parser.add_argument("--sms-batch-size", type=int, default=50)
+    parser.add_argument("--out", help="write results JSON here")
+    args = parser.parse_args(argv)
+
+    result = run_bench(emails=args.emails, sms=args.sms, concurrency=args.concurrency,
+                       handshake_ms=args.handshake_ms, sms_latency_ms=args.sms_latency_ms,
+                       sms_batch_size=args.sms_batch_size)
+    text = json.dumps(result, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as fh:
+            fh.write(text + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,737 @@
+"""
+Pooled, rate-limited outbound delivery for the Messaging API.
+
+- SmtpPool: persistent authenticated SMTP sessions per profile, reused across messages
+  instead of a TCP + STARTTLS + AUTH handshake per email.
+- RateLimiter: token bucket per provider (each SMTP profile, DOIT, SNS) so bursts are
+  paced below relay / gateway limits instead of being rejected.
+- Outbox: queue in Redis shared by every API process, drained by background threads in
+  each. Due messages of the same channel are handed to the transport as one batch and
+  failures are retried with exponential backoff. POST /api/messaging/send-batch enqueues
+  here and returns at once, so Celery workers fanning out reports or escalation notices do
+  not wait on delivery. An email whose attachments are refused is sent once more without
+  them, with a note, as the synchronous callers do.
+
+Accepted messages survive an API restart: a batch is leased while it is being delivered
+and becomes due again if its worker dies, so delivery is at-least-once. The backend app
+starts the drain threads in its lifespan (start_outbox), so queued messages, pending
+retries and expired leases are picked up after a restart without waiting for new sends. Callers that need
+the delivery outcome keep using send-sms / send-email, which share the same pools and
+limiters.
+
+See docs/services/05_messaging_service.md §9.
+"""
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import smtplib
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from backend.config.smtp_config import SmtpConfig
+from backend.logger.logger import TaskLogger
+
+logger = TaskLogger(service_name="messaging_service").logger
+
+
+@dataclass(frozen=True)
+class DispatchConfig:
+    smtp_pool_size: int = 4             # open sessions per SMTP profile
+    smtp_idle_seconds: float = 60.0     # idle sessions older than this are closed, not reused
+    smtp_rate_per_sec: float = 5.0      # messages/sec per SMTP profile (0 = unlimited)
+    sms_rate_per_sec: float = 10.0      # provider requests/sec (0 = unlimited)
+    sms_batch_size: int = 1             # DOIT recipients per request (1 = one request per SMS)
+    outbox_workers: int = 2
+    outbox_batch_size: int = 50
+    outbox_max_attempts: int = 5
+    outbox_retry_seconds: float = 5.0   # first retry delay; doubles per attempt, capped at 5 min
+    outbox_lease_seconds: float = 300.0 # a claimed batch is redelivered if not settled by then
+    outbox_redis_url: str = ""          # empty = REDIS_URL from backend.task_queue.settings
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, "").strip() or default)
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, "").strip() or default)
+    except ValueError:
+        return default
+
+
+def resolve_dispatch_config() -> DispatchConfig:
+    """Dispatcher tuning from env (MESSAGING_* / DOIT_SMS_BATCH_SIZE)."""
+    d = DispatchConfig()
+    return DispatchConfig(
+        smtp_pool_size=max(1, _env_int("MESSAGING_SMTP_POOL_SIZE", d.smtp_pool_size)),
+        smtp_idle_seconds=_env_float("MESSAGING_SMTP_IDLE_SECONDS", d.smtp_idle_seconds),
+        smtp_rate_per_sec=_env_float("MESSAGING_SMTP_RATE_PER_SEC", d.smtp_rate_per_sec),
+        sms_rate_per_sec=_env_float("MESSAGING_SMS_RATE_PER_SEC", d.sms_rate_per_sec),
+        sms_batch_size=max(1, _env_int("DOIT_SMS_BATCH_SIZE", d.sms_batch_size)),
+        outbox_workers=max(1, _env_int("MESSAGING_OUTBOX_WORKERS", d.outbox_workers)),
+        outbox_batch_size=max(1, _env_int("MESSAGING_OUTBOX_BATCH_SIZE", d.outbox_batch_size)),
+        outbox_max_attempts=max(1, _env_int("MESSAGING_OUTBOX_MAX_ATTEMPTS", d.outbox_max_attempts)),
+        outbox_retry_seconds=_env_float("MESSAGING_OUTBOX_RETRY_SECONDS", d.outbox_retry_seconds),
+        outbox_lease_seconds=_env_float("MESSAGING_OUTBOX_LEASE_SECONDS", d.outbox_lease_seconds),
+        outbox_redis_url=os.getenv("MESSAGING_OUTBOX_REDIS_URL", "").strip(),
+    )
+
+
+class RateLimiter:
+    """Token bucket: ``rate`` tokens/sec, bursts up to ``burst``. rate <= 0 never blocks."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.burst
+        self._last = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until ``tokens`` are available; returns the seconds spent waiting."""
+        if self.rate <= 0:
+            return 0.0
+        tokens = min(tokens, self.burst)
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            self._sleep(delay)
+            waited += delay
+
+
+def open_smtp_session(cfg: SmtpConfig, timeout: float = 30) -> smtplib.SMTP:
+    """Authenticated SMTP session (SMTPS on 465, STARTTLS on other ports)."""
+    use_ssl = cfg.port == 465
+    smtp_cls = smtplib.SMTP_SSL if use_ssl else smtplib.SMTP
+    smtp = smtp_cls(cfg.host, cfg.port, timeout=timeout)
+    try:
+        smtp.ehlo()
+        if not use_ssl:
+            smtp.starttls()
+            smtp.ehlo()
+        smtp.login(cfg.username, cfg.password)
+    except Exception:
+        smtp.close()
+        raise
+    return smtp
+
+
+def _quit(smtp: smtplib.SMTP) -> None:
+    try:
+        smtp.quit()
+    except Exception:
+        smtp.close()
+
+
+class SmtpPool:
+    """
+    Up to ``size`` authenticated sessions to one SMTP profile, reused most-recent-first.
+
+    A session idle longer than ``idle_seconds`` is closed rather than reused (relays drop
+    idle connections); one idle for more than a few seconds is checked with NOOP first.
+    A session is discarded whenever the caller's block raises; ``sendmail`` also retries
+    once on a fresh session when a reused one turns out to be disconnected.
+    """
+
+    NOOP_AFTER_SECONDS = 5.0
+
+    def __init__(
+        self,
+        cfg: SmtpConfig,
+        *,
+        size: int = 4,
+        idle_seconds: float = 60.0,
+        timeout: float = 30,
+        connect: Optional[Callable[[], smtplib.SMTP]] = None,
+    ) -> None:
+        self.cfg = cfg
+        self.size = max(1, size)
+        self.idle_seconds = idle_seconds
+        self._connect = connect or (lambda: open_smtp_session(cfg, timeout=timeout))
+        self._idle: List[tuple[smtplib.SMTP, float]] = []
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._lock = threading.Lock()
+        self.opened = 0
+        self.reused = 0
+
+    @contextmanager
+    def session(self) -> Iterator[smtplib.SMTP]:
+        with self._slots:
+            smtp, _ = self._checkout()
+            try:
+                yield smtp
+            except BaseException:
+                _quit(smtp)
+                raise
+            self._checkin(smtp)
+
+    def sendmail(self, from_addr: str, to_addrs: List[str], msg: str) -> None:
+        """
+        Send one message on a pooled session.
+
+        A reused session can still have been dropped by the relay (the NOOP check only
+        runs after NOOP_AFTER_SECONDS idle); if it disconnects, the message is sent once
+        more on a freshly opened session before the error reaches the caller.
+        """
+        with self._slots:
+            smtp, reused = self._checkout()
+            try:
+                smtp.sendmail(from_addr, to_addrs, msg)
+            except smtplib.SMTPServerDisconnected:
+                smtp.close()
+                if not reused:
+                    raise
+                smtp = self._open()
+                try:
+                    smtp.sendmail(from_addr, to_addrs, msg)
+                except BaseException:
+                    _quit(smtp)
+                    raise
+            except BaseException:
+                _quit(smtp)
+                raise
+            self._checkin(smtp)
+
+    def _checkin(self, smtp: smtplib.SMTP) -> None:
+        with self._lock:
+            self._idle.append((smtp, time.monotonic()))
+
+    def _checkout(self) -> tuple[smtplib.SMTP, bool]:
+        """An idle session (reused=True) or a freshly opened one."""
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                smtp, since = self._idle.pop()
+            idle = time.monotonic() - since
+            if idle > self.idle_seconds:
+                _quit(smtp)
+                continue
+            if idle > self.NOOP_AFTER_SECONDS:
+                try:
+                    if smtp.noop()[0] != 250:
+                        raise smtplib.SMTPException("NOOP rejected")
+                except (smtplib.SMTPException, OSError):
+                    smtp.close()
+                    continue
+            with self._lock:
+                self.reused += 1
+            return smtp, True
+        return self._open(), False
+
+    def _open(self) -> smtplib.SMTP:
+        smtp = self._connect()
+        with self._lock:
+            self.opened += 1
+        return smtp
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for smtp, _ in idle:
+            _quit(smtp)
+
+
+@dataclass
+class OutboxMessage:
+    channel: str                    # "sms" | "email"
+    payload: Dict[str, Any]
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    attempts: int = 0
+    last_error: Optional[str] = None
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "id": self.id,
+                "channel": self.channel,
+                "payload": self.payload,
+                "attempts": self.attempts,
+                "last_error": self.last_error,
+            },
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_json(cls, raw: Any) -> "OutboxMessage":
+        data = json.loads(raw)
+        return cls(
+            channel=data["channel"],
+            payload=data["payload"],
+            id=data["id"],
+            attempts=int(data.get("attempts") or 0),
+            last_error=data.get("last_error"),
+        )
+
+
+# Delivers one same-channel batch; returns an error string per message (None = delivered).
+Deliver = Callable[[str, List[OutboxMessage]], List[Optional[str]]]
+
+OUTBOX_CHANNELS = ("sms", "email")
+_DEAD_KEEP = 200
+
+
+class MemoryOutboxStore:
+    """Process-local store for tests and the bench; nothing survives a restart."""
+
+    durable = False
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._messages: Dict[str, OutboxMessage] = {}
+        self._due: Dict[str, float] = {}
+        self._counters = {"sent": 0, "retried": 0, "failed": 0}
+        self._dead: deque[OutboxMessage] = deque(maxlen=_DEAD_KEEP)
+
+    def add(self, messages: List[OutboxMessage], due: float) -> None:
+        with self._lock:
+            for msg in messages:
+                self._messages[msg.id] = msg
+                self._due[msg.id] = due
+
+    def claim(self, channel: str, now: float, limit: int, lease_until: float) -> List[OutboxMessage]:
+        with self._lock:
+            ready = sorted(
+                (mid for mid, due in self._due.items() if due <= now and self._messages[mid].channel == channel),
+                key=self._due.__getitem__,
+            )[:limit]
+            for mid in ready:
+                self._due[mid] = lease_until
+            return [self._messages[mid] for mid in ready]
+
+    def ack(self, messages: List[OutboxMessage]) -> None:
+        with self._lock:
+            for msg in messages:
+                self._messages.pop(msg.id, None)
+                self._due.pop(msg.id, None)
+            self._counters["sent"] += len(messages)
+
+    def retry(self, msg: OutboxMessage, due: float) -> None:
+        with self._lock:
+            self._messages[msg.id] = msg
+            self._due[msg.id] = due
+            self._counters["retried"] += 1
+
+    def bury(self, msg: OutboxMessage) -> None:
+        with self._lock:
+            self._messages.pop(msg.id, None)
+            self._due.pop(msg.id, None)
+            self._dead.append(msg)
+            self._counters["failed"] += 1
+
+    def dead(self, limit: int = 50) -> List[OutboxMessage]:
+        with self._lock:
+            return list(self._dead)[-limit:][::-1]
+
+    def stats(self, now: float) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "queued": len(self._due),
+                "due": sum(1 for due in self._due.values() if due <= now),
+                **self._counters,
+                "dead": len(self._dead),
+            }
+
+
+# Hand out up to ARGV[2] due ids from one channel and push their score to the lease
+# deadline, atomically, so two API processes never claim the same message. A worker that
+# dies mid-batch leaves the lease to expire and the message becomes due again.
+_CLAIM_LUA = """
+local ids = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[2]))
+local out = {}
+for _, id in ipairs(ids) do
+  local body = redis.call('HGET', KEYS[2], id)
+  if body then
+    redis.call('ZADD', KEYS[1], ARGV[3], id)
+    table.insert(out, body)
+  else
+    redis.call('ZREM', KEYS[1], id)
+  end
+end
+return out
+"""
+
+
+class RedisOutboxStore:
+    """
+    Outbox shared by every API process through Redis.
+
+    ``<prefix>:due:<channel>`` is a sorted set of message ids scored by due time (or lease
+    deadline while a batch is out), ``<prefix>:msg`` holds the JSON bodies, ``<prefix>:dead``
+    the last undeliverable messages and ``<prefix>:stats`` the sent / retried / failed
+    counters. Delivery is at-least-once: a message whose worker died is sent again once
+    its lease runs out.
+    """
+
+    durable = True
+
+    def __init__(self, client: Any, prefix: str = "grm:messaging:outbox") -> None:
+        self.client = client
+        self.prefix = prefix
+        self._claim = client.register_script(_CLAIM_LUA)
+
+    def _due_key(self, channel: str) -> str:
+        return f"{self.prefix}:due:{channel}"
+
+    @property
+    def _msg_key(self) -> str:
+        return f"{self.prefix}:msg"
+
+    def add(self, messages: List[OutboxMessage], due: float) -> None:
+        pipe = self.client.pipeline(transaction=True)
+        pipe.hset(self._msg_key, mapping={m.id: m.to_json() for m in messages})
+        for channel in {m.channel for m in messages}:
+            pipe.zadd(self._due_key(channel), {m.id: due for m in messages if m.channel == channel})
+        pipe.execute()
+
+    def claim(self, channel: str, now: float, limit: int, lease_until: float) -> List[OutboxMessage]:
+        rows = self._claim(keys=[self._due_key(channel), self._msg_key], args=[now, limit, lease_until])
+        return [OutboxMessage.from_json(row) for row in rows]
+
+    def ack(self, messages: List[OutboxMessage]) -> None:
+        pipe = self.client.pipeline(transaction=True)
+        for msg in messages:
+            pipe.zrem(self._due_key(msg.channel), msg.id)
+        pipe.hdel(self._msg_key, *[m.id for m in messages])
+        pipe.hincrby(f"{self.prefix}:stats", "sent", len(messages))
+        pipe.execute()
+
+    def retry(self, msg: OutboxMessage, due: float) -> None:
+        pipe = self.client.pipeline(transaction=True)
+        pipe.hset(self._msg_key, msg.id, msg.to_json())
+        pipe.zadd(self._due_key(msg.channel), {msg.id: due})
+        pipe.hincrby(f"{self.prefix}:stats", "retried", 1)
+        pipe.execute()
+
+    def bury(self, msg: OutboxMessage) -> None:
+        pipe = self.client.pipeline(transaction=True)
+        pipe.zrem(self._due_key(msg.channel), msg.id)
+        pipe.hdel(self._msg_key, msg.id)
+        pipe.lpush(f"{self.prefix}:dead", msg.to_json())
+        pipe.ltrim(f"{self.prefix}:dead", 0, _DEAD_KEEP - 1)
+        pipe.hincrby(f"{self.prefix}:stats", "failed", 1)
+        pipe.execute()
+
+    def dead(self, limit: int = 50) -> List[OutboxMessage]:
+        return [OutboxMessage.from_json(row) for row in self.client.lrange(f"{self.prefix}:dead", 0, limit - 1)]
+
+    def stats(self, now: float) -> Dict[str, int]:
+        pipe = self.client.pipeline(transaction=False)
+        for channel in OUTBOX_CHANNELS:
+            pipe.zcard(self._due_key(channel))
+            pipe.zcount(self._due_key(channel), "-inf", now)
+        pipe.hgetall(f"{self.prefix}:stats")
+        pipe.llen(f"{self.prefix}:dead")
+        *counts, counters, dead = pipe.execute()
+        counters = {k.decode() if isinstance(k, bytes) else k: int(v) for k, v in counters.items()}
+        return {
+            "queued": sum(counts[0::2]),
+            "due": sum(counts[1::2]),
+            "sent": counters.get("sent", 0),
+            "retried": counters.get("retried", 0),
+            "failed": counters.get("failed", 0),
+            "dead": dead,
+        }
+
+
+class Outbox:
+    """
+    Delivery queue with retry over an outbox store, drained by ``workers`` background threads.
+
+    Workers claim due messages of one channel at a time, hand them to ``deliver`` as a
+    batch and ack, reschedule or bury each one. Threads start with start(), lazily on
+    first submit, and again after fork (Celery prefork, uvicorn workers); with a shared
+    store every process drains the same queue. Messages that exhaust ``max_attempts`` are logged and buried.
+    """
+
+    MAX_RETRY_SECONDS = 300.0
+
+    def __init__(
+        self,
+        deliver: Deliver,
+        *,
+        store: Optional[Any] = None,
+        workers: int = 2,
+        batch_size: int = 50,
+        max_attempts: int = 5,
+        retry_seconds: float = 5.0,
+        lease_seconds: float = 300.0,
+        poll_seconds: float = 1.0,
+    ) -> None:
+        self._deliver = deliver
+        self.store = store if store is not None else MemoryOutboxStore()
+        self.workers = max(1, workers)
+        self.batch_size = max(1, batch_size)
+        self.max_attempts = max(1, max_attempts)
+        self.retry_seconds = retry_seconds
+        self.lease_seconds = lease_seconds
+        self.poll_seconds = poll_seconds
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._next_channel = 0
+        self._pid: Optional[int] = None
+        self._stopping = False
+
+    def submit(self, channel: str, payload: Dict[str, Any]) -> str:
+        return self.submit_many([(channel, payload)])[0]
+
+    def submit_many(self, items: List[tuple[str, Dict[str, Any]]]) -> List[str]:
+        """Store all messages in one write (store errors propagate), then wake a worker."""
+        messages = [OutboxMessage(channel=channel, payload=payload) for channel, payload in items]
+        if messages:
+            self.store.add(messages, time.time())
+            self._ensure_workers()
+            with self._cond:
+                self._cond.notify()
+        return [m.id for m in messages]
+
+    def stats(self) -> Dict[str, int]:
+        """Store-wide counters: queued (incl. pending retries), due, sent, retried, failed, dead."""
+        return self.store.stats(time.time())
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the store is empty and this process has nothing in flight."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._cond:
+                idle = not self._in_flight
+            if idle and not self.stats()["queued"]:
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            with self._cond:
+                self._cond.wait(0.05)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop the workers; a process-local store is drained for up to ``timeout`` first."""
+        if self._pid != os.getpid():
+            return
+        if not self.store.durable:
+            self.drain(timeout)
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        self._pid = None
+        try:
+            left = self.stats()["queued"]
+        except Exception:
+            return
+        if left and not self.store.durable:
+            logger.warning("Messaging outbox stopped with %d undelivered messages", left)
+
+    def start(self) -> None:
+        """Start draining now (app startup): work already in the store is delivered."""
+        self._ensure_workers()
+        with self._cond:
+            self._cond.notify_all()
+
+    def _ensure_workers(self) -> None:
+        if self._pid == os.getpid():
+            return
+        with self._cond:
+            if self._pid == os.getpid():
+                return
+            self._stopping = False
+            for n in range(self.workers):
+                threading.Thread(target=self._run, name=f"messaging-outbox-{n}", daemon=True).start()
+            self._pid = os.getpid()
+
+    def _claim(self) -> List[OutboxMessage]:
+        now = time.time()
+        for _ in OUTBOX_CHANNELS:
+            with self._cond:
+                channel = OUTBOX_CHANNELS[self._next_channel % len(OUTBOX_CHANNELS)]
+                self._next_channel += 1
+            batch = self.store.claim(channel, now, self.batch_size, now + self.lease_seconds)
+            if batch:
+                with self._cond:
+                    self._in_flight += len(batch)
+                return batch
+        return []
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if self._stopping:
+                    return
+            try:
+                batch = self._claim()
+            except Exception as exc:
+                logger.warning("Messaging outbox claim failed: %s", exc)
+                batch = []
+            if not batch:
+                with self._cond:
+                    if not self._stopping:
+                        self._cond.wait(self.poll_seconds)
+                continue
+            try:
+                self._settle(batch)
+            finally:
+                with self._cond:
+                    self._in_flight -= len(batch)
+                    self._cond.notify_all()
+
+    def _settle(self, batch: List[OutboxMessage]) -> None:
+        try:
+            errors = self._deliver(batch[0].channel, batch)
+        except Exception as exc:
+            logger.exception("Messaging outbox %s batch failed: %s", batch[0].channel, exc)
+            errors = [str(exc) or type(exc).__name__] * len(batch)
+        try:
+            delivered = [msg for msg, error in zip(batch, errors) if error is None]
+            if delivered:
+                self.store.ack(delivered)
+            for msg, error in zip(batch, errors):
+                if error is None:
+                    continue
+                msg.attempts += 1
+                msg.last_error = error
+                if msg.attempts >= self.max_attempts:
+                    self.store.bury(msg)
+                    logger.error(
+                        "Messaging outbox gave up on %s %s after %d attempts: %s",
+                        msg.channel, msg.id, msg.attempts, error,
+                    )
+                else:
+                    delay = min(self.MAX_RETRY_SECONDS, self.retry_seconds * 2 ** (msg.attempts - 1))
+                    self.store.retry(msg, time.time() + delay)
+        except Exception as exc:
+            # The lease still holds the batch; it is delivered again once the lease runs out.
+            logger.warning("Messaging outbox could not record %s batch outcome: %s", batch[0].channel, exc)
+
+
+ATTACHMENT_FALLBACK_NOTE = "<p><em>Attachment could not be delivered; download it from the system.</em></p>"
+
+
+class MessageDispatcher:
+    """Outbox whose deliver step goes through Messaging (pooled SMTP, batched SMS)."""
+
+    def __init__(
+        self,
+        messaging: Any,
+        config: Optional[DispatchConfig] = None,
+        *,
+        store: Optional[Any] = None,
+    ) -> None:
+        config = config or resolve_dispatch_config()
+        self.messaging = messaging
+        self.outbox = Outbox(
+            self._deliver,
+            store=store,
+            workers=config.outbox_workers,
+            batch_size=config.outbox_batch_size,
+            max_attempts=config.outbox_max_attempts,
+            retry_seconds=config.outbox_retry_seconds,
+            lease_seconds=config.outbox_lease_seconds,
+        )
+
+    @staticmethod
+    def sms_item(to: str, text: str) -> tuple[str, Dict[str, Any]]:
+        return "sms", {"to": to, "text": text}
+
+    @staticmethod
+    def email_item(
+        to: List[str],
+        subject: str,
+        html_body: str,
+        attachments: Optional[List[Dict[str, Any]]] = None,
+    ) -> tuple[str, Dict[str, Any]]:
+        return "email", {"to": list(to), "subject": subject, "html_body": html_body, "attachments": attachments}
+
+    def enqueue_sms(self, to: str, text: str) -> str:
+        return self.outbox.submit(*self.sms_item(to, text))
+
+    def enqueue_email(
+        self,
+        to: List[str],
+        subject: str,
+        html_body: str,
+        attachments: Optional[List[Dict[str, Any]]] = None,
+    ) -> str:
+        return self.outbox.submit(*self.email_item(to, subject, html_body, attachments))
+
+    def enqueue_many(self, items: List[tuple[str, Dict[str, Any]]]) -> List[str]:
+        """Queue sms_item / email_item tuples in one store write."""
+        return self.outbox.submit_many(items)
+
+    def _deliver(self, channel: str, batch: List[OutboxMessage]) -> List[Optional[str]]:
+        if channel == "sms":
+            results = self.messaging.send_sms_batch([(m.payload["to"], m.payload["text"]) for m in batch])
+            return [None if ok else "SMS delivery failed or disabled" for ok in results]
+        results = self.messaging.send_email_batch([m.payload for m in batch])
+        for i, (msg, ok) in enumerate(zip(batch, results)):
+            if not ok and msg.payload.get("attachments"):
+                results[i] = self._send_body_only(msg.payload)
+        return [None if ok else "Email delivery failed" for ok in results]
+
+    def _send_body_only(self, payload: Dict[str, Any]) -> bool:
+        """Attachment refused (size, type, relay limit): still deliver the message itself."""
+        logger.warning("Email with attachments to %s failed; sending body only", payload["to"])
+        return self.messaging.send_email(
+            payload["to"], payload["subject"], payload["html_body"] + ATTACHMENT_FALLBACK_NOTE
+        )
+
+
+_dispatcher: Optional[MessageDispatcher] = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_dispatcher() -> MessageDispatcher:
+    """Process-wide dispatcher over the Messaging singleton and the Redis outbox."""
+    global _dispatcher
+    if _dispatcher is None:
+        with _dispatcher_lock:
+            if _dispatcher is None:
+                import redis
+
+                from backend.services.messaging import Messaging
+                from backend.task_queue.settings import REDIS_URL
+
+                config = resolve_dispatch_config()
+                client = redis.Redis.from_url(
+                    config.outbox_redis_url or REDIS_URL, socket_timeout=5, socket_connect_timeout=2
+                )
+                _dispatcher = MessageDispatcher(Messaging(), config, store=RedisOutboxStore(client))
+                atexit.register(_dispatcher.outbox.stop)
+    return _dispatcher
+
+
+def start_outbox() -> None:
+    """Start this process's drain threads (backend app startup). Errors are logged, not raised."""
+    try:
+        get_dispatcher().outbox.start()
+    except Exception as exc:
+        logger.warning("Messaging outbox not started: %s", exc)
+
+
+def stop_outbox() -> None:
+    """Stop the drain threads if this process started them (backend app shutdown)."""
+    if _dispatcher is not None:
+        _dispatcher.outbox.stop()
@@ -1,5 +1,4 @@
 import base64
-import smtplib
 from contextlib import contextmanager
 from email.mime.application import MIMEApplication
 from email.mime.multipart import MIMEMultipart
@@ -9,7 +8,7 @@ from email.utils import formataddr
 import boto3
 import requests
 from botocore.exceptions import ClientError
-from typing import Any, Text, Dict, List, Optional, Protocol
+from typing import Any, Text, Dict, List, Optional, Protocol, Tuple
 from backend.config.constants import (
     WHITELIST_PHONE_NUMBERS_OTP_TESTING,
     AWS_REGION,
@@ -28,6 +27,13 @@ from backend.config.smtp_config import (
     smtp_delivery_summary,
 )
 from backend.logger.logger import TaskLogger
+from backend.services.message_dispatcher import (
+    DispatchConfig,
+    RateLimiter,
+    SmtpPool,
+    open_smtp_session,
+    resolve_dispatch_config,
+)
 from backend.services.db_debug_log import email_send_log_summary, mask_phone_for_log, text_len_for_log
 import os
 
@@ -106,6 +112,28 @@ class Messaging:
             self.logger.error(f"Failed to send email: {str(e)}")
             return False
 
+    def send_sms_batch(self, messages: List[Tuple[str, str]]) -> List[bool]:
+        """
+        Send many (phone_number, message) SMS; one result per message, in order.
+        Uses the provider's multi-recipient submission when configured (DOIT_SMS_BATCH_SIZE).
+        """
+        try:
+            return self.sms_client.send_sms_batch(messages)
+        except Exception as e:
+            self.logger.error(f"Failed to send SMS batch: {str(e)}")
+            return [False] * len(messages)
+
+    def send_email_batch(self, messages: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Send many emails ({to, subject, html_body, attachments?}) over pooled SMTP sessions.
+        """
+        results = []
+        for m in messages:
+            results.append(
+                self.send_email(m["to"], m["subject"], m["html_body"], attachments=m.get("attachments"))
+            )
+        return results
+
     def test_sms_connection(self, test_phone_number: str) -> bool:
         """
         Test SMS sending functionality.
@@ -134,6 +162,8 @@ class Messaging:
 class SmsTransport(Protocol):
     def send_sms(self, phone_number: str, message: str) -> bool: ...
 
+    def send_sms_batch(self, messages: List[Tuple[str, str]]) -> List[bool]: ...
+
     def test_connection(self, test_phone_number: str) -> bool: ...
 
     def format_phone_number(self, phone_number: str) -> str: ...
@@ -156,6 +186,10 @@ class DisabledSmsClient:
         self.logger.info("SMS disabled — message not sent to %s", mask_phone_for_log(phone_number))
         return False
 
+    def send_sms_batch(self, messages: List[Tuple[str, str]]) -> List[bool]:
+        self.logger.info("SMS disabled — %d messages not sent", len(messages))
+        return [False] * len(messages)
+
     def test_connection(self, test_phone_number: str) -> bool:
         return False
 
@@ -166,12 +200,20 @@ class DisabledSmsClient:
 class DoitSmsClient:
     """Nepal DOIT government SMS gateway (sms.doit.gov.np)."""
 
-    def __init__(self, config: SmsConfig) -> None:
+    def __init__(self, config: SmsConfig, dispatch: Optional[DispatchConfig] = None) -> None:
         self.config = config
         self.task_logger = TaskLogger(service_name="messaging_service")
         self.logger = self.task_logger.logger
         self.log_event = self.task_logger.log_event
-        self.logger.info("DOIT SMS client initialized (base_url=%s)", config.base_url)
+        dispatch = dispatch or resolve_dispatch_config()
+        self.batch_size = dispatch.sms_batch_size
+        self._limiter = RateLimiter(dispatch.sms_rate_per_sec)
+        # Keep-alive session: one TLS handshake per pooled connection, not per SMS.
+        self._http = requests.Session()
+        self._http.headers.update(self._headers())
+        self.logger.info(
+            "DOIT SMS client initialized (base_url=%s, batch_size=%s)", config.base_url, self.batch_size
+        )
         self._log_balance_on_startup()
 
     def _headers(self) -> dict[str, str]:
@@ -197,11 +239,7 @@ class DoitSmsClient:
             self.logger.warning("DOIT SMS balance check failed: %s", exc)
 
     def get_balance(self) -> dict[str, Any]:
-        response = requests.get(
-            f"{self.config.base_url}/api/balance",
-            headers=self._headers(),
-            timeout=30,
-        )
+        response = self._http.get(f"{self.config.base_url}/api/balance", timeout=30)
         response.raise_for_status()
         payload = response.json()
         return payload if isinstance(payload, dict) else {"raw": payload}
@@ -217,16 +255,13 @@ class DoitSmsClient:
             )
             return False
 
-    def send_sms(self, phone_number: str, message: str) -> bool:
-        if not self.config.enabled:
-            self.logger.info("SMS_ENABLED is false — DOIT message not sent")
-            return False
-
+    def _recipient(self, phone_number: str) -> Optional[str]:
+        """Normalized mobile, or None (logged) when invalid or blocked by the whitelist."""
         try:
             mobile = normalize_nepal_mobile(phone_number)
         except ValueError as exc:
             self.logger.error("DOIT SMS invalid number %s: %s", mask_phone_for_log(phone_number), exc)
-            return False
+            return None
 
         if self.config.whitelist_only and mobile not in {
             normalize_nepal_mobile(p) for p in WHITELIST_PHONE_NUMBERS_OTP_TESTING
@@ -235,21 +270,25 @@ class DoitSmsClient:
                 "Phone number %s not in whitelist. DOIT SMS not sent.",
                 mask_phone_for_log(mobile),
             )
-            return False
+            return None
+        return mobile
 
+    def _submit(self, mobiles: List[str], message: str) -> bool:
+        """One POST /api/sms; several recipients go comma-separated in ``mobile``."""
+        label = mask_phone_for_log(mobiles[0]) if len(mobiles) == 1 else f"{len(mobiles)} recipients"
         try:
-            self.logger.info("Sending SMS via DOIT to %s", mask_phone_for_log(mobile))
-            response = requests.post(
+            self._limiter.acquire()
+            self.logger.info("Sending SMS via DOIT to %s", label)
+            response = self._http.post(
                 f"{self.config.base_url}/api/sms",
-                headers=self._headers(),
-                json={"message": message, "mobile": mobile},
+                json={"message": message, "mobile": ",".join(mobiles)},
                 timeout=30,
             )
             payload = response.json() if response.content else {}
             if response.ok and isinstance(payload, dict):
                 msg = str(payload.get("message", "")).lower()
                 if "sent successfully" in msg or "queued" in msg:
-                    self.logger.info("DOIT SMS accepted for %s", mask_phone_for_log(mobile))
+                    self.logger.info("DOIT SMS accepted for %s", label)
                     return True
             error_detail = payload if isinstance(payload, dict) else response.text
             self.logger.error(
@@ -258,10 +297,36 @@ class DoitSmsClient:
                 error_detail,
             )
             return False
-        except requests.RequestException as exc:
+        except (requests.RequestException, ValueError) as exc:
             self.logger.error("DOIT SMS request failed: %s", exc)
             return False
 
+    def send_sms(self, phone_number: str, message: str) -> bool:
+        if not self.config.enabled:
+            self.logger.info("SMS_ENABLED is false — DOIT message not sent")
+            return False
+        mobile = self._recipient(phone_number)
+        return bool(mobile) and self._submit([mobile], message)
+
+    def send_sms_batch(self, messages: List[Tuple[str, str]]) -> List[bool]:
+        """Same-text messages go out batch_size recipients per request (DOIT_SMS_BATCH_SIZE)."""
+        results = [False] * len(messages)
+        if not self.config.enabled:
+            self.logger.info("SMS_ENABLED is false — %d DOIT messages not sent", len(messages))
+            return results
+        by_text: Dict[str, List[Tuple[int, str]]] = {}
+        for index, (phone_number, message) in enumerate(messages):
+            mobile = self._recipient(phone_number)
+            if mobile:
+                by_text.setdefault(message, []).append((index, mobile))
+        for message, recipients in by_text.items():
+            for start in range(0, len(recipients), self.batch_size):
+                chunk = recipients[start:start + self.batch_size]
+                ok = self._submit([mobile for _, mobile in chunk], message)
+                for index, _ in chunk:
+                    results[index] = ok
+        return results
+
     def format_phone_number(self, phone_number: str) -> str:
         return normalize_nepal_mobile(phone_number)
 
@@ -274,6 +339,7 @@ class SnsSmsClient:
         self.task_logger = TaskLogger(service_name='messaging_service')
         self.logger = self.task_logger.logger
         self.log_event = self.task_logger.log_event
+        self._limiter = RateLimiter(resolve_dispatch_config().sms_rate_per_sec)
         try:
             self.sns_client = boto3.client('sns', region_name=AWS_REGION)
             self.logger.info("Successfully initialized SNS client")
@@ -325,6 +391,7 @@ class SnsSmsClient:
                 mask_phone_for_log(formatted_number),
             )
 
+            self._limiter.acquire()
             response = self.sns_client.publish(
                 PhoneNumber=formatted_number,
                 Message=message,
@@ -341,6 +408,10 @@ class SnsSmsClient:
             self.logger.error("Failed to send SMS via SNS: %s", e)
             return False
 
+    def send_sms_batch(self, messages: List[Tuple[str, str]]) -> List[bool]:
+        # SNS has no batch publish for direct-to-phone SMS; the boto3 client is already pooled.
+        return [self.send_sms(phone_number, message) for phone_number, message in messages]
+
     def format_phone_number(self, phone_number: str) -> str:
         return format_philippines_e164(phone_number)
 
@@ -361,7 +432,15 @@ class EmailClient:
                     "(SERVER, USERNAME, PASSWORD, FROM)."
                 )
             self.smtp_config = self.smtp_profiles[0][1]
-            self.logger.info("Email transport: SMTP (%s)", smtp_delivery_summary())
+            dispatch = resolve_dispatch_config()
+            self._pools = {
+                cfg: SmtpPool(cfg, size=dispatch.smtp_pool_size, idle_seconds=dispatch.smtp_idle_seconds)
+                for _, cfg in self.smtp_profiles
+            }
+            self._limiters = {cfg: RateLimiter(dispatch.smtp_rate_per_sec) for _, cfg in self.smtp_profiles}
+            self.logger.info(
+                "Email transport: SMTP (%s, pool_size=%s)", smtp_delivery_summary(), dispatch.smtp_pool_size
+            )
         except Exception as e:
             self.logger.error("Failed to initialize email client: %s", e)
             raise
@@ -410,17 +489,15 @@ class EmailClient:
 
     @contextmanager
     def _smtp_session(self, cfg: SmtpConfig, timeout: int = 30):
-        """Authenticated SMTP session (SMTPS on 465, STARTTLS on other ports)."""
-        use_ssl = cfg.port == 465
-        smtp_cls = smtplib.SMTP_SSL if use_ssl else smtplib.SMTP
-        with smtp_cls(cfg.host, cfg.port, timeout=timeout) as smtp:
-            smtp.ehlo()
-            if not use_ssl:
-                smtp.starttls()
-                smtp.ehlo()
-            smtp.login(cfg.username, cfg.password)
+        """Fresh authenticated SMTP session (connectivity checks; sends use the pool)."""
+        with open_smtp_session(cfg, timeout=timeout) as smtp:
             yield smtp
 
+    def close(self) -> None:
+        """Close pooled SMTP sessions."""
+        for pool in self._pools.values():
+            pool.close()
+
     def test_connection(
         self,
         *,
@@ -513,8 +590,8 @@ class EmailClient:
         msg["From"] = from_header
         msg["To"] = ", ".join(to_emails)
 
-        with self._smtp_session(cfg, timeout=30) as smtp:
-            smtp.sendmail(cfg.from_addr, to_emails, msg.as_string())
+        self._limiters[cfg].acquire()
+        self._pools[cfg].sendmail(cfg.from_addr, to_emails, msg.as_string())
 
         self.logger.info("SMTP email sent from %s", cfg.from_addr)
 
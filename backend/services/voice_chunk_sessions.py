@@ -0,0 +1,225 @@
+"""Resumable voice-note upload sessions, stored on disk next to the part file.
+
+Layout under ``<upload_folder>/.voice_chunks/<upload_id>/``:
+
+    session.json   written once at creation (grievance, file name, expiry)
+    data.part      chunk bytes, each written at its byte offset
+    chunks/<idx>   one marker per accepted chunk ("<offset> <length>"), created with O_EXCL
+
+Nothing is kept in process memory, so any API worker that sees the upload folder can continue
+a session, and a restart loses nothing. Expiry is checked on lookup (one stat + one small read);
+abandoned sessions are swept at most once per sweep interval.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+SESSIONS_DIRNAME = ".voice_chunks"
+_SESSION_FILE = "session.json"
+_FINALIZING_FILE = "session.finalizing"
+_PART_FILE = "data.part"
+_CHUNKS_DIRNAME = "chunks"
+
+_last_sweep_at: Dict[str, float] = {}
+
+
+class VoiceChunkSessionStore:
+    """File-backed voice chunk sessions. Errors are ValueError codes, as the router expects."""
+
+    def __init__(self, upload_folder: str, ttl_sec: int, max_bytes: int, sweep_interval_sec: int = 300):
+        self.root = os.path.join(upload_folder, SESSIONS_DIRNAME)
+        self.ttl_sec = ttl_sec
+        self.max_bytes = max_bytes
+        self.sweep_interval_sec = sweep_interval_sec
+
+    def _session_dir(self, upload_id: str) -> str:
+        # upload ids are server-minted UUIDs; refuse anything that could escape the root
+        try:
+            upload_id = str(uuid.UUID(str(upload_id)))
+        except ValueError:
+            raise ValueError("upload_session_not_found")
+        return os.path.join(self.root, upload_id)
+
+    def create(self, grievance_id: str, file_name: str, mime_type: str) -> Dict[str, Any]:
+        self.sweep_expired()
+        upload_id = str(uuid.uuid4())
+        session_dir = self._session_dir(upload_id)
+        os.makedirs(os.path.join(session_dir, _CHUNKS_DIRNAME))
+        now = time.time()
+        session = {
+            "upload_id": upload_id,
+            "file_id": str(uuid.uuid4()),
+            "grievance_id": grievance_id,
+            "file_name": file_name,
+            "mime_type": mime_type,
+            "part_path": os.path.join(session_dir, _PART_FILE),
+            "created_at": now,
+            "expires_at": now + self.ttl_sec,
+        }
+        open(session["part_path"], "wb").close()
+        fd, tmp_path = tempfile.mkstemp(dir=session_dir, prefix=".session_")
+        with os.fdopen(fd, "w") as f:
+            json.dump(session, f)
+        os.replace(tmp_path, os.path.join(session_dir, _SESSION_FILE))
+        return self._with_progress(session)
+
+    def get(self, upload_id: str) -> Dict[str, Any]:
+        """Load a live session or raise upload_session_not_found (expired sessions are removed)."""
+        session_dir = self._session_dir(upload_id)
+        try:
+            with open(os.path.join(session_dir, _SESSION_FILE)) as f:
+                session = json.load(f)
+        except (FileNotFoundError, ValueError):
+            raise ValueError("upload_session_not_found")
+        if session["expires_at"] < time.time():
+            self._remove(session_dir)
+            raise ValueError("upload_session_not_found")
+        return session
+
+    def write_chunk(
+        self,
+        upload_id: str,
+        chunk_index: int,
+        chunk_bytes: bytes,
+        offset: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Write one chunk at its offset. Without an offset, chunks must arrive in order.
+
+        Duplicate indices are acknowledged without rewriting (retry-safe).
+        """
+        self.sweep_expired()
+        session = self.get(upload_id)
+        session_dir = os.path.dirname(session["part_path"])
+        marker_path = os.path.join(session_dir, _CHUNKS_DIRNAME, str(chunk_index))
+        if os.path.exists(marker_path):
+            return {"duplicate": True, "session": self._with_progress(session)}
+
+        chunk_len = len(chunk_bytes)
+        if chunk_len == 0:
+            raise ValueError("empty_chunk")
+        if offset is None:
+            if chunk_index > self._chunk_count(session_dir):
+                raise ValueError("chunk_out_of_order")
+            offset = os.path.getsize(session["part_path"])
+        if offset < 0:
+            raise ValueError("invalid_chunk_offset")
+        if offset + chunk_len > self.max_bytes:
+            raise ValueError("voice_chunk_size_exceeded")
+
+        try:
+            marker_fd = os.open(marker_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            return {"duplicate": True, "session": self._with_progress(session)}
+        try:
+            with os.fdopen(marker_fd, "w") as marker:
+                marker.write(f"{offset} {chunk_len}")
+            part_fd = os.open(session["part_path"], os.O_WRONLY)
+            try:
+                os.pwrite(part_fd, chunk_bytes, offset)
+            finally:
+                os.close(part_fd)
+        except Exception:
+            try:
+                os.remove(marker_path)
+            except OSError:
+                pass
+            raise
+        return {"duplicate": False, "session": self._with_progress(session)}
+
+    def claim_for_finalize(self, upload_id: str, expected_grievance_id: Optional[str] = None) -> Dict[str, Any]:
+        """Take the session exclusively (one finalize wins) and check chunks cover 0..total."""
+        session = self.get(upload_id)
+        session_dir = os.path.dirname(session["part_path"])
+        if expected_grievance_id and session["grievance_id"] != expected_grievance_id:
+            raise ValueError("grievance_mismatch")
+        try:
+            os.rename(os.path.join(session_dir, _SESSION_FILE), os.path.join(session_dir, _FINALIZING_FILE))
+        except FileNotFoundError:
+            raise ValueError("upload_session_not_found")
+
+        ranges = sorted(self._chunk_ranges(session_dir))
+        if not ranges:
+            self._remove(session_dir)
+            raise ValueError("no_chunks_received")
+        end = 0
+        for offset, length in ranges:
+            if offset != end:
+                # A chunk is still missing: hand the session back so the client can resend it
+                os.rename(os.path.join(session_dir, _FINALIZING_FILE), os.path.join(session_dir, _SESSION_FILE))
+                raise ValueError("chunks_missing")
+            end = offset + length
+        session.update({"chunks_received": len(ranges), "total_bytes": end})
+        return session
+
+    def release(self, upload_id: str) -> None:
+        """Delete the session directory (after finalize moved the part file, or on abort)."""
+        try:
+            self._remove(self._session_dir(upload_id))
+        except ValueError:
+            pass
+
+    def sweep_expired(self, force: bool = False) -> int:
+        """Remove sessions past their TTL; runs at most once per sweep interval per process."""
+        now = time.time()
+        if not force and now - _last_sweep_at.get(self.root, 0) < self.sweep_interval_sec:
+            return 0
+        _last_sweep_at[self.root] = now
+        removed = 0
+        try:
+            entries = list(os.scandir(self.root))
+        except FileNotFoundError:
+            return 0
+        for entry in entries:
+            # session.json is never rewritten, so its mtime is the creation time
+            for name in (_SESSION_FILE, _FINALIZING_FILE):
+                try:
+                    created = os.stat(os.path.join(entry.path, name)).st_mtime
+                    break
+                except OSError:
+                    created = None
+            if created is None:
+                try:
+                    created = entry.stat().st_mtime
+                except OSError:
+                    continue
+            if now - created > self.ttl_sec:
+                self._remove(entry.path)
+                removed += 1
+        return removed
+
+    def _with_progress(self, session: Dict[str, Any]) -> Dict[str, Any]:
+        session_dir = os.path.dirname(session["part_path"])
+        received = self._chunk_count(session_dir)
+        try:
+            total_bytes = os.path.getsize(session["part_path"])
+        except OSError:
+            total_bytes = 0
+        return {**session, "chunks_received": received, "total_bytes": total_bytes}
+
+    @staticmethod
+    def _chunk_count(session_dir: str) -> int:
+        try:
+            return len(os.listdir(os.path.join(session_dir, _CHUNKS_DIRNAME)))
+        except FileNotFoundError:
+            return 0
+
+    @staticmethod
+    def _chunk_ranges(session_dir: str) -> list:
+        ranges = []
+        chunks_dir = os.path.join(session_dir, _CHUNKS_DIRNAME)
+        for name in os.listdir(chunks_dir):
+            with open(os.path.join(chunks_dir, name)) as f:
+                offset, length = f.read().split()
+            ranges.append((int(offset), int(length)))
+        return ranges
+
+    @staticmethod
+    def _remove(session_dir: str) -> None:
+        shutil.rmtree(session_dir, ignore_errors=True)
@@ -0,0 +1,293 @@
+"""
+Read-only in-process snapshot of ticketing.locations + location_translations.
+
+location_mapping answers name → code, code → hierarchy and code → names from the current
+snapshot with dictionary lookups (rapidfuzz over precomputed option lists for fuzzy
+matches) instead of one query per level per turn. Without a snapshot — or for a
+db_manager other than the one it was loaded from (tests, scripts) — it falls back to SQL.
+
+The snapshot carries a content version (md5 over codes, parents, levels, active flags and
+translations). A daemon thread re-reads only the version every LOCATION_GAZETTEER_REFRESH_SEC
+(default 60) and swaps in a fresh snapshot when it changed, so imports done by the
+ticketing service are picked up without a restart. The version covers centroids too, and a
+change also drops the map-pin geo index (geo_index) so it is rebuilt on the next lookup.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from rapidfuzz import process
+
+from backend.config.constants import CUT_OFF_FUZZY_MATCH_LOCATION
+from backend.shared_functions.geo_index import invalidate_location_geo_index
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REFRESH_SEC = 60.0
+
+_VERSION_SQL = """
+    SELECT md5(
+        COALESCE((
+            SELECT string_agg(
+                location_code || '/' || country_code || '/' || level_number || '/'
+                    || COALESCE(parent_location_code, '') || '/' || is_active::text || '/'
+                    || COALESCE(latitude::text, '') || '/' || COALESCE(longitude::text, ''),
+                '|' ORDER BY location_code
+            )
+            FROM ticketing.locations
+        ), '')
+        || '#' ||
+        COALESCE((
+            SELECT string_agg(
+                location_code || '/' || lang_code || '/' || name,
+                '|' ORDER BY location_code, lang_code, name
+            )
+            FROM ticketing.location_translations
+        ), '')
+    ) AS version
+"""
+
+GroupKey = Tuple[str, int, Optional[str]]  # (country_code, level_number, parent_code or None = any)
+
+
+@dataclass
+class _NameGroup:
+    """Candidates at one (country, level, parent) — same ordering the SQL path used."""
+
+    exact: Dict[str, str] = field(default_factory=dict)          # lower(trim(name)) → code, en first
+    stripped: Dict[str, str] = field(default_factory=dict)       # suffix-stripped alias → code
+    full: Dict[str, str] = field(default_factory=dict)           # lower(name) → code
+    stripped_keys: List[str] = field(default_factory=list)
+    full_keys: List[str] = field(default_factory=list)
+
+
+@dataclass
+class _Node:
+    country_code: str
+    level_number: int
+    parent_code: Optional[str]
+    is_active: bool
+
+
+class Gazetteer:
+    """Immutable once built; safe to share between threads."""
+
+    def __init__(
+        self,
+        locations: Iterable[Dict[str, Any]],
+        translations: Iterable[Dict[str, Any]],
+        *,
+        version: str,
+        source: Any = None,
+    ):
+        from backend.shared_functions.location_mapping import strip_admin_suffix
+
+        self.version = version
+        self.source = source
+        self.loaded_at = time.time()
+        self._nodes: Dict[str, _Node] = {
+            r["location_code"]: _Node(
+                r["country_code"], int(r["level_number"]), r.get("parent_location_code"), bool(r["is_active"])
+            )
+            for r in locations
+        }
+        self._names: Dict[str, Dict[str, str]] = {}
+        ordered: List[Tuple[str, str, str]] = []
+        for r in translations:
+            code, lang, name = r["location_code"], r["lang_code"], r["name"]
+            if code not in self._nodes:
+                continue
+            self._names.setdefault(code, {})[lang] = name
+            ordered.append((code, lang, name))
+        # ORDER BY lt.lang_code = 'en' DESC, lt.lang_code, lt.name
+        ordered.sort(key=lambda t: (t[1] != "en", t[1], t[2]))
+
+        self._groups: Dict[GroupKey, _NameGroup] = {}
+        for code, lang, name in ordered:
+            node = self._nodes[code]
+            if not node.is_active:
+                continue
+            stripped = strip_admin_suffix(name or "", node.level_number).lower() or (name or "").lower()
+            exact_key = (name or "").strip().lower()
+            for key in ((node.country_code, node.level_number, node.parent_code),
+                        (node.country_code, node.level_number, None)):
+                group = self._groups.get(key)
+                if group is None:
+                    group = self._groups[key] = _NameGroup()
+                group.exact.setdefault(exact_key, code)
+                group.stripped.setdefault(stripped, code)
+                if name:
+                    group.full[name.lower()] = code  # later rows win, as the dict comprehension did
+        for group in self._groups.values():
+            group.stripped_keys = list(group.stripped)
+            group.full_keys = list(group.full)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def resolve_name(
+        self,
+        *,
+        country_code: str,
+        level_number: int,
+        candidate_name: str,
+        parent_code: Optional[str],
+    ) -> Optional[str]:
+        """Exact name (any language) first, then fuzzy on suffix-stripped aliases, then on full names."""
+        from backend.shared_functions.location_mapping import strip_admin_suffix
+
+        group = self._groups.get((country_code, level_number, parent_code or None))
+        if group is None:
+            return None
+        code = group.exact.get(candidate_name.strip().lower())
+        if code:
+            return code
+
+        needle = strip_admin_suffix(candidate_name, level_number).lower() or candidate_name.lower()
+        match = process.extractOne(needle, group.stripped_keys, score_cutoff=CUT_OFF_FUZZY_MATCH_LOCATION)
+        if match:
+            return group.stripped[match[0]]
+        match = process.extractOne(
+            candidate_name.lower(), group.full_keys, score_cutoff=CUT_OFF_FUZZY_MATCH_LOCATION
+        )
+        if match:
+            return group.full[match[0]]
+        return None
+
+    def name(self, location_code: str, lang_code: str = "en") -> Optional[str]:
+        names = self._names.get(location_code) or {}
+        return names.get(lang_code) or names.get("en")
+
+    def hierarchy(self, location_code: str, lang_code: str = "en") -> Dict[str, Any]:
+        """level_n_name / level_n_code for the code and its active ancestors."""
+        payload: Dict[str, Any] = {}
+        code: Optional[str] = location_code
+        seen = set()
+        while code and code not in seen:
+            seen.add(code)
+            node = self._nodes.get(code)
+            if node is None or not node.is_active:
+                break
+            if node.level_number > 0:
+                payload[f"level_{node.level_number}_name"] = self.name(code, lang_code)
+                payload[f"level_{node.level_number}_code"] = code
+            code = node.parent_code
+        return payload
+
+    def code_row(self, location_code: str, lang_code: str = "en") -> Optional[Dict[str, Any]]:
+        """The row resolve_location_code_to_names selects: the code, its level and its parent."""
+        node = self._nodes.get(location_code)
+        if node is None or not node.is_active:
+            return None
+        parent = node.parent_code if node.parent_code in self._nodes else None
+        return {
+            "location_code": location_code,
+            "level_number": node.level_number,
+            "name": self.name(location_code, lang_code),
+            "parent_code": parent,
+            "parent_name": self.name(parent, lang_code) if parent else None,
+        }
+
+
+_current: Optional[Gazetteer] = None
+_lock = threading.Lock()
+_refresher: Optional[threading.Thread] = None
+
+
+def current_gazetteer(db_manager: Any = None) -> Optional[Gazetteer]:
+    """The loaded snapshot, if it was loaded from ``db_manager`` (no I/O)."""
+    snapshot = _current
+    if snapshot is None or (db_manager is not None and snapshot.source is not db_manager):
+        return None
+    return snapshot
+
+
+def _fetch_version(db_manager: Any) -> Optional[str]:
+    rows = db_manager.execute_query(_VERSION_SQL, (), "gazetteer_version")
+    return rows[0]["version"] if rows else None
+
+
+def load_gazetteer(db_manager: Any) -> Gazetteer:
+    """Read both tables and install a new snapshot."""
+    global _current
+    started = time.perf_counter()
+    version = _fetch_version(db_manager) or ""
+    locations = db_manager.execute_query(
+        """
+        SELECT location_code, country_code, level_number, parent_location_code, is_active
+        FROM ticketing.locations
+        """,
+        (),
+        "gazetteer_locations",
+    )
+    translations = db_manager.execute_query(
+        "SELECT location_code, lang_code, name FROM ticketing.location_translations",
+        (),
+        "gazetteer_translations",
+    )
+    snapshot = Gazetteer(locations or [], translations or [], version=version, source=db_manager)
+    with _lock:
+        _current = snapshot
+    logger.info(
+        "gazetteer: loaded %d locations (version %s) in %.0fms",
+        len(snapshot),
+        version[:8],
+        (time.perf_counter() - started) * 1000,
+    )
+    return snapshot
+
+
+def refresh_gazetteer(db_manager: Any) -> bool:
+    """Reload when the table version changed; returns True when a new snapshot was installed."""
+    snapshot = current_gazetteer(db_manager)
+    if snapshot is not None and _fetch_version(db_manager) == snapshot.version:
+        return False
+    load_gazetteer(db_manager)
+    invalidate_location_geo_index()
+    return True
+
+
+def invalidate_gazetteer() -> None:
+    """Drop the snapshot; lookups fall back to SQL until the next load."""
+    global _current
+    with _lock:
+        _current = None
+
+
+def _refresh_interval() -> float:
+    try:
+        return float(os.getenv("LOCATION_GAZETTEER_REFRESH_SEC") or DEFAULT_REFRESH_SEC)
+    except ValueError:
+        return DEFAULT_REFRESH_SEC
+
+
+def start_gazetteer(db_manager: Any) -> Optional[Gazetteer]:
+    """
+    Load the snapshot now and keep it current from a daemon thread. Failures are logged and
+    leave the SQL path in place; the refresher keeps retrying.
+    """
+    global _refresher
+    try:
+        load_gazetteer(db_manager)
+    except Exception as exc:
+        logger.warning("gazetteer: initial load failed (%s); using per-query lookups", exc)
+
+    with _lock:
+        if _refresher is None or not _refresher.is_alive():
+            def run() -> None:
+                while True:
+                    time.sleep(_refresh_interval())
+                    try:
+                        refresh_gazetteer(db_manager)
+                    except Exception as exc:
+                        logger.warning("gazetteer: refresh failed (%s)", exc)
+
+            _refresher = threading.Thread(target=run, name="gazetteer-refresh", daemon=True)
+            _refresher.start()
+    return current_gazetteer(db_manager)
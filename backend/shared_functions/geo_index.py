@@ -0,0 +1,385 @@
+"""
+Offline map-pin → ticketing location resolution (no network).
+
+Two sources, both held in memory per country and refreshed every
+LOCATION_GEO_INDEX_TTL_SEC (default 1h), or as soon as the gazetteer refresher sees
+ticketing.locations change. A failed load is retried after LOAD_RETRY_SEC, not per call:
+
+  - centroids: ticketing.locations latitude/longitude at every level, in a KD-tree
+    over unit-sphere vectors so "nearest" is great-circle nearest, not planar lat/lng.
+  - boundaries (optional): GeoJSON files listed in LOCATION_BOUNDARIES_GEOJSON
+    (comma-separated paths; Polygon/MultiPolygon features with a ``location_code``
+    property). Point-in-polygon is exact; a bbox grid prefilters candidates.
+
+A polygon hit is authoritative; a centroid match is an approximation (nearest seat,
+not containment) and is reported with method="centroid" so callers can still ask
+Nominatim for the municipality when it matters.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_KM = 6371.0088
+DEFAULT_TTL_SEC = 3600.0
+LOAD_RETRY_SEC = 60.0
+_GRID_DEG = 0.25
+
+Vector = Tuple[float, float, float]
+Ring = List[Tuple[float, float]]  # (lng, lat) as stored in GeoJSON
+
+
+def _to_vector(lat: float, lng: float) -> Vector:
+    phi, lam = math.radians(lat), math.radians(lng)
+    cos_phi = math.cos(phi)
+    return (cos_phi * math.cos(lam), cos_phi * math.sin(lam), math.sin(phi))
+
+
+def _chord2_to_km(chord2: float) -> float:
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(chord2) / 2))
+
+
+class KDTree:
+    """Static 3-d tree over unit vectors; nearest() is O(log n) for well-spread points."""
+
+    __slots__ = ("_points", "_codes", "_axis", "_left", "_right", "_root")
+
+    def __init__(self, items: Iterable[Tuple[str, float, float]]):
+        self._points: List[Vector] = []
+        self._codes: List[str] = []
+        self._axis: List[int] = []
+        self._left: List[int] = []
+        self._right: List[int] = []
+        entries = [(code, _to_vector(lat, lng)) for code, lat, lng in items]
+        self._root = self._build(entries, 0)
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def _build(self, entries: List[Tuple[str, Vector]], depth: int) -> int:
+        if not entries:
+            return -1
+        axis = depth % 3
+        entries.sort(key=lambda e: e[1][axis])
+        mid = len(entries) // 2
+        index = len(self._points)
+        self._codes.append(entries[mid][0])
+        self._points.append(entries[mid][1])
+        self._axis.append(axis)
+        self._left.append(-1)
+        self._right.append(-1)
+        self._left[index] = self._build(entries[:mid], depth + 1)
+        self._right[index] = self._build(entries[mid + 1:], depth + 1)
+        return index
+
+    def nearest(self, lat: float, lng: float) -> Optional[Tuple[str, float]]:
+        """(location_code, distance_km) of the nearest point, or None when empty."""
+        if self._root < 0:
+            return None
+        target = _to_vector(lat, lng)
+        best_index, best_d2 = -1, math.inf
+        stack = [self._root]
+        points, axes, left, right = self._points, self._axis, self._left, self._right
+        while stack:
+            node = stack.pop()
+            point = points[node]
+            d2 = (point[0] - target[0]) ** 2 + (point[1] - target[1]) ** 2 + (point[2] - target[2]) ** 2
+            if d2 < best_d2:
+                best_index, best_d2 = node, d2
+            diff = target[axes[node]] - point[axes[node]]
+            near, far = (left[node], right[node]) if diff < 0 else (right[node], left[node])
+            # Far side is pushed first so the near side is explored (and tightens best_d2) first
+            if far >= 0 and diff * diff < best_d2:
+                stack.append(far)
+            if near >= 0:
+                stack.append(near)
+        return self._codes[best_index], _chord2_to_km(best_d2)
+
+
+def _ring_contains(ring: Ring, lng: float, lat: float) -> bool:
+    inside = False
+    j = len(ring) - 1
+    for i in range(len(ring)):
+        xi, yi = ring[i]
+        xj, yj = ring[j]
+        if (yi > lat) != (yj > lat) and lng < (xj - xi) * (lat - yi) / (yj - yi) + xi:
+            inside = not inside
+        j = i
+    return inside
+
+
+@dataclass
+class _Boundary:
+    location_code: str
+    level_number: int
+    polygons: List[List[Ring]]  # each polygon: outer ring, then holes
+    bbox: Tuple[float, float, float, float]  # min_lng, min_lat, max_lng, max_lat
+
+    def contains(self, lat: float, lng: float) -> bool:
+        min_lng, min_lat, max_lng, max_lat = self.bbox
+        if not (min_lng <= lng <= max_lng and min_lat <= lat <= max_lat):
+            return False
+        for rings in self.polygons:
+            if _ring_contains(rings[0], lng, lat) and not any(_ring_contains(h, lng, lat) for h in rings[1:]):
+                return True
+        return False
+
+
+def _parse_geometry(geometry: Dict[str, Any]) -> List[List[Ring]]:
+    kind = (geometry or {}).get("type")
+    coords = (geometry or {}).get("coordinates") or []
+    if kind == "Polygon":
+        coords = [coords]
+    elif kind != "MultiPolygon":
+        return []
+    return [
+        [[(float(p[0]), float(p[1])) for p in ring] for ring in polygon if len(ring) >= 4]
+        for polygon in coords
+        if polygon
+    ]
+
+
+class BoundaryIndex:
+    """Admin boundary polygons with a coarse bbox grid so a lookup tests only a few polygons."""
+
+    def __init__(self, boundaries: Sequence[_Boundary]):
+        self._grid: Dict[Tuple[int, int], List[_Boundary]] = {}
+        for boundary in boundaries:
+            min_lng, min_lat, max_lng, max_lat = boundary.bbox
+            for gx in range(self._cell(min_lng), self._cell(max_lng) + 1):
+                for gy in range(self._cell(min_lat), self._cell(max_lat) + 1):
+                    self._grid.setdefault((gx, gy), []).append(boundary)
+        self.count = len(boundaries)
+
+    @staticmethod
+    def _cell(value: float) -> int:
+        return math.floor(value / _GRID_DEG)
+
+    def containing(self, lat: float, lng: float) -> Dict[int, str]:
+        """level_number → location_code of every boundary containing the point."""
+        hits: Dict[int, str] = {}
+        for boundary in self._grid.get((self._cell(lng), self._cell(lat)), ()):
+            if boundary.level_number not in hits and boundary.contains(lat, lng):
+                hits[boundary.level_number] = boundary.location_code
+        return hits
+
+
+def load_boundaries(paths: Iterable[str], levels: Dict[str, int]) -> List[_Boundary]:
+    """Read GeoJSON FeatureCollections; features whose location_code is not in ``levels`` are skipped."""
+    boundaries: List[_Boundary] = []
+    for path in paths:
+        try:
+            with open(path, encoding="utf-8") as f:
+                collection = json.load(f)
+        except (OSError, ValueError) as exc:
+            logger.warning("geo_index: cannot read boundaries %s: %s", path, exc)
+            continue
+        for feature in collection.get("features") or []:
+            code = ((feature.get("properties") or {}).get("location_code") or "").strip()
+            polygons = _parse_geometry(feature.get("geometry"))
+            if not code or code not in levels or not polygons:
+                continue
+            xs = [p[0] for rings in polygons for p in rings[0]]
+            ys = [p[1] for rings in polygons for p in rings[0]]
+            boundaries.append(_Boundary(code, levels[code], polygons, (min(xs), min(ys), max(xs), max(ys))))
+    return boundaries
+
+
+@dataclass
+class LocationGeoIndex:
+    """Per-country centroid trees (by level) plus optional boundary polygons."""
+
+    parents: Dict[str, Optional[str]]
+    levels: Dict[str, int]
+    trees: Dict[int, KDTree]
+    centroids: Dict[str, Tuple[float, float]]
+    boundaries: Optional[BoundaryIndex] = None
+    children: Dict[str, List[str]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        for code, parent in self.parents.items():
+            if parent and code in self.centroids:
+                self.children.setdefault(parent, []).append(code)
+
+    def _chain(self, location_code: str) -> Dict[int, str]:
+        chain: Dict[int, str] = {}
+        code: Optional[str] = location_code
+        while code and code in self.levels:
+            chain[self.levels[code]] = code
+            code = self.parents.get(code)
+        return chain
+
+    def _nearest_child(self, parent: str, lat: float, lng: float) -> Optional[str]:
+        best, best_km = None, math.inf
+        for code in self.children.get(parent, ()):
+            c_lat, c_lng = self.centroids[code]
+            km = haversine_km(lat, lng, c_lat, c_lng)
+            if km < best_km:
+                best, best_km = code, km
+        return best
+
+    def resolve(
+        self,
+        lat: float,
+        lng: float,
+        *,
+        max_level: int = 3,
+        max_km: Optional[float] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Resolve a pin to level_1_code..level_{max_level}_code.
+
+        Polygons win; below the deepest polygon hit, the nearest child centroid fills
+        the next level. Without a polygon hit, the nearest centroid at the deepest level
+        ≤ max_level is used (None when it is farther than max_km).
+        """
+        method = "polygon"
+        code: Optional[str] = None
+        distance_km: Optional[float] = None
+        if self.boundaries is not None:
+            hits = self.boundaries.containing(lat, lng)
+            if hits:
+                code = hits[max(hits)]
+                while code and self.levels[code] > max_level:
+                    code = self.parents.get(code)
+        if code is None:
+            method = "centroid"
+            for level in sorted((lv for lv in self.trees if lv <= max_level), reverse=True):
+                found = self.trees[level].nearest(lat, lng)
+                if found:
+                    code, distance_km = found
+                    break
+            if code is None or (max_km is not None and distance_km > max_km):
+                return None
+        else:
+            while self.levels[code] < max_level:
+                child = self._nearest_child(code, lat, lng)
+                if child is None:
+                    break
+                code = child
+                method = "polygon+centroid"
+
+        result: Dict[str, Any] = {
+            "location_code": code,
+            "level_number": self.levels[code],
+            "method": method,
+            "distance_km": round(distance_km, 3) if distance_km is not None else None,
+        }
+        for level, level_code in self._chain(code).items():
+            result[f"level_{level}_code"] = level_code
+        return result
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp, dl = p2 - p1, math.radians(lng2 - lng1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def boundary_paths() -> List[str]:
+    raw = os.getenv("LOCATION_BOUNDARIES_GEOJSON") or ""
+    return [p.strip() for p in raw.split(",") if p.strip()]
+
+
+def build_location_geo_index(
+    rows: Iterable[Dict[str, Any]],
+    boundary_files: Sequence[str] = (),
+) -> Optional[LocationGeoIndex]:
+    """Build from ticketing.locations rows (location_code, level_number, parent_location_code, latitude, longitude)."""
+    parents: Dict[str, Optional[str]] = {}
+    levels: Dict[str, int] = {}
+    centroids: Dict[str, Tuple[float, float]] = {}
+    by_level: Dict[int, List[Tuple[str, float, float]]] = {}
+    for row in rows:
+        code = row["location_code"]
+        level = int(row["level_number"])
+        parents[code] = row.get("parent_location_code")
+        levels[code] = level
+        lat, lng = row.get("latitude"), row.get("longitude")
+        if lat is not None and lng is not None:
+            centroids[code] = (float(lat), float(lng))
+            by_level.setdefault(level, []).append((code, float(lat), float(lng)))
+
+    boundaries = load_boundaries(boundary_files, levels) if boundary_files else []
+    if not by_level and not boundaries:
+        return None
+    return LocationGeoIndex(
+        parents=parents,
+        levels=levels,
+        trees={level: KDTree(items) for level, items in by_level.items()},
+        centroids=centroids,
+        boundaries=BoundaryIndex(boundaries) if boundaries else None,
+    )
+
+
+_cache: Dict[str, Tuple[float, Optional[LocationGeoIndex]]] = {}  # country → (expires_at, index)
+_cache_lock = threading.Lock()
+
+
+def _ttl_sec() -> float:
+    try:
+        return float(os.getenv("LOCATION_GEO_INDEX_TTL_SEC") or DEFAULT_TTL_SEC)
+    except ValueError:
+        return DEFAULT_TTL_SEC
+
+
+def get_location_geo_index(db_manager: Any, country_code: str = "NP") -> Optional[LocationGeoIndex]:
+    """Cached index for country_code; rebuilt after the TTL. None when no geodata is available."""
+    now = time.monotonic()
+    cached = _cache.get(country_code)
+    if cached and now < cached[0]:
+        return cached[1]
+
+    with _cache_lock:
+        cached = _cache.get(country_code)
+        if cached and now < cached[0]:
+            return cached[1]
+        try:
+            rows = db_manager.execute_query(
+                """
+                SELECT location_code, level_number, parent_location_code, latitude, longitude
+                FROM ticketing.locations
+                WHERE country_code = %s
+                  AND is_active = TRUE
+                """,
+                (country_code,),
+                "load_location_geo_index",
+            )
+        except Exception as exc:
+            logger.warning("geo_index: cannot load locations for %s: %s", country_code, exc)
+            # Keep serving the previous index if there was one; back off before the next query
+            previous = cached[1] if cached else None
+            _cache[country_code] = (now + min(LOAD_RETRY_SEC, _ttl_sec()), previous)
+            return previous
+
+        started = time.perf_counter()
+        index = build_location_geo_index(rows or [], boundary_paths())
+        if index is not None:
+            logger.info(
+                "geo_index: %s built in %.1fms (centroids=%d, boundaries=%d)",
+                country_code,
+                (time.perf_counter() - started) * 1000,
+                len(index.centroids),
+                index.boundaries.count if index.boundaries else 0,
+            )
+        _cache[country_code] = (now + _ttl_sec(), index)
+        return index
+
+
+def invalidate_location_geo_index(country_code: Optional[str] = None) -> None:
+    """Drop the cached index (all countries when country_code is None); refresh_gazetteer calls this on a version change."""
+    with _cache_lock:
+        if country_code is None:
+            _cache.clear()
+        else:
+            _cache.pop(country_code, None)
@@ -25,11 +25,32 @@ SUFFIX_LIST = SUFFIX_LIST_DIC["en"] + SUFFIX_LIST_DIC["ne"]
 SUFFIX_LIST = list(set([i.lower().strip() for i in SUFFIX_LIST]))
 SKIP_VALUE = DEFAULT_VALUES["SKIP_VALUE"]
 NOT_PROVIDED = DEFAULT_VALUES["NOT_PROVIDED"]
+SUPPORTED_LANGUAGE_CODES = ("en", "ne")
     
 class HelpersRepo:
     def __init__(self):
         self.location_validator = ContactLocationValidator()
         self.keyword_detector = KeywordDetector()
+        self._keyword_detectors = {self.keyword_detector.language_code: self.keyword_detector}
+        self.warm_up()
+
+    def warm_up(self, language_codes=SUPPORTED_LANGUAGE_CODES) -> None:
+        """Build the per-language detectors/validators once, at startup."""
+        for language_code in language_codes:
+            self.keyword_detector_for(language_code)
+            self.location_validator_for(language_code)
+
+    def keyword_detector_for(self, language_code: Optional[str]) -> KeywordDetector:
+        """Prebuilt detector for a language; shared, never re-initialised per session."""
+        language_code = language_code or DEFAULT_LANGUAGE_CODE
+        detector = self._keyword_detectors.get(language_code)
+        if detector is None:
+            detector = self._keyword_detectors.setdefault(language_code, KeywordDetector(language_code))
+        return detector
+
+    def location_validator_for(self, language_code: Optional[str]) -> ContactLocationValidator:
+        """Prebuilt location validator view for a language (see ContactLocationValidator.for_language)."""
+        return self.location_validator.for_language(language_code)
 
     def validate_municipality_input(self, location_string: str,
                         qr_province: str = DEFAULT_PROVINCE, 
@@ -38,9 +59,8 @@ class HelpersRepo:
         return self.location_validator.validate_municipality_input(location_string, qr_province, qr_district)
 
     def init_language(self, language_code: str = DEFAULT_LANGUAGE_CODE):
-        """Initialize the language code for the helpers."""
-        self.location_validator._initialize_constants(language_code)
-        self.keyword_detector.language_code = language_code
+        """Make sure helpers for `language_code` are built (shared instances are not mutated)."""
+        self.warm_up((language_code,))
         
     def check_province(self, province: str) -> bool:
         """Check if the province is valid."""
@@ -72,12 +92,8 @@ class HelpersRepo:
             - action_required: str - Recommended action
         """
         try:
-            # Update language if needed
-            if language_code != self.keyword_detector.language_code:
-                self.keyword_detector = KeywordDetector(language_code=language_code)
-            
-            # Detect sensitive content
-            result = self.keyword_detector.detect_sensitive_content(text)
+            # Detect sensitive content with the detector prebuilt for this language
+            result = self.keyword_detector_for(language_code).detect_sensitive_content(text)
             # level as string (e.g. result.level.value if enum) for serialization
             level = result.level
             level_str = level.value if hasattr(level, 'value') else str(level)
@@ -48,9 +48,25 @@ class KeywordDetector:
         self.language_code = language_code
         self.keyword_patterns = self._load_keyword_patterns()
         self.thresholds = self._load_thresholds()
+        self._compiled_patterns: Dict[str, List[Tuple[str, str, DetectionLevel, re.Pattern]]] = {}
+        self._patterns_for(language_code)
     
     def _initialize_constants(self, language_code: str = DEFAULT_LANGUAGE_CODE):
         self.language_code = language_code
+
+    def _patterns_for(self, language_code: str) -> List[Tuple[str, str, DetectionLevel, re.Pattern]]:
+        """(category, level name, level, compiled regex) for a language, compiled once."""
+        compiled = self._compiled_patterns.get(language_code)
+        if compiled is None:
+            compiled = []
+            for category, patterns in self.keyword_patterns.items():
+                lang_patterns = patterns.get(language_code, patterns.get("en", {}))
+                for level_name, pattern_list in lang_patterns.items():
+                    level = DetectionLevel(level_name)
+                    for pattern in pattern_list:
+                        compiled.append((category, level_name, level, re.compile(pattern, re.IGNORECASE)))
+            self._compiled_patterns[language_code] = compiled
+        return compiled
         
     def _load_keyword_patterns(self) -> Dict[str, Dict[str, Any]]:
         """Load keyword patterns for different categories"""
@@ -279,29 +295,21 @@ class KeywordDetector:
         all_matches = []
         
         # Check each category
-        for category, patterns in self.keyword_patterns.items():
-            lang_patterns = patterns.get(self.language_code, patterns.get("en", {}))
-            
-            for level_name, pattern_list in lang_patterns.items():
-                level = DetectionLevel(level_name)
+        for category, level_name, level, regex in self._patterns_for(self.language_code):
+            for match in regex.finditer(text_lower):
+                confidence = self._calculate_confidence(match, text_lower, level)
                 
-                for pattern in pattern_list:
-                    matches = re.finditer(pattern, text_lower, re.IGNORECASE)
-                    
-                    for match in matches:
-                        confidence = self._calculate_confidence(match, text_lower, level)
-                        
-                        if confidence >= self.thresholds[category][level_name]:
-                            keyword_match = KeywordMatch(
-                                keyword=match.group(),
-                                category=category,
-                                level=level,
-                                confidence=confidence,
-                                context=text[max(0, match.start()-20):match.end()+20],
-                                start_pos=match.start(),
-                                end_pos=match.end()
-                            )
-                            all_matches.append(keyword_match)
+                if confidence >= self.thresholds[category][level_name]:
+                    keyword_match = KeywordMatch(
+                        keyword=match.group(),
+                        category=category,
+                        level=level,
+                        confidence=confidence,
+                        context=text[max(0, match.start()-20):match.end()+20],
+                        start_pos=match.start(),
+                        end_pos=match.end()
+                    )
+                    all_matches.append(keyword_match)
         
         if not all_matches:
             return DetectionResult(
@@ -54,6 +54,13 @@ def strip_admin_suffix(name: str, level_number: int) -> str:
     return " ".join(text.split()).strip()
 
 
+def _gazetteer_for(db_manager: Any):
+    """In-process location snapshot loaded from this db_manager, else None (use SQL)."""
+    from backend.shared_functions.gazetteer import current_gazetteer
+
+    return current_gazetteer(db_manager)
+
+
 def _fetch_location_candidates(
     db_manager: Any,
     *,
@@ -115,6 +122,15 @@ def _resolve_location_code_by_name(
     if not cleaned:
         return None
 
+    gazetteer = _gazetteer_for(db_manager)
+    if gazetteer is not None:
+        return gazetteer.resolve_name(
+            country_code=country_code,
+            level_number=level_number,
+            candidate_name=cleaned,
+            parent_code=parent_code,
+        )
+
     try:
         if parent_code:
             rows = db_manager.execute_query(
@@ -216,6 +232,10 @@ def resolve_location_hierarchy_from_code(
     if not code:
         return payload
 
+    gazetteer = _gazetteer_for(db_manager)
+    if gazetteer is not None:
+        return gazetteer.hierarchy(code, lang_code)
+
     try:
         rows = db_manager.execute_query(
             """
@@ -283,34 +303,39 @@ def resolve_location_code_to_names(
     if not cleaned:
         return result
 
+    gazetteer = _gazetteer_for(db_manager)
     try:
-        rows = db_manager.execute_query(
-            """
-            SELECT
-                l.location_code,
-                l.parent_location_code,
-                l.level_number,
-                COALESCE(lt_pref.name, lt_en.name) AS name,
-                COALESCE(parent_pref.name, parent_en.name) AS parent_name,
-                p.location_code AS parent_code
-            FROM ticketing.locations l
-            LEFT JOIN ticketing.location_translations lt_pref
-              ON lt_pref.location_code = l.location_code AND lt_pref.lang_code = %s
-            LEFT JOIN ticketing.location_translations lt_en
-              ON lt_en.location_code = l.location_code AND lt_en.lang_code = 'en'
-            LEFT JOIN ticketing.locations p
-              ON p.location_code = l.parent_location_code
-            LEFT JOIN ticketing.location_translations parent_pref
-              ON parent_pref.location_code = p.location_code AND parent_pref.lang_code = %s
-            LEFT JOIN ticketing.location_translations parent_en
-              ON parent_en.location_code = p.location_code AND parent_en.lang_code = 'en'
-            WHERE l.location_code = %s
-              AND l.is_active = TRUE
-            LIMIT 1
-            """,
-            (lang_code, lang_code, cleaned),
-            "resolve_location_code_to_names",
-        )
+        if gazetteer is not None:
+            row = gazetteer.code_row(cleaned, lang_code)
+            rows = [row] if row else []
+        else:
+            rows = db_manager.execute_query(
+                """
+                SELECT
+                    l.location_code,
+                    l.parent_location_code,
+                    l.level_number,
+                    COALESCE(lt_pref.name, lt_en.name) AS name,
+                    COALESCE(parent_pref.name, parent_en.name) AS parent_name,
+                    p.location_code AS parent_code
+                FROM ticketing.locations l
+                LEFT JOIN ticketing.location_translations lt_pref
+                  ON lt_pref.location_code = l.location_code AND lt_pref.lang_code = %s
+                LEFT JOIN ticketing.location_translations lt_en
+                  ON lt_en.location_code = l.location_code AND lt_en.lang_code = 'en'
+                LEFT JOIN ticketing.locations p
+                  ON p.location_code = l.parent_location_code
+                LEFT JOIN ticketing.location_translations parent_pref
+                  ON parent_pref.location_code = p.location_code AND parent_pref.lang_code = %s
+                LEFT JOIN ticketing.location_translations parent_en
+                  ON parent_en.location_code = p.location_code AND parent_en.lang_code = 'en'
+                WHERE l.location_code = %s
+                  AND l.is_active = TRUE
+                LIMIT 1
+                """,
+                (lang_code, lang_code, cleaned),
+                "resolve_location_code_to_names",
+            )
     except Exception:
         return result
 
@@ -413,36 +438,45 @@ def resolve_location_payload(
     return payload
 
 
+def resolve_pin_to_location_hierarchy(
+    db_manager: Any,
+    lat: float,
+    lng: float,
+    country_code: str = "NP",
+    *,
+    max_level: int = 3,
+) -> Optional[Dict[str, Any]]:
+    """
+    Offline pin → level_n_code fields via the in-memory geo index (see geo_index.py).
+
+    ``method`` is "polygon" when boundary GeoJSON contains the pin, otherwise "centroid"
+    (nearest location seat). None when no coordinates/boundaries are loaded.
+    """
+    from backend.shared_functions.geo_index import get_location_geo_index
+
+    try:
+        index = get_location_geo_index(db_manager, country_code)
+        if index is None:
+            return None
+        return index.resolve(float(lat), float(lng), max_level=max_level)
+    except Exception:
+        return None
+
+
 def resolve_pin_to_location_code(
     db_manager: Any,
     lat: float,
     lng: float,
     country_code: str = "NP",
+    level_number: int = 2,
 ) -> Optional[str]:
     """
-    Best-effort: map pin to nearest ticketing location_code (district level).
+    Best-effort: map pin to its ticketing location_code at ``level_number`` (district by default).
     Returns None when geodata is unavailable — pin coords are still stored on grievance.
     """
-    try:
-        rows = db_manager.execute_query(
-            """
-            SELECT location_code
-            FROM ticketing.locations
-            WHERE country_code = %s
-              AND level_number = 2
-              AND is_active = TRUE
-              AND latitude IS NOT NULL
-              AND longitude IS NOT NULL
-            ORDER BY (
-              (latitude - %s) * (latitude - %s) + (longitude - %s) * (longitude - %s)
-            )
-            LIMIT 1
-            """,
-            (country_code, lat, lat, lng, lng),
-            "resolve_pin_to_location_code",
-        )
-        if rows:
-            return rows[0].get("location_code")
-    except Exception:
-        pass
-    return None
+    resolved = resolve_pin_to_location_hierarchy(
+        db_manager, lat, lng, country_code, max_level=level_number
+    )
+    if not resolved:
+        return None
+    return resolved.get(f"level_{level_number}_code")
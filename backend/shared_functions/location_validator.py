@@ -23,6 +23,15 @@ from backend.shared_functions.text_language import detect_app_language, language
 
 DEFAULT_LANGUAGE_CODE = DEFAULT_VALUES["DEFAULT_LANGUAGE_CODE"]
 
+COMMON_SUFFIXES = (
+    "province", "district", "municipality",
+    "rural municipality", "metropolitan",
+    "sub-metropolitan", "submetropolitan",
+    "metropolitan city", "rural mun", "mun",
+    "महानगरपालिका", "प्रदेश", "जिल्ला", "गाउँपालिका", "नगरपालिका",
+)
+_TITLED_SUFFIXES = tuple(suffix.title() for suffix in COMMON_SUFFIXES)
+
 
 def _norm_municipality(name: Optional[str]) -> str:
     if not name:
@@ -81,6 +90,31 @@ class ContactLocationValidator:
         self.municipality_villages: List[Dict[str, str]] = self._load_municipality_villages()
         self._office_rows: List[Dict[str, Any]] = self._load_office_rows()
 
+        # One prebuilt view per tree language; shared by reference with every view
+        self._language_views: Dict[str, "ContactLocationValidator"] = {}
+        for lang in self.locations_both_language:
+            self._language_views[lang] = self._build_language_view(lang)
+
+    def _build_language_view(self, language_code: str) -> "ContactLocationValidator":
+        """Shallow copy bound to one language; trees, villages and office rows are shared."""
+        view = copy.copy(self)
+        view._initialize_constants(language_code)
+        view._municipality_names_by_district = {
+            id(district): view._build_municipality_names(district)
+            for province in view.locations
+            for district in province.get("districts", [])
+        }
+        return view
+
+    def for_language(self, language_code: Optional[str]) -> "ContactLocationValidator":
+        """Prebuilt validator for `language_code` (default language if not loaded).
+
+        Views are read-only: callers pick the view they need instead of calling
+        `_initialize_constants` on a shared instance.
+        """
+        view = self._language_views.get(language_code or DEFAULT_LANGUAGE_CODE)
+        return view or self._language_views[DEFAULT_LANGUAGE_CODE]
+
     def _build_location_tree_for_lang(self, lang_code: str) -> Optional[List[Dict[str, Any]]]:
         """Build province → district → municipality list from ticketing schema."""
         try:
@@ -330,14 +364,7 @@ class ContactLocationValidator:
 
     def _get_common_suffixes(self):
         """Return list of common suffixes to remove."""
-        return [
-            "province", "district", "municipality", 
-            "rural municipality", "metropolitan", 
-            "sub-metropolitan", "submetropolitan",
-            "metropolitan city", "rural mun", "mun", 
-            "महानगरपालिका" , "प्रदेश", "जिल्ला", "गाउँपालिका" , "नगरपालिका" 
-            
-        ]
+        return list(COMMON_SUFFIXES)
 
     def _preprocess(self, text):
         """Normalize user input to lowercase and remove common suffixes."""
@@ -345,8 +372,8 @@ class ContactLocationValidator:
             return None
         
         text = text.title().strip()
-        for suffix in self._get_common_suffixes():
-            text = text.replace(suffix.title(), "").strip()
+        for suffix in _TITLED_SUFFIXES:
+            text = text.replace(suffix, "").strip()
         return text
 
     def _generate_possible_names(self, text):
@@ -399,6 +426,13 @@ class ContactLocationValidator:
         return [d["name"] for d in province_data.get("districts", [])]
         
     def _get_municipality_names(self, district_data: dict) -> list:
+        """Municipality names for a district (precomputed on language views)."""
+        cached = getattr(self, "_municipality_names_by_district", {}).get(id(district_data))
+        if cached is not None:
+            return cached
+        return self._build_municipality_names(district_data)
+
+    def _build_municipality_names(self, district_data: dict) -> list:
         """
         Extract and process municipality names from district data.
         
@@ -438,30 +472,30 @@ class ContactLocationValidator:
         tree_langs = self._tree_languages_for(input_hint, qr_hint)
 
         for tree_lang in tree_langs:
-            self._initialize_constants(tree_lang)
-            province_names = [p["name"] for p in self.locations]
+            view = self.for_language(tree_lang)
+            province_names = [p["name"] for p in view.locations]
 
             matched_province = (
-                self._find_best_match(qr_province, province_names) if qr_province else None
+                view._find_best_match(qr_province, province_names) if qr_province else None
             )
             if not matched_province:
                 continue
 
-            province_data = self._get_province_data(matched_province)
+            province_data = view._get_province_data(matched_province)
             district_names = [d["name"] for d in province_data.get("districts", [])]
             matched_district = (
-                self._find_best_match(qr_district, district_names) if qr_district else None
+                view._find_best_match(qr_district, district_names) if qr_district else None
             )
             if not matched_district:
                 continue
 
-            district_data = self._get_district_data(province_data, matched_district)
-            municipality_names = self._get_municipality_names(district_data)
+            district_data = view._get_district_data(province_data, matched_district)
+            municipality_names = view._get_municipality_names(district_data)
 
             for possible_name in possible_names:
                 if municipality_names:
                     print(f"######## LocationValidator: Municipality names: {municipality_names}")
-                matched_municipality = self._find_best_match(possible_name, municipality_names)
+                matched_municipality = view._find_best_match(possible_name, municipality_names)
                 if matched_municipality:
                     return matched_province, matched_district, matched_municipality
 
@@ -472,26 +506,26 @@ class ContactLocationValidator:
         print(f"######## LocationValidator: String")
         input_hint = possible_names[0] if possible_names else ""
         for tree_lang in self._tree_languages_for(input_hint):
-            self._initialize_constants(tree_lang)
-            for province in self.locations:
+            view = self.for_language(tree_lang)
+            for province in view.locations:
                 for district in province.get("districts", []):
-                    municipality_names = self._get_municipality_names(district)
+                    municipality_names = view._get_municipality_names(district)
                     for possible_name in possible_names:
-                        matched_municipality = self._find_best_match(
+                        matched_municipality = view._find_best_match(
                             possible_name, municipality_names
                         )
                         if matched_municipality:
                             return province["name"], district["name"], matched_municipality
 
-            for province in self.locations:
+            for province in view.locations:
                 district_names = [d["name"] for d in province.get("districts", [])]
                 for possible_name in possible_names:
-                    matched_district = self._find_best_match(possible_name, district_names)
+                    matched_district = view._find_best_match(possible_name, district_names)
                     if matched_district:
                         return province["name"], matched_district, None
 
             for possible_name in possible_names:
-                matched_province = self._find_best_match(possible_name, self.provinces)
+                matched_province = view._find_best_match(possible_name, view.provinces)
                 if matched_province:
                     return matched_province, None, None
 
@@ -520,23 +554,21 @@ class ContactLocationValidator:
 
     def check_province(self, input_text):
         """Check if the province name is valid."""
-        possible_names = self._generate_possible_names(input_text)
         for tree_lang in self._tree_languages_for(input_text):
-            self._initialize_constants(tree_lang)
-            for possible_name in possible_names:
-                matched_province = self._find_best_match(possible_name, self.provinces)
+            view = self.for_language(tree_lang)
+            for possible_name in view._generate_possible_names(input_text):
+                matched_province = view._find_best_match(possible_name, view.provinces)
                 if matched_province:
                     return matched_province
         return None
     
     def check_district(self, input_text, province_name):
         """Check if the district name is valid."""
-        possible_names = self._generate_possible_names(input_text)
         for tree_lang in self._tree_languages_for(input_text, province_name):
-            self._initialize_constants(tree_lang)
-            district_names = self._get_district_names(province_name)
-            for possible_name in possible_names:
-                matched_district = self._find_best_match(possible_name, district_names)
+            view = self.for_language(tree_lang)
+            district_names = view._get_district_names(province_name)
+            for possible_name in view._generate_possible_names(input_text):
+                matched_district = view._find_best_match(possible_name, district_names)
                 if matched_district:
                     return matched_district
         return None
@@ -602,8 +634,7 @@ class ContactLocationValidator:
                 return None
 
             for tree_lang in self._tree_languages_for(cleaned, qr_province, qr_district):
-                self._initialize_constants(tree_lang)
-                validation_result = self._validate_location(
+                validation_result = self.for_language(tree_lang)._validate_location(
                     cleaned,
                     qr_province,
                     qr_district,
@@ -628,22 +659,22 @@ class ContactLocationValidator:
         input_text: str,
         qr_municipality: str,
     ) -> tuple[Optional[str], Optional[str]]:
-        """Match village + ward for a municipality using fuzzy matching on seeded rows."""
-        for tree_lang in self._tree_languages_for(input_text, qr_municipality):
-            self._initialize_constants(tree_lang)
-            qr_municipality_norm = _norm_municipality(qr_municipality)
-
-            mun_rows = [
-                r for r in self.municipality_villages if r["municipality"] == qr_municipality_norm
-            ]
-            village_names = [r["village"] for r in mun_rows if r.get("village")]
-
-            matched_village = self._find_best_match(input_text, village_names)
-            print(f"######## LocationValidator: Matched village: {matched_village}")
-            if matched_village:
-                for r in mun_rows:
-                    if r["village"] == matched_village:
-                        return matched_village, str(r["ward"])
+        """Match village + ward for a municipality using fuzzy matching on seeded rows.
+
+        Village rows are not split by tree language, so a single pass is enough.
+        """
+        qr_municipality_norm = _norm_municipality(qr_municipality)
+        mun_rows = [
+            r for r in self.municipality_villages if r["municipality"] == qr_municipality_norm
+        ]
+        village_names = [r["village"] for r in mun_rows if r.get("village")]
+
+        matched_village = self._find_best_match(input_text, village_names)
+        print(f"######## LocationValidator: Matched village: {matched_village}")
+        if matched_village:
+            for r in mun_rows:
+                if r["village"] == matched_village:
+                    return matched_village, str(r["ward"])
         return None, None
 
     def get_office_in_charge_info(
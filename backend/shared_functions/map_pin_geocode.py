@@ -14,13 +14,13 @@ from backend.shared_functions.geo_pin import (
 from backend.shared_functions.location_mapping import (
     resolve_location_hierarchy_from_code,
     resolve_location_payload,
+    resolve_pin_to_location_hierarchy,
 )
-from backend.shared_functions.location_validator import ContactLocationValidator
 from backend.shared_functions.reverse_geocode import (
     NominatimError,
     NominatimRateLimitError,
     NominatimUnavailableError,
-    nominatim_reverse_geocode,
+    cached_reverse_geocode,
 )
 
 logger = logging.getLogger(__name__)
@@ -44,7 +44,8 @@ def _canonicalize_admin_names(
         return {"province": None, "district": None, "municipality": None}
 
     try:
-        validator = ContactLocationValidator()
+        # Shared per-language validators, built once per process (not per pin).
+        from backend.shared_functions.helpers_repo import helpers_repo
     except Exception as exc:
         logger.warning("map_pin_geocode: validator init failed (%s); using raw names", exc)
         return dict(raw)
@@ -54,16 +55,19 @@ def _canonicalize_admin_names(
     municipality = None
 
     if province_raw:
-        validator._initialize_constants(detect_app_language(province_raw, lang_code))
-        province = validator.check_province(province_raw)
+        province = helpers_repo.location_validator_for(
+            detect_app_language(province_raw, lang_code)
+        ).check_province(province_raw)
 
     if province and district_raw:
-        validator._initialize_constants(detect_app_language(district_raw, lang_code))
-        district = validator.check_district(district_raw, province)
+        district = helpers_repo.location_validator_for(
+            detect_app_language(district_raw, lang_code)
+        ).check_district(district_raw, province)
 
     if province and district and municipality_raw:
-        validator._initialize_constants(detect_app_language(municipality_raw, lang_code))
-        municipality = validator.validate_municipality_input(
+        municipality = helpers_repo.location_validator_for(
+            detect_app_language(municipality_raw, lang_code)
+        ).validate_municipality_input(
             municipality_raw,
             province,
             district,
@@ -92,6 +96,29 @@ def build_slots_from_geocode_names(
     }
 
 
+def _apply_hierarchy_names(
+    db_manager: Any,
+    payload: Dict[str, Any],
+    names: Dict[str, Optional[str]],
+    lang_code: str,
+) -> Dict[str, Any]:
+    location_code = payload.get("location_code")
+    if location_code:
+        hierarchy = resolve_location_hierarchy_from_code(
+            db_manager,
+            location_code,
+            lang_code=lang_code or "en",
+        )
+        for key, value in hierarchy.items():
+            if value:
+                payload[key] = value
+
+    payload["complainant_province"] = payload.get("level_1_name") or names.get("province")
+    payload["complainant_district"] = payload.get("level_2_name") or names.get("district")
+    payload["complainant_municipality"] = payload.get("level_3_name") or names.get("municipality")
+    return payload
+
+
 def resolve_map_pin_location_payload(
     db_manager: Any,
     lat: float,
@@ -100,14 +127,28 @@ def resolve_map_pin_location_payload(
     lang_code: str = "en",
     country_code: str = "NP",
     respect_rate_limit: bool = True,
+    use_local_index: bool = True,
 ) -> Dict[str, Any]:
     """
     Reverse geocode a pin and resolve ticketing location codes.
 
-    Nominatim + code matching always use English admin labels (stable OSM/DB mapping).
+    A municipality boundary hit in the offline geo index answers without Nominatim;
+    otherwise Nominatim + code matching use English admin labels (stable OSM/DB mapping).
     Display names (level_* / complainant_*) use ``lang_code`` from DB translations.
     """
-    raw = nominatim_reverse_geocode(
+    if use_local_index:
+        local = resolve_pin_to_location_hierarchy(db_manager, lat, lng, country_code)
+        if local and local["method"] == "polygon" and local["level_number"] >= 3:
+            payload = {
+                "country_code": country_code,
+                "location_code": local["location_code"],
+                "location_resolution_status": "mapped_full",
+                "location_deepest_mapped_level": local["level_number"],
+                "location_source": "geo_index",
+            }
+            return _apply_hierarchy_names(db_manager, payload, {}, lang_code)
+
+    raw = cached_reverse_geocode(
         lat,
         lng,
         lang_code="en",
@@ -121,22 +162,7 @@ def resolve_map_pin_location_payload(
         slots_for_location_resolve(slots),
         country_code=country_code,
     )
-
-    location_code = payload.get("location_code")
-    if location_code:
-        hierarchy = resolve_location_hierarchy_from_code(
-            db_manager,
-            location_code,
-            lang_code=lang_code or "en",
-        )
-        for key, value in hierarchy.items():
-            if value:
-                payload[key] = value
-
-    payload["complainant_province"] = payload.get("level_1_name") or names.get("province")
-    payload["complainant_district"] = payload.get("level_2_name") or names.get("district")
-    payload["complainant_municipality"] = payload.get("level_3_name") or names.get("municipality")
-    return payload
+    return _apply_hierarchy_names(db_manager, payload, names, lang_code)
 
 
 def build_complainant_geocode_update(
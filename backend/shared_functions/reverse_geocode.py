@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import json
 import logging
 import os
+import threading
 import time
-from typing import Any, Dict, Optional
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
 from urllib.parse import urlencode
 
 import httpx
@@ -19,6 +24,16 @@ NOMINATIM_ADMIN_ZOOM = 10
 MIN_REQUEST_INTERVAL_SEC = 1.05
 _REDIS_LOCK_KEY = "nominatim:geocode:mutex"
 _REDIS_LAST_CALL_KEY = "nominatim:geocode:last_call"
+_REDIS_CELL_KEY_PREFIX = "nominatim:cell"
+# Grid precision in decimal degrees: 3 → ~110 m cells, well inside a municipality.
+DEFAULT_CACHE_PRECISION = 3
+DEFAULT_CACHE_TTL_SEC = 180 * 24 * 3600
+DEFAULT_MEMORY_CACHE_SIZE = 20_000
+NOMINATIM_TIMEOUT_SEC = 20.0
+_CELL_LOCK_TTL_SEC = 30
+_CELL_WAIT_POLL_SEC = 0.2
+# Waiters give up on another process's fetch after one upstream request's worth of time.
+_CELL_WAIT_MAX_SEC = NOMINATIM_TIMEOUT_SEC + MIN_REQUEST_INTERVAL_SEC
 
 
 class NominatimError(Exception):
@@ -121,7 +136,7 @@ def nominatim_reverse_geocode(
     lang_code: str = "en",
     zoom: int = NOMINATIM_ADMIN_ZOOM,
     respect_rate_limit: bool = True,
-    timeout: float = 20.0,
+    timeout: float = NOMINATIM_TIMEOUT_SEC,
 ) -> Dict[str, Optional[str]]:
     """
     Reverse geocode coordinates to province / district / municipality names.
@@ -169,3 +184,281 @@ def nominatim_reverse_geocode(
         return {"province": None, "district": None, "municipality": None}
 
     return parse_nominatim_admin_address(address)
+
+
+# ── Grid-cell cache with request coalescing ──────────────────────────────────
+
+Geocoder = Callable[..., Dict[str, Optional[str]]]
+_ADMIN_KEYS = ("province", "district", "municipality")
+
+
+def grid_cell(lat: float, lng: float, precision: int) -> Tuple[float, float]:
+    """Cell centre for a pin: lat/lng rounded to ``precision`` decimal places."""
+    return round(float(lat), precision), round(float(lng), precision)
+
+
+class ReverseGeocodeCache:
+    """
+    Admin names per (lang, zoom, grid cell): in-process LRU, then Redis (shared by the
+    chatbot and Celery workers, survives restarts), then the geocoder for the cell centre.
+
+    Misses for one cell are coalesced — one upstream call in flight per cell in this process
+    (waiters share its Future) and, with Redis, across processes (SET NX cell lock; others poll
+    for the value while the lock is held, for at most one upstream timeout). Only misses pay
+    the Nominatim rate limit. Errors are never cached.
+    """
+
+    def __init__(
+        self,
+        *,
+        precision: int = DEFAULT_CACHE_PRECISION,
+        ttl_sec: int = DEFAULT_CACHE_TTL_SEC,
+        memory_size: int = DEFAULT_MEMORY_CACHE_SIZE,
+        redis_client: Any = None,
+        geocoder: Optional[Geocoder] = None,
+    ):
+        self.precision = int(precision)
+        self.ttl_sec = int(ttl_sec)
+        self._memory_size = int(memory_size)
+        self._memory: "OrderedDict[str, Dict[str, Optional[str]]]" = OrderedDict()
+        self._redis = redis_client
+        self._geocoder = geocoder or nominatim_reverse_geocode
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+        self._stats_lock = threading.Lock()
+        self.stats = {"memory_hits": 0, "redis_hits": 0, "upstream_calls": 0, "coalesced": 0}
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            self.stats[name] += 1
+
+    def cell_key(self, lat: float, lng: float, *, lang_code: str = "en", zoom: int = NOMINATIM_ADMIN_ZOOM) -> str:
+        cell_lat, cell_lng = grid_cell(lat, lng, self.precision)
+        return f"{_REDIS_CELL_KEY_PREFIX}:{self.precision}:{lang_code}:{int(zoom)}:{cell_lat:.{self.precision}f}:{cell_lng:.{self.precision}f}"
+
+    # memory layer
+
+    def _memory_get(self, key: str) -> Optional[Dict[str, Optional[str]]]:
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+            return value
+
+    def _memory_put(self, key: str, value: Dict[str, Optional[str]]) -> None:
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > self._memory_size:
+                self._memory.popitem(last=False)
+
+    # redis layer (best-effort: an unreachable Redis degrades to memory-only)
+
+    def _redis_get(self, key: str) -> Optional[Dict[str, Optional[str]]]:
+        if self._redis is None:
+            return None
+        try:
+            raw = self._redis.get(key)
+        except Exception as exc:
+            logger.warning("reverse geocode cache: Redis get failed (%s)", exc)
+            return None
+        if not raw:
+            return None
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            return None
+        return {k: value.get(k) for k in _ADMIN_KEYS} if isinstance(value, dict) else None
+
+    def _redis_put(self, key: str, value: Dict[str, Optional[str]]) -> None:
+        if self._redis is None:
+            return
+        try:
+            self._redis.set(key, json.dumps(value, ensure_ascii=False), ex=self.ttl_sec)
+        except Exception as exc:
+            logger.warning("reverse geocode cache: Redis set failed (%s)", exc)
+
+    def _cached(self, key: str) -> Optional[Dict[str, Optional[str]]]:
+        value = self._memory_get(key)
+        if value is not None:
+            self._count("memory_hits")
+            return value
+        value = self._redis_get(key)
+        if value is not None:
+            self._count("redis_hits")
+            self._memory_put(key, value)
+        return value
+
+    def put(self, key: str, value: Dict[str, Optional[str]]) -> None:
+        value = {k: value.get(k) for k in _ADMIN_KEYS}
+        self._memory_put(key, value)
+        self._redis_put(key, value)
+
+    def _fetch_across_processes(self, key: str, fetch: Callable[[], Dict[str, Optional[str]]]):
+        """Hold the Redis cell lock while fetching; if another process holds it, wait for its value."""
+        if self._redis is None:
+            return fetch()
+        lock_key = f"{key}:lock"
+        token = uuid.uuid4().hex
+        try:
+            acquired = self._redis.set(lock_key, token, nx=True, ex=_CELL_LOCK_TTL_SEC)
+        except Exception:
+            return fetch()
+        if not acquired:
+            deadline = time.monotonic() + _CELL_WAIT_MAX_SEC
+            while time.monotonic() < deadline:
+                time.sleep(_CELL_WAIT_POLL_SEC)
+                value = self._redis_get(key)
+                if value is not None:
+                    self._count("coalesced")
+                    return value
+                try:
+                    if self._redis.get(lock_key) is None:
+                        break  # holder failed (errors are not cached) or its lock expired
+                except Exception:
+                    break
+            return fetch()  # holder failed, died or is too slow; fetch ourselves
+        try:
+            return fetch()
+        finally:
+            try:
+                if self._redis.get(lock_key) in (token, token.encode()):
+                    self._redis.delete(lock_key)
+            except Exception:
+                pass
+
+    def lookup(
+        self,
+        lat: float,
+        lng: float,
+        *,
+        lang_code: str = "en",
+        zoom: int = NOMINATIM_ADMIN_ZOOM,
+        respect_rate_limit: bool = True,
+    ) -> Dict[str, Optional[str]]:
+        key = self.cell_key(lat, lng, lang_code=lang_code, zoom=zoom)
+        value = self._cached(key)
+        if value is not None:
+            return dict(value)
+
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        if not leader:
+            self._count("coalesced")
+            return dict(future.result())
+
+        cell_lat, cell_lng = grid_cell(lat, lng, self.precision)
+
+        def fetch() -> Dict[str, Optional[str]]:
+            # Another process may have filled the cell while we waited for the lock
+            cached = self._redis_get(key)
+            if cached is not None:
+                return cached
+            self._count("upstream_calls")
+            result = self._geocoder(
+                cell_lat, cell_lng, lang_code=lang_code, zoom=zoom, respect_rate_limit=respect_rate_limit
+            )
+            self.put(key, result)
+            return {k: result.get(k) for k in _ADMIN_KEYS}
+
+        try:
+            value = self._fetch_across_processes(key, fetch)
+            self._memory_put(key, value)
+            future.set_result(value)
+            return dict(value)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def warm(self, entries: Iterable[Dict[str, Any]], *, lang_code: str = "en", zoom: int = NOMINATIM_ADMIN_ZOOM) -> int:
+        """Seed cells from {lat, lng, province, district, municipality[, lang_code, zoom]} records."""
+        count = 0
+        for entry in entries:
+            try:
+                key = self.cell_key(
+                    float(entry["lat"]),
+                    float(entry["lng"]),
+                    lang_code=entry.get("lang_code") or lang_code,
+                    zoom=int(entry.get("zoom") or zoom),
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+            self.put(key, entry)
+            count += 1
+        return count
+
+    def warm_from_file(self, path: str) -> int:
+        """Load a JSON list or JSON-lines file of warm() records; returns cells loaded."""
+        count = self.warm(_read_records(path))
+        logger.info("reverse geocode cache: warmed %d cells from %s", count, path)
+        return count
+
+
+def _read_records(path: str) -> Iterator[Dict[str, Any]]:
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    stripped = text.lstrip()
+    if stripped.startswith("["):
+        yield from (r for r in json.loads(stripped) if isinstance(r, dict))
+        return
+    for line in text.splitlines():
+        line = line.strip()
+        if line:
+            record = json.loads(line)
+            if isinstance(record, dict):
+                yield record
+
+
+_default_cache: Optional[ReverseGeocodeCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_reverse_geocode_cache() -> ReverseGeocodeCache:
+    """
+    Process-wide cache. NOMINATIM_CACHE_PRECISION / NOMINATIM_CACHE_TTL_SEC configure it;
+    NOMINATIM_CACHE_WARM_FILE (JSON / JSON-lines) is loaded on first use.
+    """
+    global _default_cache
+    if _default_cache is not None:
+        return _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            try:
+                client = _redis_client()
+                client.ping()
+            except Exception as exc:
+                logger.warning("reverse geocode cache: Redis unavailable (%s); memory-only", exc)
+                client = None
+            cache = ReverseGeocodeCache(
+                precision=int(os.getenv("NOMINATIM_CACHE_PRECISION") or DEFAULT_CACHE_PRECISION),
+                ttl_sec=int(os.getenv("NOMINATIM_CACHE_TTL_SEC") or DEFAULT_CACHE_TTL_SEC),
+                redis_client=client,
+            )
+            warm_file = (os.getenv("NOMINATIM_CACHE_WARM_FILE") or "").strip()
+            if warm_file:
+                try:
+                    cache.warm_from_file(warm_file)
+                except (OSError, ValueError) as exc:
+                    logger.warning("reverse geocode cache: warm file %s unreadable (%s)", warm_file, exc)
+            _default_cache = cache
+    return _default_cache
+
+
+def cached_reverse_geocode(
+    lat: float,
+    lng: float,
+    *,
+    lang_code: str = "en",
+    zoom: int = NOMINATIM_ADMIN_ZOOM,
+    respect_rate_limit: bool = True,
+) -> Dict[str, Optional[str]]:
+    """nominatim_reverse_geocode through the process-wide grid-cell cache."""
+    return get_reverse_geocode_cache().lookup(
+        lat, lng, lang_code=lang_code, zoom=zoom, respect_rate_limit=respect_rate_limit
+    )
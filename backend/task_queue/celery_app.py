@@ -1,5 +1,7 @@
 from celery import Celery
+from celery.signals import worker_process_shutdown
 from kombu import Exchange, Queue
+from backend.logger.metrics import mark_process_dead
 from .settings import (
     QUEUE_FOLDER,
     CELERY_BROKER_URL,
@@ -56,3 +58,7 @@ celery_app.conf.update(
 )
 
 
+@worker_process_shutdown.connect
+def _drop_task_metrics_of_exited_child(pid=None, **kwargs):
+    """In Prometheus multiprocess mode, stop reporting live values of an exited prefork child."""
+    mark_process_dead(pid)
@@ -119,7 +119,8 @@ def process_file_upload_task(self, grievance_id: str,
                            file_data: Dict[str, Any], 
                            emit_websocket: bool = True,
                            session_type: str = 'bot',
-                           session_id: str = None) -> Dict[str, Any]:
+                           session_id: str = None,
+                           batch_member: bool = False) -> Dict[str, Any]:
     """
     Process a single file upload.
     
@@ -129,6 +130,9 @@ def process_file_upload_task(self, grievance_id: str,
         emit_websocket: Whether to emit a websocket message (default: True)
         session_type: Type of session (default: 'bot')
         session_id: ID of the session
+        batch_member: Part of a process_batch_files_task chord: once retries are used up,
+            return a FAILED entry instead of raising, so one bad file does not skip
+            aggregate_batch_results
         
     Returns:
         Dict containing processing results with keys:
@@ -136,6 +140,7 @@ def process_file_upload_task(self, grievance_id: str,
         - operation: 'file_upload'
         - field_name: 'file_data'
         - value: Processed file data
+        As a batch member: {status, file_id, file_name, result | error}
     """
     session_id = grievance_id if session_id is None else session_id
     task_mgr = TaskManager(task=self, emit_websocket=emit_websocket)
@@ -165,6 +170,8 @@ def process_file_upload_task(self, grievance_id: str,
             session_id=session_id
         )
         
+        if batch_member:
+            return _batch_entry(file_data, SUCCESS, result=result)
         return result
     except Exception as e:
         task_mgr.fail_task(
@@ -178,8 +185,20 @@ def process_file_upload_task(self, grievance_id: str,
                 'file_name': file_data.get('file_name'),
             },
         )
+        if batch_member and self.request.retries >= (self.max_retries or 0):
+            return _batch_entry(file_data, FAILED, error=str(e))
         raise
 
+
+def _batch_entry(file_data: Dict[str, Any], status: str, **outcome) -> Dict[str, Any]:
+    """One file's outcome as aggregate_batch_results expects it."""
+    return {
+        'status': status,
+        'file_id': file_data.get('file_id'),
+        'file_name': file_data.get('file_name'),
+        **outcome,
+    }
+
 @TaskManager.register_task(task_type='FileUpload')
 def process_batch_files_task(self, 
                              grievance_id: str, 
@@ -195,6 +214,7 @@ def process_batch_files_task(self,
         files_data: List of file metadata and paths
         allowed_extensions: List of allowed file extensions (default: ALLOWED_EXTENSIONS)
         emit_websocket: Whether to emit a websocket message (default: True)
+        session_id: Session for status events (batch start/complete and the aggregate)
         
     Returns:
         Dict containing batch processing summary with keys:
@@ -212,13 +232,17 @@ def process_batch_files_task(self,
         session_id=session_id
     )
     try:
+        # Compress the batch's images together (bounded), so per-file tasks only store them
+        file_server_core.precompress_batch_images(files_data)
+        # Each file keeps its own status events (file_status_update / FAILED with file_id)
         upload_group = group(
             process_file_upload_task.s(grievance_id, file_data, 
-                                       emit_websocket=False)
+                                       session_id=session_id,
+                                       batch_member=True)
             for file_data in files_data
         )
         # The callback will be called with the list of results
-        callback = aggregate_batch_results.s(grievance_id)
+        callback = aggregate_batch_results.s(grievance_id, session_id=session_id)
         result = chord(upload_group)(callback)
         # Return the chord id for tracking
         summary = {
@@ -246,13 +270,14 @@ def process_batch_files_task(self,
         raise
 
 @TaskManager.register_task(task_type='FileUpload')
-def aggregate_batch_results(self, results, grievance_id):
+def aggregate_batch_results(self, results, grievance_id, session_id=None):
     """
     Aggregates results of all file upload tasks in a batch.
     
     Args:
-        results: List of results from process_file_upload_task
+        results: Batch entries from process_file_upload_task(batch_member=True)
         grievance_id: ID of the grievance
+        session_id: Session to notify (webchat flask session; None = grievance room)
         
     Returns:
         Dict containing aggregation summary with keys:
@@ -262,9 +287,9 @@ def aggregate_batch_results(self, results, grievance_id):
         - success_count: Number of successful tasks
         - failed_count: Number of failed tasks
     """
-    # results is a list of return values from process_file_upload_task
-    success_count = sum(1 for r in results if r.get('status') == SUCCESS)
-    failed_count = sum(1 for r in results if r.get('status') != SUCCESS)
+    # Members never raise in a batch; each entry carries its own status
+    success_count = sum(1 for r in results if (r or {}).get('status') == SUCCESS)
+    failed_count = len(results) - success_count
     summary = {
         'status': SUCCESS if failed_count == 0 else FAILED,
         'grievance_id': grievance_id,
@@ -278,7 +303,7 @@ def aggregate_batch_results(self, results, grievance_id):
         status=summary['status'], 
         data=summary, 
         grievance_id=grievance_id, 
-        session_id=None
+        session_id=session_id
     )
     return summary
 
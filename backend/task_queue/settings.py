@@ -20,6 +20,14 @@ if REDIS_PASSWORD:
 CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL', 'redis://localhost:6379/1')
 CELERY_RESULT_BACKEND = os.getenv('CELERY_RESULT_BACKEND', 'redis://localhost:6379/2')
 
+# Task status bus: workers XADD status events to a Redis stream, the backend API fans them out
+# to Socket.IO rooms. TASK_STATUS_TRANSPORT=http restores the legacy POST /task-status per event.
+TASK_STATUS_TRANSPORT = os.getenv('TASK_STATUS_TRANSPORT', 'redis').strip().lower()
+TASK_STATUS_REDIS_URL = os.getenv('TASK_STATUS_REDIS_URL', REDIS_URL)
+TASK_STATUS_STREAM_MAXLEN = int(os.getenv('TASK_STATUS_STREAM_MAXLEN', '10000'))
+TASK_STATUS_REPLAY_SIZE = int(os.getenv('TASK_STATUS_REPLAY_SIZE', '20'))
+TASK_STATUS_REPLAY_TTL = int(os.getenv('TASK_STATUS_REPLAY_TTL', '86400'))
+
 
 @dataclass
 class TaskConfig:
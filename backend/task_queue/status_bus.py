@@ -0,0 +1,239 @@
+"""
+Task status bus - Redis stream between Celery workers and the backend API.
+
+Workers call `publish_task_status` (a single XADD, no HTTP round-trip). The backend API runs
+one `TaskStatusFanout` loop per deployment (a Redis lease makes sure only one API worker
+consumes at a time), which dispatches events in stream order - so per grievance/session order
+is preserved - and keeps the last TASK_STATUS_REPLAY_SIZE events per room so reconnecting
+clients can catch up with `recent_events`.
+
+Event shape matches the legacy POST /task-status body:
+    {"status": ..., "data": {...}, "grievance_id": ..., "flask_session_id": ...}
+plus "event_id" (the stream entry id) once the fan-out has consumed it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import socket
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .settings import (
+    TASK_STATUS_REDIS_URL,
+    TASK_STATUS_REPLAY_SIZE,
+    TASK_STATUS_REPLAY_TTL,
+    TASK_STATUS_STREAM_MAXLEN,
+)
+
+logger = logging.getLogger(__name__)
+
+STREAM_KEY = "task_status:stream"
+RECENT_KEY_PREFIX = "task_status:recent:"
+FANOUT_LEADER_KEY = "task_status:fanout:leader"
+FANOUT_CURSOR_KEY = "task_status:fanout:cursor"
+_EVENT_FIELD = "e"
+
+_sync_client = None
+_async_client = None
+
+
+def build_status_event(
+    status: str,
+    data: Optional[Dict[str, Any]],
+    grievance_id: Optional[str] = None,
+    session_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Build a bus event (same keys as the POST /task-status body)."""
+    event: Dict[str, Any] = {"status": status, "data": data or {}}
+    if grievance_id:
+        event["grievance_id"] = grievance_id
+    if session_id:
+        event["flask_session_id"] = session_id
+    return event
+
+
+def event_source(grievance_id: Optional[str]) -> str:
+    """'A' for accessible-interface grievances (id suffix A), otherwise 'B' (bot/webchat)."""
+    return "A" if grievance_id and str(grievance_id).endswith("A") else "B"
+
+
+def event_room(event: Dict[str, Any]) -> Optional[str]:
+    """Socket.IO room for an event: grievance_id for accessible, client session id for webchat."""
+    if event_source(event.get("grievance_id")) == "A":
+        return event.get("grievance_id")
+    return event.get("flask_session_id")
+
+
+def parse_event_id(event_id: str) -> Tuple[int, int]:
+    """Stream entry id '<ms>-<seq>' as a comparable tuple. Raises ValueError on bad input."""
+    ms, _, seq = str(event_id).partition("-")
+    return int(ms), int(seq or 0)
+
+
+def _redis_sync():
+    global _sync_client
+    if _sync_client is None:
+        import redis
+
+        _sync_client = redis.Redis.from_url(
+            TASK_STATUS_REDIS_URL, socket_timeout=2, socket_connect_timeout=2
+        )
+    return _sync_client
+
+
+def async_client():
+    """Shared redis.asyncio client for the API process (fan-out loop and replay)."""
+    global _async_client
+    if _async_client is None:
+        import redis.asyncio as aioredis
+
+        _async_client = aioredis.Redis.from_url(TASK_STATUS_REDIS_URL, decode_responses=True)
+    return _async_client
+
+
+def publish_task_status(event: Dict[str, Any]) -> str:
+    """Append a status event to the stream. Redis errors propagate so callers can fall back."""
+    payload = json.dumps(event, separators=(",", ":"), default=str)
+    entry_id = _redis_sync().xadd(
+        STREAM_KEY,
+        {_EVENT_FIELD: payload},
+        maxlen=TASK_STATUS_STREAM_MAXLEN,
+        approximate=True,
+    )
+    return entry_id.decode() if isinstance(entry_id, bytes) else entry_id
+
+
+async def recent_events(client, room: str, after_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Last events delivered to `room`, oldest first; only those newer than `after_id` if given."""
+    raw = await client.lrange(RECENT_KEY_PREFIX + room, 0, -1)
+    events = [json.loads(item) for item in reversed(raw)]
+    if not after_id:
+        return events
+    try:
+        cutoff = parse_event_id(after_id)
+    except ValueError:
+        return events
+    return [e for e in events if parse_event_id(e.get("event_id", "0-0")) > cutoff]
+
+
+class TaskStatusFanout:
+    """
+    Consume the status stream and hand each event to `dispatch`, in order.
+
+    Only the API worker holding FANOUT_LEADER_KEY reads; the others poll the lease so one of them
+    takes over within `lease_seconds` if the leader dies. The read cursor lives in Redis, so a
+    new leader continues where the previous one stopped.
+    """
+
+    def __init__(
+        self,
+        dispatch: Callable[[Dict[str, Any]], Awaitable[None]],
+        *,
+        client=None,
+        lease_seconds: int = 15,
+        block_ms: int = 5000,
+        batch_size: int = 100,
+    ):
+        self._dispatch = dispatch
+        self._client = client
+        self._lease_seconds = lease_seconds
+        self._block_ms = block_ms
+        self._batch_size = batch_size
+        self._consumer = f"{socket.gethostname()}:{os.getpid()}"
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = async_client()
+        return self._client
+
+    def start(self) -> None:
+        """Schedule the consume loop on the running event loop (idempotent)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            if await self.client.get(FANOUT_LEADER_KEY) == self._consumer:
+                await self.client.delete(FANOUT_LEADER_KEY)
+        except Exception as exc:
+            logger.debug("task status fan-out: lease release failed: %s", exc)
+
+    async def hold_lease(self) -> bool:
+        """Acquire or renew the consumer lease. True when this process is the leader."""
+        client = self.client
+        if await client.set(FANOUT_LEADER_KEY, self._consumer, nx=True, ex=self._lease_seconds):
+            return True
+        if await client.get(FANOUT_LEADER_KEY) == self._consumer:
+            await client.expire(FANOUT_LEADER_KEY, self._lease_seconds)
+            return True
+        return False
+
+    async def run(self) -> None:
+        backoff = 1.0
+        while True:
+            try:
+                if not await self.hold_lease():
+                    await asyncio.sleep(self._lease_seconds / 3)
+                    continue
+                await self.consume_once()
+                backoff = 1.0
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("task status fan-out error (%s); retrying in %.0fs", exc, backoff)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+
+    async def consume_once(self) -> int:
+        """Read one batch from the stream and dispatch it. Returns the number of entries handled."""
+        client = self.client
+        cursor = await client.get(FANOUT_CURSOR_KEY) or "$"
+        response = await client.xread(
+            {STREAM_KEY: cursor}, count=self._batch_size, block=self._block_ms
+        )
+        handled = 0
+        for _stream, entries in response or []:
+            for entry_id, fields in entries:
+                event = self._decode(entry_id, fields)
+                if event is not None:
+                    try:
+                        await self._dispatch(event)
+                    except Exception as exc:
+                        logger.warning("task status dispatch failed for %s: %s", entry_id, exc)
+                await self._advance(entry_id, event)
+                handled += 1
+        return handled
+
+    @staticmethod
+    def _decode(entry_id: str, fields: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        try:
+            event = json.loads(fields[_EVENT_FIELD])
+        except (KeyError, TypeError, ValueError):
+            logger.warning("task status fan-out: skipping malformed entry %s", entry_id)
+            return None
+        event["event_id"] = entry_id
+        return event
+
+    async def _advance(self, entry_id: str, event: Optional[Dict[str, Any]]) -> None:
+        """Record the event for replay and move the cursor past it in one round-trip."""
+        pipe = self.client.pipeline(transaction=False)
+        room = event_room(event) if event else None
+        if room:
+            key = RECENT_KEY_PREFIX + room
+            pipe.lpush(key, json.dumps(event, separators=(",", ":"), default=str))
+            pipe.ltrim(key, 0, TASK_STATUS_REPLAY_SIZE - 1)
+            pipe.expire(key, TASK_STATUS_REPLAY_TTL)
+        pipe.set(FANOUT_CURSOR_KEY, entry_id)
+        await pipe.execute()
@@ -54,7 +54,7 @@ Architecture Benefits:
 Dependencies:
 ============
 - Celery for async task processing
-- Redis for task queuing and WebSocket communication
+- Redis for task queuing and the task status bus (status_bus.py)
 - WebSocket utilities for real-time status updates
 """
 
@@ -72,6 +72,8 @@ import functools
 from backend.logger.logger import TaskLogger, LoggingConfig  # Import LoggingConfig
 from backend.config.constants import FIELD_MAPPING, VALID_FIELD_NAMES, RASA_API_URL, FLASK_URL
 from .celery_app import celery_app  # Safe to import at module level now
+from .settings import TASK_STATUS_TRANSPORT
+from .status_bus import build_status_event, publish_task_status
 from celery import current_task
 
 import requests
@@ -287,7 +289,10 @@ class TaskManager:
 
     def emit_status(self, status, data, grievance_id=None, session_id=None):
         """
-        Send task status update to the backend HTTP API (POST /task-status) for Socket.IO emission
+        Publish a task status update for Socket.IO emission.
+
+        Goes onto the Redis task status bus (see status_bus.py); the backend API fans it out to the
+        client's room. Falls back to POST /task-status when the bus is disabled or unreachable.
         Args:
             status (str): The status to send
             data (dict): The data to send
@@ -304,129 +309,41 @@ class TaskManager:
             raise ValueError("grievance_id is required for emit_status")
         if not session_id:
             raise ValueError("session_id is required for emit_status")
-            
-        try:
-            # Debug logging to understand the issue
-            self.monitoring.log_task_event(
-                task_name=self.task_name,
-                details={
-                    'grievance_id': grievance_id,
-                    'session_id': session_id,
-                    'status': status,
-                    'data': data,
-                    'task_name': current_task.name,
-                    'requests_available': 'requests' in globals(),
-                    'note': 'DEBUG: Starting emit_status method'
-                }
-            )
-            
-            if data is None:
-                data = {}
-            
-            # Add task name and status to data
-            data['task_name'] = self.task_name
-            data['status'] = status
-            
-            url = FLASK_URL.rstrip("/") + "/task-status"
-            payload = {
-                'status': status,
-                'data': data,
-                'grievance_id': grievance_id,
-                'flask_session_id': session_id,
-            }
-            
-            self.monitoring.log_task_event(
-                task_name=self.task_name,
-                details={
-                    'url': url,
-                    'payload': payload,
-                    'note': 'Sending to backend /task-status'
-                }
-            )
-        
-            try:
-                # Debug: Log before making the request
-                self.monitoring.log_task_event(
-                    task_name=self.task_name,
-                    details={
-                        'grievance_id': grievance_id,
-                        'session_id': session_id,
-                        'url': url,
-                        'payload_keys': list(payload.keys()) if payload else None,
-                        'note': 'DEBUG: About to make HTTP request'
-                    }
-                )
-                
-                try:
-                    response = requests.post(url, json=payload, timeout=10)
-                except ImportError as e:
-                    raise Exception(f"requests module not available: {e}")
-                except requests.exceptions.ConnectionError as e:
-                    raise Exception(f"Connection error to {url}: {e}")
-                except requests.exceptions.Timeout as e:
-                    raise Exception(f"Timeout error to {url}: {e}")
-                except Exception as e:
-                    raise Exception(f"HTTP request error to {url}: {e}")
-                
-                self.monitoring.log_task_event(
-                    task_name=self.task_name,
-                    details={
-                        'grievance_id': grievance_id,
-                        'session_id': session_id,
-                        'response_status': response.status_code,
-                        'response_text': response.text,
-                        'note': 'Task status update sent successfully'
-                    }
-                )
-                
-                if response.status_code != 200:
-                    self.monitoring.log_task_event(
-                        task_name=self.task_name,
-                        details={
-                            'grievance_id': grievance_id,
-                            'session_id': session_id,
-                            'error': f'API returned status {response.status_code}',
-                            'response': response.text,
-                            'note': 'Task status update failed'
-                        }
-                    )
 
+        if data is None:
+            data = {}
+        # Add task name and status to data
+        data['task_name'] = self.task_name
+        data['status'] = status
+        self._send_status_event(build_status_event(status, data, grievance_id, session_id))
+
+    def _send_status_event(self, event: Dict[str, Any]) -> None:
+        """Publish on the status bus, or POST to the backend when the bus is off/unavailable. Never raises."""
+        if TASK_STATUS_TRANSPORT != 'http':
+            try:
+                publish_task_status(event)
+                return
             except Exception as e:
-                # Debug logging for inner exception
+                logging.warning(f"Task status bus unavailable ({e}); falling back to HTTP /task-status")
+
+        url = FLASK_URL.rstrip("/") + "/task-status"
+        try:
+            response = requests.post(url, json=event, timeout=10)
+            if response.status_code != 200:
                 self.monitoring.log_task_event(
                     task_name=self.task_name,
                     details={
-                        'grievance_id': grievance_id,
-                        'session_id': session_id,
-                        'error': str(e),
-                        'exception_type': type(e).__name__,
-                        'exception_traceback': str(e.__traceback__),
-                        'note': 'DEBUG: Inner exception in HTTP request'
+                        'grievance_id': event.get('grievance_id'),
+                        'session_id': event.get('flask_session_id'),
+                        'error': f'API returned status {response.status_code}',
+                        'response': response.text,
+                        'note': 'Task status update failed'
                     }
                 )
-                logging.error(f"Failed to send task status update for grievance '{grievance_id}' and session '{session_id}': {e}")
-
         except Exception as e:
-            # Debug logging to understand the exception
-            self.monitoring.log_task_event(
-                task_name=current_task.name,
-                details={
-                    'grievance_id': grievance_id,
-                    'session_id': session_id,
-                    'exception_type': type(e).__name__,
-                    'exception_message': str(e),
-                    'exception_traceback': str(e.__traceback__),
-                    'note': 'DEBUG: Exception in emit_status method'
-                }
-            )
-            
-            self.monitoring.log_task_event(
-                task_name=self.task_name,
-                details={
-                    'grievance_id': grievance_id,
-                    'session_id': session_id,
-                    'error': f"Failed to emit status update: {str(e)}"
-                }
+            logging.error(
+                f"Failed to send task status update for grievance '{event.get('grievance_id')}' "
+                f"and session '{event.get('flask_session_id')}': {e}"
             )
 
     def retry_task(self, error: Exception) -> Tuple[bool, Optional[float]]:
@@ -851,89 +768,20 @@ class TaskManager:
 
     def trigger_task_status_update(self, status: str, data: Optional[dict] = None, grievance_id=None, session_id=None):
         """
-        Send task status update to the backend HTTP API (POST /task-status) for websocket emission.
+        Publish a task status update for websocket emission (status bus, HTTP fallback).
         Args:
             status (str): The status to send
             data (dict): The data to send
             grievance_id (str): Grievance ID for websocket emission
             session_id (str): Client session ID (sent as flask_session_id; webchat room)
         """
-        
-        self.monitoring.log_task_event(
-            task_name='trigger_task_status_update',
-            details={
-                'grievance_id': grievance_id,
-                'session_id': session_id,
-                'status': status,
-                'data': data,
-                'note': 'Sending task status update to backend /task-status'
-            }
-        )
-        
         if data is None:
             data = {}
         
         # Add task name and status to data
         data['task_name'] = current_task.name
         data['status'] = status
-        
-        url = FLASK_URL.rstrip("/") + "/task-status"
-        payload = {
-            'status': status,
-            'data': data
-        }
-        
-        if grievance_id:
-            payload['grievance_id'] = grievance_id
-        
-        if session_id:
-            payload['flask_session_id'] = session_id
-        
-        self.monitoring.log_task_event(
-            task_name='trigger_task_status_update',
-            details={
-                'url': url,
-                'payload': payload,
-                'note': 'Sending to backend /task-status'
-            }
-        )
-        
-        try:
-            response = requests.post(url, json=payload, timeout=10)
-            self.monitoring.log_task_event(
-                task_name='trigger_task_status_update',
-                details={
-                    'grievance_id': grievance_id,
-                    'session_id': session_id,
-                    'response_status': response.status_code,
-                    'response_text': response.text,
-                    'note': 'Task status update sent successfully'
-                }
-            )
-            
-            if response.status_code != 200:
-                self.monitoring.log_task_event(
-                    task_name='trigger_task_status_update',
-                    details={
-                        'grievance_id': grievance_id,
-                        'session_id': session_id,
-                        'error': f'API returned status {response.status_code}',
-                        'response': response.text,
-                        'note': 'Task status update failed'
-                    }
-                )
-
-        except Exception as e:
-            self.monitoring.log_task_event(
-                task_name='trigger_task_status_update',
-                details={
-                    'grievance_id': grievance_id,
-                    'session_id': session_id,
-                    'error': str(e),
-                    'note': 'Failed to send task status update'
-                }
-            )
-            logging.error(f"Failed to send task status update for grievance '{grievance_id}' and session '{session_id}': {e}")
+        self._send_status_event(build_status_event(status, data, grievance_id, session_id))
 
 
 class DatabaseTaskManager(TaskManager):
@@ -499,9 +499,18 @@ function setupTaskStatusSocket() {
       path: "/accessible-socket.io",
     });
 
+    // Last task status event seen; on reconnect the server replays anything newer.
+    let lastTaskEventId = null;
+
     taskStatusSocket.on("connect", () => {
       console.log("REST_webchat Socket.IO connected, joining room:", roomId);
-      taskStatusSocket.emit("join", { room: roomId });
+      const joinPayload = { room: roomId };
+      if (lastTaskEventId) joinPayload.last_event_id = lastTaskEventId;
+      taskStatusSocket.emit("join", joinPayload);
+    });
+
+    taskStatusSocket.onAny((eventName, data) => {
+      if (data && data.event_id) lastTaskEventId = data.event_id;
     });
 
     taskStatusSocket.on("file_status_update", (data) => {
@@ -54,6 +54,7 @@ async function withRetry(fn) {
 export async function uploadVoiceChunk({
   uploadId,
   chunkIndex,
+  chunkOffset,
   blob,
   fileName,
   mimeType,
@@ -64,6 +65,7 @@ export async function uploadVoiceChunk({
 }) {
   const formData = new FormData();
   formData.append("chunk_index", String(chunkIndex));
+  if (Number.isInteger(chunkOffset)) formData.append("chunk_offset", String(chunkOffset));
   if (uploadId) formData.append("upload_id", uploadId);
   if (fileName) formData.append("file_name", fileName);
   if (mimeType) formData.append("mime_type", mimeType);
@@ -68,12 +68,13 @@ function resetUploadState() {
   uploadFinalized = false;
 }
 
-async function uploadRecordingChunk(blob, index) {
+async function uploadRecordingChunk(blob, index, offset) {
   if (uploadFinalized) return null;
   const ctx = getUploadContext();
   const promise = uploadVoiceChunk({
     uploadId,
     chunkIndex: index,
+    chunkOffset: offset,
     blob,
     fileName: index === 0 ? plannedFileName : undefined,
     mimeType: index === 0 ? plannedMimeType : undefined,
@@ -120,7 +121,9 @@ async function startRecording(button, onStatus, onUploadComplete, onUploadError,
       }
       const index = chunkIndex;
       chunkIndex += 1;
-      void uploadRecordingChunk(event.data, index).catch((error) => {
+      // Byte offset lets the server place slices that arrive out of order
+      const offset = totalBytes - event.data.size;
+      void uploadRecordingChunk(event.data, index, offset).catch((error) => {
         if (isIgnorableLateChunkError(error)) return;
         console.error("Voice chunk upload failed:", error);
         void stopRecording(button, onUploadComplete, onUploadError, onStatus, "upload_error");
@@ -69,7 +69,8 @@ export function AttachmentListSection({
     try {
       await onBeforeDownload?.();
       if (isImageFile(file)) {
-        const blobUrl = await fetchAuthenticatedBlobUrl(path);
+        // Display-size rendition (WebP when available) instead of the stored file
+        const blobUrl = await fetchAuthenticatedBlobUrl(`${path}?size=display`, "image/webp,image/*");
         previewWindow?.close();
         setPreview({ src: blobUrl, name: file.file_name });
         return;
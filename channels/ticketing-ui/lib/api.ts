@@ -949,11 +949,11 @@ export function officerAttachmentPath(fileId: string): string {
 }
 
 /** Fetch a protected file with session cookie + Bearer token; returns a blob URL. */
-export async function fetchAuthenticatedBlobUrl(path: string): Promise<string> {
+export async function fetchAuthenticatedBlobUrl(path: string, accept = "*/*"): Promise<string> {
   const resp = await fetch(`${BASE}${path}`, {
     credentials: "include",
     headers: {
-      Accept: "*/*",
+      Accept: accept,
       ...authHeaders(),
     },
   });
@@ -0,0 +1,74 @@
+"""content-addressed attachment blobs (attachment_blobs + file_attachments.content_sha256)
+
+Revision ID: pub010_attachment_blobs
+Revises: pub009_seah_service_providers
+Create Date: 2026-10-18
+
+# Safe to run: only creates/modifies public.* (default schema) chatbot tables
+# Does NOT touch: ticketing.* schema — use ticketing/migrations/alembic.ini for those
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "pub010_attachment_blobs"
+down_revision: Union[str, None] = "pub009_seah_service_providers"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # One row per distinct upload (SHA-256 of the bytes the client sent).
+    # blob_path is the stored (possibly compressed) file shared by every attachment row
+    # with that hash; processing_metadata caches compression / audio probe results.
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS attachment_blobs (
+            content_sha256 TEXT PRIMARY KEY,
+            blob_path TEXT NOT NULL,
+            file_type TEXT,
+            file_size BIGINT,
+            processing_metadata JSONB,
+            ref_count INTEGER NOT NULL DEFAULT 0,
+            storage_tier VARCHAR(16) NOT NULL DEFAULT 'active',
+            storage_key TEXT NULL,
+            created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+            last_referenced_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+        );
+        """
+    )
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM information_schema.tables
+                WHERE table_schema = 'public' AND table_name = 'file_attachments'
+            ) THEN
+                ALTER TABLE file_attachments
+                    ADD COLUMN IF NOT EXISTS content_sha256 TEXT NULL;
+                CREATE INDEX IF NOT EXISTS idx_file_attachments_content_sha256
+                    ON file_attachments(content_sha256);
+            END IF;
+        END $$;
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM information_schema.tables
+                WHERE table_schema = 'public' AND table_name = 'file_attachments'
+            ) THEN
+                DROP INDEX IF EXISTS idx_file_attachments_content_sha256;
+                ALTER TABLE file_attachments DROP COLUMN IF EXISTS content_sha256;
+            END IF;
+        END $$;
+        """
+    )
+    op.execute("DROP TABLE IF EXISTS attachment_blobs;")
@@ -0,0 +1,26 @@
+"""Flattened utterance/button lookup tables built from UTTERANCE_MAPPING."""
+
+import pytest
+
+from backend.actions.utils import utterance_mapping_rasa as mapping
+from backend.actions.utils.mapping_buttons import BUTTONS_LANGUAGE_OPTIONS
+
+
+def test_mapping_has_no_missing_language_keys():
+    assert mapping._MAPPING_PROBLEMS == []
+
+
+def test_buttons_are_shared_read_only_sequences():
+    first = mapping.get_buttons_base("action_ask_commons", "action_ask_language_code", 1, "en")
+    again = mapping.get_buttons_base("action_ask_commons", "action_ask_language_code", 1, "en")
+
+    assert first is again
+    assert isinstance(first, tuple)
+    assert list(first) == BUTTONS_LANGUAGE_OPTIONS["en"]
+
+
+def test_missing_lookups():
+    assert mapping.get_buttons_base("action_ask_commons", "no_such_action", 1, "en") == ()
+    assert mapping.get_utterance_count("action_ask_commons", "no_such_action") == 0
+    with pytest.raises(ValueError):
+        mapping.get_utterance_base("action_ask_commons", "action_ask_story_main", 99, "en")
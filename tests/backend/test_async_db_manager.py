@@ -0,0 +1,158 @@
+"""Async DB path for the API routers: per-router selection, threadpool facade, asyncpg SQL (fake pool, no DB)."""
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+
+import pytest
+
+from backend.services.database_services import async_manager
+from backend.services.database_services.async_manager import (
+    AsyncpgDbManager,
+    ThreadedAsyncDbManager,
+    get_async_db_manager,
+    resolve_async_db_config,
+)
+
+
+class SyncHelpers:
+    """Stands in for GrievanceDbManager: pure helpers plus a couple of sync reads."""
+
+    DEFAULT_LANGUAGE_CODE = "en"
+    DEFAULT_USER = "system"
+
+    def __init__(self):
+        self.calls = []
+
+    def _parse_database_result(self, row):
+        return {k: (v if k != "grievance_categories" else ["x"]) for k, v in row.items()}
+
+    def _prepare_field_for_database(self, field, value):
+        return f"prepared:{value}" if isinstance(value, list) else value
+
+    def get_grievance_by_id(self, grievance_id):
+        self.calls.append(("get_grievance_by_id", grievance_id))
+        return {"grievance_id": grievance_id}
+
+    def check_entry_exists_for_entity_key(self, key, value):
+        self.calls.append((key, value))
+        return value == "GR-1"
+
+
+class FakeConn:
+    def __init__(self, pool):
+        self.pool = pool
+
+    async def fetch(self, query, *args):
+        self.pool.sql.append((" ".join(query.split()), args))
+        result = self.pool.results.pop(0) if self.pool.results else []
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def fetchval(self, query, *args):
+        rows = await self.fetch(query, *args)
+        return rows[0] if rows else None
+
+    async def execute(self, query, *args):
+        self.pool.sql.append((" ".join(query.split()), args))
+
+    @asynccontextmanager
+    async def transaction(self):
+        self.pool.sql.append(("BEGIN", ()))
+        yield
+        self.pool.sql.append(("COMMIT", ()))
+
+
+class FakePool:
+    def __init__(self, *results):
+        self.results = list(results)
+        self.sql = []
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield FakeConn(self)
+
+
+def test_routers_are_selected_from_env(monkeypatch):
+    monkeypatch.setenv("DB_ASYNC_ROUTERS", "grievance, Files")
+    config = resolve_async_db_config()
+    assert config.enabled_for("files") and not config.enabled_for("voice")
+    assert get_async_db_manager("voice", config=config).backend == "threaded"
+
+    monkeypatch.setattr(async_manager, "asyncpg", None)  # enabled but not installed: threaded
+    assert get_async_db_manager("grievance", config=config).backend == "threaded"
+
+    monkeypatch.setenv("DB_ASYNC_ROUTERS", "all")
+    assert resolve_async_db_config().enabled_for("voice")
+
+
+def test_threaded_manager_runs_sync_managers_off_the_loop():
+    sync = SyncHelpers()
+    db = ThreadedAsyncDbManager(grievance=sync)
+    threads = []
+    sync.get_grievance_by_id = lambda gid: threads.append(threading.get_ident()) or {"grievance_id": gid}
+
+    async def run():
+        threads.append(threading.get_ident())
+        return await db.get_grievance_by_id("GR-1"), await db.grievance_exists("GR-2")
+
+    assert asyncio.run(run()) == ({"grievance_id": "GR-1"}, False)
+    assert threads[0] != threads[1]
+    assert sync.calls == [("grievance_id", "GR-2")]
+
+
+def test_asyncpg_grievance_read_falls_back_to_core_row():
+    pool = FakePool(RuntimeError("no grievance_parties"), [{"grievance_id": "GR-1", "grievance_categories": "[]"}])
+    db = AsyncpgDbManager(pool, grievance=SyncHelpers())
+    row = asyncio.run(db.get_grievance_by_id("GR-1"))
+    assert row == {"grievance_id": "GR-1", "grievance_categories": ["x"]}
+    assert pool.sql[1] == ("SELECT * FROM grievances WHERE grievance_id = $1", ("GR-1",))
+    assert asyncio.run(db.get_grievance_files("GR-1")) == []
+
+
+def test_asyncpg_update_numbers_placeholders():
+    pool = FakePool([{"grievance_id": "GR-1"}])
+    db = AsyncpgDbManager(pool, grievance=SyncHelpers())
+    affected = asyncio.run(db.update_grievance("GR-1", {
+        "grievance_summary": "s",
+        "grievance_categories": ["a"],
+        "not_allowed": "x",
+    }))
+    query, args = pool.sql[0]
+    assert affected == 1
+    assert "SET grievance_categories = $1, grievance_summary = $2, grievance_modification_date" in query
+    assert query.endswith("WHERE grievance_id = $3 RETURNING grievance_id")
+    assert args == ("prepared:['a']", "s", "GR-1")
+
+
+def test_asyncpg_status_change_is_one_transaction():
+    pool = FakePool([1])
+    db = AsyncpgDbManager(pool, grievance=SyncHelpers())
+    assert asyncio.run(db.update_grievance_status("GR-1", "archived", notes="done"))
+    steps = [q.split(" ")[0] for q, _ in pool.sql]
+    assert steps == ["BEGIN", "SELECT", "INSERT", "UPDATE", "COMMIT"]
+    assert pool.sql[2][1] == ("GR-1", "archived", None, "done", "system")
+    assert pool.sql[3][1] == ("GR-1", True)
+
+    inactive = FakePool([])
+    db = AsyncpgDbManager(inactive, grievance=SyncHelpers())
+    assert asyncio.run(db.update_grievance_status("GR-1", "bogus")) is False
+    assert not any(q.startswith("INSERT") for q, _ in inactive.sql)
+
+
+def test_asyncpg_pool_is_per_event_loop(monkeypatch):
+    asyncpg = pytest.importorskip("asyncpg")
+    created = []
+
+    async def create_pool(**kwargs):
+        created.append(kwargs)
+        return object()
+
+    monkeypatch.setattr(asyncpg, "create_pool", create_pool)
+    pool = async_manager.AsyncDbPool(resolve_async_db_config(), db_params={"host": "h", "port": "5433"})
+
+    async def twice():
+        return await pool.get_pool() is await pool.get_pool()
+
+    assert asyncio.run(twice()) and asyncio.run(twice())
+    assert len(created) == 2 and created[0]["port"] == 5433
@@ -0,0 +1,62 @@
+"""Content-addressed attachment store: blob layout and dedup in FileServerCore.process_file_upload."""
+import hashlib
+import os
+from unittest.mock import MagicMock, patch
+
+from backend.services import file_server_core as core_module
+from backend.services.attachment_store import adopt_into_store, blob_path_for, stored_file_name
+from backend.services.file_server_core import FileServerCore
+
+
+def _upload(tmp_path, grievance_id, name, payload):
+    grievance_dir = tmp_path / grievance_id
+    grievance_dir.mkdir(exist_ok=True)
+    path = grievance_dir / name
+    path.write_bytes(payload)
+    return {"file_id": f"{grievance_id}-{name}", "file_name": name, "file_path": str(path)}
+
+
+def test_adopt_into_store_drops_second_copy(tmp_path):
+    first = tmp_path / "a.webm"
+    second = tmp_path / "b.webm"
+    first.write_bytes(b"same")
+    second.write_bytes(b"same")
+    blob = blob_path_for(str(tmp_path), "ab" * 32, ".webm")
+
+    assert adopt_into_store(str(first), blob) == blob
+    assert adopt_into_store(str(second), blob) == blob
+    assert os.path.isfile(blob) and not first.exists() and not second.exists()
+
+
+def test_stored_file_name_follows_blob_extension():
+    assert stored_file_name("photo.png", "uploads/blobs/ab/abc.jpg") == "photo.jpg"
+    assert stored_file_name("note.webm", "uploads/blobs/ab/abc.webm") == "note.webm"
+
+
+def test_reupload_reuses_blob_without_reprocessing(tmp_path):
+    payload = b"\x1aE\xdf\xa3 voice bytes"
+    sha = hashlib.sha256(payload).hexdigest()
+    blobs = {}
+
+    fake_db = MagicMock()
+    fake_db.store_file_attachment.return_value = True
+    fake_db.file.get_attachment_blob.side_effect = lambda h: blobs.get(h)
+
+    def add_reference(blob):
+        row = blobs.setdefault(blob["content_sha256"], {**blob, "ref_count": 0})
+        row["ref_count"] += 1
+        return True
+
+    fake_db.file.add_attachment_blob_reference.side_effect = add_reference
+
+    with patch.object(core_module, "db_manager", fake_db):
+        core = FileServerCore(upload_folder=str(tmp_path))
+        first = core.process_file_upload("GR-1-B", _upload(tmp_path, "GR-1-B", "voice_note_1.webm", payload))
+        with patch.object(core, "get_audio_metadata") as probe:
+            second = core.process_file_upload("GR-2-B", _upload(tmp_path, "GR-2-B", "voice_note_1.webm", payload))
+
+    probe.assert_not_called()
+    assert first["file_path"] == second["file_path"] == blob_path_for(str(tmp_path), sha, ".webm")
+    assert second["content_sha256"] == sha
+    assert blobs[sha]["ref_count"] == 2
+    assert not (tmp_path / "GR-2-B" / "voice_note_1.webm").exists()
@@ -0,0 +1,45 @@
+"""Batch file chord: members report a status entry once retries are spent; the aggregate counts it."""
+from unittest.mock import patch
+
+from backend.task_queue import registered_tasks
+from backend.task_queue.registered_tasks import (
+    FAILED,
+    SUCCESS,
+    aggregate_batch_results,
+    process_file_upload_task,
+)
+from backend.task_queue.task_manager import TaskManager
+
+
+def _run_member(side_effect, retries):
+    emitted = []
+    with patch.object(TaskManager, "start_task"), \
+            patch.object(TaskManager, "complete_task"), \
+            patch.object(TaskManager, "fail_task", side_effect=lambda **kw: emitted.append(kw)), \
+            patch.object(registered_tasks.file_server_core, "process_file_upload", side_effect=side_effect):
+        result = process_file_upload_task.apply(
+            args=("GR-1", {"file_id": "f1", "file_name": "a.jpg"}),
+            kwargs={"session_id": "sess", "batch_member": True},
+            retries=retries,
+        )
+    return result, emitted
+
+
+def test_member_entry_carries_status_and_keeps_per_file_failure_event():
+    result, _ = _run_member(lambda **kw: {"file_id": "f1"}, retries=0)
+    assert result.get() == {"status": SUCCESS, "file_id": "f1", "file_name": "a.jpg", "result": {"file_id": "f1"}}
+
+    result, emitted = _run_member(RuntimeError("corrupt"), retries=process_file_upload_task.max_retries)
+    assert result.get() == {"status": FAILED, "file_id": "f1", "file_name": "a.jpg", "error": "corrupt"}
+    assert emitted[0]["extra_data"] == {"file_id": "f1", "file_name": "a.jpg"}
+
+
+def test_aggregate_counts_member_status():
+    sent = []
+    with patch.object(TaskManager, "emit_status", side_effect=lambda **kw: sent.append(kw)):
+        summary = aggregate_batch_results.apply(
+            args=([{"status": SUCCESS}, {"status": FAILED}, {"status": SUCCESS}], "GR-1"),
+            kwargs={"session_id": "sess"},
+        ).get()
+    assert (summary["status"], summary["success_count"], summary["failed_count"]) == (FAILED, 2, 1)
+    assert sent[0]["session_id"] == "sess"
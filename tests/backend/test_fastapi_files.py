@@ -191,6 +191,61 @@ def test_upload_files_valid(mock_task: MagicMock, client: TestClient):
     mock_task.delay.assert_called_once()
 
 
+@patch("backend.api.routers.files.process_file_upload_task")
+def test_upload_files_multiple_queue_one_task_per_file(mock_task: MagicMock, client: TestClient):
+    """POST /upload-files with several files queues one task per file, so each reports its own status."""
+    mock_task.delay.side_effect = [MagicMock(id="task-a"), MagicMock(id="task-b")]
+    r = client.post(
+        "/upload-files",
+        data={
+            "grievance_id": "GR-20241201-KO-JH-TEST1-A",
+            "flask_session_id": "sess-123",
+        },
+        files=[
+            ("files[]", ("a.txt", io.BytesIO(b"hello"), "text/plain")),
+            ("files[]", ("b.txt", io.BytesIO(b"world"), "text/plain")),
+        ],
+    )
+    assert r.status_code == 202
+    body = r.json()
+    assert body["task_ids"] == ["task-a", "task-b"] and len(body["files"]) == 2
+    assert all(c.kwargs["session_id"] == "sess-123" for c in mock_task.delay.call_args_list)
+
+
+def test_stream_upload_to_disk_hashes_and_renames(tmp_path):
+    """Streaming copy writes the final file atomically and returns size + SHA-256."""
+    import asyncio
+    import hashlib
+
+    from fastapi import UploadFile
+
+    from backend.api.routers import files as files_router
+
+    payload = b"x" * (files_router.UPLOAD_CHUNK_SIZE + 10)
+    upload = UploadFile(file=io.BytesIO(payload), filename="photo.jpg")
+    stored = asyncio.run(
+        files_router._stream_upload_to_disk(upload, str(tmp_path), "photo.jpg", len(payload))
+    )
+    assert stored["file_size"] == len(payload)
+    assert stored["content_sha256"] == hashlib.sha256(payload).hexdigest()
+    assert (tmp_path / "photo.jpg").read_bytes() == payload
+    assert [p.name for p in tmp_path.iterdir()] == ["photo.jpg"]
+
+
+def test_stream_upload_to_disk_cuts_off_oversized(tmp_path):
+    """An upload past the limit is abandoned mid-stream with no temp file left behind."""
+    import asyncio
+
+    from fastapi import UploadFile
+
+    from backend.api.routers import files as files_router
+
+    upload = UploadFile(file=io.BytesIO(b"y" * 64), filename="big.jpg")
+    with pytest.raises(files_router._UploadTooLarge):
+        asyncio.run(files_router._stream_upload_to_disk(upload, str(tmp_path), "big.jpg", 32))
+    assert list(tmp_path.iterdir()) == []
+
+
 # --- files list / download / file-status ---
 
 
@@ -13,8 +13,11 @@ from backend.config.constants import (
     IMAGE_COMPRESS_SKIP_MAX_BYTES,
 )
 from backend.services.image_compression import (
+    RENDITIONS,
     ImageCompressPolicy,
     compress_image,
+    compress_images,
+    rendition_path,
 )
 
 
@@ -84,3 +87,30 @@ def test_skip_policy_respects_custom_threshold(work_dir):
     result = compress_image(src, policy=policy)
 
     assert result.status == "compressed"
+
+
+def test_renditions_written_from_one_decode(work_dir):
+    src = os.path.join(work_dir, "photo.jpg")
+    _write_large_jpeg(src)
+
+    result = compress_image(src)
+
+    assert [(r["name"], r["format"]) for r in result.renditions] == list(RENDITIONS)
+    for rendition in result.renditions:
+        assert rendition["path"] == rendition_path(result.output_path, rendition["name"], rendition["format"])
+        assert os.path.getsize(rendition["path"]) == rendition["bytes"]
+    thumb = next(r for r in result.renditions if r["name"] == "thumb")
+    assert max(thumb["width"], thumb["height"]) <= ImageCompressPolicy().thumb_long_edge
+
+
+def test_compress_images_keeps_input_order(work_dir):
+    paths = []
+    for i, size in enumerate((2000, 1600, 2400)):
+        path = os.path.join(work_dir, f"batch_{i}.jpg")
+        _write_large_jpeg(path, width=size, height=size // 2)
+        paths.append(path)
+
+    results = compress_images(paths, max_workers=2)
+
+    assert [r.output_path for r in results] == paths
+    assert all(r.status == "compressed" for r in results)
@@ -0,0 +1,177 @@
+"""Outbound dispatcher: pooled SMTP sessions, rate limiting, DOIT batching, outbox retry (local fakes, in-memory store)."""
+import smtplib
+
+import pytest
+
+from backend.services.message_dispatch_bench import FakeSmsServer, FakeSmtpServer, _doit_client
+from backend.services.message_dispatcher import (
+    ATTACHMENT_FALLBACK_NOTE,
+    MessageDispatcher,
+    Outbox,
+    OutboxMessage,
+    RateLimiter,
+    SmtpPool,
+)
+
+
+@pytest.fixture
+def smtp_server():
+    server = FakeSmtpServer()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def sms_server():
+    server = FakeSmsServer()
+    yield server
+    server.close()
+
+
+def test_rate_limiter_paces_after_burst():
+    now = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    limiter = RateLimiter(2.0, burst=2, clock=lambda: now[0], sleep=sleep)
+    assert [limiter.acquire() for _ in range(2)] == [0.0, 0.0]
+    assert limiter.acquire() == pytest.approx(0.5)
+    assert RateLimiter(0).acquire(100) == 0.0  # unlimited
+
+
+def test_smtp_pool_reuses_sessions_and_drops_broken_ones(smtp_server):
+    pool = SmtpPool(smtp_server.config(), size=2, connect=smtp_server.connect)
+    for i in range(5):
+        with pool.session() as smtp:
+            smtp.sendmail("a@x", [f"b{i}@x"], "Subject: hi\r\n\r\nbody")
+    assert (pool.opened, pool.reused) == (1, 4)
+
+    with pytest.raises(smtplib.SMTPServerDisconnected):
+        with pool.session() as smtp:
+            smtp.close()
+            smtp.noop()
+    with pool.session() as smtp:
+        smtp.sendmail("a@x", ["c@x"], "Subject: again\r\n\r\nbody")
+    pool.close()
+    assert pool.opened == 2
+    assert smtp_server.stats == {"connections": 2, "messages": 6}
+
+
+def test_doit_batches_same_text_recipients(sms_server):
+    client = _doit_client(sms_server, batch_size=2)
+    results = client.send_sms_batch([
+        ("9800000001", "level 1"),
+        ("9800000002", "level 1"),
+        ("12345", "level 1"),          # invalid number: not submitted
+        ("9800000003", "level 1"),
+        ("9800000004", "level 2"),
+    ])
+    assert results == [True, True, False, True, True]
+    assert sms_server.requests == 3
+    assert sorted(sms_server.recipients) == ["9800000001", "9800000002", "9800000003", "9800000004"]
+
+
+def test_outbox_batches_by_channel_and_retries_with_backoff():
+    calls = []
+    failures = {"flaky": 1, "dead": 99}
+
+    def deliver(channel, batch):
+        calls.append((channel, [m.payload["k"] for m in batch]))
+        errors = []
+        for m in batch:
+            left = failures.get(m.payload["k"], 0)
+            failures[m.payload["k"]] = left - 1
+            errors.append("boom" if left > 0 else None)
+        return errors
+
+    outbox = Outbox(deliver, workers=1, batch_size=10, max_attempts=3, retry_seconds=0.01, poll_seconds=0.01)
+    outbox.store.add([_msg("sms", k) for k in ("a", "flaky", "dead")] + [_msg("email", "e")], 0.0)
+    outbox.start()  # messages already in the store (e.g. from before a restart) are drained
+    assert outbox.drain(timeout=5)
+
+    assert calls[0] == ("sms", ["a", "flaky", "dead"])
+    assert ("email", ["e"]) in calls
+    assert outbox.stats() == {"queued": 0, "due": 0, "sent": 3, "retried": 3, "failed": 1, "dead": 1}
+    dead = outbox.store.dead()
+    assert [m.payload["k"] for m in dead] == ["dead"]
+    assert dead[0].attempts == 3 and dead[0].last_error == "boom"
+    outbox.stop()
+
+
+def test_outbox_message_round_trips_through_json():
+    msg = _msg("email", "x")
+    msg.attempts, msg.last_error = 2, "timeout"
+    assert OutboxMessage.from_json(msg.to_json()) == msg
+
+
+def test_smtp_pool_retries_a_dropped_reused_session_once(smtp_server):
+    pool = SmtpPool(smtp_server.config(), size=1, connect=smtp_server.connect)
+    pool.sendmail("a@x", ["b@x"], "Subject: one\r\n\r\nbody")
+    with pool._lock:
+        pool._idle[0][0].close()  # relay dropped the idle session
+    pool.sendmail("a@x", ["c@x"], "Subject: two\r\n\r\nbody")
+    assert (pool.opened, pool.reused) == (2, 1)
+    assert smtp_server.stats["messages"] == 2
+
+    fresh = SmtpPool(smtp_server.config(), size=1, connect=lambda: _closed(smtp_server.connect()))
+    with pytest.raises(smtplib.SMTPServerDisconnected):
+        fresh.sendmail("a@x", ["d@x"], "Subject: three\r\n\r\nbody")
+    assert fresh.opened == 1  # a fresh session that fails is not retried
+    pool.close()
+
+
+def test_dispatcher_delivers_through_messaging_batches():
+    class Recorder:
+        def __init__(self):
+            self.sms, self.email = [], []
+
+        def send_sms_batch(self, messages):
+            self.sms.append(messages)
+            return [True] * len(messages)
+
+        def send_email_batch(self, messages):
+            self.email.append(messages)
+            return [True] * len(messages)
+
+    messaging = Recorder()
+    dispatcher = MessageDispatcher(messaging)
+    dispatcher.enqueue_sms("9800000001", "hello")
+    dispatcher.enqueue_email(["o@x"], "Subject", "<p>x</p>")
+    assert dispatcher.outbox.drain(timeout=5)
+    assert [m for batch in messaging.sms for m in batch] == [("9800000001", "hello")]
+    assert messaging.email[0][0]["to"] == ["o@x"]
+    dispatcher.outbox.stop()
+
+
+def _msg(channel, key):
+    return OutboxMessage(channel=channel, payload={"k": key})
+
+
+def _closed(smtp):
+    smtp.close()
+    return smtp
+
+
+def test_dispatcher_sends_body_only_when_attachments_are_refused():
+    class Refuses:
+        def __init__(self):
+            self.plain = []
+
+        def send_email_batch(self, messages):
+            return [not m.get("attachments") for m in messages]
+
+        def send_email(self, to, subject, body, attachments=None):
+            self.plain.append((to, subject, body))
+            return True
+
+    messaging = Refuses()
+    dispatcher = MessageDispatcher(messaging)
+    xlsx = [{"filename": "q.xlsx", "content_base64": "eA==", "content_type": "application/octet-stream"}]
+    dispatcher.enqueue_email(["o@x"], "Report", "<p>r</p>", attachments=xlsx)
+    assert dispatcher.outbox.drain(timeout=5)
+    assert messaging.plain == [(["o@x"], "Report", "<p>r</p>" + ATTACHMENT_FALLBACK_NOTE)]
+    assert dispatcher.outbox.stats()["sent"] == 1
+    dispatcher.outbox.stop()
@@ -0,0 +1,63 @@
+"""Queued logging: records reach the original handlers via the writer thread; debug sampling; JSON lines."""
+
+import io
+import json
+import logging
+
+from backend.logger import logger as logger_module
+from backend.logger.logger import JsonFormatter, SampledDebugFilter, install_queue_logging
+
+
+def _flush_writer():
+    # stop() drains the queue; the next record starts a fresh writer
+    logger_module._writer.stop()
+
+
+def test_queued_logger_writes_through_background_thread(monkeypatch):
+    monkeypatch.setattr(logger_module.LoggingConfig, "LOG_QUEUE", True)
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    log = logging.getLogger("tests.queued_logging")
+    log.propagate = False
+    log.setLevel(logging.INFO)
+    log.addHandler(handler)
+
+    install_queue_logging(log)
+    install_queue_logging(log)  # idempotent
+    assert len(log.handlers) == 1 and log.handlers[0] is not handler
+
+    log.info("hello %s", "world")
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        log.exception("failed")
+    _flush_writer()
+
+    output = stream.getvalue()
+    assert "INFO hello world" in output
+    assert "ERROR failed" in output and "ValueError: boom" in output
+
+
+def test_debug_records_are_sampled_per_call_site():
+    sampler = SampledDebugFilter(burst=3, interval=60)
+
+    def record(lineno, level=logging.DEBUG):
+        return logging.LogRecord("db", level, "base_manager.py", lineno, "row %s", (1,), None)
+
+    assert [sampler.filter(record(10)) for _ in range(10)].count(True) == 3
+    assert sampler.filter(record(11))  # other call site has its own budget
+    assert sampler.filter(record(10, logging.INFO))  # only DEBUG is sampled
+
+    sampler.interval = 0
+    next_window = record(10)
+    assert sampler.filter(next_window)
+    assert "[7 similar debug lines dropped]" in next_window.msg
+
+
+def test_json_formatter_emits_one_object_per_line():
+    record = logging.LogRecord("svc", logging.WARNING, __file__, 1, "rows=%d", (5,), None)
+    entry = json.loads(JsonFormatter().format(record))
+    assert entry["level"] == "WARNING"
+    assert entry["logger"] == "svc"
+    assert entry["message"] == "rows=5"
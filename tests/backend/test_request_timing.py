@@ -0,0 +1,76 @@
+"""Request timing middleware: Server-Timing, SQL counting (SQLAlchemy + manual), profile trigger."""
+
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from backend.logger import request_timing
+from backend.logger.request_timing import (
+    RequestStats,
+    RequestTimingMiddleware,
+    instrument_sqlalchemy_engine,
+    record_sql,
+)
+
+
+def _app(engine=None):
+    app = FastAPI()
+
+    @app.get("/sync")
+    def sync_endpoint():
+        # Runs in the threadpool: stats must follow the request context there
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+        return {"ok": True}
+
+    @app.get("/async")
+    async def async_endpoint():
+        record_sql("SELECT pg_sleep(0)", 0.002)
+        return {"ok": True}
+
+    @app.get("/slow")
+    def slow_endpoint():
+        deadline = time.perf_counter() + 0.1
+        while time.perf_counter() < deadline:
+            pass
+        return {"ok": True}
+
+    app.add_middleware(RequestTimingMiddleware)
+    return app
+
+
+def test_server_timing_counts_sqlalchemy_and_manual_statements():
+    engine = create_engine("sqlite://")
+    instrument_sqlalchemy_engine(engine)
+    client = TestClient(_app(engine))
+
+    sync_header = client.get("/sync").headers["server-timing"]
+    assert sync_header.startswith("app;dur=")
+    assert 'desc="2 queries"' in sync_header
+    assert 'desc="1 queries"' in client.get("/async").headers["server-timing"]
+    # Outside a request nothing is recorded
+    record_sql("SELECT 1", 1.0)
+
+
+def test_slowest_statements_are_kept_in_order():
+    stats = RequestStats()
+    for n in range(10):
+        stats.add_statement(f"SELECT   {n}\n FROM t", n / 1000)
+    slowest = stats.slowest_statements()
+    assert stats.statement_count == 10
+    assert [sql for _, sql in slowest] == [f"SELECT {n} FROM t" for n in (9, 8, 7, 6, 5)]
+
+
+def test_profile_trigger_requires_token(monkeypatch):
+    monkeypatch.setattr(request_timing, "PROFILE_TOKEN", "secret")
+    monkeypatch.setattr(request_timing, "PROFILE_INTERVAL_MS", 2)
+    client = TestClient(_app())
+
+    assert client.get("/slow?__profile=1").json() == {"ok": True}
+    r = client.get("/slow?__profile=1", headers={"X-Profile-Token": "secret"})
+    assert r.headers["content-type"].startswith("text/plain")
+    assert "slow_endpoint" in r.text
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in r.text.splitlines())
@@ -0,0 +1,57 @@
+"""In-memory task metrics: TaskLogger events feed Prometheus counters, no metrics.json writes."""
+
+from backend.logger.logger import LoggingConfig, TaskLogger
+from backend.logger.metrics import REGISTRY, record_task_event, render_metrics
+
+
+def _sample(name, task, service="queue_system"):
+    return REGISTRY.get_sample_value(name, {"service": service, "task": task}) or 0
+
+
+def test_task_events_update_counters_without_file_io(tmp_path, monkeypatch):
+    monkeypatch.setattr(LoggingConfig, "LOG_DIR", str(tmp_path))
+    task_logger = TaskLogger("metrics_test_service")
+    task = "metrics_test_task"
+
+    task_logger.log_task_event(task, {"n": 1}, event_type="started")
+    task_logger.log_task_event(task, event_type="SUCCESS")
+    task_logger.log_task_event(task, event_type="started")
+    task_logger.log_task_event(task, event_type="retrying")
+    task_logger.log_task_event(task, event_type="failed")
+
+    service = "metrics_test_service"
+    assert _sample("grm_tasks_started_total", task, service) == 2
+    assert _sample("grm_tasks_completed_total", task, service) == 1
+    assert _sample("grm_tasks_retried_total", task, service) == 1
+    assert _sample("grm_tasks_failed_total", task, service) == 1
+    assert _sample("grm_task_duration_seconds_count", task, service) == 2
+    assert not (tmp_path / "metrics.json").exists()
+
+
+def test_explicit_duration_and_exposition():
+    record_task_event("metrics_exposed_task", "completed", duration=3.0)
+
+    assert _sample("grm_task_duration_seconds_sum", "metrics_exposed_task") == 3.0
+    body, content_type = render_metrics()
+    assert content_type.startswith("text/plain")
+    assert b'grm_tasks_completed_total{service="queue_system",task="metrics_exposed_task"} 1.0' in body
+
+
+def test_multiprocess_files_are_named_by_host_and_pid(tmp_path):
+    import os
+    import socket
+    import subprocess
+    import sys
+
+    script = (
+        "import os\n"
+        "from backend.logger.metrics import record_task_event, render_metrics\n"
+        "record_task_event('mp_task', 'completed', duration=1.0)\n"
+        "print(os.getpid())\n"
+        "assert b'grm_tasks_completed_total{service=\"queue_system\",task=\"mp_task\"} 1.0' in render_metrics()[0]\n"
+    )
+    env = dict(os.environ, PROMETHEUS_MULTIPROC_DIR=str(tmp_path))
+    out = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True)
+    pid = out.stdout.strip().splitlines()[-1]
+    files = sorted(p.name for p in tmp_path.iterdir())
+    assert files == [f"counter_{socket.gethostname()}-{pid}.db", f"histogram_{socket.gethostname()}-{pid}.db"]
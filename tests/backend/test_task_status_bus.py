@@ -0,0 +1,144 @@
+"""Task status bus: ordered fan-out, cursor handling and per-room replay (in-memory Redis stand-in)."""
+import asyncio
+import json
+
+from backend.task_queue import status_bus
+from backend.task_queue.status_bus import (
+    FANOUT_CURSOR_KEY,
+    STREAM_KEY,
+    TaskStatusFanout,
+    build_status_event,
+    event_room,
+    recent_events,
+)
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._ops = []
+
+    def __getattr__(self, name):
+        def _queue(*args, **kwargs):
+            self._ops.append((name, args, kwargs))
+            return self
+        return _queue
+
+    async def execute(self):
+        return [await getattr(self._redis, name)(*a, **kw) for name, a, kw in self._ops]
+
+
+class _FakeAsyncRedis:
+    """Just the commands the fan-out uses, with decode_responses=True semantics."""
+
+    def __init__(self):
+        self.kv = {}
+        self.lists = {}
+        self.stream = []
+
+    def add(self, event):
+        entry_id = f"{1000 + len(self.stream)}-0"
+        self.stream.append((entry_id, {"e": json.dumps(event)}))
+        return entry_id
+
+    async def get(self, key):
+        return self.kv.get(key)
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.kv:
+            return None
+        self.kv[key] = value
+        return True
+
+    async def expire(self, key, seconds):
+        return True
+
+    async def delete(self, key):
+        self.kv.pop(key, None)
+
+    async def lpush(self, key, value):
+        self.lists.setdefault(key, []).insert(0, value)
+
+    async def ltrim(self, key, start, end):
+        self.lists[key] = self.lists.get(key, [])[start:end + 1]
+
+    async def lrange(self, key, start, end):
+        return list(self.lists.get(key, []))
+
+    async def xread(self, streams, count=None, block=None):
+        cursor = streams[STREAM_KEY]
+        if cursor == "$":
+            return []
+        after = status_bus.parse_event_id(cursor)
+        entries = [e for e in self.stream if status_bus.parse_event_id(e[0]) > after][:count]
+        return [(STREAM_KEY, entries)] if entries else []
+
+    def pipeline(self, transaction=False):
+        return _FakePipeline(self)
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def test_event_room_by_source():
+    assert event_room(build_status_event("SUCCESS", {}, "GR-1-A", "sess")) == "GR-1-A"
+    assert event_room(build_status_event("SUCCESS", {}, "GR-1-B", "sess")) == "sess"
+
+
+def test_fanout_dispatches_in_order_and_advances_cursor():
+    redis = _FakeAsyncRedis()
+    redis.kv[FANOUT_CURSOR_KEY] = "0-0"
+    first = redis.add(build_status_event("started", {"task_name": "t"}, "GR-1-B", "s1"))
+    second = redis.add(build_status_event("SUCCESS", {"task_name": "t"}, "GR-1-B", "s1"))
+    seen = []
+
+    async def dispatch(event):
+        seen.append((event["event_id"], event["status"]))
+
+    fanout = TaskStatusFanout(dispatch, client=redis)
+    assert _run(fanout.hold_lease()) is True
+    assert _run(fanout.consume_once()) == 2
+    assert seen == [(first, "started"), (second, "SUCCESS")]
+    assert redis.kv[FANOUT_CURSOR_KEY] == second
+    # Nothing new: a second read hands out nothing
+    assert _run(fanout.consume_once()) == 0
+
+
+def test_dispatch_error_does_not_stall_the_stream():
+    redis = _FakeAsyncRedis()
+    redis.kv[FANOUT_CURSOR_KEY] = "0-0"
+    redis.add(build_status_event("FAILED", {}, "GR-1-B", "s1"))
+    last = redis.add(build_status_event("SUCCESS", {}, "GR-1-B", "s1"))
+
+    async def dispatch(event):
+        raise RuntimeError("socket down")
+
+    _run(TaskStatusFanout(dispatch, client=redis).consume_once())
+    assert redis.kv[FANOUT_CURSOR_KEY] == last
+
+
+def test_replay_returns_events_after_last_seen():
+    redis = _FakeAsyncRedis()
+    redis.kv[FANOUT_CURSOR_KEY] = "0-0"
+    ids = [redis.add(build_status_event(s, {}, "GR-2-B", "room")) for s in ("a", "b", "c")]
+
+    async def dispatch(event):
+        return None
+
+    _run(TaskStatusFanout(dispatch, client=redis).consume_once())
+    assert [e["status"] for e in _run(recent_events(redis, "room"))] == ["a", "b", "c"]
+    assert [e["status"] for e in _run(recent_events(redis, "room", ids[0]))] == ["b", "c"]
+
+
+def test_second_consumer_does_not_take_held_lease():
+    redis = _FakeAsyncRedis()
+
+    async def dispatch(event):
+        return None
+
+    leader = TaskStatusFanout(dispatch, client=redis)
+    follower = TaskStatusFanout(dispatch, client=redis)
+    follower._consumer = "other-host:1"
+    assert _run(leader.hold_lease()) is True
+    assert _run(follower.hold_lease()) is False
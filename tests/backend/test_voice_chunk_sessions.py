@@ -0,0 +1,46 @@
+"""Disk-backed voice chunk sessions: offset writes, cross-worker continuation, expiry."""
+import os
+
+import pytest
+
+from backend.services.file_server_core import FileServerCore
+from backend.services.voice_chunk_sessions import VoiceChunkSessionStore
+
+
+def test_out_of_order_chunks_with_offsets_assemble(tmp_path):
+    core = FileServerCore(upload_folder=str(tmp_path))
+    session = core.create_voice_chunk_session("GR-1-B", "voice_note_1.webm", "audio/webm")
+    upload_id = session["upload_id"]
+
+    core.append_voice_chunk(upload_id, 2, b"ghi", chunk_offset=6)
+    core.append_voice_chunk(upload_id, 0, b"abc", chunk_offset=0)
+    with pytest.raises(ValueError, match="chunks_missing"):
+        core.finalize_voice_chunk_upload(upload_id, expected_grievance_id="GR-1-B")
+
+    # Another worker (fresh instance, no shared memory) continues the same session
+    other = FileServerCore(upload_folder=str(tmp_path))
+    assert other.append_voice_chunk(upload_id, 1, b"def", chunk_offset=3)["duplicate"] is False
+    assert other.append_voice_chunk(upload_id, 1, b"def", chunk_offset=3)["duplicate"] is True
+
+    file_data = other.finalize_voice_chunk_upload(upload_id, expected_grievance_id="GR-1-B")
+    assert file_data["file_size"] == 9
+    with open(file_data["file_path"], "rb") as f:
+        assert f.read() == b"abcdefghi"
+    assert not os.path.exists(os.path.dirname(session["part_path"]))
+
+
+def test_chunks_without_offset_must_be_in_order(tmp_path):
+    core = FileServerCore(upload_folder=str(tmp_path))
+    upload_id = core.create_voice_chunk_session("GR-1-B", "voice_note_2.webm")["upload_id"]
+    with pytest.raises(ValueError, match="chunk_out_of_order"):
+        core.append_voice_chunk(upload_id, 1, b"late")
+    assert core.append_voice_chunk(upload_id, 0, b"first")["session"]["total_bytes"] == 5
+
+
+def test_expired_session_is_not_found_and_swept(tmp_path):
+    store = VoiceChunkSessionStore(str(tmp_path), ttl_sec=-1, max_bytes=1024)
+    session = store.create("GR-1-B", "voice_note_3.webm", "audio/webm")
+    with pytest.raises(ValueError, match="upload_session_not_found"):
+        store.get(session["upload_id"])
+    store.create("GR-1-B", "voice_note_4.webm", "audio/webm")
+    assert store.sweep_expired(force=True) == 1
@@ -0,0 +1,79 @@
+"""Lazy action registry and the database constants snapshot."""
+
+import importlib
+
+import pytest
+
+from backend.config import database_constants
+from backend.orchestrator import action_registry
+
+
+def test_every_registered_action_resolves():
+    for name, (module_path, class_name) in action_registry._ACTION_FACTORIES.items():
+        module = importlib.import_module(module_path)
+        assert callable(getattr(module, class_name)), name
+
+
+def test_actions_are_built_once_and_unknown_names_are_none():
+    action = action_registry._get_action("action_introduce")
+    assert action is not None
+    assert action_registry._get_action("action_introduce") is action
+    assert action_registry._get_action("action_does_not_exist") is None
+
+
+def test_snapshot_round_trip_updates_constants_in_place(tmp_path, monkeypatch):
+    monkeypatch.setattr(database_constants, "SNAPSHOT_PATH", str(tmp_path / "constants.json"))
+    grievance_status = database_constants.GRIEVANCE_STATUS
+    snapshot = {
+        "grievance_statuses": [{"status_code": "SUBMITTED", "status_name_en": "Submitted"}],
+        "task_statuses": [{"task_status_code": "SUCCESS"}],
+        "processing_statuses": [{"status_code": "COMPLETED"}],
+        "grievance_classification_statuses": [{"code": "CLASSIFIED"}],
+        "field_names": [{"field_name": "grievance_description"}],
+        "status_update_timeline": [
+            {"status_update_code": "SUBMITTED", "grievance_high_priority": True,
+             "sensitive_issues_detected": False, "timeline": 3},
+        ],
+    }
+    saved = {name: dict(getattr(database_constants, name)) for name in (
+        "GRIEVANCE_STATUSES", "GRIEVANCE_STATUS_CODES", "TASK_STATUSES", "TASK_STATUS_CODES",
+        "PROCESSING_STATUSES", "PROCESSING_STATUS_CODES", "GRIEVANCE_CLASSIFICATION_STATUSES",
+        "FIELD_NAMES", "TIMELINE_CACHE", "GRIEVANCE_STATUS_DICT", "TASK_STATUS",
+        "GRIEVANCE_CLASSIFICATION_STATUS",
+    )}
+    try:
+        database_constants._write_snapshot_file(snapshot)
+        database_constants._apply_snapshot(database_constants._read_snapshot_file())
+
+        assert grievance_status is database_constants.GRIEVANCE_STATUS
+        assert grievance_status == {"SUBMITTED": "SUBMITTED"}
+        assert database_constants.get_timedelta_for_status("SUBMITTED", True, False) == 3
+        assert database_constants.GRIEVANCE_STATUS_DICT["SUBMITTED"]["name_en"] == "Submitted"
+    finally:
+        for name, values in saved.items():
+            database_constants._replace(getattr(database_constants, name), values)
+
+
+def test_stale_snapshot_is_ignored(tmp_path, monkeypatch):
+    monkeypatch.setattr(database_constants, "SNAPSHOT_PATH", str(tmp_path / "constants.json"))
+    database_constants._write_snapshot_file({"grievance_statuses": []})
+    assert database_constants._read_snapshot_file(max_age_sec=-1) is None
+
+
+def test_refresh_never_leaves_a_live_key_missing():
+    class Watched(dict):
+        seen = []
+
+        def update(self, *args, **kwargs):
+            super().update(*args, **kwargs)
+            self.seen.append(dict(self))
+
+        def pop(self, *args):
+            value = super().pop(*args)
+            self.seen.append(dict(self))
+            return value
+
+    target = Watched({"STARTED": "STARTED", "OLD": "OLD"})
+    database_constants._replace(target, {"STARTED": "STARTED", "SUCCESS": "SUCCESS"})
+    assert target == {"STARTED": "STARTED", "SUCCESS": "SUCCESS"}
+    assert all("STARTED" in state for state in Watched.seen)
@@ -0,0 +1,56 @@
+"""Orchestrator load-test harness: stats, comparison and a small in-process replay."""
+
+import asyncio
+
+from backend.orchestrator.bench import runner
+from backend.orchestrator.bench.standins import standins
+
+
+def test_percentile_is_nearest_rank():
+    samples = [float(n) for n in range(1, 101)]
+    assert runner.percentile(samples, 50) == 50.0
+    assert runner.percentile(samples, 95) == 95.0
+    assert runner.percentile(samples, 99) == 99.0
+    assert runner.percentile([3.0], 99) == 3.0
+    assert runner.percentile([], 50) == 0.0
+
+
+def test_compare_results_flags_regressions_beyond_threshold():
+    def results(turns_per_sec, p95):
+        summary = {"turns_per_sec": turns_per_sec, "p50_ms": 10.0, "p95_ms": p95, "p99_ms": 80.0}
+        return {"meta": {"commit": "x"}, "summary": summary,
+                "conversations": {"grievance_intake": {"p95_ms": p95}}}
+
+    baseline = results(200.0, 40.0)
+    assert runner.compare_results(baseline, results(190.0, 42.0), 0.10) == []
+    assert runner.compare_results(baseline, results(150.0, 60.0), 0.10) == [
+        "summary.turns_per_sec", "summary.p95_ms", "conversations.grievance_intake.p95_ms",
+    ]
+
+
+def test_recorded_conversations_load():
+    conversations = runner.load_conversations()
+    assert {"grievance_intake", "seah_intake", "status_check"} <= set(conversations)
+    for conversation in conversations.values():
+        assert conversation["turns"][0].get("expect_state") == "intro"
+        assert all("expect_state" in turn for turn in conversation["turns"])
+
+
+def test_in_process_replay_matches_recording():
+    conversations = runner.load_conversations(["status_check", "seah_intake"])
+    with standins(), runner.InProcessServer() as server:
+        async def main():
+            transport = runner.HttpTransport(server.url)
+            try:
+                return await runner.replay_all(transport, conversations, concurrency=2,
+                                               iterations=2, warmup=0, run_id="test")
+            finally:
+                await transport.close()
+
+        stats = asyncio.run(main())
+
+    results = runner.build_results(stats, 1.0, {})
+    assert results["summary"]["errors"] == 0
+    assert results["summary"]["divergences"] == 0
+    assert results["summary"]["conversations"] == 4
+    assert results["summary"]["turns"] == 2 * sum(len(c["turns"]) for c in conversations.values())
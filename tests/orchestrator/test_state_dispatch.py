@@ -0,0 +1,82 @@
+"""State dispatch table: flow.yaml coverage, timing hook, and an opt-in turns/sec benchmark."""
+
+import os
+import time
+from collections import defaultdict
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.orchestrator import state_machine
+from backend.orchestrator.config_loader import load_config
+from tests.orchestrator.flow_helpers import (
+    accept_location_consent,
+    choose_location_manual,
+    complete_contact_for_test,
+    complete_grievance_review,
+    drive_until_filed_or_done,
+    intro_english,
+    post_turn,
+)
+
+
+def _standard_manual_flow(client: TestClient, user_id: str) -> None:
+    intro_english(client, user_id)
+    post_turn(client, user_id, payload="/new_grievance")
+    post_turn(client, user_id, text="Dust from road construction affecting my home.")
+    post_turn(client, user_id, payload="/submit_details")
+    accept_location_consent(client, user_id)
+    body = choose_location_manual(client, user_id)
+    body = complete_contact_for_test(client, user_id, body)
+    body = drive_until_filed_or_done(client, user_id, body)
+    complete_grievance_review(client, user_id, body)
+
+
+def test_flow_yaml_states_all_have_handlers():
+    flow = load_config().get("flow")
+    declared = state_machine.flow_state_ids(flow)
+    assert declared
+    table = state_machine.compile_state_table(flow)
+    assert sorted(declared - table.keys()) == []
+
+
+def test_timing_hook_sees_each_handled_turn(client: TestClient, mock_flow_db):
+    seen = []
+    state_machine.set_transition_timing_hook(lambda *args: seen.append(args))
+    try:
+        intro_english(client, "dispatch-timing-hook")
+    finally:
+        state_machine.set_transition_timing_hook(None)
+
+    assert [(s, i, n) for s, i, n, _ in seen] == [
+        ("intro", "intent_slot_neutral", "intro"),
+        ("intro", "set_english", "main_menu"),
+    ]
+    assert all(elapsed >= 0 for *_, elapsed in seen)
+
+
+@pytest.mark.skipif(
+    not os.environ.get("ORCHESTRATOR_BENCH"), reason="set ORCHESTRATOR_BENCH=<runs> to benchmark"
+)
+def test_benchmark_scripted_flow_turns_per_second(client: TestClient, mock_flow_db):
+    runs = int(os.environ["ORCHESTRATOR_BENCH"] or 20)
+    per_transition = defaultdict(list)
+    state_machine.set_transition_timing_hook(
+        lambda state, intent, next_state, seconds: per_transition[(state, next_state)].append(seconds)
+    )
+    try:
+        started = time.perf_counter()
+        for n in range(runs):
+            _standard_manual_flow(client, f"bench-standard-manual-{n}")
+        elapsed = time.perf_counter() - started
+    finally:
+        state_machine.set_transition_timing_hook(None)
+
+    turns = sum(len(v) for v in per_transition.values())
+    print(f"\n{runs} flows, {turns} turns in {elapsed:.2f}s: {turns / elapsed:.1f} turns/sec")
+    for (state, next_state), samples in sorted(per_transition.items(), key=lambda kv: -sum(kv[1])):
+        print(
+            f"  {state:>28} -> {next_state:<28} n={len(samples):<5} "
+            f"avg={1000 * sum(samples) / len(samples):.2f}ms"
+        )
+    assert turns > 0
@@ -0,0 +1,133 @@
+"""In-process gazetteer snapshot: name/code lookups without per-turn location queries."""
+
+import pytest
+
+from backend.shared_functions import gazetteer
+from backend.shared_functions.location_mapping import (
+    resolve_location_code_to_names,
+    resolve_location_hierarchy_from_code,
+    resolve_location_payload,
+)
+
+LOCATIONS = [
+    ("P1", 1, None), ("P1_MOR", 2, "P1"), ("P1_MOR_BEL", 3, "P1_MOR"), ("P1_MOR_BIR", 3, "P1_MOR"),
+    ("P3", 1, None), ("P3_KAT", 2, "P3"), ("P3_KAT_KAT", 3, "P3_KAT"), ("P3_KAT_OLD", 3, "P3_KAT"),
+]
+TRANSLATIONS = [
+    ("P1", "en", "Koshi Province"), ("P1", "ne", "कोशी प्रदेश"),
+    ("P1_MOR", "en", "Morang"), ("P1_MOR", "ne", "मोरङ"),
+    ("P1_MOR_BEL", "en", "Belbari Municipality"),
+    ("P1_MOR_BIR", "en", "Biratnagar Metropolitan City"),
+    ("P3", "en", "Bagmati Province"),
+    ("P3_KAT", "en", "Kathmandu"),
+    ("P3_KAT_KAT", "en", "Kathmandu Metropolitan City"), ("P3_KAT_KAT", "ne", "काठमाडौं महानगरपालिका"),
+    ("P3_KAT_OLD", "en", "Old Kathmandu Ward"),
+]
+
+
+class FakeDb:
+    def __init__(self, version="v1"):
+        self.version = version
+        self.queries = []
+
+    def execute_query(self, query, params, operation=None):
+        self.queries.append(operation)
+        if operation == "gazetteer_version":
+            return [{"version": self.version}]
+        if operation == "gazetteer_locations":
+            return [
+                {"location_code": c, "country_code": "NP", "level_number": lv, "parent_location_code": p,
+                 "is_active": c != "P3_KAT_OLD"}
+                for c, lv, p in LOCATIONS
+            ]
+        if operation == "gazetteer_translations":
+            return [{"location_code": c, "lang_code": lang, "name": n} for c, lang, n in TRANSLATIONS]
+        raise AssertionError(f"unexpected per-turn query {operation}")
+
+
+@pytest.fixture
+def db():
+    gazetteer.invalidate_gazetteer()
+    db = FakeDb()
+    gazetteer.load_gazetteer(db)
+    db.queries.clear()
+    yield db
+    gazetteer.invalidate_gazetteer()
+
+
+def test_resolve_location_payload_runs_without_queries(db):
+    payload = resolve_location_payload(
+        db,
+        {
+            "complainant_province": "koshi province",
+            "complainant_district": "मोरङ",
+            "complainant_municipality": "Belbari",
+            "language_code": "ne",
+        },
+    )
+    assert payload["location_code"] == "P1_MOR_BEL"
+    assert payload["location_resolution_status"] == "mapped_full"
+    assert (payload["level_1_code"], payload["level_2_code"]) == ("P1", "P1_MOR")
+    assert db.queries == []
+
+
+def test_name_lookup_is_scoped_to_parent_and_skips_inactive(db):
+    snapshot = gazetteer.current_gazetteer(db)
+    assert snapshot.resolve_name(country_code="NP", level_number=3, candidate_name="Kathmandu",
+                                 parent_code="P3_KAT") == "P3_KAT_KAT"
+    assert snapshot.resolve_name(country_code="NP", level_number=3, candidate_name="Kathmandu",
+                                 parent_code="P1_MOR") is None
+    assert snapshot.resolve_name(country_code="NP", level_number=3, candidate_name="Old Kathmandu Ward",
+                                 parent_code="P3_KAT") == "P3_KAT_KAT"  # fuzzy, inactive row never offered
+    assert snapshot.resolve_name(country_code="NP", level_number=3, candidate_name="Biratnagar",
+                                 parent_code=None) == "P1_MOR_BIR"
+
+
+def test_hierarchy_and_names_prefer_language_then_english(db):
+    assert resolve_location_hierarchy_from_code(db, "P3_KAT_KAT", lang_code="ne") == {
+        "level_1_name": "Bagmati Province", "level_1_code": "P3",
+        "level_2_name": "Kathmandu", "level_2_code": "P3_KAT",
+        "level_3_name": "काठमाडौं महानगरपालिका", "level_3_code": "P3_KAT_KAT",
+    }
+    assert resolve_location_code_to_names(db, "P1_MOR", "ne") == {
+        "district_code": "P1_MOR", "district_name": "मोरङ",
+        "province_code": "P1", "province_name": "कोशी प्रदेश",
+    }
+    assert resolve_location_hierarchy_from_code(db, "P3_KAT_OLD") == {}
+    assert db.queries == []
+
+
+def test_other_db_managers_keep_the_sql_path(db):
+    class OtherDb:
+        calls = 0
+
+        def execute_query(self, query, params, operation=None):
+            OtherDb.calls += 1
+            return [{"location_code": "P1"}]
+
+    assert gazetteer.current_gazetteer(OtherDb()) is None
+    assert resolve_location_payload(OtherDb(), {"complainant_province": "Koshi"})["location_code"] == "P1"
+    assert OtherDb.calls >= 1
+
+
+def test_refresh_reloads_only_when_version_changes(db):
+    first = gazetteer.current_gazetteer(db)
+    assert gazetteer.refresh_gazetteer(db) is False
+    assert db.queries == ["gazetteer_version"]
+    assert gazetteer.current_gazetteer(db) is first
+
+    db.version = "v2"
+    assert gazetteer.refresh_gazetteer(db) is True
+    assert gazetteer.current_gazetteer(db).version == "v2"
+
+
+def test_version_change_drops_the_geo_index(db, monkeypatch):
+    from backend.shared_functions import geo_index
+
+    monkeypatch.setitem(geo_index._cache, "NP", (float("inf"), None))
+    assert gazetteer.refresh_gazetteer(db) is False
+    assert "NP" in geo_index._cache
+
+    db.version = "v2"
+    assert gazetteer.refresh_gazetteer(db) is True
+    assert "NP" not in geo_index._cache
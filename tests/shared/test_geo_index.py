@@ -0,0 +1,161 @@
+"""Offline map-pin geo index: KD-tree nearest, boundary containment, Nominatim bypass."""
+
+import json
+import random
+
+import pytest
+
+from backend.shared_functions import geo_index
+from backend.shared_functions.geo_index import KDTree, build_location_geo_index, haversine_km
+from ticketing.constants.nepal_district_centroids import NEPAL_DISTRICT_CENTROIDS
+
+
+def _district_rows():
+    rows = [
+        {"location_code": f"P{p}", "level_number": 1, "parent_location_code": None,
+         "latitude": None, "longitude": None}
+        for p in range(1, 8)
+    ]
+    for code, (lat, lng) in NEPAL_DISTRICT_CENTROIDS.items():
+        rows.append({"location_code": code, "level_number": 2, "parent_location_code": code.split("_")[0],
+                     "latitude": lat, "longitude": lng})
+    return rows
+
+
+def _square(code, min_lng, min_lat, max_lng, max_lat):
+    ring = [[min_lng, min_lat], [max_lng, min_lat], [max_lng, max_lat], [min_lng, max_lat], [min_lng, min_lat]]
+    return {"type": "Feature", "properties": {"location_code": code},
+            "geometry": {"type": "Polygon", "coordinates": [ring]}}
+
+
+class FakeDb:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = 0
+
+    def execute_query(self, query, params, name):
+        self.calls += 1
+        return self.rows
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch):
+    monkeypatch.delenv("LOCATION_BOUNDARIES_GEOJSON", raising=False)
+    geo_index.invalidate_location_geo_index()
+    yield
+    geo_index.invalidate_location_geo_index()
+
+
+def test_kdtree_matches_brute_force_great_circle_nearest():
+    items = list((code, lat, lng) for code, (lat, lng) in NEPAL_DISTRICT_CENTROIDS.items())
+    tree = KDTree(items)
+    rng = random.Random(3)
+    for _ in range(500):
+        lat, lng = rng.uniform(26.3, 30.5), rng.uniform(80.0, 88.2)
+        expected = min(items, key=lambda i: haversine_km(lat, lng, i[1], i[2]))
+        code, km = tree.nearest(lat, lng)
+        assert code == expected[0]
+        assert km == pytest.approx(haversine_km(lat, lng, expected[1], expected[2]), rel=1e-6)
+
+
+def test_resolve_pin_to_location_code_uses_cached_index():
+    from backend.shared_functions.location_mapping import (
+        resolve_pin_to_location_code,
+        resolve_pin_to_location_hierarchy,
+    )
+
+    db = FakeDb(_district_rows())
+    assert resolve_pin_to_location_code(db, 27.72259, 85.33167) == "P3_KAT"
+    assert resolve_pin_to_location_code(db, 26.58, 87.45) == "P1_MOR"
+    assert db.calls == 1
+
+    resolved = resolve_pin_to_location_hierarchy(db, 26.58, 87.45)
+    assert resolved["method"] == "centroid"
+    assert resolved["level_1_code"] == "P1"
+    assert resolved["distance_km"] < 5
+
+
+def test_failed_load_backs_off_and_keeps_previous_index(monkeypatch):
+    db = FakeDb(_district_rows())
+    first = geo_index.get_location_geo_index(db)
+    clock = [10_000.0]
+    monkeypatch.setattr(geo_index.time, "monotonic", lambda: clock[0])
+    geo_index.invalidate_location_geo_index()
+    geo_index._cache["NP"] = (clock[0] - 1, first)
+
+    def down(*args):
+        db.calls += 1
+        raise RuntimeError("db down")
+
+    db.execute_query = down
+    calls = db.calls
+    assert geo_index.get_location_geo_index(db) is first
+    assert geo_index.get_location_geo_index(db) is first
+    assert db.calls == calls + 1
+
+    clock[0] += geo_index.LOAD_RETRY_SEC
+    geo_index.get_location_geo_index(db)
+    assert db.calls == calls + 2
+
+
+def test_resolve_pin_returns_none_without_geodata():
+    from backend.shared_functions.location_mapping import resolve_pin_to_location_code
+
+    rows = [dict(r, latitude=None, longitude=None) for r in _district_rows()]
+    assert resolve_pin_to_location_code(FakeDb(rows), 27.7, 85.3) is None
+
+
+def test_boundary_hit_wins_over_nearer_centroid(tmp_path):
+    rows = _district_rows() + [
+        {"location_code": "P3_KAT_M1", "level_number": 3, "parent_location_code": "P3_KAT",
+         "latitude": 27.70, "longitude": 85.30},
+        {"location_code": "P3_KAT_M2", "level_number": 3, "parent_location_code": "P3_KAT",
+         "latitude": 27.75, "longitude": 85.40},
+    ]
+    path = tmp_path / "boundaries.geojson"
+    path.write_text(json.dumps({"type": "FeatureCollection", "features": [
+        _square("P3_KAT", 85.20, 27.60, 85.50, 27.85),
+        _square("P3_KAT_M1", 85.20, 27.60, 85.35, 27.85),
+        _square("P3_KAT_M2", 85.35, 27.60, 85.50, 27.85),
+    ]}))
+    index = build_location_geo_index(rows, [str(path)])
+
+    # Closer to M1's centroid but inside M2's boundary
+    hit = index.resolve(27.70, 85.36)
+    assert hit["method"] == "polygon"
+    assert (hit["level_3_code"], hit["level_2_code"], hit["level_1_code"]) == ("P3_KAT_M2", "P3_KAT", "P3")
+    assert index.resolve(27.70, 85.36, max_level=2)["location_code"] == "P3_KAT"
+
+    outside = index.resolve(26.58, 87.45)
+    assert outside["method"] == "centroid"
+    assert outside["location_code"] == "P3_KAT_M2"  # deepest centroid level, no distance cap
+    assert index.resolve(26.58, 87.45, max_km=50) is None
+
+
+def test_map_pin_payload_skips_nominatim_on_municipality_boundary_hit(tmp_path, monkeypatch):
+    from backend.shared_functions import map_pin_geocode
+
+    rows = _district_rows() + [
+        {"location_code": "P3_KAT_M1", "level_number": 3, "parent_location_code": "P3_KAT",
+         "latitude": 27.70, "longitude": 85.30},
+    ]
+    path = tmp_path / "boundaries.geojson"
+    path.write_text(json.dumps({"type": "FeatureCollection",
+                                "features": [_square("P3_KAT_M1", 85.20, 27.60, 85.50, 27.85)]}))
+    monkeypatch.setenv("LOCATION_BOUNDARIES_GEOJSON", str(path))
+
+    def no_network(*args, **kwargs):
+        raise AssertionError("Nominatim should not be called")
+
+    def hierarchy(db_manager, code, lang_code="en"):
+        return {"level_1_name": "Bagmati", "level_1_code": "P3", "level_2_name": "Kathmandu",
+                "level_2_code": "P3_KAT", "level_3_name": "Ward One", "level_3_code": code}
+
+    monkeypatch.setattr(map_pin_geocode, "cached_reverse_geocode", no_network)
+    monkeypatch.setattr(map_pin_geocode, "resolve_location_hierarchy_from_code", hierarchy)
+
+    payload = map_pin_geocode.resolve_map_pin_location_payload(FakeDb(rows), 27.7, 85.32)
+    assert payload["location_code"] == "P3_KAT_M1"
+    assert payload["location_resolution_status"] == "mapped_full"
+    assert payload["complainant_municipality"] == "Ward One"
+    assert payload["complainant_district"] == "Kathmandu"
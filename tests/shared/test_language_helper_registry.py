@@ -0,0 +1,32 @@
+"""Prebuilt per-language helpers: views are shared and lookups never mutate them."""
+
+from backend.shared_functions.keyword_detector import KeywordDetector
+from backend.shared_functions.location_validator import ContactLocationValidator
+
+
+def test_location_views_are_prebuilt_and_not_mutated():
+    validator = ContactLocationValidator()
+    en = validator.for_language("en")
+    ne = validator.for_language("ne")
+
+    assert en.language_code == "en" and ne.language_code == "ne"
+    assert validator.for_language("en") is en
+    assert en.municipality_villages is validator.municipality_villages
+
+    province = en.locations[0]
+    district = province["districts"][0]
+    municipality = district["municipalities"][0]["name"]
+    # Matching walks several tree languages internally; the views must stay as built
+    ne.validate_municipality_input(municipality, province["name"], district["name"])
+    assert en.language_code == "en" and ne.language_code == "ne"
+    assert not hasattr(validator, "language_code")
+
+
+def test_keyword_patterns_compiled_once_per_language():
+    detector = KeywordDetector("en")
+    compiled = detector._patterns_for("en")
+
+    result = detector.detect_sensitive_content("Someone threatened to kill me")
+
+    assert result.category == "harassment"
+    assert detector._patterns_for("en") is compiled
@@ -85,3 +85,27 @@ def test_build_slots_from_geocode_names():
     )
     assert slots["complainant_municipality"] == "Belbari"
     assert slots["location_pin_status"] == "map_pin"
+
+
+def test_canonicalize_admin_names_reuses_shared_validators(monkeypatch):
+    from backend.shared_functions import location_validator, map_pin_geocode
+    from backend.shared_functions.helpers_repo import helpers_repo
+
+    languages = []
+    shared = helpers_repo.location_validator_for
+
+    def tracked(language_code):
+        languages.append(language_code)
+        return shared(language_code)
+
+    def no_new_validator(*args, **kwargs):
+        raise AssertionError("validator rebuilt per pin")
+
+    monkeypatch.setattr(helpers_repo, "location_validator_for", tracked)
+    monkeypatch.setattr(location_validator.ContactLocationValidator, "__init__", no_new_validator)
+    for _ in range(2):
+        names = map_pin_geocode._canonicalize_admin_names(
+            {"province": "Koshi Province", "district": "Morang", "municipality": None}
+        )
+        assert names["district"] == "Morang"
+    assert languages == ["en", "en", "en", "en"]
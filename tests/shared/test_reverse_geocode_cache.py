@@ -0,0 +1,138 @@
+"""Grid-cell reverse geocode cache: hits, coalescing, warm-up, Redis sharing (fake geocoder)."""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from backend.shared_functions.reverse_geocode import (
+    NominatimUnavailableError,
+    ReverseGeocodeCache,
+    grid_cell,
+)
+
+
+class FakeGeocoder:
+    def __init__(self, delay=0.0, fail=False):
+        self.calls = []
+        self.delay = delay
+        self.fail = fail
+        self._lock = threading.Lock()
+
+    def __call__(self, lat, lng, *, lang_code="en", zoom=10, respect_rate_limit=True):
+        with self._lock:
+            self.calls.append((lat, lng, lang_code))
+        if self.delay:
+            time.sleep(self.delay)
+        if self.fail:
+            raise NominatimUnavailableError("upstream down")
+        return {"province": "Bagmati Province", "district": "Kathmandu", "municipality": f"M@{lat},{lng}"}
+
+
+class FakeRedis:
+    """The handful of redis-py calls the cache uses."""
+
+    def __init__(self):
+        self.data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, nx=False, ex=None):
+        with self._lock:
+            if nx and key in self.data:
+                return None
+            self.data[key] = value
+            return True
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+def test_grid_cell_rounds_to_precision():
+    assert grid_cell(27.717245, 85.323961, 3) == (27.717, 85.324)
+    assert grid_cell(27.717245, 85.323961, 2) == (27.72, 85.32)
+
+
+def test_nearby_pins_share_one_upstream_call_for_the_cell_centre():
+    geocoder = FakeGeocoder()
+    cache = ReverseGeocodeCache(precision=3, geocoder=geocoder)
+
+    first = cache.lookup(27.71721, 85.32398)
+    second = cache.lookup(27.71738, 85.32412)  # ~20 m away, same cell
+    other = cache.lookup(27.7300, 85.3300)
+
+    assert first == second
+    assert geocoder.calls == [(27.717, 85.324, "en"), (27.73, 85.33, "en")]
+    assert other["municipality"] == "M@27.73,85.33"
+    assert cache.stats["memory_hits"] == 1
+
+
+def test_concurrent_lookups_for_one_cell_coalesce():
+    geocoder = FakeGeocoder(delay=0.2)
+    cache = ReverseGeocodeCache(precision=3, geocoder=geocoder)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda i: cache.lookup(27.7172 + i * 1e-5, 85.3240), range(8)))
+
+    assert len(geocoder.calls) == 1
+    assert all(r == results[0] for r in results)
+
+
+def test_errors_are_not_cached():
+    geocoder = FakeGeocoder(fail=True)
+    cache = ReverseGeocodeCache(geocoder=geocoder)
+
+    with pytest.raises(NominatimUnavailableError):
+        cache.lookup(27.7, 85.3)
+    geocoder.fail = False
+    assert cache.lookup(27.7, 85.3)["district"] == "Kathmandu"
+    assert len(geocoder.calls) == 2
+
+
+def test_redis_layer_is_shared_between_cache_instances():
+    redis = FakeRedis()
+    geocoder = FakeGeocoder()
+    ReverseGeocodeCache(redis_client=redis, geocoder=geocoder).lookup(27.7, 85.3)
+
+    other_process = ReverseGeocodeCache(redis_client=redis, geocoder=geocoder)
+    assert other_process.lookup(27.70001, 85.30001)["district"] == "Kathmandu"
+    assert len(geocoder.calls) == 1
+    assert other_process.stats["redis_hits"] == 1
+    assert not [k for k in redis.data if k.endswith(":lock")]
+
+
+def test_waiter_fetches_itself_once_the_other_holder_gives_up():
+    redis = FakeRedis()
+    geocoder = FakeGeocoder()
+    cache = ReverseGeocodeCache(redis_client=redis, geocoder=geocoder)
+    lock_key = cache.cell_key(27.7, 85.3) + ":lock"
+    redis.set(lock_key, "other-process")
+    threading.Timer(0.3, redis.delete, args=(lock_key,)).start()  # its upstream call failed
+
+    started = time.monotonic()
+    assert cache.lookup(27.7, 85.3)["district"] == "Kathmandu"
+    assert time.monotonic() - started < 2
+    assert len(geocoder.calls) == 1
+    assert cache.stats["coalesced"] == 0
+
+
+def test_warm_from_file_avoids_upstream(tmp_path):
+    geocoder = FakeGeocoder()
+    cache = ReverseGeocodeCache(precision=3, geocoder=geocoder)
+    path = tmp_path / "warm.jsonl"
+    path.write_text("\n".join(json.dumps(r) for r in [
+        {"lat": 26.4521, "lng": 87.2718, "province": "Koshi Province", "district": "Morang",
+         "municipality": "Biratnagar"},
+        {"lat": 28.2096, "lng": 83.9856, "lang_code": "ne", "province": "गण्डकी", "district": "कास्की",
+         "municipality": "पोखरा"},
+        {"lng": 1.0},  # malformed rows are skipped
+    ]))
+
+    assert cache.warm_from_file(str(path)) == 2
+    assert cache.lookup(26.45249, 87.27181)["municipality"] == "Biratnagar"
+    assert cache.lookup(28.2096, 83.9856, lang_code="ne")["district"] == "कास्की"
+    assert geocoder.calls == []
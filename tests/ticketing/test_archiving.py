@@ -135,3 +135,73 @@ def test_save_archiving_policy_writes_audit(db):
         pytest.skip("DB not available")
     finally:
         session.close()
+
+
+def test_resolution_cutoff_matches_archive_eligible_date():
+    """The SQL cutoff admits exactly the tickets archive_eligible_date would."""
+    from datetime import timedelta
+
+    from ticketing.services.archiving import resolution_cutoff
+
+    tz = ZoneInfo("Asia/Kathmandu")
+    policy = dict(DEFAULT_ARCHIVING_POLICY)
+    resolved_samples = [
+        datetime(2025, 12, 31, 23, 59, tzinfo=tz),
+        datetime(2026, 1, 1, 0, 1, tzinfo=tz),
+        datetime(2026, 6, 15, 10, 0, tzinfo=tz),
+        datetime(2026, 12, 31, 18, 30, tzinfo=timezone.utc),  # already 2027 in Kathmandu
+    ]
+    for years in (1, 2):
+        as_of = date(2027, 12, 25)
+        while as_of <= date(2029, 1, 5):
+            cutoff = resolution_cutoff(as_of, years, policy)
+            for resolved_at in resolved_samples:
+                expected = as_of >= archive_eligible_date(resolved_at, years, "Asia/Kathmandu")
+                assert (resolved_at < cutoff) is expected, (years, as_of, resolved_at)
+            as_of += timedelta(days=1)
+
+
+def test_eligible_ticket_ids_query_is_one_set_based_predicate():
+    from sqlalchemy.dialects import postgresql
+
+    from ticketing.services.archiving import eligible_ticket_ids_query
+
+    policy = dict(DEFAULT_ARCHIVING_POLICY, seah_years_before_archiving=3)
+    sql = str(
+        eligible_ticket_ids_query(policy, date(2030, 1, 2)).compile(dialect=postgresql.dialect())
+    ).lower()
+    assert sql.startswith("select ticketing.tickets.ticket_id")
+    assert "ticket_resolved_summaries" in sql
+    assert "max(ticketing.ticket_events.created_at)" in sql
+    assert "case when" in sql  # SEAH override
+    assert "order by ticketing.tickets.ticket_id" in sql
+
+
+def test_run_archive_job_merges_parallel_chunks():
+    from ticketing.services import archiving
+
+    chunks = [["a", "b"], ["c", "d"], ["e"]]
+
+    def fake_chunk(bind, ticket_ids, policy, dry_run):
+        part = archiving.ArchiveJobSummary(as_of=date(2030, 1, 2), dry_run=dry_run)
+        for tid in ticket_ids:
+            if tid == "d":
+                part.errors += 1
+            else:
+                part.archived += 1
+                part.details.append(archiving.ArchiveResult(tid, f"GR-{tid}", True))
+        return part
+
+    db = MagicMock()
+    with patch.object(archiving, "load_archiving_policy", return_value=dict(DEFAULT_ARCHIVING_POLICY)), \
+            patch.object(archiving, "count_missing_resolution_timestamp", return_value=0), \
+            patch.object(archiving, "iter_eligible_ticket_id_chunks", return_value=iter(chunks)), \
+            patch.object(archiving, "_archive_chunk", side_effect=fake_chunk) as archive_chunk:
+        summary = archiving.run_archive_job(
+            db, as_of=date(2030, 1, 2), dry_run=False, chunk_size=2, workers=3
+        )
+
+    assert archive_chunk.call_count == 3
+    assert (summary.candidates, summary.archived, summary.errors) == (5, 4, 1)
+    assert sorted(r.ticket_id for r in summary.details) == ["a", "b", "c", "e"]
+    db.commit.assert_not_called()  # chunks commit in their own sessions
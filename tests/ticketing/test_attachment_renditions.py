@@ -0,0 +1,36 @@
+"""Attachment download rendition selection (smallest acceptable image variant)."""
+from __future__ import annotations
+
+from ticketing.api.routers.tickets import _select_rendition
+
+
+def _write(path, size):
+    path.write_bytes(b"x" * size)
+    return str(path)
+
+
+def test_thumb_prefers_smallest_accepted_format(tmp_path):
+    stored = _write(tmp_path / "abc.jpg", 900)
+    _write(tmp_path / "abc.thumb.jpg", 60)
+    webp = _write(tmp_path / "abc.thumb.webp", 40)
+
+    assert _select_rendition(stored, "thumb", "image/webp,image/*") == webp
+    assert _select_rendition(stored, "thumb", "*/*") == str(tmp_path / "abc.thumb.jpg")
+
+
+def test_missing_rendition_falls_back_to_larger_size(tmp_path):
+    stored = _write(tmp_path / "abc.jpg", 900)
+    display = _write(tmp_path / "abc.display.webp", 500)
+
+    assert _select_rendition(stored, "thumb", "image/webp") == display
+    assert _select_rendition(stored, "original", "image/webp") == stored
+    assert _select_rendition(stored, "thumb", None) == stored
+
+
+def test_renditions_of_images_kept_in_their_own_format(tmp_path):
+    stored = _write(tmp_path / "abc.png", 300)  # under the compression skip threshold
+    thumb = _write(tmp_path / "abc.thumb.jpg", 30)
+    _write(tmp_path / "abc.display.webp", 400)
+
+    assert _select_rendition(stored, "thumb", None) == thumb
+    assert _select_rendition(stored, "display", "image/webp") == stored
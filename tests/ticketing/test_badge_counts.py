@@ -0,0 +1,148 @@
+"""Officer badge counter cache: commit-time deltas, SSE stream, concurrent subscribers (no Redis)."""
+import asyncio
+import uuid
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from ticketing.models.ticket import TicketEvent
+from ticketing.seed.badge_stream_load import run_in_process
+from ticketing.services import badge_counts
+from ticketing.services.badge_counts import (
+    BadgeCounter,
+    badge_event_stream,
+    install_badge_tracking,
+    record_badge_delta,
+)
+
+
+@pytest.fixture
+def counter():
+    counter = BadgeCounter(None)
+    badge_counts.set_badge_counter(counter)
+    yield counter
+    badge_counts.set_badge_counter(None)
+
+
+@pytest.fixture
+def session_factory():
+    engine = sa.create_engine("sqlite://", poolclass=StaticPool)
+
+    @sa.event.listens_for(engine, "connect")
+    def _attach(dbapi_conn, _record):
+        dbapi_conn.execute("ATTACH DATABASE ':memory:' AS ticketing")
+
+    TicketEvent.__table__.create(engine)
+    factory = sessionmaker(bind=engine)
+    install_badge_tracking(factory)
+    install_badge_tracking(factory)  # idempotent
+    yield factory
+    engine.dispose()
+
+
+def _event(user_id, seen=False):
+    return TicketEvent(event_id=str(uuid.uuid4()), ticket_id="T-1", event_type="ASSIGNMENT_NOTIFICATION",
+                       seen=seen, assigned_to_user_id=user_id, created_by_user_id="system")
+
+
+def test_committed_event_writes_adjust_cached_counts(counter, session_factory):
+    counter.get("alice", lambda: 0)
+    counter.get("bob", lambda: 0)
+
+    db = session_factory()
+    db.add_all([_event("alice"), _event("alice"), _event("bob", seen=True)])
+    db.flush()
+    assert counter.peek("alice") == 0  # nothing until commit
+    db.commit()
+    assert (counter.peek("alice"), counter.peek("bob")) == (2, 0)
+
+    ev = db.query(TicketEvent).filter_by(assigned_to_user_id="alice").first()
+    ev.assigned_to_user_id = "bob"
+    db.commit()
+    assert (counter.peek("alice"), counter.peek("bob")) == (1, 1)
+
+    ev.seen = True
+    db.commit()
+    assert counter.peek("bob") == 0
+
+    db.add(_event("alice"))
+    db.rollback()
+    assert counter.peek("alice") == 1
+
+    record_badge_delta(db, "alice", -1)  # Core bulk UPDATE path (POST /tickets/{id}/seen)
+    db.commit()
+    assert counter.peek("alice") == 0
+    db.close()
+
+
+def test_missing_or_drifted_key_is_recounted_not_guessed(counter):
+    counter.apply({"carol": 3})
+    assert counter.peek("carol") is None
+    assert counter.get("carol", lambda: 5) == 5
+
+    counter.apply({"carol": -9})  # below zero: cache is wrong, drop it
+    assert counter.peek("carol") is None
+    assert counter.get("carol", lambda: 1) == 1
+
+
+def test_recount_racing_a_commit_is_not_stored(counter):
+    db_count = [2]
+
+    def recount_while_alice_gets_an_event():
+        counted = db_count[0]
+        counter.mark_pending("alice")  # writer flushed before its commit
+        db_count[0] += 1
+        counter.apply({"alice": 1}, release={"alice"})  # after_commit: key absent, skipped
+        return counted
+
+    assert counter.get("alice", recount_while_alice_gets_an_event) == 2
+    assert counter.peek("alice") is None  # the stale 2 was not cached
+    assert counter.get("alice", lambda: db_count[0]) == 3
+
+    counter.mark_pending("bob")  # committed in the DB, after_commit not run yet
+    assert counter.get("bob", lambda: 1) == 1
+    assert counter.peek("bob") is None  # would be counted twice once the +1 lands
+    counter.apply({"bob": 1}, release={"bob"})
+    assert counter.get("bob", lambda: 1) == 1 and counter.peek("bob") == 1
+
+    counter.mark_pending("carol")
+    counter.release({"carol"})  # rolled back
+    assert counter.get("carol", lambda: 0) == 0 and counter.peek("carol") == 0
+
+
+def test_stream_sends_initial_count_then_changes():
+    counter = BadgeCounter(None)
+    counter.get("dave", lambda: 4)
+    reloads = []
+
+    def load():
+        reloads.append(1)
+        return counter.get("dave", lambda: 9)
+
+    async def scenario():
+        stream = badge_event_stream("dave", counter=counter, load=load, keepalive_seconds=0.05)
+        received = [await stream.__anext__()]
+        assert counter.hub.subscriber_count() == 1
+        counter.apply({"dave": 1})
+        received.append(await stream.__anext__())
+        counter.invalidate("dave")
+        received.append(await stream.__anext__())
+        received.append(await stream.__anext__())  # idle → keepalive comment
+        await stream.aclose()
+        return received
+
+    received = asyncio.run(scenario())
+    assert received[0] == 'retry: 5000\n\nevent: badge\ndata: {"unseen_count": 4}\n\n'
+    assert received[1] == 'event: badge\ndata: {"unseen_count": 5}\n\n'
+    assert received[2] == 'event: badge\ndata: {"unseen_count": 9}\n\n'
+    assert received[3] == ": keepalive\n\n"
+    assert len(reloads) == 2
+    assert counter.hub.subscriber_count() == 0
+
+
+def test_many_concurrent_subscribers_converge_on_final_counts():
+    result = asyncio.run(run_in_process(subscribers=400, officers=60, updates=600, rate=0, settle_seconds=0.2))
+    assert result["stale_subscribers"] == 0
+    assert result["delivery_ms"]["runs"] > 600
@@ -0,0 +1,112 @@
+"""Closure PDF disk cache: content-addressed keys, ETag revalidation, public route (no DB)."""
+from types import SimpleNamespace
+
+import pytest
+
+from ticketing.config.settings import get_settings
+from ticketing.services import closure_pdf
+from ticketing.api.routers.public_closure import etag_matches
+from ticketing.services.closure_pdf import closure_pdf_key, get_or_render_closure_pdf
+
+PUBLIC = {
+    "project_name": "Kakarbhitta-Laukahi Road",
+    "complaint_filed_at": "2026-09-01T08:00:00+00:00",
+    "resolved_at": "2026-09-20T10:00:00+00:00",
+    "resolved_duration_days": 19,
+    "original_complaint": "Dust from the site",
+    "resolution_category_label": "Resolved",
+    "resolution_text_public": "Water sprinkling twice a day.",
+}
+
+
+@pytest.fixture
+def renders(monkeypatch, tmp_path):
+    monkeypatch.setattr(get_settings(), "closure_pdf_cache_dir", str(tmp_path))
+    calls = []
+    real = closure_pdf.build_closure_pdf
+
+    def counting(public_json, grievance_id):
+        calls.append(grievance_id)
+        return real(public_json, grievance_id)
+
+    monkeypatch.setattr(closure_pdf, "build_closure_pdf", counting)
+    return calls
+
+
+def test_key_tracks_only_rendered_fields_and_template_version(monkeypatch):
+    key = closure_pdf_key(PUBLIC, "G-1")
+    assert closure_pdf_key({**PUBLIC, "internal_only": "x"}, "G-1") == key
+    assert closure_pdf_key({**PUBLIC, "resolution_text_public": "Edited"}, "G-1") != key
+    assert closure_pdf_key(PUBLIC, "G-2") != key
+    monkeypatch.setattr(closure_pdf, "TEMPLATE_VERSION", closure_pdf.TEMPLATE_VERSION + 1)
+    assert closure_pdf_key(PUBLIC, "G-1") != key
+
+
+def test_second_request_is_a_file_read(renders, tmp_path):
+    path, key = get_or_render_closure_pdf(PUBLIC, "G-1")
+    again, key_again = get_or_render_closure_pdf(PUBLIC, "G-1")
+    assert renders == ["G-1"]
+    assert (again, key_again) == (path, key) and key == closure_pdf_key(PUBLIC, "G-1")
+    assert path.parent.parent == tmp_path
+    assert path.read_bytes().startswith(b"%PDF")
+    assert [p.name for p in path.parent.iterdir()] == [path.name]  # no temp files left
+
+
+def test_if_none_match_parsing():
+    assert etag_matches('"abc"', '"abc"')
+    assert etag_matches('W/"abc", "def"', '"abc"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches('"abd"', '"abc"')
+    assert not etag_matches(None, '"abc"')
+
+
+def test_public_route_serves_cache_and_revalidates(renders):
+    from fastapi.testclient import TestClient
+
+    from ticketing.api.main import app
+    from ticketing.models.base import get_db
+
+    row = SimpleNamespace(summary_public_json=PUBLIC, grievance_id="G-9", generation_status="complete")
+
+    class FakeDb:
+        def execute(self, statement):
+            return SimpleNamespace(scalar_one_or_none=lambda: row)
+
+    app.dependency_overrides[get_db] = lambda: FakeDb()
+    try:
+        client = TestClient(app)
+        first = client.get("/api/v1/public/closure/tok/pdf")
+        assert first.status_code == 200
+        assert first.headers["content-type"] == "application/pdf"
+        assert 'filename="GRM-closure-G-9.pdf"' in first.headers["content-disposition"]
+        etag = first.headers["etag"]
+
+        second = client.get("/api/v1/public/closure/tok/pdf")
+        assert second.content == first.content and second.headers["etag"] == etag
+
+        cached = client.get("/api/v1/public/closure/tok/pdf", headers={"If-None-Match": etag})
+        assert cached.status_code == 304 and cached.content == b""
+        assert renders == ["G-9"]
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_prune_drops_unused_then_least_recently_used(tmp_path):
+    import os
+
+    def cached(name, size, mtime):
+        path = tmp_path / name[:2] / f"{name}.pdf"
+        path.parent.mkdir(exist_ok=True)
+        path.write_bytes(b"x" * size)
+        os.utime(path, (mtime, mtime))
+        return path
+
+    now = 100 * 86400
+    old = cached("aa-old", 10, now - 91 * 86400)
+    lru = cached("bb-lru", 10, now - 2 * 86400)
+    recent = cached("bb-recent", 10, now - 86400)
+    temp = cached(".closure_tmp", 10, now - 7200)
+
+    stats = closure_pdf.prune_closure_pdf_cache(tmp_path, max_age_days=90, max_bytes=15, now=now)
+    assert stats == {"removed": 3, "kept": 1, "bytes": 10}
+    assert [p.exists() for p in (old, lru, recent, temp)] == [False, False, True, False]
@@ -0,0 +1,107 @@
+"""ticket_events monthly partitions: naming, creation and the detach path (no DB)."""
+import re
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from ticketing.services import event_partitions
+from ticketing.services.event_partitions import (
+    EventPartition,
+    add_months,
+    ensure_ticket_event_partitions,
+    partition_bounds,
+    partition_name,
+)
+
+VERSIONS = Path(__file__).resolve().parents[2] / "ticketing" / "migrations" / "versions"
+
+
+class RecordingDb:
+    def __init__(self, stray=False):
+        self.sql = []
+        self.stray = stray
+
+    def execute(self, statement, params=None):
+        self.sql.append(" ".join(str(statement).split()))
+        return self
+
+    def scalar(self):
+        return self.stray
+
+    @property
+    def rowcount(self):
+        return 2
+
+
+@pytest.fixture
+def partitions(monkeypatch):
+    existing = [EventPartition("ticket_events_default", None)]
+    monkeypatch.setattr(event_partitions, "list_partitions", lambda db: list(existing))
+    return existing
+
+
+def test_month_math_and_names():
+    assert add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+    assert partition_name(date(2026, 2, 1)) == "ticket_events_y2026m02"
+    assert partition_bounds(date(2026, 12, 15)) == (
+        datetime(2026, 12, 1, tzinfo=timezone.utc),
+        datetime(2027, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+def test_ensure_creates_missing_months_through_horizon(partitions):
+    partitions.append(EventPartition("ticket_events_y2026m10", date(2026, 10, 1)))
+    db = RecordingDb()
+    created = ensure_ticket_event_partitions(db, months_ahead=2, today=date(2026, 10, 18))
+    assert created == ["ticket_events_y2026m11", "ticket_events_y2026m12"]
+    creates = [s for s in db.sql if s.startswith("CREATE TABLE")]
+    assert creates[0] == (
+        "CREATE TABLE ticketing.ticket_events_y2026m11 PARTITION OF ticketing.ticket_events "
+        "FOR VALUES FROM ('2026-11-01T00:00:00+00:00') TO ('2026-12-01T00:00:00+00:00')"
+    )
+
+
+def test_rows_stranded_in_default_are_moved_before_attach(partitions):
+    db = RecordingDb(stray=True)
+    assert event_partitions.create_month_partition(db, date(2026, 11, 5))
+    steps = [s.split(" (")[0] for s in db.sql if not s.startswith("SELECT")]
+    assert steps[0].startswith("CREATE TABLE ticketing.ticket_events_y2026m11")
+    assert "DELETE FROM ticketing.ticket_events_default" in db.sql[3]
+    assert db.sql[4].startswith("ALTER TABLE ticketing.ticket_events ATTACH PARTITION")
+    assert db.sql[5].endswith("DROP CONSTRAINT ticket_events_y2026m11_bounds")
+
+
+def test_detach_skips_months_with_live_tickets(partitions, monkeypatch):
+    partitions += [EventPartition(partition_name(date(2024, m, 1)), date(2024, m, 1)) for m in (1, 2, 3)]
+    monkeypatch.setattr(event_partitions, "_month_has_live_tickets", lambda db, name: name.endswith("m02"))
+    db = RecordingDb()
+    detached = event_partitions.detach_ticket_event_partitions(db, before=date(2024, 3, 20))
+    assert detached == ["ticket_events_y2024m01"]
+    assert db.sql[-1] == "ALTER TABLE ticketing.ticket_events_y2024m01 SET SCHEMA ticketing_archive"
+
+
+def test_partition_migration_extends_the_single_head():
+    revisions, parents = set(), set()
+    for path in VERSIONS.glob("*.py"):
+        text = path.read_text(encoding="utf-8")
+        rev = re.search(r"^revision(?::\s*str)?\s*=\s*['\"](\w+)['\"]", text, re.M)
+        down = re.search(r"^down_revision(?::[^=]+)?\s*=\s*(.+)$", text, re.M)
+        revisions.add(rev.group(1))
+        parents.update(re.findall(r"['\"](\w+)['\"]", down.group(1)))
+    assert revisions - parents == {"b4d6f8h0"}
+    assert 'down_revision: Union[str, None] = "g0h2i4j6"' in (VERSIONS / "b4d6f8h0_partition_ticket_events.py").read_text()
+
+
+def test_model_ddl_matches_partitioned_migration():
+    from sqlalchemy import inspect
+    from sqlalchemy.dialects import postgresql
+    from sqlalchemy.schema import CreateTable
+
+    from ticketing.models.ticket import TicketEvent
+
+    ddl = " ".join(str(CreateTable(TicketEvent.__table__).compile(dialect=postgresql.dialect())).split())
+    assert "PRIMARY KEY (event_id, created_at)" in ddl
+    assert ddl.endswith("PARTITION BY RANGE (created_at)")
+    assert [c.name for c in inspect(TicketEvent).primary_key] == ["event_id"]
@@ -0,0 +1,80 @@
+"""Bulk COPY location import: staging CSV encoding, validation and diff counts."""
+from __future__ import annotations
+
+import csv
+
+import pytest
+
+from ticketing.seed.location_import_core import (
+    _LOC_STAGE_COLUMNS,
+    LocationImportError,
+    _copy_buffer,
+    bulk_upsert_locations,
+    import_locations,
+)
+
+
+def _loc(code, level, parent, source_id=None, active=True):
+    return {"location_code": code, "country_code": "NP", "level_number": level,
+            "parent_location_code": parent, "source_id": source_id, "is_active": active}
+
+
+def _tree():
+    locations = [_loc("ZZT", 1, None, 1), _loc("ZZT_A", 2, "ZZT", 2), _loc("ZZT_A_X", 3, "ZZT_A", 3)]
+    trans = [{"location_code": r["location_code"], "lang_code": "en", "name": f"Name {r['location_code']}"}
+             for r in locations]
+    return locations, trans
+
+
+def test_copy_buffer_writes_copy_csv_in_stage_column_order():
+    rows = [_loc("P1", 1, None, 1), _loc("P1_JHA", 2, "P1", None, active=False)]
+    parsed = list(csv.reader(_copy_buffer(rows, _LOC_STAGE_COLUMNS)))
+    assert parsed == [
+        ["0", "P1", "NP", "1", "", "1", "t"],
+        ["1", "P1_JHA", "NP", "2", "P1", "", "f"],
+    ]
+
+
+def test_import_error_lists_problem_codes():
+    err = LocationImportError([(f"C{i}", "unknown parent X") for i in range(25)])
+    assert isinstance(err, ValueError)
+    assert str(err).startswith("25 invalid row(s): C0: unknown parent X")
+    assert str(err).endswith("(+5 more)")
+
+
+def test_import_locations_rejects_unknown_method():
+    with pytest.raises(ValueError, match="Unknown import method"):
+        import_locations([], [], db=None, method="orm")
+
+
+@pytest.fixture
+def pg_session():
+    from ticketing.models.base import SessionLocal
+
+    session = SessionLocal()
+    try:
+        session.connection()
+    except Exception:
+        session.close()
+        pytest.skip("DB not available")
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+
+
+def test_bulk_import_reports_diff_and_validates_parents(pg_session):
+    locations, trans = _tree()
+    first = bulk_upsert_locations(locations, trans, pg_session)
+    assert (first["locations"], first["locations_inserted"], first["translations_inserted"]) == (3, 3, 3)
+
+    locations[2]["is_active"] = False
+    trans[0]["name"] = "Renamed"
+    second = bulk_upsert_locations(locations + [locations[0]], trans, pg_session)
+    assert (second["locations_inserted"], second["locations_updated"], second["locations_unchanged"]) == (0, 1, 2)
+    assert (second["translations_updated"], second["translations_unchanged"]) == (1, 2)
+
+    with pytest.raises(LocationImportError) as exc_info:
+        bulk_upsert_locations([_loc("ZZT_B_Y", 3, "ZZT_B"), _loc("ZZT_Q", 1, "ZZT_A")], [], pg_session)
+    assert [code for code, _ in exc_info.value.problems] == ["ZZT_B_Y", "ZZT_Q"]
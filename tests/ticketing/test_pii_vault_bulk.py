@@ -0,0 +1,97 @@
+"""Bulk vault decrypt: one query per batch, per-request memo, per-value fallback (fake engine, no DB)."""
+from types import SimpleNamespace
+
+import pytest
+
+from ticketing.config.settings import get_settings
+from ticketing.services import pii_vault
+from ticketing.services.pii_vault import (
+    decrypt_ciphertexts,
+    grievance_pii_for_officer_card,
+    grievance_reveal_content,
+    pii_decrypt_cache,
+)
+
+NAME = "a1" * 30
+PHONE = "b2" * 30
+BAD = "c3" * 30
+PLAIN = {NAME: b"Sita Sharma", PHONE: memoryview(b"9800000001")}
+
+
+class FakeConn:
+    def __init__(self, engine):
+        self.engine = engine
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, statement, params):
+        cts = params.get("cts") or [params["ct"]]
+        self.engine.queries.append(cts)
+        if BAD in cts:
+            raise RuntimeError("Wrong key or corrupt data")
+        rows = [{"ct": ct, "decrypted": PLAIN.get(ct)} for ct in cts]
+        return SimpleNamespace(mappings=lambda: SimpleNamespace(all=lambda: rows, first=lambda: rows[0]))
+
+    def rollback(self):
+        pass
+
+
+class FakeEngine:
+    def __init__(self):
+        self.queries = []
+
+    def connect(self):
+        return FakeConn(self)
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    monkeypatch.setattr(get_settings(), "db_encryption_key", "k")
+    fake = FakeEngine()
+    monkeypatch.setattr(pii_vault, "engine", fake)
+    return fake
+
+
+def test_many_fields_one_query(engine):
+    grievance = {
+        "complainant_full_name": NAME,
+        "complainant_phone": f" {PHONE} ",
+        "complainant_email": "plain@example.org",
+        "complainant_address": NAME,
+        "grievance_description": "Dust",
+    }
+    card = grievance_pii_for_officer_card(grievance, mask_sensitive_contact=False)
+    assert (card["complainant_name"], card["phone_number"], card["email"], card["address"]) == (
+        "Sita Sharma", "9800000001", "plain@example.org", "Sita Sharma",
+    )
+    assert engine.queries == [[NAME, PHONE]]
+
+
+def test_request_scope_memoizes_then_forgets(engine):
+    with pii_decrypt_cache() as cache:
+        grievance_reveal_content({"complainant_full_name": NAME})
+        content = grievance_reveal_content({"complainant_phone": PHONE, "complainant_full_name": NAME})
+        assert content["complainant_name"] == "Sita Sharma"
+        assert pii_vault.decrypt_ciphertext(NAME) == "Sita Sharma"
+        assert engine.queries == [[NAME], [PHONE]]
+    assert cache == {}
+    pii_vault.decrypt_ciphertext(NAME)
+    assert len(engine.queries) == 3
+
+
+def test_bad_value_does_not_blank_the_batch(engine):
+    assert decrypt_ciphertexts([NAME, BAD, "not-cipher", PHONE]) == {
+        NAME: "Sita Sharma", BAD: None, PHONE: "9800000001",
+    }
+    assert engine.queries[0] == [NAME, BAD, PHONE]
+    assert engine.queries[1:] == [[NAME], [BAD], [PHONE]]
+
+
+def test_no_key_means_no_query(engine, monkeypatch):
+    monkeypatch.setattr(get_settings(), "db_encryption_key", "")
+    assert pii_vault.reveal_field(NAME) is None
+    assert engine.queries == []
@@ -0,0 +1,116 @@
+"""Synthetic perf dataset generator: determinism and referential consistency (no DB)."""
+from collections import defaultdict
+from datetime import date, datetime, timezone
+
+from ticketing.seed.synthetic_dataset import (
+    GRIEVANCE_PREFIX,
+    OFFICER_PREFIX,
+    SYNTHETIC_CHATBOT_ID,
+    TABLE_COLUMNS,
+    LocationNode,
+    ReferenceData,
+    StepSpec,
+    SyntheticDataset,
+    SyntheticProfile,
+    _csv_value,
+)
+
+
+class ListSink:
+    def __init__(self):
+        self.rows = defaultdict(list)
+
+    def add(self, table, row):
+        assert len(row) == len(TABLE_COLUMNS[table]), table
+        self.rows[table].append(dict(zip(TABLE_COLUMNS[table], row)))
+
+    def ticket_done(self):
+        pass
+
+
+def _reference() -> ReferenceData:
+    locations = [LocationNode("NP_P1", 1, None, "Koshi"), LocationNode("NP_P2", 1, None, "Madhesh")]
+    for p in ("NP_P1", "NP_P2"):
+        for d in range(2):
+            district = f"{p}_D{d}"
+            locations.append(LocationNode(district, 2, p))
+            locations += [LocationNode(f"{district}_M{m}", 3, district) for m in range(3)]
+    standard = [
+        StepSpec("S1", 1, "site_safeguards_focal_person", 2),
+        StepSpec("S2", 2, "pd_piu_safeguards_focal", 7),
+        StepSpec("S3", 3, "grc_chair", 15),
+        StepSpec("S4", 4, "adb_hq_safeguards", None),
+    ]
+    seah = [StepSpec("H1", 1, "seah_national_officer", 3), StepSpec("H2", 2, "seah_hq_officer", None)]
+    roles = ["site_safeguards_focal_person", "pd_piu_safeguards_focal", "grc_chair", "adb_hq_safeguards",
+             "seah_national_officer", "seah_hq_officer"]
+    return ReferenceData(
+        locations=locations,
+        workflows={"STANDARD": ("WF-STD", standard), "SEAH": ("WF-SEAH", seah)},
+        role_ids={r: f"role-{r}" for r in roles},
+        project_id="proj-kl",
+        categories=[{"category_key": "Environmental - Dust", "short_description": "Dust"}],
+    )
+
+
+def _generate(**overrides) -> ListSink:
+    profile = SyntheticProfile(grievances=300, officers=40, as_of="2026-06-30", seah_share=0.2, **overrides)
+    sink = ListSink()
+    SyntheticDataset(profile, _reference()).generate(sink)
+    return sink
+
+
+def test_same_seed_same_rows_and_different_seed_differs():
+    assert _generate(seed=7).rows == _generate(seed=7).rows
+    assert _generate(seed=7).rows["ticketing.tickets"] != _generate(seed=8).rows["ticketing.tickets"]
+
+
+def test_rows_are_tagged_and_reference_each_other():
+    rows = _generate().rows
+    grievance_ids = {g["grievance_id"] for g in rows["public.grievances"]}
+    tickets = {t["ticket_id"]: t for t in rows["ticketing.tickets"]}
+    officers = {s["user_id"] for s in rows["ticketing.officer_scopes"]}
+
+    assert len(grievance_ids) == 300 and all(g.startswith(GRIEVANCE_PREFIX) for g in grievance_ids)
+    assert officers == {r["user_id"] for r in rows["ticketing.user_roles"]}
+    assert all(o.startswith(OFFICER_PREFIX) for o in officers)
+    for ticket in tickets.values():
+        assert ticket["chatbot_id"] == SYNTHETIC_CHATBOT_ID
+        assert ticket["grievance_id"] in grievance_ids
+        assert ticket["assigned_to_user_id"] in officers
+        assert ticket["current_workflow_id"] == ("WF-SEAH" if ticket["is_seah"] else "WF-STD")
+
+    for table in ("ticketing.ticket_events", "ticketing.ticket_viewers", "ticketing.ticket_tasks",
+                  "ticketing.ticket_overdue_episodes"):
+        assert rows[table], table
+        assert all(r["ticket_id"] in tickets for r in rows[table]), table
+
+    events_by_ticket = defaultdict(list)
+    for e in rows["ticketing.ticket_events"]:
+        events_by_ticket[e["ticket_id"]].append(e)
+    for ticket_id, ticket in tickets.items():
+        types = [e["event_type"] for e in events_by_ticket[ticket_id]]
+        assert types[:2] == ["CREATED", "ASSIGNED"]
+        assert ("RESOLVED" in types) == (ticket["status_code"] == "RESOLVED")
+
+
+def test_breached_tickets_have_one_open_episode_past_their_sla():
+    rows = _generate(overdue_share=0.5).rows
+    as_of = datetime(2026, 6, 30, tzinfo=timezone.utc)
+    open_episodes = {e["ticket_id"]: e for e in rows["ticketing.ticket_overdue_episodes"] if e["ended_at"] is None}
+    breached = [t for t in rows["ticketing.tickets"] if t["sla_breached"]]
+
+    assert breached
+    assert {t["ticket_id"] for t in breached} == set(open_episodes)
+    for ticket in breached:
+        assert ticket["status_code"] != "RESOLVED"
+        assert open_episodes[ticket["ticket_id"]]["started_at"] <= as_of
+        assert open_episodes[ticket["ticket_id"]]["workflow_step_id"] == ticket["current_step_id"]
+
+
+def test_csv_values_match_postgres_copy_text():
+    assert _csv_value(None) is None
+    assert _csv_value(True) == "t" and _csv_value(False) == "f"
+    assert _csv_value(date(2026, 1, 2)) == "2026-01-02"
+    assert _csv_value(datetime(2026, 1, 2, 3, 4, tzinfo=timezone.utc)) == "2026-01-02T03:04:00+00:00"
+    assert _csv_value(3) == 3
@@ -12,7 +12,7 @@ Or via module:
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from ticketing.api.routers import auth as auth_router
@@ -28,7 +28,15 @@ from ticketing.api.routers import webhooks as webhooks_router
 from ticketing.api.routers import public_closure as public_closure_router
 from ticketing.api.routers import public_report as public_report_router
 from ticketing.config.settings import get_settings
-from ticketing.models.base import ensure_ticketing_schema
+from backend.logger.metrics import render_metrics
+from backend.logger.request_timing import (
+    REQUEST_TIMING_ENABLED,
+    RequestTimingMiddleware,
+    instrument_sqlalchemy_engine,
+)
+from ticketing.models.base import SessionLocal, engine, ensure_ticketing_schema
+from ticketing.services.badge_counts import install_badge_tracking
+from ticketing.services.pii_vault import PiiDecryptCacheMiddleware
 
 logging.basicConfig(
     level=logging.INFO,
@@ -79,6 +87,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ── Vault plaintexts memoized per request (ticketing/services/pii_vault.py) ────
+app.add_middleware(PiiDecryptCacheMiddleware)
+
+# ── Request timing (opt-in: REQUEST_TIMING=1) ─────────────────────────────────
+# Server-Timing header with DB time and SQL count per request; slow requests are
+# logged with their slowest statements. See backend/logger/request_timing.py.
+if REQUEST_TIMING_ENABLED:
+    instrument_sqlalchemy_engine(engine)
+    app.add_middleware(RequestTimingMiddleware)
+
+# ── Officer badge counter cache: event writes adjust counts after commit ───────
+install_badge_tracking(SessionLocal)
+
 # ── Routers ───────────────────────────────────────────────────────────────────
 app.include_router(auth_router.router,       prefix="/api/v1", tags=["Auth"])
 app.include_router(tickets.router,          prefix="/api/v1", tags=["Tickets"])
@@ -104,6 +125,13 @@ def health():
     return {"status": "ok", "service": "grm-ticketing", "version": "1.0.0"}
 
 
+@app.get("/metrics", tags=["Health"])
+def metrics():
+    """GRM Celery task metrics in Prometheus text format."""
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+
 # ── Dev entrypoint ────────────────────────────────────────────────────────────
 
 if __name__ == "__main__":
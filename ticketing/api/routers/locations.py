@@ -479,6 +479,14 @@ class ImportResult(BaseModel):
     locations_upserted: int
     translations_upserted: int
     dry_run: bool
+    method: str | None = None
+    # Diff counts (COPY path only): rows that were new / changed / already identical
+    locations_inserted: int | None = None
+    locations_updated: int | None = None
+    locations_unchanged: int | None = None
+    translations_inserted: int | None = None
+    translations_updated: int | None = None
+    translations_unchanged: int | None = None
 
 
 @router.post(
@@ -496,6 +504,7 @@ async def import_locations(
     dry_run: bool = Form(False, description="Parse only — do not write to DB"),
     # CSV-specific column mapping (optional overrides)
     lang_prefix: str = Form("name_", description="CSV language column prefix (default: name_)"),
+    method: str = Form("auto", description="Write path: 'copy' (staging table + set-based merge), 'rows' (batched upsert), or 'auto'"),
     db: Session = Depends(get_db),
     _admin: CurrentUser = Depends(require_admin),
 ):
@@ -517,6 +526,9 @@ async def import_locations(
     Download the template from `GET /locations/import/template.json`.
 
     Both formats are **idempotent** (ON CONFLICT DO UPDATE).
+    On PostgreSQL the rows are COPYed into a staging table, parent links are
+    validated in SQL (422 listing the offending codes), and each table is merged
+    with one set-based upsert; the response then carries inserted/updated/unchanged counts.
     Only `super_admin` may use this endpoint.
     """
     # Validate country exists
@@ -540,7 +552,11 @@ async def import_locations(
             stripped = raw_bytes.lstrip()
             fmt = "json" if stripped.startswith(b"[") or stripped.startswith(b"{") else "csv"
 
-    from ticketing.seed.location_import_core import parse_csv, parse_json, upsert_locations
+    from ticketing.seed.location_import_core import LocationImportError, parse_csv, parse_json
+    from ticketing.seed.location_import_core import import_locations as write_locations
+
+    if method not in ("auto", "copy", "rows"):
+        raise HTTPException(status_code=422, detail=f"Unknown method '{method}' (expected auto, copy or rows)")
 
     try:
         if fmt == "json":
@@ -572,8 +588,11 @@ async def import_locations(
         )
 
     try:
-        counts = upsert_locations(location_rows, trans_rows, db)
+        counts = write_locations(location_rows, trans_rows, db, method=method)
         db.commit()
+    except LocationImportError as exc:
+        db.rollback()
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
     except Exception as exc:
         db.rollback()
         raise HTTPException(status_code=500, detail=f"DB write failed: {exc}") from exc
@@ -584,6 +603,8 @@ async def import_locations(
         locations_upserted=counts["locations"],
         translations_upserted=counts["translations"],
         dry_run=False,
+        method="copy" if "locations_inserted" in counts else "rows",
+        **{k: v for k, v in counts.items() if k not in ("locations", "translations")},
     )
 
 
@@ -2,18 +2,58 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import Response
+from typing import Any, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import FileResponse, Response
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from ticketing.models.base import get_db
 from ticketing.models.ticket_resolved_summary import TicketResolvedSummary
-from ticketing.services.closure_pdf import build_closure_pdf
+from ticketing.services.closure_pdf import closure_pdf_key, get_or_render_closure_pdf
 
 router = APIRouter()
 
 
+def closure_pdf_etag(key: str) -> str:
+    return f'"{key[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """RFC 9110 weak comparison of an If-None-Match header against ``etag``."""
+    if not if_none_match:
+        return False
+    candidates = [c.strip() for c in if_none_match.split(",")]
+    return "*" in candidates or etag in (c.removeprefix("W/") for c in candidates)
+
+
+def closure_pdf_response(
+    public_json: dict[str, Any],
+    grievance_id: str,
+    if_none_match: Optional[str] = None,
+) -> Response:
+    """
+    Cached closure PDF as an attachment with a strong ETag; 304 when the client already
+    has it. Revalidation only needs the summary row, never a render or file read.
+    Also serves the officer route GET /tickets/{ticket_id}/closure.pdf.
+    """
+    etag = closure_pdf_etag(closure_pdf_key(public_json, grievance_id))
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    try:
+        path, _ = get_or_render_closure_pdf(public_json, grievance_id)
+    except Exception as exc:
+        raise HTTPException(status_code=503, detail=f"PDF generation failed: {exc}") from exc
+    return FileResponse(
+        path,
+        media_type="application/pdf",
+        filename=f"GRM-closure-{grievance_id}.pdf",
+        headers=headers,
+    )
+
+
 @router.get("/public/closure/{token}")
 def get_public_closure(token: str, db: Session = Depends(get_db)) -> dict:
     row = db.execute(
@@ -35,7 +75,11 @@ def get_public_closure(token: str, db: Session = Depends(get_db)) -> dict:
 
 
 @router.get("/public/closure/{token}/pdf")
-def get_public_closure_pdf(token: str, db: Session = Depends(get_db)) -> Response:
+def get_public_closure_pdf(
+    token: str,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+) -> Response:
     row = db.execute(
         select(TicketResolvedSummary).where(
             TicketResolvedSummary.closure_public_token == token
@@ -48,13 +92,4 @@ def get_public_closure_pdf(token: str, db: Session = Depends(get_db)) -> Respons
             status_code=503,
             detail="PDF not available until summary generation completes",
         )
-    try:
-        pdf_bytes = build_closure_pdf(row.summary_public_json, row.grievance_id)
-    except Exception as exc:
-        raise HTTPException(status_code=503, detail=f"PDF generation failed: {exc}") from exc
-    filename = f"GRM-closure-{row.grievance_id}.pdf"
-    return Response(
-        content=pdf_bytes,
-        media_type="application/pdf",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-    )
+    return closure_pdf_response(row.summary_public_json, row.grievance_id, if_none_match)
@@ -26,7 +26,7 @@ import os
 import shutil
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile, status
+from fastapi import APIRouter, Depends, File, Form, Header, HTTPException, Query, UploadFile, status
 from fastapi.responses import FileResponse
 from sqlalchemy import and_, func, or_, select, text
 from sqlalchemy.orm import Session, joinedload
@@ -72,6 +72,7 @@ from ticketing.constants.resolution import (
 )
 from ticketing.clients.orchestrator import send_message_to_complainant
 from ticketing.models.ticket_overdue_episode import TicketOverdueEpisode
+from ticketing.services.badge_counts import record_badge_delta
 from ticketing.services.overdue_episodes import close_open_episode, overdue_days_display
 from ticketing.services.ticket_intake import (
     DuplicateTicketError,
@@ -322,12 +323,52 @@ def _resolve_attachment_path(stored_path: str | None) -> str | None:
     return None
 
 
+# Image renditions written by the chatbot file worker next to the stored image as
+# <base>.<name>.<format> (backend/services/image_compression.py RENDITIONS); the stored
+# image is the "display" size. Large uploads are stored as JPEG; small ones keep their
+# format (PNG, WebP, ...) but still get renditions. Files are immutable per file_id, so
+# responses cache long.
+_RENDITION_SIZES = ("thumb", "display")
+_RENDITION_SOURCE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp", ".heic", ".heif")
+_ATTACHMENT_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+
+def _select_rendition(file_path: str, size: str, accept: str | None) -> str:
+    """Smallest existing rendition of at least `size` the client accepts; else the stored file."""
+    if size not in _RENDITION_SIZES or not file_path.lower().endswith(_RENDITION_SOURCE_EXTENSIONS):
+        return file_path
+    formats = ("webp", "jpg") if "image/webp" in (accept or "") else ("jpg",)
+    base, _ = os.path.splitext(file_path)
+    for name in _RENDITION_SIZES[_RENDITION_SIZES.index(size):]:
+        candidates = [f"{base}.{name}.{fmt}" for fmt in formats]
+        if name == "display":
+            candidates.append(file_path)
+        existing = [c for c in candidates if os.path.isfile(c)]
+        if existing:
+            return min(existing, key=os.path.getsize)
+    return file_path
+
+
+def _attachment_response(file_path: str, file_name: str, size: str, accept: str | None) -> FileResponse:
+    served = _select_rendition(file_path, size, accept)
+    if served != file_path:
+        file_name = os.path.splitext(file_name)[0] + os.path.splitext(served)[1]
+    return FileResponse(
+        path=served,
+        filename=file_name,
+        media_type=_media_type_for_path(served),
+        headers={"Cache-Control": _ATTACHMENT_CACHE_CONTROL, "Vary": "Accept"},
+    )
+
+
 def _media_type_for_path(file_path: str) -> str:
     lower = file_path.lower()
     if lower.endswith((".jpg", ".jpeg")):
         return "image/jpeg"
     if lower.endswith(".png"):
         return "image/png"
+    if lower.endswith(".webp"):
+        return "image/webp"
     if lower.endswith(".pdf"):
         return "application/pdf"
     if lower.endswith((".m4a", ".mp4")):
@@ -1759,7 +1800,7 @@ def mark_events_seen(
     if not ticket or ticket.is_deleted:
         raise HTTPException(status_code=404, detail="Ticket not found")
 
-    db.execute(
+    result = db.execute(
         TicketEvent.__table__.update()
         .where(
             TicketEvent.ticket_id == ticket_id,
@@ -1768,6 +1809,8 @@ def mark_events_seen(
         )
         .values(seen=True)
     )
+    # Core UPDATE bypasses the ORM flush hooks — hand the badge delta over explicitly
+    record_badge_delta(db, current_user.user_id, -result.rowcount)
     db.commit()
 
 
@@ -1952,11 +1995,15 @@ def list_ticket_files(
 )
 def download_file(
     file_id: str,
+    size: str = Query("original", pattern="^(original|display|thumb)$"),
+    accept: Optional[str] = Header(None),
     db: Session = Depends(get_db),
     current_user: CurrentUser = Depends(get_authenticated_user),
 ) -> FileResponse:
     """
     Streams a file from disk using the path stored in public.file_attachments.
+
+    `size=display|thumb` serves the smallest matching image rendition (WebP when accepted).
     """
     row = db.execute(
         text(
@@ -1980,8 +2027,7 @@ def download_file(
     if not file_path:
         raise HTTPException(status_code=404, detail="File not on disk")
 
-    media_type = _media_type_for_path(file_path)
-    return FileResponse(path=file_path, filename=row["file_name"], media_type=media_type)
+    return _attachment_response(file_path, row["file_name"], size, accept)
 
 
 # ─── POST /tickets/{ticket_id}/attachments — officer file upload ──────────────
@@ -2117,6 +2163,8 @@ def list_officer_attachments(
 )
 def download_officer_attachment(
     file_id: str,
+    size: str = Query("original", pattern="^(original|display|thumb)$"),
+    accept: Optional[str] = Header(None),
     db: Session = Depends(get_db),
     _: CurrentUser = Depends(get_authenticated_user),
 ) -> FileResponse:
@@ -2126,8 +2174,7 @@ def download_officer_attachment(
     if not os.path.isfile(tf.file_path):
         raise HTTPException(status_code=404, detail="File not on disk")
 
-    media_type = _media_type_for_path(tf.file_path)
-    return FileResponse(path=tf.file_path, filename=tf.file_name, media_type=media_type)
+    return _attachment_response(tf.file_path, tf.file_name, size, accept)
 
 
 # ─── GET /tickets/{ticket_id}/pii — broker complainant PII from backend ──────────
@@ -2250,6 +2297,32 @@ def get_resolved_summary(
     }
 
 
+@router.get("/tickets/{ticket_id}/closure.pdf")
+def get_closure_pdf(
+    ticket_id: str,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+    current_user: CurrentUser = Depends(get_authenticated_user),
+):
+    """Public closure PDF (same document the complainant downloads), served from the PDF cache."""
+    ticket = db.get(Ticket, ticket_id)
+    if not ticket or ticket.is_deleted:
+        raise HTTPException(status_code=404, detail="Ticket not found")
+    if ticket.is_seah and not current_user.can_see_seah:
+        raise HTTPException(status_code=403, detail="Access denied")
+    row = db.get(TicketResolvedSummary, ticket_id)
+    if not row or not row.summary_public_json:
+        raise HTTPException(status_code=404, detail="Resolved summary not found")
+    if row.generation_status != "complete":
+        raise HTTPException(
+            status_code=503,
+            detail="PDF not available until summary generation completes",
+        )
+    from ticketing.api.routers.public_closure import closure_pdf_response
+
+    return closure_pdf_response(row.summary_public_json, row.grievance_id, if_none_match)
+
+
 @router.post(
     "/tickets/{ticket_id}/resolved-summary",
     status_code=status.HTTP_202_ACCEPTED,
@@ -8,7 +8,8 @@ from collections import defaultdict
 from datetime import datetime, timezone
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
@@ -34,6 +35,7 @@ from ticketing.api.schemas.user import (
     UserRoleCreate,
     UserRoleResponse,
 )
+from ticketing.config.settings import get_settings
 from ticketing.constants.role_archetypes import (
     list_archetypes,
     permissions_for_archetype,
@@ -1451,16 +1453,56 @@ def get_badge(
     db: Session = Depends(get_db),
     current_user: CurrentUser = Depends(get_current_user),
 ) -> NotificationBadgeResponse:
-    from sqlalchemy import func
-    count = db.execute(
-        select(func.count(TicketEvent.event_id)).where(
-            TicketEvent.assigned_to_user_id == current_user.user_id,
-            TicketEvent.seen.is_(False),
-        )
-    ).scalar_one()
+    from ticketing.services.badge_counts import count_unseen_events, get_badge_counter
+
+    count = get_badge_counter().get(
+        current_user.user_id, lambda: count_unseen_events(db, current_user.user_id)
+    )
     return NotificationBadgeResponse(unseen_count=count)
 
 
+@router.get(
+    "/users/me/badge/stream",
+    response_class=StreamingResponse,
+    summary="Server-sent events: unread notification count for the current officer",
+)
+async def stream_badge(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: CurrentUser = Depends(get_current_user),
+) -> StreamingResponse:
+    """
+    `text/event-stream` replacement for polling GET /users/me/badge.
+
+    Sends `event: badge` with `{"unseen_count": n}` on connect and after every
+    change (new assignment/notification events, tickets marked seen), plus a
+    keepalive comment every BADGE_SSE_KEEPALIVE_SECONDS. Counts come from the
+    Redis counter cache (services/badge_counts.py), not a per-client recount.
+    """
+    from ticketing.services.badge_counts import (
+        badge_event_stream,
+        get_badge_counter,
+        recount_with_own_session,
+    )
+
+    # Auth is done; don't hold a pooled connection for the life of the stream.
+    db.close()
+    user_id = current_user.user_id
+    counter = get_badge_counter()
+    counter.start_listener()
+    return StreamingResponse(
+        badge_event_stream(
+            user_id,
+            counter=counter,
+            load=lambda: recount_with_own_session(user_id),
+            is_disconnected=request.is_disconnected,
+            keepalive_seconds=get_settings().badge_sse_keepalive_seconds,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get(
     "/users/me/notifications",
     response_model=NotificationsResponse,
@@ -4,6 +4,7 @@ HTTP client for the Backend Messaging API.
 Used for:
   1. SMS fallback to complainant when chatbot session has expired.
   2. Quarterly report delivery by email to senior roles.
+  3. Bulk fan-out (send_batch): queued in the backend outbox, delivered in the background.
 
 Base URL: settings.backend_grievance_base_url
 Auth:     x-api-key: TICKETING_SECRET_KEY (or MESSAGING_API_KEY fallback)
@@ -11,10 +12,15 @@ Auth:     x-api-key: TICKETING_SECRET_KEY (or MESSAGING_API_KEY fallback)
 INTEGRATION POINT: backend/api/routers/messaging.py
   POST /api/messaging/send-sms   — DOIT gateway (Nepal) or AWS SNS fallback
   POST /api/messaging/send-email — SMTP mailbox relay
+  POST /api/messaging/send-batch — queue many SMS/emails (202, retried by the backend)
+
+One keep-alive httpx client per process is reused across calls.
 """
 from __future__ import annotations
 
 import logging
+import os
+import threading
 
 import httpx
 
@@ -23,18 +29,29 @@ from ticketing.config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+_shared: httpx.Client | None = None
+_shared_pid: int | None = None
+_shared_lock = threading.Lock()
+
 
 def _client() -> httpx.Client:
-    settings = get_settings()
-    headers: dict[str, str] = {}
-    api_key = service_integration_api_key()
-    if api_key:
-        headers["x-api-key"] = api_key
-    return httpx.Client(
-        base_url=settings.backend_grievance_base_url,
-        headers=headers,
-        timeout=15.0,
-    )
+    """Process-wide client (recreated after fork — Celery prefork workers)."""
+    global _shared, _shared_pid
+    if _shared is None or _shared_pid != os.getpid():
+        with _shared_lock:
+            if _shared is None or _shared_pid != os.getpid():
+                settings = get_settings()
+                headers: dict[str, str] = {}
+                api_key = service_integration_api_key()
+                if api_key:
+                    headers["x-api-key"] = api_key
+                _shared = httpx.Client(
+                    base_url=settings.backend_grievance_base_url,
+                    headers=headers,
+                    timeout=15.0,
+                )
+                _shared_pid = os.getpid()
+    return _shared
 
 
 def send_sms(phone_number: str, body: str, template_id: str | None = None) -> dict:
@@ -48,15 +65,14 @@ def send_sms(phone_number: str, body: str, template_id: str | None = None) -> di
     if template_id:
         payload.setdefault("context", {})["template_id"] = template_id
 
-    with _client() as client:
-        try:
-            resp = client.post("/api/messaging/send-sms", json=payload)
-            resp.raise_for_status()
-            logger.info("SMS sent to %s", phone_number[:7] + "***")
-            return resp.json()
-        except httpx.HTTPError as exc:
-            logger.error("SMS delivery failed: %s", exc)
-            raise
+    try:
+        resp = _client().post("/api/messaging/send-sms", json=payload)
+        resp.raise_for_status()
+        logger.info("SMS sent to %s", phone_number[:7] + "***")
+        return resp.json()
+    except httpx.HTTPError as exc:
+        logger.error("SMS delivery failed: %s", exc)
+        raise
 
 
 def send_email(
@@ -78,12 +94,50 @@ def send_email(
     if attachments:
         payload.setdefault("context", {})["attachments"] = attachments
 
-    with _client() as client:
-        try:
-            resp = client.post("/api/messaging/send-email", json=payload)
-            resp.raise_for_status()
-            logger.info("Email sent to %s", to)
-            return resp.json()
-        except httpx.HTTPError as exc:
-            logger.error("Email delivery failed: %s", exc)
-            raise
+    try:
+        resp = _client().post("/api/messaging/send-email", json=payload)
+        resp.raise_for_status()
+        logger.info("Email sent to %s", to)
+        return resp.json()
+    except httpx.HTTPError as exc:
+        logger.error("Email delivery failed: %s", exc)
+        raise
+
+
+def send_batch(
+    sms: list[tuple[str, str]] | None = None,
+    emails: list[dict] | None = None,
+) -> dict:
+    """
+    Queue many messages in one request; returns {"status": "QUEUED", "message_ids": [...]}.
+
+    ``sms`` is (phone_number, body) pairs; ``emails`` are dicts with to, subject, body and
+    optional attachments (same shape as send_email). Acceptance only — the backend outbox
+    delivers and retries in the background, so use send_sms / send_email when the caller
+    must record the delivery outcome.
+    """
+    payload: dict = {
+        "sms": [{"to": phone, "text": body} for phone, body in (sms or [])],
+        "email": [],
+    }
+    for item in emails or []:
+        to = item["to"]
+        entry: dict = {
+            "to": [to] if isinstance(to, str) else to,
+            "subject": item["subject"],
+            "html_body": item["body"],
+        }
+        if item.get("attachments"):
+            entry["context"] = {"attachments": item["attachments"]}
+        payload["email"].append(entry)
+
+    try:
+        resp = _client().post("/api/messaging/send-batch", json=payload, timeout=60.0)
+        resp.raise_for_status()
+        data = resp.json()
+        logger.info("Queued %d messages (sms=%d email=%d)", data.get("queued", 0),
+                    len(payload["sms"]), len(payload["email"]))
+        return data
+    except httpx.HTTPError as exc:
+        logger.error("Batch enqueue failed: %s", exc)
+        raise
@@ -68,6 +68,23 @@ class TicketingSettings(BaseSettings):
 
     # ── Archiving (docs/ARCHIVING_AND_RETENTION.md §7) ──
     archiving_dry_run: bool = False
+    archiving_chunk_size: int = 500      # tickets per archive transaction
+    archiving_workers: int = 4           # chunks archived in parallel
+    # ticket_events monthly partitions (§5.4): months created ahead; detach months older
+    # than N (0 = keep everything attached); drop instead of moving to ticketing_archive
+    ticket_events_partition_months_ahead: int = 3
+    ticket_events_detach_after_months: int = 0
+    ticket_events_detach_drop: bool = False
+
+    # ── Officer badge counts (SSE push; ticketing/services/badge_counts.py) ──
+    badge_redis_url: str = ""            # empty → db 0 of the broker's Redis; memory:// = in-process only
+    badge_cache_ttl_seconds: int = 3600  # cached counts are recounted from the DB at least this often
+    badge_sse_keepalive_seconds: int = 15
+
+    # ── Closure PDF cache (ticketing/services/closure_pdf.py) ──
+    closure_pdf_cache_dir: str = ""      # empty → {UPLOAD_FOLDER}/ticketing/closure_pdf; API and worker must share it
+    closure_pdf_cache_max_age_days: int = 90   # evict PDFs not downloaded for this long (0 = no age cap)
+    closure_pdf_cache_max_mb: int = 1024       # then evict least recently used above this size (0 = no cap)
 
     # ── Grievance sync: wait before backfill CREATE (seconds; webhook is primary path) ──
     ticketing_sync_backfill_grace_seconds: int = 180
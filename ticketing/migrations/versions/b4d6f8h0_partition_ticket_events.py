@@ -0,0 +1,127 @@
+# Safe to run: only creates/modifies ticketing.* tables
+# Does NOT touch: grievances, complainants, or any existing public.* table
+"""partition ticketing.ticket_events by month (RANGE on created_at)
+
+Rebuilds ticket_events as a partitioned table: one partition per UTC month from the
+oldest event through three months ahead, plus ticket_events_default. Rows are copied
+from the old table in one INSERT … SELECT (routed to partitions by PostgreSQL), then the
+old table is dropped. Runs in the migration transaction — take a maintenance window
+sized to the table.
+
+The primary key becomes (event_id, created_at): a partitioned table's unique keys must
+include the partition column. event_id stays a UUID and the ORM identity is unchanged.
+
+Later months are created by ticketing.tasks.archiving.maintain_ticket_event_partitions
+(ticketing/services/event_partitions.py).
+
+Revision ID: b4d6f8h0
+Revises: g0h2i4j6
+Create Date: 2026-10-18
+"""
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "b4d6f8h0"
+down_revision: Union[str, None] = "g0h2i4j6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+
+# (name, columns) — same set as before, now declared on the partitioned parent
+_INDEXES = (
+    ("idx_ticket_events_ticket_id", ["ticket_id", "created_at"]),
+    ("idx_ticket_events_event_type", ["event_type"]),
+    ("idx_ticket_events_assigned_seen", ["assigned_to_user_id", "seen"]),
+    ("idx_ticket_events_regen", ["summary_regen_required", "created_at"]),
+)
+
+
+def _relkind() -> str | None:
+    return op.get_bind().execute(sa.text("""
+        SELECT c.relkind FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = 'ticketing' AND c.relname = 'ticket_events'
+    """)).scalar()
+
+
+def _add_months(month: date, n: int) -> date:
+    index = month.year * 12 + (month.month - 1) + n
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _utc(month: date) -> str:
+    return datetime(month.year, month.month, 1, tzinfo=timezone.utc).isoformat()
+
+
+def _swap_aside(suffix: str) -> None:
+    """Rename the current table, its PK and indexes so the replacement can reuse the names."""
+    op.execute(f"ALTER TABLE ticketing.ticket_events RENAME TO ticket_events_{suffix}")
+    op.execute(
+        f"ALTER TABLE ticketing.ticket_events_{suffix} "
+        f"RENAME CONSTRAINT ticket_events_pkey TO ticket_events_{suffix}_pkey"
+    )
+    for name, _ in _INDEXES:
+        op.execute(f"ALTER INDEX IF EXISTS ticketing.{name} RENAME TO {name}_{suffix}")
+
+
+def _add_keys_and_indexes(pk_columns: str) -> None:
+    op.execute(f"ALTER TABLE ticketing.ticket_events ADD CONSTRAINT ticket_events_pkey PRIMARY KEY ({pk_columns})")
+    op.execute(
+        "ALTER TABLE ticketing.ticket_events ADD CONSTRAINT ticket_events_ticket_id_fkey "
+        "FOREIGN KEY (ticket_id) REFERENCES ticketing.tickets (ticket_id) ON DELETE CASCADE"
+    )
+    for name, columns in _INDEXES:
+        op.create_index(name, "ticket_events", columns, schema="ticketing")
+
+
+def upgrade() -> None:
+    if _relkind() == "p":
+        return
+
+    _swap_aside("unpartitioned")
+    op.execute(
+        "CREATE TABLE ticketing.ticket_events "
+        "(LIKE ticketing.ticket_events_unpartitioned INCLUDING DEFAULTS) "
+        "PARTITION BY RANGE (created_at)"
+    )
+    _add_keys_and_indexes("event_id, created_at")
+
+    oldest = op.get_bind().execute(sa.text(
+        "SELECT (min(created_at) AT TIME ZONE 'UTC')::date FROM ticketing.ticket_events_unpartitioned"
+    )).scalar()
+    today = datetime.now(timezone.utc).date()
+    month = date((oldest or today).year, (oldest or today).month, 1)
+    last = _add_months(date(today.year, today.month, 1), MONTHS_AHEAD)
+    while month <= last:
+        nxt = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE ticketing.ticket_events_y{month.year:04d}m{month.month:02d} "
+            f"PARTITION OF ticketing.ticket_events FOR VALUES FROM ('{_utc(month)}') TO ('{_utc(nxt)}')"
+        )
+        month = nxt
+    op.execute("CREATE TABLE ticketing.ticket_events_default PARTITION OF ticketing.ticket_events DEFAULT")
+
+    op.execute("INSERT INTO ticketing.ticket_events SELECT * FROM ticketing.ticket_events_unpartitioned")
+    op.execute("DROP TABLE ticketing.ticket_events_unpartitioned")
+    op.execute("ANALYZE ticketing.ticket_events")
+
+
+def downgrade() -> None:
+    if _relkind() != "p":
+        return
+
+    _swap_aside("partitioned")
+    op.execute(
+        "CREATE TABLE ticketing.ticket_events "
+        "(LIKE ticketing.ticket_events_partitioned INCLUDING DEFAULTS)"
+    )
+    _add_keys_and_indexes("event_id")
+    op.execute("INSERT INTO ticketing.ticket_events SELECT * FROM ticketing.ticket_events_partitioned")
+    # Drops every attached partition with it; detached months in ticketing_archive are left alone.
+    op.execute("DROP TABLE ticketing.ticket_events_partitioned CASCADE")
@@ -148,15 +148,23 @@ class Ticket(Base):
 
 
 class TicketEvent(Base):
-    """Immutable append-only log. Powers audit trail, case timeline, and notification badge."""
+    """
+    Immutable append-only log. Powers audit trail, case timeline, and notification badge.
+
+    Partitioned by month on created_at (migration b4d6f8h0, services/event_partitions.py).
+    The table's primary key is (event_id, created_at), as PostgreSQL requires the partition
+    column in it; the ORM identity stays event_id (mapper primary_key), so
+    db.get(TicketEvent, event_id) keeps working.
+    """
 
     __tablename__ = "ticket_events"
     __table_args__ = (
         Index("idx_ticket_events_ticket_id", "ticket_id", "created_at"),
         Index("idx_ticket_events_event_type", "event_type"),
         Index("idx_ticket_events_assigned_seen", "assigned_to_user_id", "seen"),
-        {"schema": "ticketing"},
+        {"schema": "ticketing", "postgresql_partition_by": "RANGE (created_at)"},
     )
+    __mapper_args__ = {"primary_key": ["event_id"]}
 
     event_id: Mapped[str] = mapped_column(String(36), primary_key=True, default=_uuid)
     ticket_id: Mapped[str] = mapped_column(
@@ -172,10 +180,14 @@ class TicketEvent(Base):
     workflow_step_id: Mapped[str | None] = mapped_column(String(36), nullable=True)
     note: Mapped[str | None] = mapped_column(Text, nullable=True)
     payload: Mapped[dict | None] = mapped_column(JSON, nullable=True)
-    # Notification badge: seen=False counts toward officer's unread badge
-    seen: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
-    assigned_to_user_id: Mapped[str | None] = mapped_column(String(128), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=_now)
+    # Notification badge: seen=False counts toward officer's unread badge.
+    # active_history keeps the previous value on change so services/badge_counts.py
+    # can move the cached count even when the instance was expired by a commit.
+    seen: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False, active_history=True)
+    assigned_to_user_id: Mapped[str | None] = mapped_column(String(128), nullable=True, active_history=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), primary_key=True, nullable=False, default=_now
+    )
     created_by_user_id: Mapped[str | None] = mapped_column(String(128), nullable=True)
 
     # ── SEAH privacy handoff fields (seah-privacy-worktree-handoff.md) ──────────
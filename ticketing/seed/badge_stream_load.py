@@ -0,0 +1,251 @@
+"""
+Drive many concurrent officer badge SSE subscribers and measure push latency.
+
+Modes:
+  in-process (default)  N subscribers run badge_event_stream against an in-memory
+                        BadgeCounter; a driver applies random unseen-event deltas the
+                        way the session hooks do after commit. Measures hub fan-out
+                        and stream overhead without a server, DB or Redis.
+  --url URL             N subscribers open GET {URL}/api/v1/users/me/badge/stream
+                        (dev auth: x-internal-user-id / x-api-key headers) against a
+                        running ticketing API; the driver applies deltas through the
+                        shared Redis counter (BADGE_REDIS_URL or the broker's db 0),
+                        so updates travel Redis pub/sub → API listener → SSE.
+
+Reports connect time, delivery latency (p50/p95/max from apply to receipt) and whether
+every subscriber's last received count equals the final cached count.
+
+Run:
+  python -m ticketing.seed.badge_stream_load --subscribers 2000 --officers 500 --updates 5000
+  python -m ticketing.seed.badge_stream_load --url http://localhost:5002 --subscribers 300 --officers 100
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import time
+from typing import AsyncIterator, Optional
+
+from ticketing.seed.synthetic_benchmark import summarize
+from ticketing.services.badge_counts import BadgeCounter, badge_event_stream, get_badge_counter
+
+logger = logging.getLogger(__name__)
+
+OFFICER_PREFIX = "load-officer-"
+
+
+class DeliveryLog:
+    """Send time per (officer, count) and receive samples per subscriber."""
+
+    def __init__(self) -> None:
+        self.sent: dict[tuple[str, int], float] = {}
+        self.latencies: list[float] = []
+        self.last_seen: dict[int, int] = {}
+        self.connect: list[float] = []
+        self.events = 0
+
+    def received(self, subscriber: int, user_id: str, count: int) -> None:
+        now = time.perf_counter()
+        self.events += 1
+        self.last_seen[subscriber] = count
+        sent_at = self.sent.get((user_id, count))
+        if sent_at is not None:
+            self.latencies.append(now - sent_at)
+
+
+async def _parse_events(chunks: AsyncIterator[str]) -> AsyncIterator[int]:
+    """unseen_count from each ``data:`` line of an SSE body."""
+    buffer = ""
+    async for chunk in chunks:
+        buffer += chunk
+        while "\n\n" in buffer:
+            block, buffer = buffer.split("\n\n", 1)
+            for line in block.splitlines():
+                if line.startswith("data:"):
+                    yield json.loads(line[5:])["unseen_count"]
+
+
+async def _drive(
+    counter: BadgeCounter,
+    officers: list[str],
+    log: DeliveryLog,
+    *,
+    updates: int,
+    rate: float,
+    seed: int,
+) -> None:
+    """Random +1 (new event) / -n (marked seen) deltas, applied like _after_commit."""
+    rng = random.Random(seed)
+    interval = 1.0 / rate if rate > 0 else 0.0
+    for i in range(updates):
+        user_id = rng.choice(officers)
+        current = counter.peek(user_id) or 0
+        delta = 1 if current == 0 or rng.random() < 0.7 else -rng.randint(1, current)
+        log.sent[(user_id, current + delta)] = time.perf_counter()
+        await asyncio.to_thread(counter.apply, {user_id: delta})
+        if interval:
+            await asyncio.sleep(interval)
+        elif i % 100 == 0:
+            await asyncio.sleep(0)
+
+
+async def run_in_process(
+    *,
+    subscribers: int,
+    officers: int,
+    updates: int,
+    rate: float,
+    seed: int = 7,
+    settle_seconds: float = 1.0,
+) -> dict:
+    counter = BadgeCounter(None)
+    officer_ids = [f"{OFFICER_PREFIX}{i:05d}" for i in range(officers)]
+    for user_id in officer_ids:
+        counter.get(user_id, lambda: 0)
+    log = DeliveryLog()
+    streams: list[asyncio.Task] = []
+
+    async def subscriber(n: int, user_id: str, ready: asyncio.Event) -> None:
+        started = time.perf_counter()
+        stream = badge_event_stream(
+            user_id, counter=counter, load=lambda: counter.peek(user_id) or 0, keepalive_seconds=30
+        )
+        first = True
+        async for count in _parse_events(stream):
+            if first:
+                log.connect.append(time.perf_counter() - started)
+                ready.set()
+                first = False
+            log.received(n, user_id, count)
+
+    readies = []
+    for n in range(subscribers):
+        ready = asyncio.Event()
+        readies.append(ready)
+        streams.append(asyncio.create_task(subscriber(n, officer_ids[n % officers], ready)))
+    await asyncio.gather(*(r.wait() for r in readies))
+
+    started = time.perf_counter()
+    await _drive(counter, officer_ids, log, updates=updates, rate=rate, seed=seed)
+    drive_seconds = time.perf_counter() - started
+    await asyncio.sleep(settle_seconds)
+    for task in streams:
+        task.cancel()
+    await asyncio.gather(*streams, return_exceptions=True)
+
+    return _report(log, counter, officer_ids, subscribers, updates, drive_seconds)
+
+
+async def run_http(
+    url: str,
+    *,
+    subscribers: int,
+    officers: int,
+    updates: int,
+    rate: float,
+    api_key: str = "",
+    seed: int = 7,
+    settle_seconds: float = 2.0,
+    counter: Optional[BadgeCounter] = None,
+) -> dict:
+    import httpx
+
+    counter = counter or get_badge_counter()
+    officer_ids = [f"{OFFICER_PREFIX}{i:05d}" for i in range(officers)]
+    log = DeliveryLog()
+    limits = httpx.Limits(max_connections=subscribers + 10, max_keepalive_connections=0)
+
+    async with httpx.AsyncClient(base_url=url, timeout=None, limits=limits) as client:
+
+        async def subscriber(n: int, user_id: str, ready: asyncio.Event) -> None:
+            headers = {"x-internal-user-id": user_id, "x-internal-role": "site_safeguards_focal_person"}
+            if api_key:
+                headers["x-api-key"] = api_key
+            started = time.perf_counter()
+            async with client.stream("GET", "/api/v1/users/me/badge/stream", headers=headers) as response:
+                response.raise_for_status()
+                first = True
+                async for count in _parse_events(response.aiter_text()):
+                    if first:
+                        log.connect.append(time.perf_counter() - started)
+                        ready.set()
+                        first = False
+                    log.received(n, user_id, count)
+
+        readies = [asyncio.Event() for _ in range(subscribers)]
+        streams = [
+            asyncio.create_task(subscriber(n, officer_ids[n % officers], readies[n]))
+            for n in range(subscribers)
+        ]
+        await asyncio.gather(*(r.wait() for r in readies))
+
+        started = time.perf_counter()
+        await _drive(counter, officer_ids, log, updates=updates, rate=rate, seed=seed)
+        drive_seconds = time.perf_counter() - started
+        await asyncio.sleep(settle_seconds)
+        for task in streams:
+            task.cancel()
+        await asyncio.gather(*streams, return_exceptions=True)
+
+    return _report(log, counter, officer_ids, subscribers, updates, drive_seconds)
+
+
+def _report(
+    log: DeliveryLog,
+    counter: BadgeCounter,
+    officer_ids: list[str],
+    subscribers: int,
+    updates: int,
+    drive_seconds: float,
+) -> dict:
+    final = {u: counter.peek(u) for u in officer_ids}
+    stale = sum(
+        1 for n in range(subscribers)
+        if log.last_seen.get(n) != final[officer_ids[n % len(officer_ids)]]
+    )
+    return {
+        "subscribers": subscribers,
+        "officers": len(officer_ids),
+        "updates": updates,
+        "updates_per_sec": round(updates / drive_seconds, 1) if drive_seconds else None,
+        "events_received": log.events,
+        "connect_ms": summarize(log.connect),
+        "delivery_ms": summarize(log.latencies),
+        "stale_subscribers": stale,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m ticketing.seed.badge_stream_load", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--subscribers", type=int, default=1000)
+    parser.add_argument("--officers", type=int, default=250)
+    parser.add_argument("--updates", type=int, default=2000)
+    parser.add_argument("--rate", type=float, default=0.0, help="updates/sec (0 = as fast as possible)")
+    parser.add_argument("--url", help="ticketing API base URL; omit for the in-process run")
+    parser.add_argument("--api-key", default="", help="x-api-key for internal-header auth (TICKETING_SECRET_KEY)")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--out", help="write results JSON here")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+
+    common = dict(subscribers=args.subscribers, officers=args.officers, updates=args.updates,
+                  rate=args.rate, seed=args.seed)
+    if args.url:
+        result = asyncio.run(run_http(args.url, api_key=args.api_key, **common))
+    else:
+        result = asyncio.run(run_in_process(**common))
+
+    text = json.dumps(result, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as fh:
+            fh.write(text + "\n")
+    return 1 if result["stale_subscribers"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
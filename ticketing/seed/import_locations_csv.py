@@ -12,6 +12,7 @@ Usage (from repo root, with ticketing DB env vars set):
         [--active-col   is_active]
         [--lang-prefix  name_]           # default: auto-detect 'name_*' columns
         [--max-level 3]                  # skip rows with level_number > max (default: no limit)
+        [--method auto]                  # copy = staging table + set-based merge, rows = batched upsert
         [--dry-run]
 
 CSV format example (NP may use legacy NP_* columns; they are rewritten to P1 / P1_* on import):
@@ -36,9 +37,10 @@ from __future__ import annotations
 import argparse
 import logging
 import sys
+import time
 from pathlib import Path
 
-from ticketing.seed.location_import_core import parse_csv, upsert_locations
+from ticketing.seed.location_import_core import import_locations, parse_csv
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
 log = logging.getLogger(__name__)
@@ -57,6 +59,7 @@ def run(
     explicit_langs: dict[str, str],
     max_level: int | None,
     dry_run: bool,
+    method: str = "auto",
 ) -> None:
     log.info("Loading CSV from %s", csv_path)
 
@@ -98,10 +101,16 @@ def run(
                 f"Country '{country}' not found in ticketing.countries. "
                 "Run migration f1a3e9c72b05 first, or insert the country manually."
             )
-        counts = upsert_locations(location_rows, trans_rows, db)
+        started = time.perf_counter()
+        counts = import_locations(location_rows, trans_rows, db, method=method)
         db.commit()
-        log.info("Done — %d locations upserted, %d translations upserted",
-                 counts["locations"], counts["translations"])
+        log.info("Done in %.2fs — %d locations upserted, %d translations upserted",
+                 time.perf_counter() - started, counts["locations"], counts["translations"])
+        if "locations_inserted" in counts:
+            log.info("  locations: %d new, %d changed, %d unchanged; translations: %d new, %d changed, %d unchanged",
+                     counts["locations_inserted"], counts["locations_updated"], counts["locations_unchanged"],
+                     counts["translations_inserted"], counts["translations_updated"],
+                     counts["translations_unchanged"])
     except Exception:
         db.rollback()
         raise
@@ -127,6 +136,8 @@ def main() -> None:
     parser.add_argument("--lang",         action="append", nargs=2, metavar=("CODE", "COLUMN"),
                         help="Explicit language column: --lang en english_name  (repeatable)")
     parser.add_argument("--max-level",    type=int, default=None,         help="Skip rows with level_number > this value")
+    parser.add_argument("--method",       choices=("auto", "copy", "rows"), default="auto",
+                        help="Write path: copy (COPY + set-based merge), rows (batched upsert). Default auto.")
     parser.add_argument("--dry-run",      action="store_true",            help="Preview without writing to DB")
     args = parser.parse_args()
 
@@ -148,6 +159,7 @@ def main() -> None:
         explicit_langs=explicit_langs,
         max_level=args.max_level,
         dry_run=args.dry_run,
+        method=args.method,
     )
 
 
@@ -7,6 +7,7 @@ Usage (from repo root, with ticketing DB env vars set):
         --en  backend/dev-resources/location_dataset/en_cleaned.json \\
         --ne  backend/dev-resources/location_dataset/ne_cleaned.json \\
         [--max-level 3]   # default 3: Province/District/Municipality (skip Wards)
+        [--method auto]   # copy = staging table + set-based merge, rows = batched upsert
         [--dry-run]
 
 Idempotent: uses ON CONFLICT DO UPDATE so safe to re-run.
@@ -27,9 +28,10 @@ import argparse
 import json
 import logging
 import sys
+import time
 from pathlib import Path
 
-from ticketing.seed.location_import_core import parse_json, upsert_locations
+from ticketing.seed.location_import_core import import_locations, parse_json
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
 log = logging.getLogger(__name__)
@@ -46,6 +48,7 @@ def run(
     extra_langs: dict[str, str],  # lang_code → file path
     max_level: int,
     dry_run: bool,
+    method: str = "auto",
 ) -> None:
     log.info("Loading EN data from %s", en_path)
     en_data = load_json(en_path)
@@ -78,10 +81,16 @@ def run(
                 f"Country '{country}' not found in ticketing.countries. "
                 "Run migration f1a3e9c72b05 first, or insert the country manually."
             )
-        counts = upsert_locations(location_rows, trans_rows, db)
+        started = time.perf_counter()
+        counts = import_locations(location_rows, trans_rows, db, method=method)
         db.commit()
-        log.info("Done — %d locations upserted, %d translations upserted",
-                 counts["locations"], counts["translations"])
+        log.info("Done in %.2fs — %d locations upserted, %d translations upserted",
+                 time.perf_counter() - started, counts["locations"], counts["translations"])
+        if "locations_inserted" in counts:
+            log.info("  locations: %d new, %d changed, %d unchanged; translations: %d new, %d changed, %d unchanged",
+                     counts["locations_inserted"], counts["locations_updated"], counts["locations_unchanged"],
+                     counts["translations_inserted"], counts["translations_updated"],
+                     counts["translations_unchanged"])
     except Exception:
         db.rollback()
         raise
@@ -98,6 +107,8 @@ def main() -> None:
                         help="Additional language: --lang fr path/to/fr.json  (repeatable)")
     parser.add_argument("--max-level", type=int, default=3,
                         help="Max level to import (1=Province, 2=District, 3=Municipality). Default 3.")
+    parser.add_argument("--method",    choices=("auto", "copy", "rows"), default="auto",
+                        help="Write path: copy (COPY + set-based merge), rows (batched upsert). Default auto.")
     parser.add_argument("--dry-run",   action="store_true", help="Preview without writing")
     args = parser.parse_args()
 
@@ -114,6 +125,7 @@ def main() -> None:
         extra_langs=extra_langs,
         max_level=args.max_level,
         dry_run=args.dry_run,
+        method=args.method,
     )
 
 
@@ -305,6 +305,227 @@ def upsert_locations(
     return {"locations": inserted_locs, "translations": upserted_trans}
 
 
+# ── Bulk COPY import (PostgreSQL) ─────────────────────────────────────────────
+
+class LocationImportError(ValueError):
+    """Staged rows failed validation; ``problems`` lists (location_code, reason)."""
+
+    def __init__(self, problems: list[tuple[str, str]]):
+        self.problems = problems
+        shown = "; ".join(f"{code}: {reason}" for code, reason in problems[:20])
+        more = f" (+{len(problems) - 20} more)" if len(problems) > 20 else ""
+        super().__init__(f"{len(problems)} invalid row(s): {shown}{more}")
+
+
+_LOC_STAGE_COLUMNS = (
+    "ord", "location_code", "country_code", "level_number",
+    "parent_location_code", "source_id", "is_active",
+)
+_TRANS_STAGE_COLUMNS = ("ord", "location_code", "lang_code", "name")
+
+
+def _copy_value(value: Any) -> Any:
+    if value is None:
+        return None  # unquoted empty field → NULL
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    return value
+
+
+def _copy_buffer(rows: list[dict], columns: tuple[str, ...]) -> io.StringIO:
+    """CSV for COPY ... FROM STDIN; ``ord`` keeps file order so the last duplicate wins."""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for ord_, row in enumerate(rows):
+        writer.writerow([ord_] + [_copy_value(row.get(c)) for c in columns[1:]])
+    buf.seek(0)
+    return buf
+
+
+_STAGE_DDL = """
+    DROP TABLE IF EXISTS pg_temp.location_import_stage;
+    DROP TABLE IF EXISTS pg_temp.location_translation_import_stage;
+    CREATE TEMP TABLE location_import_stage (
+        ord integer NOT NULL,
+        location_code varchar(64) NOT NULL,
+        country_code varchar(8) NOT NULL,
+        level_number integer NOT NULL,
+        parent_location_code varchar(64),
+        source_id integer,
+        is_active boolean NOT NULL
+    ) ON COMMIT DROP;
+    CREATE TEMP TABLE location_translation_import_stage (
+        ord integer NOT NULL,
+        location_code varchar(64) NOT NULL,
+        lang_code varchar(8) NOT NULL,
+        name text NOT NULL
+    ) ON COMMIT DROP;
+"""
+
+# Last row per code wins, as in the batched path where later rows overwrite earlier ones.
+_VALIDATE_SQL = """
+    WITH src AS (
+        SELECT DISTINCT ON (location_code) *
+        FROM location_import_stage
+        ORDER BY location_code, ord DESC
+    ),
+    merged AS (
+        SELECT location_code, level_number FROM src
+        UNION ALL
+        SELECT l.location_code, l.level_number
+        FROM ticketing.locations l
+        WHERE NOT EXISTS (SELECT 1 FROM src WHERE src.location_code = l.location_code)
+    )
+    SELECT s.location_code,
+           CASE WHEN p.location_code IS NULL
+                THEN 'unknown parent ' || s.parent_location_code
+                ELSE 'parent ' || s.parent_location_code || ' is not above level ' || s.level_number
+           END AS reason
+    FROM src s
+    LEFT JOIN merged p ON p.location_code = s.parent_location_code
+    WHERE s.parent_location_code IS NOT NULL
+      AND (p.location_code IS NULL OR p.level_number >= s.level_number)
+    UNION ALL
+    SELECT DISTINCT t.location_code, 'translation for unknown location'
+    FROM location_translation_import_stage t
+    WHERE NOT EXISTS (SELECT 1 FROM merged m WHERE m.location_code = t.location_code)
+    ORDER BY 1
+"""
+
+# Only new or changed rows reach the INSERT, so unchanged rows are neither locked nor rewritten.
+# The data-modifying CTE runs to completion even though the final SELECT does not read it.
+_MERGE_LOCATIONS_SQL = """
+    WITH src AS (
+        SELECT DISTINCT ON (location_code) *
+        FROM location_import_stage
+        ORDER BY location_code, ord DESC
+    ),
+    diff AS (
+        SELECT src.*, l.location_code IS NULL AS is_new
+        FROM src
+        LEFT JOIN ticketing.locations l USING (location_code)
+        WHERE l.location_code IS NULL
+           OR (l.level_number, l.parent_location_code, l.source_id, l.is_active)
+              IS DISTINCT FROM (src.level_number, src.parent_location_code, src.source_id, src.is_active)
+    ),
+    up AS (
+        INSERT INTO ticketing.locations
+            (location_code, country_code, level_number, parent_location_code,
+             source_id, is_active, created_at, updated_at)
+        SELECT location_code, country_code, level_number, parent_location_code,
+               source_id, is_active, now(), now()
+        FROM diff
+        ON CONFLICT (location_code) DO UPDATE SET
+            level_number         = EXCLUDED.level_number,
+            parent_location_code = EXCLUDED.parent_location_code,
+            source_id            = EXCLUDED.source_id,
+            is_active            = EXCLUDED.is_active,
+            updated_at           = EXCLUDED.updated_at
+    )
+    SELECT (SELECT count(*) FROM src) AS total,
+           (SELECT count(*) FROM diff WHERE is_new) AS inserted,
+           (SELECT count(*) FROM diff WHERE NOT is_new) AS updated
+"""
+
+_MERGE_TRANSLATIONS_SQL = """
+    WITH src AS (
+        SELECT DISTINCT ON (location_code, lang_code) *
+        FROM location_translation_import_stage
+        ORDER BY location_code, lang_code, ord DESC
+    ),
+    diff AS (
+        SELECT src.*, lt.location_code IS NULL AS is_new
+        FROM src
+        LEFT JOIN ticketing.location_translations lt USING (location_code, lang_code)
+        WHERE lt.location_code IS NULL OR lt.name IS DISTINCT FROM src.name
+    ),
+    up AS (
+        INSERT INTO ticketing.location_translations (location_code, lang_code, name)
+        SELECT location_code, lang_code, name FROM diff
+        ON CONFLICT (location_code, lang_code) DO UPDATE SET name = EXCLUDED.name
+    )
+    SELECT (SELECT count(*) FROM src) AS total,
+           (SELECT count(*) FROM diff WHERE is_new) AS inserted,
+           (SELECT count(*) FROM diff WHERE NOT is_new) AS updated
+"""
+
+
+def bulk_upsert_locations(
+    location_rows: list[dict],
+    trans_rows: list[dict],
+    db: Any,               # sqlalchemy.orm.Session bound to PostgreSQL (psycopg2)
+) -> dict[str, int]:
+    """
+    Set-based equivalent of upsert_locations for full re-imports.
+
+    COPYs the parsed rows into temp staging tables on the session's connection,
+    validates parent links (parent must exist in the file or the table, at a
+    lower level) and translation targets in SQL, then merges each table with a
+    single INSERT … SELECT … ON CONFLICT that only touches new or changed rows.
+    Runs inside the caller's transaction; the caller commits.
+
+    Raises LocationImportError (a ValueError) before writing anything when
+    validation fails. Returns the upsert_locations keys ("locations",
+    "translations" = distinct rows in the file) plus diff counts:
+    locations_inserted / _updated / _unchanged and the same for translations.
+    """
+    import sqlalchemy as sa
+
+    db.flush()
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.execute(_STAGE_DDL)
+        cursor.copy_expert(
+            f"COPY location_import_stage ({', '.join(_LOC_STAGE_COLUMNS)}) FROM STDIN WITH (FORMAT csv)",
+            _copy_buffer(location_rows, _LOC_STAGE_COLUMNS),
+        )
+        cursor.copy_expert(
+            f"COPY location_translation_import_stage ({', '.join(_TRANS_STAGE_COLUMNS)}) "
+            "FROM STDIN WITH (FORMAT csv)",
+            _copy_buffer(trans_rows, _TRANS_STAGE_COLUMNS),
+        )
+    finally:
+        cursor.close()
+
+    problems = [(r[0], r[1]) for r in db.execute(sa.text(_VALIDATE_SQL)).all()]
+    if problems:
+        raise LocationImportError(problems)
+
+    counts: dict[str, int] = {}
+    for key, sql in (("locations", _MERGE_LOCATIONS_SQL), ("translations", _MERGE_TRANSLATIONS_SQL)):
+        row = db.execute(sa.text(sql)).mappings().one()
+        counts[key] = row["total"]
+        counts[f"{key}_inserted"] = row["inserted"]
+        counts[f"{key}_updated"] = row["updated"]
+        counts[f"{key}_unchanged"] = row["total"] - row["inserted"] - row["updated"]
+
+    log.info(
+        "bulk_upsert_locations: locations %d (+%d ~%d), translations %d (+%d ~%d)",
+        counts["locations"], counts["locations_inserted"], counts["locations_updated"],
+        counts["translations"], counts["translations_inserted"], counts["translations_updated"],
+    )
+    return counts
+
+
+def import_locations(
+    location_rows: list[dict],
+    trans_rows: list[dict],
+    db: Any,
+    method: str = "auto",
+) -> dict[str, int]:
+    """
+    Dispatch to bulk_upsert_locations ("copy") or upsert_locations ("rows").
+    "auto" uses COPY on a PostgreSQL bind and the batched path otherwise.
+    """
+    if method == "auto":
+        method = "copy" if db.get_bind().dialect.name == "postgresql" else "rows"
+    if method == "copy":
+        return bulk_upsert_locations(location_rows, trans_rows, db)
+    if method == "rows":
+        return upsert_locations(location_rows, trans_rows, db)
+    raise ValueError(f"Unknown import method {method!r} (expected auto, copy or rows)")
+
+
 # ── Download templates ────────────────────────────────────────────────────────
 
 CSV_TEMPLATE = """\
@@ -0,0 +1,231 @@
+"""
+Time the ticketing hot paths against a database loaded with synthetic_dataset.py.
+
+Cases (each run --repeat times after one unmeasured warm-up):
+  tickets_admin        GET /api/v1/tickets as super_admin
+  tickets_officer      GET /api/v1/tickets?tab=actor as the busiest synthetic L1 officer
+  tickets_search       GET /api/v1/tickets?q=SYN-GR-0000123
+  reports_query        GET /api/v1/reports/query (current quarter)
+  reports_summary      GET /api/v1/reports/summary?project_id=<KL_ROAD>
+  run_sla_check        engine.escalation.run_sla_check
+  sync_grievances      tasks.grievance_sync.sync_grievances
+
+run_sla_check and sync_grievances write; they run inside a transaction that is rolled
+back, so every repeat sees the same data and the dataset is left as loaded.
+
+Run:
+  python -m ticketing.seed.synthetic_benchmark --repeat 5 --out perf.json
+  python -m ticketing.seed.synthetic_benchmark --case tickets_officer --compare perf.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import math
+import subprocess
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Iterator
+from unittest import mock
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from ticketing.seed.synthetic_dataset import (
+    GRIEVANCE_PREFIX,
+    OFFICER_PREFIX,
+    PROJECT_CODE,
+    synthetic_row_counts,
+)
+
+logger = logging.getLogger(__name__)
+
+API_PREFIX = "/api/v1"
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile; 0.0 for no samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(samples: list[float]) -> dict:
+    ms = [s * 1000 for s in samples]
+    return {
+        "runs": len(ms),
+        "min_ms": round(min(ms), 1) if ms else 0.0,
+        "p50_ms": round(percentile(ms, 50), 1),
+        "p95_ms": round(percentile(ms, 95), 1),
+        "max_ms": round(max(ms), 1) if ms else 0.0,
+    }
+
+
+@contextmanager
+def rollback_session(engine) -> Iterator[Session]:
+    """Session whose commits become savepoints of an outer transaction that is rolled back."""
+    with engine.connect() as conn:
+        outer = conn.begin()
+        session = Session(bind=conn, join_transaction_mode="create_savepoint")
+        try:
+            yield session
+        finally:
+            session.close()
+            outer.rollback()
+
+
+def _api_cases(client, headers_admin: dict, headers_officer: dict, project_id: str | None) -> dict[str, Callable]:
+    def get(path: str, headers: dict, **params) -> Callable:
+        def call():
+            response = client.get(f"{API_PREFIX}{path}", headers=headers, params=params)
+            if response.status_code != 200:
+                raise RuntimeError(f"GET {path} -> {response.status_code}: {response.text[:200]}")
+        return call
+
+    cases = {
+        "tickets_admin": get("/tickets", headers_admin),
+        "tickets_officer": get("/tickets", headers_officer, tab="actor"),
+        "tickets_search": get("/tickets", headers_admin, q=f"{GRIEVANCE_PREFIX}0000123"),
+        "reports_query": get("/reports/query", headers_admin),
+    }
+    if project_id:
+        cases["reports_summary"] = get("/reports/summary", headers_admin, project_id=project_id)
+    return cases
+
+
+def _write_cases(engine) -> dict[str, Callable]:
+    from ticketing.engine.escalation import run_sla_check
+    from ticketing.tasks import grievance_sync
+
+    def sla_check():
+        with rollback_session(engine) as db:
+            run_sla_check(db)
+
+    def sync():
+        with rollback_session(engine) as db, \
+                mock.patch.object(grievance_sync, "SessionLocal", lambda: db), \
+                mock.patch("ticketing.tasks.llm.generate_findings.delay"):
+            # Backfilled tickets are rolled back, so findings must not be queued for them.
+            grievance_sync.sync_grievances.run()
+
+    return {"run_sla_check": sla_check, "sync_grievances": sync}
+
+
+def _busiest_officer(db: Session) -> str | None:
+    return db.execute(text("""
+        SELECT assigned_to_user_id FROM ticketing.tickets
+        WHERE assigned_to_user_id LIKE :p AND status_code <> 'RESOLVED'
+        GROUP BY assigned_to_user_id ORDER BY count(*) DESC LIMIT 1
+    """), {"p": f"{OFFICER_PREFIX}%"}).scalar_one_or_none()
+
+
+def run_benchmark(repeat: int, only: list[str] | None = None) -> dict:
+    from fastapi.testclient import TestClient
+
+    from ticketing.api.main import app
+    from ticketing.config.settings import get_settings
+    from ticketing.models.base import SessionLocal, engine
+
+    with SessionLocal() as db:
+        counts = synthetic_row_counts(db)
+        if not counts["tickets"]:
+            raise SystemExit("No synthetic tickets — load them with python -m ticketing.seed.synthetic_dataset")
+        officer = _busiest_officer(db)
+        project_id = db.execute(
+            text("SELECT project_id FROM ticketing.projects WHERE short_code = :c"), {"c": PROJECT_CODE}
+        ).scalar_one_or_none()
+
+    api_key = get_settings().ticketing_secret_key or ""
+    headers_admin = {"x-api-key": api_key, "x-internal-user-id": "synthetic-benchmark",
+                     "x-internal-role": "super_admin"}
+    headers_officer = {"x-api-key": api_key, "x-internal-user-id": officer or "synthetic-benchmark",
+                       "x-internal-role": "site_safeguards_focal_person"}
+
+    cases = {
+        **_api_cases(TestClient(app), headers_admin, headers_officer, project_id),
+        **_write_cases(engine),
+    }
+    if only:
+        unknown = sorted(set(only) - set(cases))
+        if unknown:
+            raise SystemExit(f"Unknown case(s): {', '.join(unknown)}; choose from {', '.join(cases)}")
+        cases = {name: fn for name, fn in cases.items() if name in only}
+
+    results: dict[str, dict] = {}
+    for name, fn in cases.items():
+        fn()  # warm-up: imports, plan cache, connection pool
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            fn()
+            samples.append(time.perf_counter() - started)
+        results[name] = summarize(samples)
+        logger.info("%-18s %s", name, results[name])
+
+    return {
+        "meta": {
+            "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "dataset": counts,
+            "officer": officer,
+            "repeat": repeat,
+        },
+        "cases": results,
+    }
+
+
+def compare(baseline: dict, current: dict, max_regression: float) -> list[str]:
+    """Case names whose p50 regressed by more than max_regression (fraction)."""
+    regressions = []
+    for name, stats in current["cases"].items():
+        before = baseline.get("cases", {}).get(name)
+        if not before or not before.get("p50_ms"):
+            continue
+        change = stats["p50_ms"] / before["p50_ms"] - 1
+        marker = "  REGRESSION" if change > max_regression else ""
+        logger.info("%-18s p50 %8.1f -> %8.1f ms (%+.0f%%)%s",
+                    name, before["p50_ms"], stats["p50_ms"], change * 100, marker)
+        if marker:
+            regressions.append(name)
+    return regressions
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=Path(__file__).resolve().parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m ticketing.seed.synthetic_benchmark", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--case", action="append", help="limit to these cases (repeatable)")
+    parser.add_argument("--out", help="write results JSON here")
+    parser.add_argument("--compare", help="baseline results JSON to compare p50 against")
+    parser.add_argument("--max-regression", type=float, default=0.15)
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.repeat, args.case)
+    if args.out:
+        Path(args.out).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        logger.info("wrote %s", args.out)
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        if compare(baseline, results, args.max_regression):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+    raise SystemExit(main())
@@ -0,0 +1,737 @@
+"""
+Synthetic large-scale dataset for ticketing performance testing.
+
+mock_tickets.py seeds a handful of demo tickets; this bulk-loads production-sized volumes
+with COPY so list, report, sync and SLA code can be timed before production finds the
+O(n) paths:
+
+  - public.grievances (non-PII columns only) and ticketing.tickets for them
+  - ticketing.ticket_events: CREATED / ASSIGNED, then notes, acks, replies, escalations
+  - officers: user_roles + officer_scopes across the imported Nepal location tree
+    (L1 per municipality, L2 per district, GRC per province, HQ / SEAH national)
+  - ticketing.ticket_viewers, ticket_tasks and ticket_overdue_episodes
+
+Distributions come from SyntheticProfile (CLI flags or a JSON profile file). The same
+profile, --seed and --as-of produce the same rows. Synthetic rows are tagged
+(tickets.chatbot_id = 'synthetic', SYN-GR-* grievances, syn-officer-* users) and removed
+with --reset; other data is never touched.
+
+Needs the location tree (import_locations_json); the KL Road workflows are seeded if
+missing.
+
+Run:
+  python -m ticketing.seed.synthetic_dataset --grievances 1000000 --events-per-ticket 20 \\
+      --officers 5000 --seed 42 --defer-indexes
+  python -m ticketing.seed.synthetic_dataset --profile perf_profile.json
+  python -m ticketing.seed.synthetic_dataset --reset
+
+Then time the hot paths against it:
+  python -m ticketing.seed.synthetic_benchmark
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import json
+import logging
+import random
+import time
+import uuid
+from collections import Counter
+from dataclasses import asdict, dataclass, field, fields
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+SYNTHETIC_CHATBOT_ID = "synthetic"
+GRIEVANCE_PREFIX = "SYN-GR-"
+OFFICER_PREFIX = "syn-officer-"
+PROJECT_CODE = "KL_ROAD"
+ORGANIZATION_ID = "DOR"
+
+# Scope level per role: 3 = municipality, 2 = district, 1 = province, None = national.
+ROLE_SCOPE_LEVEL: dict[str, Optional[int]] = {
+    "site_safeguards_focal_person": 3,
+    "pd_piu_safeguards_focal": 2,
+    "grc_chair": 1,
+    "adb_hq_safeguards": None,
+    "seah_national_officer": 1,
+    "seah_hq_officer": None,
+}
+
+ACTIVE_STATUSES = ("OPEN", "IN_PROGRESS", "ESCALATED", "GRC_HEARING_SCHEDULED")
+
+# Events between ASSIGNED and the final status change, by relative frequency.
+ACTIVITY_EVENT_WEIGHTS = {
+    "NOTE_ADDED": 0.40,
+    "ACKNOWLEDGED": 0.08,
+    "FIELD_REPORT": 0.10,
+    "COMPLAINANT_MESSAGE": 0.12,
+    "REPLY_SENT": 0.12,
+    "ASSIGNMENT_NOTIFICATION": 0.13,
+    "PRIORITY_CHANGED": 0.05,
+}
+
+TASK_TYPES = ("SITE_VISIT", "FOLLOW_UP_CALL", "DOCUMENT_PHOTO")
+
+# COPY column order per table; also the load order (parents before children).
+TABLE_COLUMNS: dict[str, tuple[str, ...]] = {
+    "ticketing.user_roles": (
+        "user_role_id", "user_id", "role_id", "organization_id", "location_code",
+        "created_at", "updated_at",
+    ),
+    "ticketing.officer_scopes": (
+        "scope_id", "user_id", "role_key", "organization_id", "location_code",
+        "project_id", "project_code", "includes_children", "created_at",
+    ),
+    "public.grievances": (
+        "grievance_id", "grievance_categories", "grievance_summary", "grievance_sensitive_issue",
+        "grievance_high_priority", "grievance_location", "language_code",
+        "grievance_classification_status", "grievance_creation_date",
+        "grievance_modification_date", "is_temporary", "source",
+    ),
+    "ticketing.tickets": (
+        "ticket_id", "grievance_id", "chatbot_id", "grievance_summary", "grievance_categories",
+        "grievance_location", "country_code", "organization_id", "location_code", "project_id",
+        "project_code", "status_code", "current_workflow_id", "current_step_id", "priority",
+        "is_seah", "intake_route", "assigned_to_user_id", "complainant_reply_owner_id",
+        "step_started_at", "sla_breached", "is_archived", "is_deleted", "created_at",
+        "created_by_user_id", "updated_at", "updated_by_user_id",
+    ),
+    "ticketing.ticket_events": (
+        "event_id", "ticket_id", "event_type", "old_status_code", "new_status_code",
+        "old_assigned_to", "new_assigned_to", "workflow_step_id", "note", "payload", "seen",
+        "assigned_to_user_id", "created_at", "created_by_user_id", "actor_role",
+        "case_sensitivity", "summary_regen_required",
+    ),
+    "ticketing.ticket_viewers": (
+        "viewer_id", "ticket_id", "user_id", "added_by_user_id", "added_at", "tier",
+    ),
+    "ticketing.ticket_tasks": (
+        "task_id", "ticket_id", "task_type", "assigned_to_user_id", "assigned_by_user_id",
+        "description", "due_date", "status", "completed_at", "completed_by_user_id", "created_at",
+    ),
+    "ticketing.ticket_overdue_episodes": (
+        "episode_id", "ticket_id", "workflow_step_id", "step_order", "assigned_to_user_id",
+        "started_at", "ended_at", "end_reason", "days_overdue", "triggered_by",
+    ),
+}
+
+# Secondary indexes worth dropping during a large load (--defer-indexes).
+DEFERRABLE_INDEX_TABLES = ("ticket_events", "tickets", "ticket_viewers", "ticket_tasks")
+
+
+@dataclass
+class SyntheticProfile:
+    """Volumes and distributions; every field can be set in a JSON profile file."""
+
+    seed: int = 42
+    as_of: Optional[str] = None          # ISO date the data is "current" at (default: today UTC)
+    grievances: int = 10_000
+    ticket_share: float = 1.0            # grievances with a ticket; the rest are sync backfill candidates
+    events_per_ticket: float = 20.0      # mean; gamma-distributed per ticket (min 2)
+    officers: int = 2_000
+    viewers_per_ticket: float = 1.5
+    task_share: float = 0.30
+    seah_share: float = 0.05
+    overdue_share: float = 0.15          # active tickets in an open overdue episode
+    unflagged_breach_share: float = 0.01  # active tickets breached since the last watchdog run
+    past_overdue_share: float = 0.25     # tickets with a closed overdue episode
+    created_within_days: int = 730
+    status_weights: dict[str, float] = field(default_factory=lambda: {
+        "OPEN": 0.15, "IN_PROGRESS": 0.25, "ESCALATED": 0.10,
+        "GRC_HEARING_SCHEDULED": 0.05, "RESOLVED": 0.45,
+    })
+    priority_weights: dict[str, float] = field(default_factory=lambda: {
+        "NORMAL": 0.80, "HIGH": 0.17, "CRITICAL": 0.03,
+    })
+    # Location level tickets are filed at (3 = municipality, 2 = district).
+    location_level_weights: dict[str, float] = field(default_factory=lambda: {"3": 0.85, "2": 0.15})
+    officer_role_weights: dict[str, float] = field(default_factory=lambda: {
+        "site_safeguards_focal_person": 0.60,
+        "pd_piu_safeguards_focal": 0.20,
+        "grc_chair": 0.10,
+        "adb_hq_safeguards": 0.02,
+        "seah_national_officer": 0.05,
+        "seah_hq_officer": 0.03,
+    })
+    batch_rows: int = 100_000            # buffered rows before a COPY round
+    commit_every: int = 100_000          # tickets per transaction
+
+    @classmethod
+    def from_file(cls, path: str) -> "SyntheticProfile":
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        known = {f.name for f in fields(cls)}
+        unknown = sorted(set(data) - known)
+        if unknown:
+            raise ValueError(f"Unknown profile field(s): {', '.join(unknown)}")
+        return cls(**data)
+
+    def as_of_datetime(self) -> datetime:
+        day = date.fromisoformat(self.as_of) if self.as_of else datetime.now(timezone.utc).date()
+        return datetime.combine(day, dt_time(0, 0), tzinfo=timezone.utc)
+
+
+@dataclass(frozen=True)
+class LocationNode:
+    location_code: str
+    level_number: int
+    parent_location_code: Optional[str]
+    name: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class StepSpec:
+    step_id: str
+    step_order: int
+    assigned_role_key: Optional[str]
+    resolution_time_days: Optional[int]
+
+
+@dataclass
+class ReferenceData:
+    """What the generator needs from the database (locations, workflows, roles, project)."""
+
+    locations: list[LocationNode]
+    workflows: dict[str, tuple[str, list[StepSpec]]]   # "STANDARD" | "SEAH" -> (workflow_id, steps)
+    role_ids: dict[str, str]
+    project_id: Optional[str]
+    categories: list[dict[str, Any]]
+
+
+class SyntheticDataset:
+    """Generates rows for every synthetic table into a sink with add(table, row) / ticket_done()."""
+
+    def __init__(self, profile: SyntheticProfile, ref: ReferenceData):
+        self.profile = profile
+        self.ref = ref
+        self.rng = random.Random(profile.seed)
+        self.as_of = profile.as_of_datetime()
+        self._by_code = {n.location_code: n for n in ref.locations}
+        self._by_level: dict[int, list[LocationNode]] = {}
+        for node in sorted(ref.locations, key=lambda n: n.location_code):
+            self._by_level.setdefault(node.level_number, []).append(node)
+        self._officers: list[str] = []
+        self._officers_by_scope: dict[tuple[str, Optional[str]], list[str]] = {}
+        self._officers_by_role: dict[str, list[str]] = {}
+
+    # ── helpers ──────────────────────────────────────────────────────────────
+
+    def _uuid(self) -> str:
+        return str(uuid.UUID(int=self.rng.getrandbits(128), version=4))
+
+    def _pick(self, weights: dict[str, float]) -> str:
+        return self.rng.choices(list(weights), weights=list(weights.values()))[0]
+
+    def _ancestors(self, location_code: Optional[str]) -> Iterable[Optional[str]]:
+        code = location_code
+        while code:
+            yield code
+            node = self._by_code.get(code)
+            code = node.parent_location_code if node else None
+        yield None
+
+    def _officer_for(self, role_key: Optional[str], location_code: Optional[str]) -> Optional[str]:
+        if not role_key:
+            return None
+        for code in self._ancestors(location_code):
+            candidates = self._officers_by_scope.get((role_key, code))
+            if candidates:
+                return self.rng.choice(candidates)
+        # District-level tickets (or too few officers to cover every municipality)
+        candidates = self._officers_by_role.get(role_key)
+        return self.rng.choice(candidates) if candidates else None
+
+    # ── officers ─────────────────────────────────────────────────────────────
+
+    def generate_officers(self, sink) -> None:
+        p = self.profile
+        weights = {r: w for r, w in p.officer_role_weights.items() if r in self.ref.role_ids}
+        missing = sorted(set(p.officer_role_weights) - set(weights))
+        if missing:
+            logger.warning("Roles not in ticketing.roles, no officers generated for: %s", ", ".join(missing))
+        total_weight = sum(weights.values()) or 1.0
+        n = 0
+        for role_key, weight in weights.items():
+            level = ROLE_SCOPE_LEVEL.get(role_key)
+            nodes = self._by_level.get(level, []) if level else []
+            count = max(1, round(p.officers * weight / total_weight))
+            for k in range(count):
+                n += 1
+                user_id = f"{OFFICER_PREFIX}{n:06d}@synthetic.grm"
+                location_code = nodes[k % len(nodes)].location_code if nodes else None
+                self._officers.append(user_id)
+                self._officers_by_scope.setdefault((role_key, location_code), []).append(user_id)
+                self._officers_by_role.setdefault(role_key, []).append(user_id)
+                sink.add("ticketing.user_roles", (
+                    self._uuid(), user_id, self.ref.role_ids[role_key], ORGANIZATION_ID,
+                    location_code, self.as_of, self.as_of,
+                ))
+                sink.add("ticketing.officer_scopes", (
+                    self._uuid(), user_id, role_key, ORGANIZATION_ID, location_code,
+                    self.ref.project_id, PROJECT_CODE, level is not None and level < 3, self.as_of,
+                ))
+
+    # ── tickets ──────────────────────────────────────────────────────────────
+
+    def _ticket_location(self) -> LocationNode:
+        for _ in range(10):
+            level = int(self._pick(self.profile.location_level_weights))
+            nodes = self._by_level.get(level)
+            if nodes:
+                return self.rng.choice(nodes)
+        return self.rng.choice(self.ref.locations)
+
+    def _step_for_status(self, status: str, steps: list[StepSpec], is_seah: bool) -> StepSpec:
+        last = len(steps) - 1
+        if status == "OPEN":
+            index = 0
+        elif status == "IN_PROGRESS":
+            index = min(self.rng.choices((0, 1), weights=(0.7, 0.3))[0], last)
+        elif status == "GRC_HEARING_SCHEDULED" and not is_seah:
+            index = min(2, last)
+        elif status in ("ESCALATED", "GRC_HEARING_SCHEDULED"):
+            index = self.rng.randint(min(1, last), last)
+        else:  # RESOLVED: most cases close at the first levels
+            index = min(self.rng.choices(range(len(steps)), weights=[0.6, 0.25, 0.1, 0.05][: len(steps)])[0], last)
+        return steps[index]
+
+    def generate(self, sink) -> Counter:
+        """Write officers, then grievances and their tickets with child rows; returns row counts."""
+        p = self.profile
+        if not self.ref.locations:
+            raise ValueError("ticketing.locations is empty — import the location tree first")
+        self.generate_officers(sink)
+        sink.ticket_done()
+
+        categories = self.ref.categories or [{"category_key": "Other", "short_description": "Other concern"}]
+        counts: Counter = Counter()
+        for n in range(1, p.grievances + 1):
+            grievance_id = f"{GRIEVANCE_PREFIX}{n:09d}"
+            is_seah = self.rng.random() < p.seah_share and "SEAH" in self.ref.workflows
+            location = self._ticket_location()
+            created_at = self.as_of - timedelta(
+                days=self.rng.triangular(0, p.created_within_days, 0), seconds=self.rng.randint(0, 86399)
+            )
+            category = self.rng.choice(categories)
+            category_json = json.dumps([category["category_key"]])
+            summary = f"{category.get('short_description') or category['category_key']} ({grievance_id})"
+            location_text = location.name or location.location_code
+            priority = self._pick(p.priority_weights)
+            sink.add("public.grievances", (
+                grievance_id, category_json, summary, is_seah, priority != "NORMAL", location_text,
+                self.rng.choice(("ne", "en")), "LLM_generated", created_at, created_at, False, "bot",
+            ))
+            counts["grievances"] += 1
+            if self.rng.random() < p.ticket_share:
+                self._generate_ticket(sink, counts, grievance_id, is_seah, location, created_at,
+                                      summary, category_json, location_text, priority)
+            sink.ticket_done()
+        return counts
+
+    def _generate_ticket(self, sink, counts, grievance_id, is_seah, location, created_at,
+                         summary, category_json, location_text, priority) -> None:
+        p = self.profile
+        workflow_id, steps = self.ref.workflows["SEAH" if is_seah else "STANDARD"]
+        status = self._pick(p.status_weights)
+        step = self._step_for_status(status, steps, is_seah)
+        ticket_id = self._uuid()
+        l1_officer = self._officer_for(steps[0].assigned_role_key, location.location_code)
+        assignee = self._officer_for(step.assigned_role_key, location.location_code) or l1_officer
+        sensitivity = "seah" if is_seah else "standard"
+
+        # Step timing: escalations happen before step_started_at; resolved cases end before as_of.
+        if status == "RESOLVED":
+            ended_at = min(self.as_of, created_at + timedelta(days=self.rng.uniform(1, 60)))
+        else:
+            ended_at = self.as_of
+        step_started_at = created_at + (ended_at - created_at) * self.rng.uniform(0.0, 0.6)
+
+        overdue = unflagged = False
+        sla_days = step.resolution_time_days
+        if status in ACTIVE_STATUSES and sla_days:
+            roll = self.rng.random()
+            overdue = roll < p.overdue_share
+            unflagged = not overdue and roll < p.overdue_share + p.unflagged_breach_share
+            if overdue or unflagged:
+                step_started_at = self.as_of - timedelta(days=sla_days + self.rng.uniform(1, 45))
+                created_at = min(created_at, step_started_at - timedelta(hours=1))
+            else:
+                step_started_at = max(created_at, self.as_of - timedelta(days=self.rng.uniform(0, sla_days)))
+
+        sink.add("ticketing.tickets", (
+            ticket_id, grievance_id, SYNTHETIC_CHATBOT_ID, summary, category_json, location_text, "NP",
+            ORGANIZATION_ID, location.location_code, self.ref.project_id, PROJECT_CODE, status,
+            workflow_id, step.step_id, priority, is_seah, "seah_intake" if is_seah else "new_grievance",
+            assignee, l1_officer, step_started_at, overdue, False, False, created_at, "system",
+            ended_at if status == "RESOLVED" else step_started_at, assignee or "system",
+        ))
+        counts["tickets"] += 1
+
+        self._generate_events(sink, counts, ticket_id, status, steps, step, assignee, l1_officer,
+                              created_at, step_started_at, ended_at, sensitivity)
+
+        viewers = int(p.viewers_per_ticket) + (self.rng.random() < p.viewers_per_ticket % 1)
+        for user_id in self.rng.sample(self._officers, min(viewers, len(self._officers))):
+            if user_id == assignee:
+                continue
+            sink.add("ticketing.ticket_viewers", (
+                self._uuid(), ticket_id, user_id, assignee or "system",
+                created_at + timedelta(hours=self.rng.uniform(1, 72)),
+                self._pick({"observer": 0.5, "informed": 0.35, "supervisor": 0.15}),
+            ))
+            counts["ticket_viewers"] += 1
+
+        if assignee and self.rng.random() < p.task_share:
+            for _ in range(self.rng.randint(1, 3)):
+                task_created = created_at + (ended_at - created_at) * self.rng.random()
+                done = status == "RESOLVED" or self.rng.random() < 0.4
+                worker = self.rng.choice(self._officers)
+                sink.add("ticketing.ticket_tasks", (
+                    self._uuid(), ticket_id, self.rng.choice(TASK_TYPES), worker, assignee,
+                    "Synthetic follow-up", (task_created + timedelta(days=self.rng.randint(1, 14))).date(),
+                    "DONE" if done else "PENDING", task_created + timedelta(days=1) if done else None,
+                    worker if done else None, task_created,
+                ))
+                counts["ticket_tasks"] += 1
+
+        if self.rng.random() < p.past_overdue_share and steps[0].resolution_time_days:
+            started = created_at + timedelta(days=steps[0].resolution_time_days)
+            if started < step_started_at:
+                ended = min(step_started_at, started + timedelta(days=self.rng.uniform(1, 10)))
+                sink.add("ticketing.ticket_overdue_episodes", (
+                    self._uuid(), ticket_id, steps[0].step_id, steps[0].step_order, l1_officer, started,
+                    ended, "ESCALATED" if step.step_order > 1 else "ACKNOWLEDGED",
+                    max(0, (ended.date() - started.date()).days), "SLA_WATCHDOG",
+                ))
+                counts["ticket_overdue_episodes"] += 1
+        if overdue:
+            # Open episode; tickets.current_overdue_episode_id is linked after the load.
+            started = step_started_at + timedelta(days=sla_days)
+            sink.add("ticketing.ticket_overdue_episodes", (
+                self._uuid(), ticket_id, step.step_id, step.step_order, assignee, started,
+                None, None, None, "SLA_WATCHDOG",
+            ))
+            counts["ticket_overdue_episodes"] += 1
+
+    def _generate_events(self, sink, counts, ticket_id, status, steps, step, assignee, l1_officer,
+                         created_at, step_started_at, ended_at, sensitivity) -> None:
+        p = self.profile
+        total = max(2, round(self.rng.gammavariate(2.0, p.events_per_ticket / 2.0)))
+        escalations = [s for s in steps if 1 < s.step_order <= step.step_order]
+        closing = 1 if status == "RESOLVED" else 0
+        activity = max(0, total - 2 - len(escalations) - closing)
+        seen_before = self.as_of - timedelta(days=7)
+
+        def event(event_type, at, *, old_status=None, new_status=None, old_to=None, new_to=None,
+                  step_id=None, note=None, payload=None, notify=None, by="system", role="system"):
+            sink.add("ticketing.ticket_events", (
+                self._uuid(), ticket_id, event_type, old_status, new_status, old_to, new_to,
+                step_id, note, payload, at < seen_before or self.rng.random() < 0.5, notify, at,
+                by, role, sensitivity, False,
+            ))
+            counts["ticket_events"] += 1
+
+        event("CREATED", created_at, new_status="OPEN", step_id=steps[0].step_id)
+        event("ASSIGNED", created_at + timedelta(minutes=1), new_to=l1_officer, step_id=steps[0].step_id,
+              notify=l1_officer)
+
+        # Activity spreads over the whole case; escalations land before the current step started.
+        activity_times = sorted(created_at + (ended_at - created_at) * self.rng.random() for _ in range(activity))
+        previous_officer = l1_officer
+        for s in escalations:
+            at = created_at + (step_started_at - created_at) * (s.step_order - 1) / max(1, step.step_order - 1)
+            officer = assignee if s.step_id == step.step_id else self._officer_for(s.assigned_role_key, None)
+            event("ESCALATED", at, old_status="IN_PROGRESS", new_status="ESCALATED", old_to=previous_officer,
+                  new_to=officer, step_id=s.step_id, payload=json.dumps({"triggered_by": "SLA_AUTO"}),
+                  notify=officer)
+            previous_officer = officer
+        for at in activity_times:
+            event_type = self._pick(ACTIVITY_EVENT_WEIGHTS)
+            event(event_type, at, step_id=step.step_id, note="Synthetic activity" if event_type == "NOTE_ADDED" else None,
+                  notify=assignee, by=assignee or "system", role=step.assigned_role_key or "system")
+        if closing:
+            event("RESOLVED", ended_at, old_status="IN_PROGRESS", new_status="RESOLVED", step_id=step.step_id,
+                  notify=l1_officer, by=assignee or "system", role=step.assigned_role_key or "system")
+
+
+# ── COPY loading ─────────────────────────────────────────────────────────────
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return None
+    if value is True:
+        return "t"
+    if value is False:
+        return "f"
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+class CopyLoader:
+    """
+    Buffers rows per table and streams them with COPY ... FROM STDIN (CSV), flushing every
+    table in TABLE_COLUMNS order so children never reach the database before their parents.
+    """
+
+    def __init__(self, connection, batch_rows: int, commit_every: int):
+        self._connection = connection
+        self._cursor = connection.cursor()
+        self._batch_rows = batch_rows
+        self._commit_every = commit_every
+        self._buffers: dict[str, tuple[io.StringIO, Any]] = {}
+        self._buffered = 0
+        self._tickets_since_commit = 0
+        self.counts: Counter = Counter()
+        self._started = time.monotonic()
+
+    def add(self, table: str, row: tuple) -> None:
+        entry = self._buffers.get(table)
+        if entry is None:
+            buf = io.StringIO()
+            entry = self._buffers[table] = (buf, csv.writer(buf))
+        entry[1].writerow([_csv_value(v) for v in row])
+        self._buffered += 1
+
+    def ticket_done(self) -> None:
+        self._tickets_since_commit += 1
+        if self._buffered >= self._batch_rows:
+            self.flush()
+        if self._tickets_since_commit >= self._commit_every:
+            self.commit()
+
+    def flush(self) -> None:
+        for table, columns in TABLE_COLUMNS.items():
+            entry = self._buffers.pop(table, None)
+            if entry is None:
+                continue
+            buf = entry[0]
+            rows = buf.getvalue().count("\n")
+            buf.seek(0)
+            self._cursor.copy_expert(
+                f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buf
+            )
+            self.counts[table] += rows
+        self._buffered = 0
+
+    def commit(self) -> None:
+        self.flush()
+        self._connection.commit()
+        self._tickets_since_commit = 0
+        elapsed = time.monotonic() - self._started
+        logger.info(
+            "  committed: %s (%.0f rows/s)",
+            ", ".join(f"{t.split('.')[-1]}={c}" for t, c in self.counts.items()),
+            sum(self.counts.values()) / elapsed if elapsed else 0,
+        )
+
+
+def load_reference_data(db) -> ReferenceData:
+    from sqlalchemy import text
+
+    from ticketing.seed.kl_road_seah import WORKFLOW_SEAH_ID
+    from ticketing.seed.kl_road_standard import WORKFLOW_STANDARD_ID
+    from ticketing.services.grievance_categories_catalog import load_default_catalog
+
+    locations = [
+        LocationNode(r.location_code, r.level_number, r.parent_location_code, r.name)
+        for r in db.execute(text("""
+            SELECT l.location_code, l.level_number, l.parent_location_code, t.name
+            FROM ticketing.locations l
+            LEFT JOIN ticketing.location_translations t
+                ON t.location_code = l.location_code AND t.lang_code = 'en'
+            WHERE l.country_code = 'NP' AND l.is_active IS TRUE
+            ORDER BY l.location_code
+        """))
+    ]
+    workflows: dict[str, tuple[str, list[StepSpec]]] = {}
+    for key, workflow_id in (("STANDARD", WORKFLOW_STANDARD_ID), ("SEAH", WORKFLOW_SEAH_ID)):
+        steps = [
+            StepSpec(r.step_id, r.step_order, r.assigned_role_key, r.resolution_time_days)
+            for r in db.execute(text("""
+                SELECT step_id, step_order, assigned_role_key, resolution_time_days
+                FROM ticketing.workflow_steps WHERE workflow_id = :wid ORDER BY step_order
+            """), {"wid": workflow_id})
+        ]
+        if steps:
+            workflows[key] = (workflow_id, steps)
+    role_ids = dict(db.execute(text("SELECT role_key, role_id FROM ticketing.roles")).all())
+    project_id = db.execute(
+        text("SELECT project_id FROM ticketing.projects WHERE short_code = :code"), {"code": PROJECT_CODE}
+    ).scalar_one_or_none()
+    return ReferenceData(locations, workflows, role_ids, project_id, load_default_catalog()["categories"])
+
+
+def _deferrable_indexes(cursor) -> list[tuple[str, str]]:
+    cursor.execute("""
+        SELECT i.relname, pg_get_indexdef(x.indexrelid)
+        FROM pg_index x
+        JOIN pg_class i ON i.oid = x.indexrelid
+        JOIN pg_class t ON t.oid = x.indrelid
+        JOIN pg_namespace n ON n.oid = t.relnamespace
+        WHERE n.nspname = 'ticketing' AND t.relname = ANY(%s)
+          AND NOT x.indisprimary AND NOT x.indisunique
+    """, (list(DEFERRABLE_INDEX_TABLES),))
+    # Indexes on partitioned ticket_events are defined "ON ONLY" the parent; recreate them
+    # recursively so every month partition gets its index back.
+    return [(name, definition.replace(" ON ONLY ", " ON ", 1)) for name, definition in cursor.fetchall()]
+
+
+def synthetic_row_counts(db) -> dict[str, int]:
+    from sqlalchemy import text
+
+    return {
+        "tickets": db.execute(text(
+            "SELECT count(*) FROM ticketing.tickets WHERE chatbot_id = :c"), {"c": SYNTHETIC_CHATBOT_ID}
+        ).scalar_one(),
+        "grievances": db.execute(text(
+            "SELECT count(*) FROM public.grievances WHERE grievance_id LIKE :p"), {"p": f"{GRIEVANCE_PREFIX}%"}
+        ).scalar_one(),
+        "officers": db.execute(text(
+            "SELECT count(DISTINCT user_id) FROM ticketing.officer_scopes WHERE user_id LIKE :p"),
+            {"p": f"{OFFICER_PREFIX}%"},
+        ).scalar_one(),
+    }
+
+
+def reset_synthetic(db) -> None:
+    """Delete every synthetic row (ticket children cascade)."""
+    from sqlalchemy import text
+
+    started = time.monotonic()
+    db.execute(text("DELETE FROM ticketing.tickets WHERE chatbot_id = :c"), {"c": SYNTHETIC_CHATBOT_ID})
+    db.execute(text("DELETE FROM public.grievances WHERE grievance_id LIKE :p"), {"p": f"{GRIEVANCE_PREFIX}%"})
+    for table in ("ticketing.officer_scopes", "ticketing.user_roles", "ticketing.officer_onboarding"):
+        db.execute(text(f"DELETE FROM {table} WHERE user_id LIKE :p"), {"p": f"{OFFICER_PREFIX}%"})
+    db.commit()
+    logger.info("Synthetic rows deleted in %.1fs", time.monotonic() - started)
+
+
+def load_synthetic(profile: SyntheticProfile, *, defer_indexes: bool = False) -> Counter:
+    """Generate and COPY the dataset described by profile; returns row counts per table."""
+    from sqlalchemy import text
+
+    from ticketing.models.base import SessionLocal, engine
+    from ticketing.seed.kl_road_seah import seed_seah
+    from ticketing.seed.kl_road_standard import seed_standard
+    from ticketing.services.event_partitions import ensure_ticket_event_partitions, is_partitioned
+
+    with SessionLocal() as db:
+        existing = synthetic_row_counts(db)
+        if any(existing.values()):
+            raise SystemExit(f"Synthetic rows already present ({existing}); run with --reset first")
+        seed_standard(db)
+        seed_seah(db)
+        db.commit()
+        ref = load_reference_data(db)
+        if is_partitioned(db):
+            as_of = profile.as_of_datetime().date()
+            created = ensure_ticket_event_partitions(
+                db, start=as_of - timedelta(days=profile.created_within_days), today=as_of
+            )
+            db.commit()
+            logger.info("Created %d ticket_events month partitions", len(created))
+
+    logger.info(
+        "Generating: seed=%s as_of=%s grievances=%d officers=%d locations=%d",
+        profile.seed, profile.as_of_datetime().date(), profile.grievances, profile.officers, len(ref.locations),
+    )
+    started = time.monotonic()
+    raw = engine.raw_connection()
+    dropped: list[tuple[str, str]] = []
+    try:
+        cursor = raw.cursor()
+        if defer_indexes:
+            dropped = _deferrable_indexes(cursor)
+            for name, _ in dropped:
+                cursor.execute(f"DROP INDEX ticketing.{name}")
+            raw.commit()
+            logger.info("Dropped %d secondary indexes for the load", len(dropped))
+
+        loader = CopyLoader(raw, profile.batch_rows, profile.commit_every)
+        SyntheticDataset(profile, ref).generate(loader)
+        loader.commit()
+
+        cursor.execute("""
+            UPDATE ticketing.tickets t
+            SET current_overdue_episode_id = e.episode_id, sla_breached = TRUE
+            FROM ticketing.ticket_overdue_episodes e
+            WHERE e.ticket_id = t.ticket_id AND e.ended_at IS NULL AND t.chatbot_id = %s
+        """, (SYNTHETIC_CHATBOT_ID,))
+        raw.commit()
+    finally:
+        if dropped:
+            raw.rollback()
+            cursor = raw.cursor()
+            index_started = time.monotonic()
+            for _, definition in dropped:
+                cursor.execute(definition)
+            raw.commit()
+            logger.info("Recreated %d indexes in %.1fs", len(dropped), time.monotonic() - index_started)
+        raw.close()
+
+    with engine.connect() as conn:
+        conn.execution_options(isolation_level="AUTOCOMMIT")
+        for table in TABLE_COLUMNS:
+            conn.execute(text(f"ANALYZE {table}"))
+
+    elapsed = time.monotonic() - started
+    total = sum(loader.counts.values())
+    logger.info("Loaded %d rows in %.1fs (%.0f rows/s)", total, elapsed, total / elapsed if elapsed else 0)
+    return loader.counts
+
+
+def _profile_from_args(args) -> SyntheticProfile:
+    profile = SyntheticProfile.from_file(args.profile) if args.profile else SyntheticProfile()
+    for name in ("seed", "as_of", "grievances", "events_per_ticket", "officers", "viewers_per_ticket",
+                 "task_share", "seah_share", "overdue_share", "created_within_days"):
+        value = getattr(args, name)
+        if value is not None:
+            setattr(profile, name, value)
+    return profile
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m ticketing.seed.synthetic_dataset", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profile", help="JSON file with SyntheticProfile fields")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--as-of", dest="as_of", help="ISO date the data is current at (default today)")
+    parser.add_argument("--grievances", type=int)
+    parser.add_argument("--events-per-ticket", dest="events_per_ticket", type=float)
+    parser.add_argument("--officers", type=int)
+    parser.add_argument("--viewers-per-ticket", dest="viewers_per_ticket", type=float)
+    parser.add_argument("--task-share", dest="task_share", type=float)
+    parser.add_argument("--seah-share", dest="seah_share", type=float)
+    parser.add_argument("--overdue-share", dest="overdue_share", type=float)
+    parser.add_argument("--created-within-days", dest="created_within_days", type=int)
+    parser.add_argument("--defer-indexes", action="store_true",
+                        help="drop secondary indexes on ticket tables during the load and rebuild after")
+    parser.add_argument("--print-profile", action="store_true", help="print the effective profile and exit")
+    parser.add_argument("--reset", action="store_true", help="delete all synthetic rows and exit")
+    args = parser.parse_args(argv)
+
+    if args.reset:
+        from ticketing.models.base import SessionLocal
+
+        with SessionLocal() as db:
+            reset_synthetic(db)
+        return
+
+    profile = _profile_from_args(args)
+    if args.print_profile:
+        print(json.dumps(asdict(profile), indent=2))
+        return
+    counts = load_synthetic(profile, defer_indexes=args.defer_indexes)
+    for table, count in counts.items():
+        logger.info("  %-36s %d", table, count)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+    main()
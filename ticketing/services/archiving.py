@@ -9,12 +9,13 @@ import logging
 import os
 import shutil
 import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from datetime import date, datetime, timezone
-from typing import Any
+from typing import Any, Iterator
 from zoneinfo import ZoneInfo
 
-from sqlalchemy import select, text
+from sqlalchemy import Select, case, func, select, text
 from sqlalchemy.orm import Session
 
 from ticketing.clients import grievance_api
@@ -124,6 +125,91 @@ def is_ticket_eligible(
     return True, None
 
 
+def resolution_cutoff(as_of: date, years_before_archiving: int, policy: dict[str, Any]) -> datetime:
+    """
+    Inverse of archive_eligible_date for a run on as_of: a ticket is eligible iff it was
+    resolved strictly before the returned instant (1 January of year N_max + 1 in the policy tz).
+    """
+    run_anchor = (int(policy.get("archive_run_month", 1)), int(policy.get("archive_run_day", 2)))
+    passed_anchor = (as_of.month, as_of.day) >= run_anchor
+    last_eligible_year = as_of.year - 1 - years_before_archiving - (0 if passed_anchor else 1)
+    return datetime(
+        last_eligible_year + 1, 1, 1,
+        tzinfo=ZoneInfo(policy.get("timezone", "Asia/Kathmandu")),
+    )
+
+
+def _resolution_timestamp_expr():
+    """L1 in SQL: latest RESOLVED event, else ticket_resolved_summaries.resolved_at."""
+    latest_resolved_event = (
+        select(func.max(TicketEvent.created_at))
+        .where(
+            TicketEvent.ticket_id == Ticket.ticket_id,
+            TicketEvent.event_type == "RESOLVED",
+        )
+        .correlate(Ticket)
+        .scalar_subquery()
+    )
+    return func.coalesce(latest_resolved_event, TicketResolvedSummary.resolved_at)
+
+
+def _unarchived_resolved_filters() -> tuple:
+    return (
+        Ticket.is_deleted.is_(False),
+        Ticket.is_archived.is_(False),
+        Ticket.archived_at.is_(None),
+        Ticket.status_code.in_(tuple(RESOLVED_STATUSES)),
+    )
+
+
+def eligible_ticket_ids_query(policy: dict[str, Any], as_of: date) -> Select:
+    """Same rule as is_ticket_eligible, as one predicate: only qualifying ticket_ids, ordered."""
+    standard_cutoff = resolution_cutoff(as_of, int(policy["years_before_archiving"]), policy)
+    seah_years = policy.get("seah_years_before_archiving")
+    cutoff = standard_cutoff
+    if seah_years is not None:
+        cutoff = case(
+            (Ticket.is_seah.is_(True), resolution_cutoff(as_of, int(seah_years), policy)),
+            else_=standard_cutoff,
+        )
+    return (
+        select(Ticket.ticket_id)
+        .outerjoin(TicketResolvedSummary, TicketResolvedSummary.ticket_id == Ticket.ticket_id)
+        .where(*_unarchived_resolved_filters(), _resolution_timestamp_expr() < cutoff)
+        .order_by(Ticket.ticket_id)
+    )
+
+
+def iter_eligible_ticket_id_chunks(
+    db: Session,
+    policy: dict[str, Any],
+    as_of: date,
+    chunk_size: int,
+) -> Iterator[list[str]]:
+    """Keyset-paginate eligible ticket_ids; rows archived meanwhile simply drop out of later pages."""
+    query = eligible_ticket_ids_query(policy, as_of)
+    last_id: str | None = None
+    while True:
+        page = query if last_id is None else query.where(Ticket.ticket_id > last_id)
+        ids = list(db.execute(page.limit(chunk_size)).scalars().all())
+        if not ids:
+            return
+        yield ids
+        if len(ids) < chunk_size:
+            return
+        last_id = ids[-1]
+
+
+def count_missing_resolution_timestamp(db: Session) -> int:
+    """Resolved, unarchived tickets with no RESOLVED event or summary — never archived (see L1)."""
+    return db.execute(
+        select(func.count())
+        .select_from(Ticket)
+        .outerjoin(TicketResolvedSummary, TicketResolvedSummary.ticket_id == Ticket.ticket_id)
+        .where(*_unarchived_resolved_filters(), _resolution_timestamp_expr().is_(None))
+    ).scalar_one()
+
+
 def select_eligible_tickets(
     db: Session,
     policy: dict[str, Any],
@@ -131,24 +217,9 @@ def select_eligible_tickets(
 ) -> list[Ticket]:
     as_of = as_of or date.today()
     q = select(Ticket).where(
-        Ticket.is_deleted.is_(False),
-        Ticket.is_archived.is_(False),
-        Ticket.archived_at.is_(None),
-        Ticket.status_code.in_(tuple(RESOLVED_STATUSES)),
+        Ticket.ticket_id.in_(eligible_ticket_ids_query(policy, as_of).order_by(None)),
     )
-    tickets = db.execute(q).scalars().all()
-    eligible: list[Ticket] = []
-    for ticket in tickets:
-        ok, reason = is_ticket_eligible(db, ticket, policy, as_of)
-        if ok:
-            eligible.append(ticket)
-        elif reason == "no_resolution_timestamp":
-            logger.warning(
-                "archive skip: ticket=%s grievance=%s — no RESOLVED event or resolved summary",
-                ticket.ticket_id,
-                ticket.grievance_id,
-            )
-    return eligible
+    return list(db.execute(q).scalars().all())
 
 
 def _tier_attachments(
@@ -164,27 +235,33 @@ def _tier_attachments(
     now = datetime.now(timezone.utc)
 
     try:
-        rows = db.execute(
-            text(
-                """
-                SELECT file_id, file_path, file_name
-                FROM public.file_attachments
-                WHERE grievance_id = :gid
-                """
-            ),
-            {"gid": grievance_id},
-        ).mappings().all()
+        with db.begin_nested():
+            rows = db.execute(
+                text(
+                    """
+                    SELECT file_id, file_path, file_name, content_sha256, storage_tier
+                    FROM public.file_attachments
+                    WHERE grievance_id = :gid
+                    """
+                ),
+                {"gid": grievance_id},
+            ).mappings().all()
     except Exception as exc:
         logger.warning("tier_attachments: file_attachments unavailable — %s", exc)
-        db.rollback()
         return 0
 
     count = 0
+    tier = "archive" if tier_mode in ("cold", "glacier") else "active"
     for row in rows:
         file_id = row["file_id"]
         src_path = row["file_path"]
+        content_sha256 = row.get("content_sha256")
         ext = os.path.splitext(row["file_name"] or src_path)[1] or ""
-        storage_key = f"archive/{grievance_id}/{file_id}{ext}"
+        if content_sha256:
+            # Shared content-addressed blob: one archive copy per hash, whichever case goes first.
+            storage_key = f"archive/blobs/{content_sha256[:2]}/{content_sha256}{ext.lower()}"
+        else:
+            storage_key = f"archive/{grievance_id}/{file_id}{ext}"
 
         if tier_mode == "cold" and os.path.isfile(src_path):
             dest_path = os.path.join(upload_root, storage_key)
@@ -203,16 +280,34 @@ def _tier_attachments(
                 """
             ),
             {
-                "tier": "archive" if tier_mode in ("cold", "glacier") else "active",
+                "tier": tier,
                 "key": storage_key if tier_mode == "cold" else None,
                 "archived_at": now,
                 "fid": file_id,
             },
         )
+        if content_sha256 and tier == "archive" and (row.get("storage_tier") or "active") == "active":
+            _release_blob_reference(db, content_sha256, tier, storage_key if tier_mode == "cold" else None)
         count += 1
     return count
 
 
+def _release_blob_reference(db: Session, content_sha256: str, tier: str, storage_key: str | None) -> None:
+    """Drop one active reference; the blob follows the tier once no active attachment uses it."""
+    db.execute(
+        text(
+            """
+            UPDATE public.attachment_blobs
+            SET ref_count = GREATEST(ref_count - 1, 0),
+                storage_tier = CASE WHEN ref_count <= 1 THEN :tier ELSE storage_tier END,
+                storage_key = CASE WHEN ref_count <= 1 THEN :key ELSE storage_key END
+            WHERE content_sha256 = :sha
+            """
+        ),
+        {"tier": tier, "key": storage_key, "sha": content_sha256},
+    )
+
+
 def archive_ticket(
     db: Session,
     ticket: Ticket,
@@ -250,13 +345,13 @@ def archive_ticket(
             note="Case archived by GRM retention policy",
         )
     except Exception as exc:
+        # Caller rolls back (run_archive_job wraps each ticket in a savepoint)
         logger.error(
             "archive_ticket: grievance API failed ticket=%s grievance=%s — %s",
             ticket.ticket_id,
             ticket.grievance_id,
             exc,
         )
-        db.rollback()
         raise
 
     attachments_tiered = _tier_attachments(db, ticket.grievance_id, policy)
@@ -322,17 +417,62 @@ def clear_archive_on_reopen(db: Session, ticket: Ticket) -> None:
         )
 
 
+def _archive_chunk(
+    bind: Any,
+    ticket_ids: list[str],
+    policy: dict[str, Any],
+    dry_run: bool,
+) -> ArchiveJobSummary:
+    """Archive one chunk in its own session and transaction; one savepoint per ticket."""
+    part = ArchiveJobSummary(as_of=date.today(), dry_run=dry_run)
+    with Session(bind=bind) as db:
+        q = select(Ticket).where(Ticket.ticket_id.in_(ticket_ids)).order_by(Ticket.ticket_id)
+        if not dry_run:
+            # A concurrent run (or officer edit) holding a row: leave it for the next run
+            q = q.with_for_update(skip_locked=True)
+        tickets = db.execute(q).scalars().all()
+        part.skipped += len(ticket_ids) - len(tickets)
+
+        for ticket in tickets:
+            try:
+                with db.begin_nested():
+                    result = archive_ticket(db, ticket, policy, dry_run=dry_run)
+                part.details.append(result)
+                if result.archived and not result.skipped_reason:
+                    part.archived += 1
+                elif result.skipped_reason:
+                    part.skipped += 1
+            except Exception:
+                part.errors += 1
+                logger.exception("archive job failed for ticket=%s", ticket.ticket_id)
+
+        if dry_run:
+            db.rollback()
+        else:
+            db.commit()
+    return part
+
+
 def run_archive_job(
     db: Session,
     *,
     as_of: date | None = None,
     dry_run: bool | None = None,
+    chunk_size: int | None = None,
+    workers: int | None = None,
 ) -> ArchiveJobSummary:
+    """
+    Archive every eligible ticket. Candidates come from eligible_ticket_ids_query in keyset
+    chunks; each chunk commits on its own (up to ``workers`` chunks in flight), so a run never
+    holds one long transaction and a failure only loses its own ticket.
+    """
     from ticketing.config.settings import get_settings
 
     settings = get_settings()
     if dry_run is None:
         dry_run = settings.archiving_dry_run
+    chunk_size = max(1, chunk_size or settings.archiving_chunk_size)
+    workers = max(1, workers or settings.archiving_workers)
 
     policy = load_archiving_policy(db)
     as_of = as_of or date.today()
@@ -342,33 +482,50 @@ def run_archive_job(
         logger.info("archive job: disabled in archiving_policy — no-op")
         return summary
 
-    candidates = select_eligible_tickets(db, policy, as_of)
-    summary.candidates = len(candidates)
-
-    for ticket in candidates:
-        try:
-            result = archive_ticket(db, ticket, policy, dry_run=dry_run)
-            summary.details.append(result)
-            if result.archived and not result.skipped_reason:
-                summary.archived += 1
-            elif result.skipped_reason:
-                summary.skipped += 1
-        except Exception:
-            summary.errors += 1
-            logger.exception("archive job failed for ticket=%s", ticket.ticket_id)
-
-    if not dry_run:
-        db.commit()
+    missing = count_missing_resolution_timestamp(db)
+    if missing:
+        logger.warning(
+            "archive job: %s resolved ticket(s) have no RESOLVED event or resolved summary — skipped",
+            missing,
+        )
+
+    bind = db.get_bind()
+
+    def merge(part: ArchiveJobSummary) -> None:
+        summary.archived += part.archived
+        summary.skipped += part.skipped
+        summary.errors += part.errors
+        summary.details.extend(part.details)
+
+    chunks = iter_eligible_ticket_id_chunks(db, policy, as_of, chunk_size)
+    if workers == 1:
+        for ticket_ids in chunks:
+            summary.candidates += len(ticket_ids)
+            merge(_archive_chunk(bind, ticket_ids, policy, dry_run))
     else:
-        db.rollback()
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="archive") as pool:
+            in_flight = set()
+            for ticket_ids in chunks:
+                summary.candidates += len(ticket_ids)
+                in_flight.add(pool.submit(_archive_chunk, bind, ticket_ids, policy, dry_run))
+                if len(in_flight) >= workers * 2:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        merge(future.result())
+            for future in in_flight:
+                merge(future.result())
+    db.rollback()  # end the read-only selection transaction
 
     logger.info(
-        "archive job complete: as_of=%s candidates=%s archived=%s skipped=%s errors=%s dry_run=%s",
+        "archive job complete: as_of=%s candidates=%s archived=%s skipped=%s errors=%s "
+        "dry_run=%s chunk_size=%s workers=%s",
         as_of,
         summary.candidates,
         summary.archived,
         summary.skipped,
         summary.errors,
         dry_run,
+        chunk_size,
+        workers,
     )
     return summary
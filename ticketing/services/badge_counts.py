@@ -0,0 +1,529 @@
+"""
+Officer notification badge counts — counter cache + server-sent-event fan-out.
+
+The badge is the number of unseen TicketEvents assigned to an officer. Instead of
+every dashboard polling GET /users/me/badge (or the ticket list) to recount, the
+count lives in Redis (``ticketing:badge:{user_id}``) and is adjusted incrementally:
+
+  - install_badge_tracking() hooks the ticketing sessionmaker. Flushed TicketEvent
+    inserts / seen flips / deletes accumulate per-officer deltas on the session, and
+    after_commit applies them (so notify_assignment, escalation, inbound messages and
+    every other event writer are covered without per-call-site changes).
+  - Core bulk updates bypass the ORM; callers record their delta with record_badge_delta().
+  - A key is only incremented when present. A missing key (first use, eviction, TTL)
+    is recounted from the DB once by the next reader, so drift heals within the TTL.
+  - A recount is stored only if no write for that officer raced it. The first delta of a
+    transaction marks the officer pending (``ticketing:badge_pending:{user_id}``) before
+    the DB commit; after_commit applies the delta, clears the mark and bumps an epoch
+    (``ticketing:badge_epoch:{user_id}``). A reader reads the epoch before counting and
+    stores its count (Lua check-and-set) only if the epoch is unchanged and nothing is
+    pending, so a concurrent commit is neither dropped nor counted twice.
+  - Rows removed by the database itself (ON DELETE CASCADE from tickets, raw SQL purges)
+    bypass the session hooks. Code that deletes tickets or events that way must call
+    invalidate() for the affected officers; otherwise the count is off until the TTL.
+
+Every change is PUBLISHed on ``ticketing:badge``; one listener thread per API process
+fans it out to that process's SSE subscribers (GET /users/me/badge/stream) through a
+BadgeHub, so N open dashboards cost one Redis subscription rather than N polls.
+
+Without Redis (BADGE_REDIS_URL=memory://, tests, the load harness) the counter keeps
+counts in-process and dispatches straight to the hub.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import Counter
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+
+from ticketing.config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+BADGE_KEY_PREFIX = "ticketing:badge:"
+BADGE_EPOCH_PREFIX = "ticketing:badge_epoch:"
+BADGE_PENDING_PREFIX = "ticketing:badge_pending:"
+BADGE_CHANNEL = "ticketing:badge"
+_SESSION_DELTAS_KEY = "badge_deltas"
+_SESSION_PENDING_KEY = "badge_pending"
+_PENDING_TTL_SECONDS = 60  # a mark left by a crashed writer stops blocking stores after this
+_REDIS_RETRY_SECONDS = 30.0
+
+# Bump the epoch, clear this writer's pending mark (ARGV[3] = 1), then INCRBY only when
+# the key exists; a negative result means the cache drifted — drop it.
+_INCR_IF_PRESENT_LUA = """
+redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+if ARGV[3] == '1' and redis.call('DECR', KEYS[3]) <= 0 then redis.call('DEL', KEYS[3]) end
+if ARGV[1] == '0' or redis.call('EXISTS', KEYS[1]) == 0 then return nil end
+local n = redis.call('INCRBY', KEYS[1], ARGV[1])
+if n < 0 then redis.call('DEL', KEYS[1]) return nil end
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return n
+"""
+
+# Store a recount only if no write is pending and none landed while it was being counted.
+_STORE_IF_UNCHANGED_LUA = """
+local epoch = redis.call('GET', KEYS[2]) or ''
+if epoch ~= ARGV[3] or tonumber(redis.call('GET', KEYS[3]) or '0') > 0 then return 0 end
+redis.call('SET', KEYS[1], ARGV[1], 'NX', 'EX', ARGV[2])
+return 1
+"""
+
+
+def badge_key(user_id: str) -> str:
+    return f"{BADGE_KEY_PREFIX}{user_id}"
+
+
+def badge_epoch_key(user_id: str) -> str:
+    return f"{BADGE_EPOCH_PREFIX}{user_id}"
+
+
+def badge_pending_key(user_id: str) -> str:
+    return f"{BADGE_PENDING_PREFIX}{user_id}"
+
+
+def _keys(user_id: str) -> list[str]:
+    return [badge_key(user_id), badge_epoch_key(user_id), badge_pending_key(user_id)]
+
+
+def format_badge_event(unseen_count: int) -> str:
+    return f"event: badge\ndata: {json.dumps({'unseen_count': unseen_count})}\n\n"
+
+
+# ── Per-process subscriber fan-out ────────────────────────────────────────────
+
+class BadgeHub:
+    """
+    Routes badge updates to the SSE subscribers of this process.
+
+    Each subscriber owns a one-slot asyncio.Queue holding only the latest value: a
+    slow client skips intermediate counts instead of buffering them. dispatch() is
+    thread-safe (called from the Redis listener thread or a sync request handler).
+    """
+
+    def __init__(self) -> None:
+        self._subscribers: dict[str, set[tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, user_id: str) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        with self._lock:
+            self._subscribers.setdefault(user_id, set()).add((asyncio.get_running_loop(), queue))
+        return queue
+
+    def unsubscribe(self, user_id: str, queue: asyncio.Queue) -> None:
+        with self._lock:
+            subs = self._subscribers.get(user_id)
+            if not subs:
+                return
+            for entry in [e for e in subs if e[1] is queue]:
+                subs.discard(entry)
+            if not subs:
+                del self._subscribers[user_id]
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(s) for s in self._subscribers.values())
+
+    def dispatch(self, user_id: str, unseen_count: Optional[int]) -> None:
+        """Deliver a count (None = "recount") to every subscriber of user_id."""
+        with self._lock:
+            targets = list(self._subscribers.get(user_id, ()))
+        for loop, queue in targets:
+            try:
+                loop.call_soon_threadsafe(_put_latest, queue, unseen_count)
+            except RuntimeError:  # loop closed — subscriber is going away
+                pass
+
+
+def _put_latest(queue: asyncio.Queue, value: Any) -> None:
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(value)
+
+
+# ── Counter cache ─────────────────────────────────────────────────────────────
+
+class BadgeCounter:
+    """
+    Cached unseen counts per officer. ``redis_client=None`` keeps them in-process.
+
+    Redis errors never reach callers: reads fall back to the recount, writes are
+    dropped (the TTL bounds any resulting drift), and Redis is skipped for
+    _REDIS_RETRY_SECONDS after a failure.
+    """
+
+    def __init__(
+        self,
+        redis_client: Any = None,
+        *,
+        ttl_seconds: int = 3600,
+        hub: Optional[BadgeHub] = None,
+    ) -> None:
+        self._redis = redis_client
+        self._ttl = ttl_seconds
+        self.hub = hub or BadgeHub()
+        self._local: dict[str, int] = {}
+        self._local_epochs: Counter = Counter()
+        self._local_pending: Counter = Counter()
+        self._local_lock = threading.Lock()
+        self._incr = redis_client.register_script(_INCR_IF_PRESENT_LUA) if redis_client is not None else None
+        self._store = redis_client.register_script(_STORE_IF_UNCHANGED_LUA) if redis_client is not None else None
+        self._redis_down_until = 0.0
+        self._listener: Optional[threading.Thread] = None
+
+    # -- redis plumbing --------------------------------------------------------
+
+    def _redis_ok(self) -> bool:
+        return self._redis is not None and time.monotonic() >= self._redis_down_until
+
+    def _redis_failed(self, exc: Exception) -> None:
+        self._redis_down_until = time.monotonic() + _REDIS_RETRY_SECONDS
+        logger.warning("badge counter: Redis unavailable (%s); falling back to DB counts", exc)
+
+    # -- reads -----------------------------------------------------------------
+
+    def peek(self, user_id: str) -> Optional[int]:
+        """Cached count or None; never touches the DB."""
+        if self._redis is None:
+            with self._local_lock:
+                return self._local.get(user_id)
+        if not self._redis_ok():
+            return None
+        try:
+            raw = self._redis.get(badge_key(user_id))
+        except Exception as exc:
+            self._redis_failed(exc)
+            return None
+        return int(raw) if raw is not None else None
+
+    def get(self, user_id: str, recount: Callable[[], int]) -> int:
+        """Cached count, or ``recount()`` stored for the next reader unless a write raced it."""
+        cached = self.peek(user_id)
+        if cached is not None:
+            return cached
+        epoch = self._epoch(user_id)
+        count = int(recount())
+        if self._redis is None:
+            with self._local_lock:
+                if self._local_epochs[user_id] == epoch and not self._local_pending[user_id]:
+                    self._local.setdefault(user_id, count)
+        elif epoch is not None and self._redis_ok():
+            try:
+                self._store(keys=_keys(user_id), args=[count, self._ttl, epoch])
+            except Exception as exc:
+                self._redis_failed(exc)
+        return count
+
+    def _epoch(self, user_id: str) -> Any:
+        """Adjustment counter read before a recount; None when Redis is unavailable."""
+        if self._redis is None:
+            with self._local_lock:
+                return self._local_epochs[user_id]
+        if not self._redis_ok():
+            return None
+        try:
+            raw = self._redis.get(badge_epoch_key(user_id))
+        except Exception as exc:
+            self._redis_failed(exc)
+            return None
+        return raw.decode() if isinstance(raw, bytes) else (raw or "")
+
+    # -- writes ----------------------------------------------------------------
+
+    def mark_pending(self, user_id: str) -> None:
+        """Block recount stores for ``user_id`` until apply()/release() (call before the DB commit)."""
+        if self._redis is None:
+            with self._local_lock:
+                self._local_pending[user_id] += 1
+            return
+        if not self._redis_ok():
+            return
+        try:
+            pipe = self._redis.pipeline(transaction=True)
+            pipe.incr(badge_pending_key(user_id))
+            pipe.expire(badge_pending_key(user_id), _PENDING_TTL_SECONDS)
+            pipe.execute()
+        except Exception as exc:
+            self._redis_failed(exc)
+
+    def release(self, user_ids: Any) -> None:
+        """Drop pending marks of a rolled-back transaction."""
+        for user_id in user_ids:
+            self._adjust(user_id, 0, release=True)
+
+    def apply(self, deltas: dict[str, int], *, release: Any = ()) -> None:
+        """Adjust cached counts, clear the ``release`` pending marks and notify subscribers."""
+        release = set(release)
+        for user_id, delta in deltas.items():
+            if not user_id or not delta:
+                continue
+            count = self._adjust(user_id, delta, release=user_id in release)
+            release.discard(user_id)
+            self.publish(user_id, count)
+        self.release(release)
+
+    def _adjust(self, user_id: str, delta: int, *, release: bool = False) -> Optional[int]:
+        if self._redis is None:
+            with self._local_lock:
+                self._local_epochs[user_id] += 1
+                if release and self._local_pending[user_id] > 0:
+                    self._local_pending[user_id] -= 1
+                if not delta or user_id not in self._local:
+                    return None
+                count = self._local[user_id] + delta
+                if count < 0:
+                    del self._local[user_id]
+                    return None
+                self._local[user_id] = count
+                return count
+        if not self._redis_ok():
+            return None
+        try:
+            result = self._incr(keys=_keys(user_id), args=[delta, self._ttl, 1 if release else 0])
+        except Exception as exc:
+            self._redis_failed(exc)
+            return None
+        return int(result) if result is not None else None
+
+    def invalidate(self, user_id: str) -> None:
+        """Forget the cached count; subscribers recount."""
+        if self._redis is None:
+            with self._local_lock:
+                self._local_epochs[user_id] += 1
+                self._local.pop(user_id, None)
+        elif self._redis_ok():
+            try:
+                pipe = self._redis.pipeline(transaction=True)
+                pipe.incr(badge_epoch_key(user_id))
+                pipe.expire(badge_epoch_key(user_id), self._ttl)
+                pipe.delete(badge_key(user_id))
+                pipe.execute()
+            except Exception as exc:
+                self._redis_failed(exc)
+        self.publish(user_id, None)
+
+    def publish(self, user_id: str, unseen_count: Optional[int]) -> None:
+        if self._redis is None or not self._redis_ok():
+            # In-process only: other API workers see the change on their next recount.
+            self.hub.dispatch(user_id, unseen_count)
+            return
+        try:
+            self._redis.publish(BADGE_CHANNEL, json.dumps({"user_id": user_id, "unseen_count": unseen_count}))
+        except Exception as exc:
+            self._redis_failed(exc)
+            self.hub.dispatch(user_id, unseen_count)
+
+    # -- pub/sub listener --------------------------------------------------------
+
+    def start_listener(self) -> None:
+        """Fan Redis badge messages out to this process's hub (idempotent, daemon thread)."""
+        if self._redis is None or (self._listener is not None and self._listener.is_alive()):
+            return
+
+        def run() -> None:
+            while True:
+                try:
+                    pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+                    pubsub.subscribe(BADGE_CHANNEL)
+                    for message in pubsub.listen():
+                        try:
+                            payload = json.loads(message["data"])
+                            self.hub.dispatch(payload["user_id"], payload.get("unseen_count"))
+                        except (TypeError, ValueError, KeyError):
+                            continue
+                except Exception as exc:
+                    logger.warning("badge listener: %s; reconnecting", exc)
+                    time.sleep(5)
+
+        self._listener = threading.Thread(target=run, name="badge-listener", daemon=True)
+        self._listener.start()
+
+
+_counter: Optional[BadgeCounter] = None
+_counter_lock = threading.Lock()
+
+
+def _redis_url() -> str:
+    """BADGE_REDIS_URL, else db 0 of the broker's Redis host (as ops_heartbeat)."""
+    settings = get_settings()
+    if settings.badge_redis_url:
+        return settings.badge_redis_url
+    base, _, _db = settings.celery_broker_url.rpartition("/")
+    return f"{base}/0" if base else settings.celery_broker_url
+
+
+def get_badge_counter() -> BadgeCounter:
+    global _counter
+    if _counter is None:
+        with _counter_lock:
+            if _counter is None:
+                url = _redis_url()
+                client = None
+                if not url.startswith("memory://"):
+                    import redis
+
+                    client = redis.from_url(url, socket_timeout=2, socket_connect_timeout=2)
+                _counter = BadgeCounter(client, ttl_seconds=get_settings().badge_cache_ttl_seconds)
+    return _counter
+
+
+def set_badge_counter(counter: Optional[BadgeCounter]) -> None:
+    """Swap the process-wide counter (tests, load harness)."""
+    global _counter
+    _counter = counter
+
+
+# ── Session hooks ─────────────────────────────────────────────────────────────
+
+def _unseen_owner(seen: Any, assignee: Any) -> Optional[str]:
+    return assignee if (seen is False and assignee) else None
+
+
+def _previous(state: Any, attr: str) -> Any:
+    history = state.attrs[attr].history
+    if history.deleted:
+        return history.deleted[0]
+    if history.unchanged:
+        return history.unchanged[0]
+    return getattr(state.obj(), attr)
+
+
+def record_badge_delta(session: Any, user_id: Optional[str], delta: int) -> None:
+    """Queue a badge change on ``session``; applied after its next commit."""
+    if user_id and delta:
+        session.info.setdefault(_SESSION_DELTAS_KEY, Counter())[user_id] += delta
+        pending = session.info.setdefault(_SESSION_PENDING_KEY, set())
+        if user_id not in pending:
+            pending.add(user_id)
+            try:
+                get_badge_counter().mark_pending(user_id)
+            except Exception as exc:
+                logger.warning("badge counter pending mark failed: %s", exc)
+
+
+def _after_flush(session: Any, flush_context: Any) -> None:
+    from sqlalchemy import inspect
+
+    from ticketing.models.ticket import TicketEvent
+
+    for obj in session.new:
+        if isinstance(obj, TicketEvent):
+            record_badge_delta(session, _unseen_owner(obj.seen, obj.assigned_to_user_id), 1)
+    for obj in session.dirty:
+        if isinstance(obj, TicketEvent):
+            state = inspect(obj)
+            if not (state.attrs.seen.history.has_changes()
+                    or state.attrs.assigned_to_user_id.history.has_changes()):
+                continue
+            before = _unseen_owner(_previous(state, "seen"), _previous(state, "assigned_to_user_id"))
+            after = _unseen_owner(obj.seen, obj.assigned_to_user_id)
+            if before != after:
+                record_badge_delta(session, before, -1)
+                record_badge_delta(session, after, 1)
+    for obj in session.deleted:
+        if isinstance(obj, TicketEvent):
+            state = inspect(obj)
+            record_badge_delta(
+                session, _unseen_owner(_previous(state, "seen"), _previous(state, "assigned_to_user_id")), -1
+            )
+
+
+def _after_commit(session: Any) -> None:
+    deltas = session.info.pop(_SESSION_DELTAS_KEY, None)
+    pending = session.info.pop(_SESSION_PENDING_KEY, None)
+    if deltas or pending:
+        try:
+            get_badge_counter().apply(dict(deltas or {}), release=pending or ())
+        except Exception as exc:  # never fail a committed request over a badge
+            logger.warning("badge counter update failed: %s", exc)
+
+
+def _after_rollback(session: Any) -> None:
+    session.info.pop(_SESSION_DELTAS_KEY, None)
+    pending = session.info.pop(_SESSION_PENDING_KEY, None)
+    if pending:
+        try:
+            get_badge_counter().release(pending)
+        except Exception as exc:
+            logger.warning("badge counter release failed: %s", exc)
+
+
+def install_badge_tracking(session_factory: Any) -> None:
+    """Attach the delta hooks to a sessionmaker (idempotent)."""
+    from sqlalchemy import event
+
+    if event.contains(session_factory, "after_commit", _after_commit):
+        return
+    event.listen(session_factory, "after_flush", _after_flush)
+    event.listen(session_factory, "after_commit", _after_commit)
+    event.listen(session_factory, "after_rollback", _after_rollback)
+
+
+# ── DB recount + SSE stream ───────────────────────────────────────────────────
+
+def count_unseen_events(db: Any, user_id: str) -> int:
+    from sqlalchemy import func, select
+
+    from ticketing.models.ticket import TicketEvent
+
+    return db.execute(
+        select(func.count(TicketEvent.event_id)).where(
+            TicketEvent.assigned_to_user_id == user_id,
+            TicketEvent.seen.is_(False),
+        )
+    ).scalar_one()
+
+
+def recount_with_own_session(user_id: str) -> int:
+    """Cached count, recounting on a short-lived session (for long-lived streams)."""
+    from ticketing.models.base import SessionLocal
+
+    def recount() -> int:
+        db = SessionLocal()
+        try:
+            return count_unseen_events(db, user_id)
+        finally:
+            db.close()
+
+    return get_badge_counter().get(user_id, recount)
+
+
+async def badge_event_stream(
+    user_id: str,
+    *,
+    counter: BadgeCounter,
+    load: Callable[[], int],
+    is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None,
+    keepalive_seconds: float = 15.0,
+) -> AsyncIterator[str]:
+    """
+    SSE body: the current count, then one ``badge`` event per change.
+
+    ``load`` returns the cached-or-recounted count (blocking; run in a thread). It is
+    called once after subscribing — so no update between the two is lost — and again
+    whenever the cache reports a miss.
+    """
+    queue = counter.hub.subscribe(user_id)
+    try:
+        last = await asyncio.to_thread(load)
+        yield "retry: 5000\n\n" + format_badge_event(last)
+        while True:
+            try:
+                count = await asyncio.wait_for(queue.get(), timeout=keepalive_seconds)
+            except asyncio.TimeoutError:
+                if is_disconnected is not None and await is_disconnected():
+                    return
+                yield ": keepalive\n\n"
+                continue
+            if count is None:
+                count = await asyncio.to_thread(load)
+            if count != last:
+                last = count
+                yield format_badge_event(count)
+    finally:
+        counter.hub.unsubscribe(user_id, queue)
@@ -1,15 +1,57 @@
-"""Complainant closure PDF (reportlab — spec §3.9.5)."""
+"""
+Complainant closure PDF (reportlab — spec §3.9.5).
+
+Rendered documents are cached on disk, content-addressed: the file name is a hash of the
+grievance id, the summary_public_json fields the layout reads and TEMPLATE_VERSION. A
+changed summary or template therefore gets a new file (and ETag) without explicit
+invalidation; the cache directory can be wiped at any time. HTTP serving (ETag,
+If-None-Match, FileResponse) lives in ticketing/api/routers/public_closure.py. Bump TEMPLATE_VERSION when
+build_closure_pdf's output changes.
+
+The Celery worker pre-renders into the same directory the API serves from, so both must
+see one CLOSURE_PDF_CACHE_DIR (the shared uploads volume in docker-compose.grm.yml).
+A cache hit refreshes the file's mtime; prune_closure_pdf_cache() (daily beat task)
+drops files unused for CLOSURE_PDF_CACHE_MAX_AGE_DAYS and then the least recently used
+ones until the directory is under CLOSURE_PDF_CACHE_MAX_MB.
+"""
 
 from __future__ import annotations
 
+import hashlib
 import io
-from typing import Any
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
 
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.lib.units import cm
 from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
 
+logger = logging.getLogger(__name__)
+
+TEMPLATE_VERSION = 1
+
+# Temp files older than this are leftovers of a crashed render
+_STALE_TEMP_SECONDS = 3600
+
+# summary_public_json keys read by build_closure_pdf — only these feed the cache key
+_PDF_FIELDS = (
+    "project_name",
+    "complaint_filed_at",
+    "resolved_at",
+    "resolved_duration_days",
+    "resolved_by_display_name",
+    "original_complaint",
+    "resolution_category_label",
+    "resolution_text_public",
+    "findings_summary_public",
+)
+
 
 def _p(text: str) -> str:
     return (text or "").replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
@@ -53,3 +95,113 @@ def build_closure_pdf(public_json: dict[str, Any], grievance_id: str) -> bytes:
 
     doc.build(story)
     return buf.getvalue()
+
+
+def closure_pdf_key(public_json: dict[str, Any], grievance_id: str) -> str:
+    """sha256 over everything that changes the rendered PDF."""
+    payload = {
+        "v": TEMPLATE_VERSION,
+        "grievance_id": grievance_id,
+        "fields": {k: public_json.get(k) for k in _PDF_FIELDS},
+    }
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def closure_pdf_cache_dir() -> Path:
+    from ticketing.config.settings import get_settings
+
+    configured = get_settings().closure_pdf_cache_dir
+    if configured:
+        return Path(configured)
+    return Path(os.getenv("UPLOAD_FOLDER", "uploads")) / "ticketing" / "closure_pdf"
+
+
+def _cache_path(key: str, cache_dir: Path) -> Path:
+    return cache_dir / key[:2] / f"{key}.pdf"
+
+
+def get_or_render_closure_pdf(
+    public_json: dict[str, Any],
+    grievance_id: str,
+    *,
+    cache_dir: Optional[Path] = None,
+) -> tuple[Path, str]:
+    """
+    Path of the cached PDF for this summary, rendering it on a miss; returns (path, key).
+
+    Writes go to a temp file in the same directory and are renamed into place, so a
+    concurrent reader never sees a partial PDF; two concurrent misses both render and
+    the last rename wins with identical content.
+    """
+    key = closure_pdf_key(public_json, grievance_id)
+    path = _cache_path(key, cache_dir or closure_pdf_cache_dir())
+    if path.is_file():
+        try:
+            os.utime(path)  # last use, for prune_closure_pdf_cache
+        except OSError:
+            pass
+        return path, key
+
+    pdf_bytes = build_closure_pdf(public_json, grievance_id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".closure_", suffix=".pdf")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(pdf_bytes)
+        os.replace(tmp_path, path)
+    except OSError:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+    logger.info("closure pdf rendered grievance_id=%s key=%s", grievance_id, key[:12])
+    return path, key
+
+
+def prune_closure_pdf_cache(
+    cache_dir: Optional[Path] = None,
+    *,
+    max_age_days: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    now: Optional[float] = None,
+) -> dict[str, int]:
+    """
+    Evict cached PDFs not used for ``max_age_days``, then the least recently used until
+    the cache holds at most ``max_bytes``. Evicted documents are re-rendered on demand.
+    """
+    from ticketing.config.settings import get_settings
+
+    settings = get_settings()
+    root = cache_dir or closure_pdf_cache_dir()
+    if max_age_days is None:
+        max_age_days = settings.closure_pdf_cache_max_age_days
+    if max_bytes is None:
+        max_bytes = settings.closure_pdf_cache_max_mb * 1024 * 1024
+    now = time.time() if now is None else now
+
+    removed = 0
+    entries: list[tuple[float, int, Path]] = []
+    for path in root.glob("*/*.pdf"):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        age = now - st.st_mtime
+        stale_temp = path.name.startswith(".closure_") and age > _STALE_TEMP_SECONDS
+        if stale_temp or (max_age_days > 0 and age > max_age_days * 86400):
+            path.unlink(missing_ok=True)
+            removed += 1
+        elif not path.name.startswith("."):
+            entries.append((st.st_mtime, st.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    if max_bytes > 0 and total > max_bytes:
+        for _, size, path in sorted(entries, key=lambda e: e[0]):
+            path.unlink(missing_ok=True)
+            removed += 1
+            total -= size
+            if total <= max_bytes:
+                break
+    kept = sum(1 for *_, path in entries if path.exists())
+    logger.info("closure pdf cache pruned: removed=%s kept=%s bytes=%s", removed, kept, total)
+    return {"removed": removed, "kept": kept, "bytes": total}
+
@@ -0,0 +1,229 @@
+"""
+Monthly range partitions of ticketing.ticket_events — docs/ARCHIVING_AND_RETENTION.md §5.4.
+
+ticket_events is PARTITION BY RANGE (created_at) (migration b4d6f8h0), one partition per
+calendar month (UTC) named ticket_events_yYYYYmMM, plus ticket_events_default for rows
+outside every month range so inserts never fail when maintenance lags. Indexes and the
+(event_id, created_at) primary key are declared on the parent; PostgreSQL creates the
+matching per-partition indexes, so each month's indexes stay small and vacuum works one
+month at a time.
+
+maintain_ticket_event_partitions (Celery beat, daily) keeps TICKET_EVENTS_PARTITION_MONTHS_AHEAD
+future months created and, when TICKET_EVENTS_DETACH_AFTER_MONTHS > 0, detaches months
+older than that into the ticketing_archive schema (or drops them with
+TICKET_EVENTS_DETACH_DROP). A month is only detached when every event in it belongs to an
+archived ticket (§5.3: events of live cases are retained on the timeline).
+"""
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = "ticketing"
+PARENT = "ticket_events"
+DEFAULT_PARTITION = "ticket_events_default"
+ARCHIVE_SCHEMA = "ticketing_archive"
+
+_NAME_RE = re.compile(r"^ticket_events_y(\d{4})m(\d{2})$")
+
+
+@dataclass(frozen=True)
+class EventPartition:
+    name: str
+    month: Optional[date]          # None for the default partition
+
+
+def month_start(value: date | datetime) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, n: int) -> date:
+    index = month.year * 12 + (month.month - 1) + n
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT}_y{month.year:04d}m{month.month:02d}"
+
+
+def partition_bounds(month: date) -> tuple[datetime, datetime]:
+    """[start, end) of a month partition, in UTC."""
+    start = month_start(month)
+    nxt = add_months(start, 1)
+    return (
+        datetime(start.year, start.month, 1, tzinfo=timezone.utc),
+        datetime(nxt.year, nxt.month, 1, tzinfo=timezone.utc),
+    )
+
+
+def _month_from_name(name: str) -> Optional[date]:
+    m = _NAME_RE.match(name)
+    return date(int(m.group(1)), int(m.group(2)), 1) if m else None
+
+
+def is_partitioned(db: Session) -> bool:
+    relkind = db.execute(text("""
+        SELECT c.relkind FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = :schema AND c.relname = :table
+    """), {"schema": SCHEMA, "table": PARENT}).scalar()
+    return relkind == "p"
+
+
+def list_partitions(db: Session) -> list[EventPartition]:
+    rows = db.execute(text("""
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        JOIN pg_class p ON p.oid = i.inhparent
+        JOIN pg_namespace n ON n.oid = p.relnamespace
+        WHERE n.nspname = :schema AND p.relname = :table
+        ORDER BY c.relname
+    """), {"schema": SCHEMA, "table": PARENT}).scalars().all()
+    return [EventPartition(name, _month_from_name(name)) for name in rows]
+
+
+def create_month_partition(db: Session, month: date) -> bool:
+    """
+    Create the partition for ``month`` if missing; returns True when created.
+
+    Rows already sitting in the default partition for that month are moved into the new
+    table before it is attached (ATTACH would otherwise fail on them). The bounds CHECK
+    added before ATTACH lets PostgreSQL skip the validation scan of the new table.
+    """
+    month = month_start(month)
+    name = partition_name(month)
+    if any(p.name == name for p in list_partitions(db)):
+        return False
+    start, end = partition_bounds(month)
+    params = {"start": start, "end": end}
+    has_default = any(p.month is None for p in list_partitions(db))
+    stray = has_default and db.execute(text(f"""
+        SELECT EXISTS (
+            SELECT 1 FROM {SCHEMA}.{DEFAULT_PARTITION}
+            WHERE created_at >= :start AND created_at < :end
+        )
+    """), params).scalar()
+
+    if not stray:
+        db.execute(text(
+            f"CREATE TABLE {SCHEMA}.{name} PARTITION OF {SCHEMA}.{PARENT} "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        ))
+        logger.info("ticket_events: created partition %s", name)
+        return True
+
+    db.execute(text(
+        f"CREATE TABLE {SCHEMA}.{name} (LIKE {SCHEMA}.{PARENT} INCLUDING DEFAULTS)"
+    ))
+    db.execute(text(
+        f"ALTER TABLE {SCHEMA}.{name} ADD CONSTRAINT {name}_bounds "
+        f"CHECK (created_at >= '{start.isoformat()}' AND created_at < '{end.isoformat()}')"
+    ))
+    moved = db.execute(text(f"""
+        WITH moved AS (
+            DELETE FROM {SCHEMA}.{DEFAULT_PARTITION}
+            WHERE created_at >= :start AND created_at < :end
+            RETURNING *
+        )
+        INSERT INTO {SCHEMA}.{name} SELECT * FROM moved
+    """), params).rowcount
+    db.execute(text(
+        f"ALTER TABLE {SCHEMA}.{PARENT} ATTACH PARTITION {SCHEMA}.{name} "
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    ))
+    db.execute(text(f"ALTER TABLE {SCHEMA}.{name} DROP CONSTRAINT {name}_bounds"))
+    logger.info("ticket_events: created partition %s (moved %d rows from default)", name, moved)
+    return True
+
+
+def ensure_ticket_event_partitions(
+    db: Session,
+    *,
+    months_ahead: int = 3,
+    start: Optional[date] = None,
+    today: Optional[date] = None,
+) -> list[str]:
+    """Create every month partition from ``start`` (default: this month) through ``months_ahead``."""
+    current = month_start(today or datetime.now(timezone.utc).date())
+    month = month_start(start) if start else current
+    last = add_months(current, months_ahead)
+    created: list[str] = []
+    while month <= last:
+        if create_month_partition(db, month):
+            created.append(partition_name(month))
+        month = add_months(month, 1)
+    return created
+
+
+def _month_has_live_tickets(db: Session, name: str) -> bool:
+    return bool(db.execute(text(f"""
+        SELECT EXISTS (
+            SELECT 1 FROM {SCHEMA}.{name} e
+            JOIN {SCHEMA}.tickets t ON t.ticket_id = e.ticket_id
+            WHERE NOT t.is_archived
+        )
+    """)).scalar())
+
+
+def detach_ticket_event_partitions(
+    db: Session,
+    *,
+    before: date,
+    drop: bool = False,
+    archive_schema: str = ARCHIVE_SCHEMA,
+) -> list[str]:
+    """
+    Detach month partitions that end on or before ``before``'s month.
+
+    Detached months move to ``archive_schema`` (still queryable for audit) or are
+    dropped when ``drop``. Months that still hold events of non-archived tickets are
+    skipped and logged. Returns the names detached.
+    """
+    cutoff = month_start(before)
+    detached: list[str] = []
+    for part in list_partitions(db):
+        if part.month is None or add_months(part.month, 1) > cutoff:
+            continue
+        if _month_has_live_tickets(db, part.name):
+            logger.warning("ticket_events: keeping %s — it holds events of non-archived tickets", part.name)
+            continue
+        db.execute(text(f"ALTER TABLE {SCHEMA}.{PARENT} DETACH PARTITION {SCHEMA}.{part.name}"))
+        if drop:
+            db.execute(text(f"DROP TABLE {SCHEMA}.{part.name}"))
+        else:
+            db.execute(text(f"CREATE SCHEMA IF NOT EXISTS {archive_schema}"))
+            db.execute(text(f"ALTER TABLE {SCHEMA}.{part.name} SET SCHEMA {archive_schema}"))
+        logger.info("ticket_events: detached %s (%s)", part.name, "dropped" if drop else archive_schema)
+        detached.append(part.name)
+    return detached
+
+
+def maintain_ticket_event_partitions(
+    db: Session,
+    *,
+    months_ahead: int,
+    detach_after_months: int = 0,
+    drop: bool = False,
+    today: Optional[date] = None,
+) -> dict:
+    """Create upcoming months, then detach expired ones when retention is configured."""
+    if not is_partitioned(db):
+        logger.warning("ticket_events is not partitioned — run the ticketing migrations")
+        return {"partitioned": False, "created": [], "detached": []}
+    current = month_start(today or datetime.now(timezone.utc).date())
+    created = ensure_ticket_event_partitions(db, months_ahead=months_ahead, today=current)
+    detached: list[str] = []
+    if detach_after_months > 0:
+        detached = detach_ticket_event_partitions(
+            db, before=add_months(current, -detach_after_months), drop=drop
+        )
+    return {"partitioned": True, "created": created, "detached": detached}
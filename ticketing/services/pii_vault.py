@@ -3,12 +3,19 @@ PII masking and vault decrypt helpers for the ticketing API broker.
 
 The grievance GET endpoint may return pgcrypto hex ciphertext when fields were
 not decrypted server-side. Officers must never see ciphertext in the default UI.
+
+Decryption is batched: decrypt_ciphertexts() sends every ciphertext a caller needs
+in one pgp_sym_decrypt query over an array. Inside pii_decrypt_cache() (every
+API request via PiiDecryptCacheMiddleware; tasks opt in) plaintexts are memoized
+so repeated fields cost nothing; the cache is dropped when the scope ends.
 """
 from __future__ import annotations
 
 import logging
 import re
-from typing import Any
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterable, Iterator
 
 from sqlalchemy import text
 
@@ -46,42 +53,136 @@ def scrub_pii_value(value: Any) -> Any:
     return value
 
 
+_request_plaintexts: ContextVar[dict[str, str | None] | None] = ContextVar(
+    "pii_request_plaintexts", default=None
+)
+
+
+@contextmanager
+def pii_decrypt_cache() -> Iterator[dict[str, str | None]]:
+    """Memoize decrypted values until the block exits (one request or task). Nested scopes share the outer cache."""
+    current = _request_plaintexts.get()
+    if current is not None:
+        yield current
+        return
+    cache: dict[str, str | None] = {}
+    token = _request_plaintexts.set(cache)
+    try:
+        yield cache
+    finally:
+        _request_plaintexts.reset(token)
+        cache.clear()
+
+
+class PiiDecryptCacheMiddleware:
+    """ASGI middleware: one plaintext cache per HTTP request (sync endpoints see it via the copied context)."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with pii_decrypt_cache():
+            await self.app(scope, receive, send)
+
+
+def _as_text(decrypted: Any) -> str | None:
+    if decrypted is None:
+        return None
+    if isinstance(decrypted, memoryview):
+        return decrypted.tobytes().decode("utf-8", errors="replace")
+    if isinstance(decrypted, bytes):
+        return decrypted.decode("utf-8", errors="replace")
+    return str(decrypted)
+
+
+def _decrypt_batch(ciphertexts: list[str], key: str) -> dict[str, str | None]:
+    """One round-trip for all ciphertexts; falls back to one query each if any value fails to decrypt."""
+    with engine.connect() as conn:
+        try:
+            rows = conn.execute(
+                text(
+                    "SELECT ct, pgp_sym_decrypt(decode(ct, 'hex'), :key) AS decrypted "
+                    "FROM unnest(CAST(:cts AS text[])) AS ct"
+                ),
+                {"cts": ciphertexts, "key": key},
+            ).mappings().all()
+            return {row["ct"]: _as_text(row["decrypted"]) for row in rows}
+        except Exception as exc:
+            if len(ciphertexts) == 1:
+                raise
+            logger.warning("bulk decrypt failed (%s values), retrying one by one: %s", len(ciphertexts), exc)
+            conn.rollback()
+        out: dict[str, str | None] = {}
+        for ct in ciphertexts:
+            try:
+                row = conn.execute(
+                    text("SELECT pgp_sym_decrypt(decode(:ct, 'hex'), :key) AS decrypted"),
+                    {"ct": ct, "key": key},
+                ).mappings().first()
+                out[ct] = _as_text(row.get("decrypted")) if row else None
+            except Exception as exc:
+                logger.warning("decrypt_ciphertext failed: %s", exc)
+                conn.rollback()
+                out[ct] = None
+        return out
+
+
+def decrypt_ciphertexts(values: Iterable[Any]) -> dict[str, str | None]:
+    """
+    Decrypt many pgcrypto hex fields with DB_ENCRYPTION_KEY in a single query.
+
+    Returns {stripped ciphertext: plaintext or None}; values that are not ciphertext
+    are skipped. Cached plaintexts (inside pii_decrypt_cache) are not re-queried.
+    """
+    wanted = list(dict.fromkeys(v.strip() for v in values if looks_like_ciphertext(v)))
+    key = (get_settings().db_encryption_key or "").strip()
+    if not wanted or not key:
+        return {}
+    cache = _request_plaintexts.get()
+    if cache is None:
+        cache = {}
+    missing = [ct for ct in wanted if ct not in cache]
+    if missing:
+        try:
+            found = _decrypt_batch(missing, key)
+        except Exception as exc:
+            logger.warning("decrypt_ciphertext failed: %s", exc)
+            return {ct: cache.get(ct) for ct in wanted}
+        for ct in missing:
+            cache[ct] = found.get(ct)
+    return {ct: cache[ct] for ct in wanted}
+
+
 def decrypt_ciphertext(hex_value: str) -> str | None:
     """Decrypt a single pgcrypto hex field using DB_ENCRYPTION_KEY (same DB as chatbot)."""
-    settings = get_settings()
-    key = (settings.db_encryption_key or "").strip()
-    if not key or not looks_like_ciphertext(hex_value):
-        return None
-    try:
-        with engine.connect() as conn:
-            row = conn.execute(
-                text("SELECT pgp_sym_decrypt(decode(:ct, 'hex'), :key) AS decrypted"),
-                {"ct": hex_value.strip(), "key": key},
-            ).mappings().first()
-        if not row:
-            return None
-        decrypted = row.get("decrypted")
-        if decrypted is None:
-            return None
-        if isinstance(decrypted, memoryview):
-            return decrypted.tobytes().decode("utf-8", errors="replace")
-        if isinstance(decrypted, bytes):
-            return decrypted.decode("utf-8", errors="replace")
-        return str(decrypted)
-    except Exception as exc:
-        logger.warning("decrypt_ciphertext failed: %s", exc)
+    if not looks_like_ciphertext(hex_value):
         return None
+    return decrypt_ciphertexts([hex_value]).get(hex_value.strip())
 
 
-def reveal_field(value: Any) -> Any:
-    """Plain text for vault reveal; decrypt ciphertext when possible."""
+def _revealed(value: Any, plaintexts: dict[str, str | None]) -> Any:
     if value is None:
         return None
     if isinstance(value, str) and looks_like_ciphertext(value):
-        return decrypt_ciphertext(value) or None
+        return plaintexts.get(value.strip()) or None
     return value
 
 
+def reveal_field(value: Any) -> Any:
+    """Plain text for vault reveal; decrypt ciphertext when possible."""
+    return _revealed(value, decrypt_ciphertexts([value]))
+
+
+def reveal_fields(record: dict[str, Any], fields: Iterable[str]) -> dict[str, Any]:
+    """reveal_field() for several fields of one record, decrypted in one query."""
+    values = {f: record.get(f) for f in fields}
+    plaintexts = decrypt_ciphertexts(values.values())
+    return {f: _revealed(v, plaintexts) for f, v in values.items()}
+
+
 def grievance_pii_masked(grievance: dict[str, Any]) -> dict[str, Any]:
     """Safe subset for default officer UI — never includes ciphertext."""
     return {
@@ -98,9 +199,8 @@ def grievance_pii_masked(grievance: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def _officer_card_identity(value: Any) -> Any:
-    """Decrypt for standard GRM card; treat placeholders as empty."""
-    plain = reveal_field(value)
+def _officer_card_identity(plain: Any) -> Any:
+    """Revealed value for standard GRM card; treat placeholders as empty."""
     if plain is None:
         return None
     s = str(plain).strip()
@@ -129,11 +229,12 @@ def grievance_pii_for_officer_card(
         data["address"] = None
         return data
 
+    plain = reveal_fields(grievance, PII_FIELD_MAP)
     return {
-        "complainant_name": _officer_card_identity(grievance.get("complainant_full_name")),
-        "phone_number": _officer_card_identity(grievance.get("complainant_phone")),
-        "email": _officer_card_identity(grievance.get("complainant_email")),
-        "address": _officer_card_identity(grievance.get("complainant_address")),
+        "complainant_name": _officer_card_identity(plain["complainant_full_name"]),
+        "phone_number": _officer_card_identity(plain["complainant_phone"]),
+        "email": _officer_card_identity(plain["complainant_email"]),
+        "address": _officer_card_identity(plain["complainant_address"]),
         "village": grievance.get("complainant_village"),
         "ward": grievance.get("complainant_ward"),
         "municipality": grievance.get("complainant_municipality"),
@@ -145,10 +246,11 @@ def grievance_pii_for_officer_card(
 
 def grievance_reveal_content(grievance: dict[str, Any]) -> dict[str, Any]:
     """Decrypted content for time-limited reveal overlay."""
+    plain = reveal_fields(grievance, ["grievance_description", *PII_FIELD_MAP])
     return {
-        "grievance_description": reveal_field(grievance.get("grievance_description")),
-        "complainant_name": reveal_field(grievance.get("complainant_full_name")),
-        "phone_number": reveal_field(grievance.get("complainant_phone")),
-        "email": reveal_field(grievance.get("complainant_email")),
-        "address": reveal_field(grievance.get("complainant_address")),
+        "grievance_description": plain["grievance_description"],
+        "complainant_name": plain["complainant_full_name"],
+        "phone_number": plain["complainant_phone"],
+        "email": plain["complainant_email"],
+        "address": plain["complainant_address"],
     }
@@ -1,7 +1,9 @@
 """
-Celery task: daily archive of eligible resolved grievances.
+Celery tasks: daily archive of eligible resolved grievances, and ticket_events
+partition maintenance.
 
-Beat schedule: 03:00 Asia/Kathmandu (21:15 UTC) — see celery_app.py.
+Beat schedule: 03:00 Asia/Kathmandu (21:15 UTC) for archiving, 02:45 (21:00 UTC)
+for partitions — see celery_app.py.
 """
 from __future__ import annotations
 
@@ -40,3 +42,35 @@ def archive_eligible_grievances_task(self) -> dict:
         raise self.retry(exc=exc) from exc
     finally:
         db.close()
+
+
+@celery_app.task(
+    name="ticketing.tasks.archiving.maintain_ticket_event_partitions",
+    bind=True,
+    max_retries=2,
+    default_retry_delay=300,
+)
+def maintain_ticket_event_partitions(self) -> dict:
+    """Create upcoming ticket_events month partitions; detach expired ones when configured."""
+    from ticketing.config.settings import get_settings
+    from ticketing.models.base import SessionLocal
+    from ticketing.services.event_partitions import maintain_ticket_event_partitions as maintain
+
+    settings = get_settings()
+    db = SessionLocal()
+    try:
+        result = maintain(
+            db,
+            months_ahead=settings.ticket_events_partition_months_ahead,
+            detach_after_months=settings.ticket_events_detach_after_months,
+            drop=settings.ticket_events_detach_drop,
+        )
+        db.commit()
+        logger.info("maintain_ticket_event_partitions: %s", result)
+        return result
+    except Exception as exc:
+        db.rollback()
+        logger.exception("maintain_ticket_event_partitions error: %s", exc)
+        raise self.retry(exc=exc) from exc
+    finally:
+        db.close()
@@ -12,8 +12,9 @@ import logging
 
 from celery import Celery
 from celery.schedules import crontab
-from celery.signals import task_failure
+from celery.signals import task_failure, task_postrun, task_prerun, worker_init
 
+from backend.logger.metrics import connect_celery_task_metrics
 from ticketing.config.settings import get_settings
 
 logger = logging.getLogger(__name__)
@@ -82,6 +83,16 @@ celery_app.conf.update(
                 month_of_year="1,4,7,10",
             ),
         },
+        # ticket_events month partitions — daily, ahead of the archive run
+        "grm-ticket-event-partitions": {
+            "task": "ticketing.tasks.archiving.maintain_ticket_event_partitions",
+            "schedule": crontab(hour=21, minute=0),
+        },
+        # Closure PDF disk cache age / size cap — daily
+        "grm-closure-pdf-cache-prune": {
+            "task": "ticketing.tasks.llm.prune_closure_pdf_cache",
+            "schedule": crontab(hour=20, minute=30),
+        },
         # Archive eligible resolved cases — daily 03:00 Asia/Kathmandu (21:15 UTC)
         "grm-archive-eligible": {
             "task": "ticketing.tasks.archiving.archive_eligible_grievances_task",
@@ -90,6 +101,39 @@ celery_app.conf.update(
     },
 )
 
+# Per-task started/completed/failed/retried counters and durations, served by GET /metrics
+connect_celery_task_metrics(celery_app, service="grm_ticketing")
+
+
+@worker_init.connect
+def _install_badge_tracking(**kwargs):
+    """Event-writing tasks (notify_assignment, SLA watchdog) keep officer badge counts current."""
+    from ticketing.models.base import SessionLocal
+    from ticketing.services.badge_counts import install_badge_tracking
+
+    install_badge_tracking(SessionLocal)
+
+
+# Open pii_decrypt_cache() scopes, keyed by task id (closed in task_postrun)
+_pii_cache_scopes: dict = {}
+
+
+@task_prerun.connect
+def _open_pii_decrypt_cache(task_id=None, **kwargs):
+    """Vault plaintexts decrypted during a task are memoized until the task returns."""
+    from ticketing.services.pii_vault import pii_decrypt_cache
+
+    scope = pii_decrypt_cache()
+    scope.__enter__()
+    _pii_cache_scopes[task_id] = scope
+
+
+@task_postrun.connect
+def _close_pii_decrypt_cache(task_id=None, **kwargs):
+    scope = _pii_cache_scopes.pop(task_id, None)
+    if scope is not None:
+        scope.__exit__(None, None, None)
+
 
 @task_failure.connect
 def _on_grm_task_failure(sender=None, task_id=None, exception=None, **kwargs):
@@ -9,6 +9,10 @@ Two tasks:
                                   stores summary_en → Ticket.ai_summary_en
                                   and full findings → TicketContextCache.findings_json
 
+generate_resolved_case_summary queues prerender_closure_pdf(ticket_id) once the
+complainant closure document is complete, so the first PDF download is a cache hit;
+prune_closure_pdf_cache (daily beat) keeps that cache under its age / size caps.
+
 LLM provider: OpenAI via ticketing/clients/llm_client.py
   Standard tickets: gpt-4o-mini  (cost-optimised, temperature=0)
   SEAH tickets:     gpt-4o        (more careful reasoning)
@@ -276,6 +280,9 @@ def generate_resolved_case_summary(self, ticket_id: str, force: bool = False) ->
         row.summary_text_en = summary_json.get("findings_summary", {}).get("combined_digest_en")
         db.commit()
 
+        if status == "complete":
+            prerender_closure_pdf.delay(ticket_id)
+
         if status == "complete" and row.closure_public_url:
             notify_complainant.delay(
                 ticket_id,
@@ -296,3 +303,47 @@ def generate_resolved_case_summary(self, ticket_id: str, force: bool = False) ->
         raise self.retry(exc=exc)
     finally:
         db.close()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# prerender_closure_pdf
+# ─────────────────────────────────────────────────────────────────────────────
+
+@celery_app.task(
+    name="ticketing.tasks.llm.prerender_closure_pdf",
+    acks_late=True,
+)
+def prerender_closure_pdf(ticket_id: str) -> dict:
+    """Render the complainant closure PDF into the disk cache (services/closure_pdf.py)."""
+    from ticketing.models.base import SessionLocal
+    from ticketing.models.ticket_resolved_summary import TicketResolvedSummary
+    from ticketing.services.closure_pdf import get_or_render_closure_pdf
+
+    db = SessionLocal()
+    try:
+        row = db.get(TicketResolvedSummary, ticket_id)
+        if not row or not row.summary_public_json or row.generation_status != "complete":
+            return {"ticket_id": ticket_id, "status": "not_ready"}
+        public_json, grievance_id = row.summary_public_json, row.grievance_id
+    finally:
+        db.close()
+
+    try:
+        _, key = get_or_render_closure_pdf(public_json, grievance_id)
+    except Exception as exc:
+        # Not retried: the download endpoint renders on a cache miss anyway.
+        logger.warning("prerender_closure_pdf failed ticket_id=%s: %s", ticket_id, exc)
+        return {"ticket_id": ticket_id, "status": "failed"}
+    return {"ticket_id": ticket_id, "status": "cached", "key": key[:12]}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# prune_closure_pdf_cache
+# ─────────────────────────────────────────────────────────────────────────────
+
+@celery_app.task(name="ticketing.tasks.llm.prune_closure_pdf_cache")
+def prune_closure_pdf_cache() -> dict:
+    """Daily age / size cap on the closure PDF disk cache (services/closure_pdf.py)."""
+    from ticketing.services.closure_pdf import prune_closure_pdf_cache as _prune
+
+    return _prune()
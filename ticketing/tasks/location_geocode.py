@@ -1,8 +1,10 @@
 """
 Celery task: async reverse geocode for map-pin submissions.
 
-Low-priority queue (grm_geocode) with global Redis rate limit (1 req/s Nominatim policy).
-Retries transient failures with backoff starting at 3 seconds.
+Low-priority queue (grm_geocode). Pins resolve through the grid-cell cache in
+reverse_geocode.py; only cache misses take the global Redis rate limit (1 req/s Nominatim
+policy), so the task itself is not rate-limited. Retries transient failures with backoff
+starting at 3 seconds.
 """
 
 from __future__ import annotations
@@ -30,7 +32,6 @@ _RETRY_MAX_SEC = 30
     bind=True,
     max_retries=8,
     default_retry_delay=_RETRY_BASE_SEC,
-    rate_limit="1/s",
     acks_late=True,
     queue="grm_geocode",
 )
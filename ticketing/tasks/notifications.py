@@ -2,14 +2,12 @@
 Celery tasks: officer + complainant notifications.
 
 Officer notifications:
-  - In-app badge via ASSIGNMENT_NOTIFICATION TicketEvent
+  - In-app badge via ASSIGNMENT_NOTIFICATION TicketEvent (pushed over SSE, see services/badge_counts.py)
   - Project-level SMS on assignment (link-only, no PII) via notify_officer_assignment
 
 Complainant notifications:
   - Primary: POST /message to orchestrator (session_id stored on ticket)
   - Fallback: POST /api/messaging/send-sms (when session expired)
-
-INTEGRATION POINT: upgrade officer notifications to SSE in v2
 """
 import logging
 from typing import Optional
@@ -233,7 +231,8 @@ def notify_assignment(
     Create an unread notification event for the newly assigned officer.
     Also queues officer SMS when project messaging is enabled for the step level.
 
-    INTEGRATION POINT: trigger SSE push here in v2 for real-time badge update.
+    The commit bumps the officer's cached badge count and pushes it to open
+    GET /users/me/badge/stream connections (services/badge_counts.py).
     """
     from ticketing.models.base import SessionLocal
     from ticketing.models.ticket import Ticket, TicketEvent